@@ -1,22 +1,92 @@
 """``on_startup`` function will be called when server trying to start."""
 
+from dependency_injector.wiring import Provide, inject
 
-async def on_startup() -> None:
+from app.internal.pkg.middlewares.metrics import mark_process_dead
+from app.internal.repository.postgresql import contacts, partners
+from app.internal.services import Services
+from app.pkg.cache import CacheInvalidator, ReadThroughCache
+from app.pkg.connectors import Connectors
+from app.pkg.connectors.postgresql.notifications import RowChangeListener
+
+#: Tuple[str, ...]: Tables, which rows are cached by services with the tag of
+#: the same name.
+__cached_tables__ = ("countries", "cities", "skills", "skill_levels", "directions")
+
+
+@inject
+async def on_startup(
+    listener: RowChangeListener = Provide[Connectors.postgresql.listener],
+    contacts_repository: contacts.ContactsRepository = Provide[
+        Services.repositories.contacts_repository
+    ],
+    partner_repository: partners.PartnerRepository = Provide[
+        Services.repositories.partner_repository
+    ],
+    cache: ReadThroughCache = Provide[Services.cache.cache],
+) -> None:
     """Run code on server startup.
 
     Warnings:
         **Don't use this function for insert default data in database.
         For this action, we have scripts/migrate.py.**
 
+    Args:
+        listener: Listener of changed rows.
+        contacts_repository: Repository of contacts with token index.
+        partner_repository: Repository of partners with token index.
+        cache: Read-through cache of services.
+
+    Notes:
+        In-process cache is invalidated by changes of rows committed by any
+        worker. Redis cache shares invalidations itself.
+
+        Listener is started after its subscribers are registered. Unavailable
+        database does not break startup, listener reconnects in background.
+
     Returns:
         None
     """
 
+    for table, repository in (
+        ("contacts", contacts_repository),
+        ("partners", partner_repository),
+    ):
+        if repository.token_index is None:
+            continue
+        await listener.subscribe(table, repository.token_index)
+        await repository.token_index.warm(repository.stream_all())
 
-async def on_shutdown() -> None:
+    if not cache.backend.shared:
+        for table in __cached_tables__:
+            await listener.subscribe(
+                table,
+                CacheInvalidator(cache=cache, tags=(table,)),
+            )
+
+    await listener.start()
+
+
+@inject
+async def on_shutdown(
+    cache: ReadThroughCache = Provide[Services.cache.cache],
+    listener: RowChangeListener = Provide[Connectors.postgresql.listener],
+) -> None:
     """Run code on server shutdown. Use this function for close all
     connections, etc.
 
+    Args:
+        cache: Read-through cache of services.
+        listener: Listener of changed rows.
+
+    Notes:
+        In multiprocess mode of metrics, live gauges of the worker are removed
+        from aggregation.
+
     Returns:
         None
     """
+
+    await cache.close()
+    await listener.close()
+    mark_process_dead()
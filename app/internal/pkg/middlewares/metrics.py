@@ -1,5 +1,18 @@
-"""Middleware for expose internal metrics to public endpoint."""
+"""Middleware for expose internal metrics to public endpoint.
 
+Notes:
+    When server runs with several workers, set ``PROMETHEUS_MULTIPROC_DIR``
+    environment variable to an empty directory, e.g. on ``tmpfs``, before the
+    server is started. Every worker writes its metrics to memory-mapped files
+    in the directory, and the endpoint aggregates files of all workers on
+    scrape, so the scrape does not depend on the worker, that receives it.
+"""
+
+import os
+from functools import lru_cache
+from typing import Optional
+
+from prometheus_client import CollectorRegistry, multiprocess
 from prometheus_client.openmetrics.exposition import (
     CONTENT_TYPE_LATEST,
     generate_latest,
@@ -8,7 +21,59 @@ from prometheus_client.registry import REGISTRY
 from starlette.requests import Request
 from starlette.responses import Response
 
-__all__ = ["metrics"]
+__all__ = ["metrics", "get_multiprocess_dir", "get_registry", "mark_process_dead"]
+
+
+def get_multiprocess_dir() -> Optional[str]:
+    """Get directory of metrics of all workers.
+
+    Returns:
+        Value of ``PROMETHEUS_MULTIPROC_DIR`` or ``None``, if metrics are
+        collected only in the current process.
+    """
+
+    return os.environ.get(
+        "PROMETHEUS_MULTIPROC_DIR",
+        os.environ.get("prometheus_multiproc_dir"),
+    )
+
+
+@lru_cache(maxsize=None)
+def __get_multiprocess_registry(path: str) -> CollectorRegistry:
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry, path=path)
+    return registry
+
+
+def get_registry() -> CollectorRegistry:
+    """Get registry of exposed metrics.
+
+    Returns:
+        Registry, that aggregates metrics of all workers in multiprocess mode,
+        else the default registry of the current process.
+    """
+
+    path = get_multiprocess_dir()
+    if path is None:
+        return REGISTRY
+    return __get_multiprocess_registry(path)
+
+
+def mark_process_dead(pid: Optional[int] = None) -> None:
+    """Remove live gauges of the worker from the directory of metrics.
+
+    Args:
+        pid: Process id of the worker. Current process by default.
+
+    Notes:
+        Call it when worker shuts down, so gauges with ``live*`` multiprocess
+        mode, like ``fastapi_requests_in_progress``, do not count the worker.
+        Counters and histograms of the worker are kept.
+    """
+
+    path = get_multiprocess_dir()
+    if path is not None:
+        multiprocess.mark_process_dead(os.getpid() if pid is None else pid, path)
 
 
 def metrics(request: Request) -> Response:
@@ -25,6 +90,6 @@ def metrics(request: Request) -> Response:
     del request  # unused
 
     return Response(
-        generate_latest(REGISTRY),
+        generate_latest(get_registry()),
         headers={"Content-Type": CONTENT_TYPE_LATEST},
     )
@@ -0,0 +1,48 @@
+"""Query parameters for keyset pagination of ``read_all`` routes."""
+
+from fastapi import Query
+
+from app.pkg import models
+
+__all__ = ["pagination_query"]
+
+
+async def pagination_query(
+    limit: int = Query(
+        default=models.PaginationFields.limit.default,
+        gt=models.PaginationFields.limit.gt,
+        le=models.PaginationFields.limit.le,
+        description=models.PaginationFields.limit.description,
+    ),
+    after_id: int = Query(
+        default=models.PaginationFields.after_id.default,
+        ge=0,
+        description=models.PaginationFields.after_id.description,
+    ),
+) -> models.PaginationQuery:
+    """Collect ``limit`` and ``after_id`` query parameters into
+    :class:`.PaginationQuery`.
+
+    Notes:
+        Parameters are declared explicitly, so invalid values are reported to the
+        client as ``422`` like any other query parameter.
+
+    Args:
+        limit: Maximum number of rows in one page.
+        after_id: Cursor returned as ``next_after_id`` by the previous page.
+
+    Examples:
+        >>> from fastapi import APIRouter, Depends
+        >>>
+        >>> router = APIRouter()
+        >>>
+        >>> @router.get("/")
+        ... async def read_all(
+        ...     query: models.PaginationQuery = Depends(pagination_query),
+        ... ):
+        ...     ...
+
+    Returns:
+        PaginationQuery: Query for ``read_all`` repository methods.
+    """
+    return models.PaginationQuery(limit=limit, after_id=after_id)
@@ -1,36 +1,155 @@
 """Prometheus middleware."""
 
 import time
-from typing import Tuple
+from typing import Dict, List, Optional, Pattern, Set, Tuple
 
 from opentelemetry import trace
 from prometheus_client import Counter, Gauge, Histogram
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 from starlette.requests import Request
-from starlette.responses import Response
-from starlette.routing import Match
-from starlette.status import HTTP_500_INTERNAL_SERVER_ERROR
-from starlette.types import ASGIApp
+from starlette.routing import BaseRoute, Match, Route
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.internal.pkg.middlewares.handle_http_exceptions import (
     handle_api_exceptions,
     handle_internal_exception,
 )
 from app.pkg.models.base import BaseAPIException
-from app.pkg.models.types.fastapi import FastAPITypes
 
 __all__ = ["PrometheusMiddleware"]
 
 
-class PrometheusMiddleware(BaseHTTPMiddleware):
-    """Middleware for collecting metrics from FastAPI application."""
+class _RouteIndex:
+    """Index of path templates of routes of the application.
 
-    app: FastAPITypes.instance
+    Static paths are found by one lookup in dict, paths with parameters are
+    matched only with routes, that have the same first segment and the same
+    count of segments. Routes, that are not :class:`starlette.routing.Route`
+    or have parameters of ``path`` type, are matched as is.
+
+    Notes:
+        Like the router, index takes the first route in order of the
+        application, that fully matches the path and the method.
+    """
+
+    #: int: Count of indexed routes.
+    size: int
+
+    def __init__(self, routes: List[BaseRoute]):
+        self.size = len(routes)
+        self.__static: Dict[str, List[Tuple[int, Optional[Set[str]], str]]] = {}
+        self.__dynamic: Dict[
+            Tuple[Optional[str], int],
+            List[Tuple[int, Pattern, Optional[Set[str]], str]],
+        ] = {}
+        self.__other: List[Tuple[int, BaseRoute]] = []
+
+        for position, route in enumerate(routes):
+            if not isinstance(route, Route) or ":path}" in route.path:
+                self.__other.append((position, route))
+            elif not route.param_convertors:
+                self.__static.setdefault(route.path, []).append(
+                    (position, route.methods, route.path),
+                )
+            else:
+                self.__dynamic.setdefault(self.__key(route.path), []).append(
+                    (position, route.path_regex, route.methods, route.path),
+                )
+
+    def resolve(self, scope: Scope) -> Optional[str]:
+        """Find path template of the route, that handles the request.
+
+        Args:
+            scope: Scope of the request.
+
+        Returns:
+            Path template or ``None``, if no route handles the request.
+        """
+
+        path, method = scope["path"], scope["method"]
+        found: Optional[Tuple[int, str]] = None
+
+        for position, methods, template in self.__static.get(path, ()):
+            if methods is None or method in methods:
+                found = (position, template)
+                break
+
+        first, count = self.__key(path)
+        for key in ((first, count), (None, count)):
+            for position, regex, methods, template in self.__dynamic.get(key, ()):
+                if found is not None and position > found[0]:
+                    break
+                if (methods is None or method in methods) and regex.match(path):
+                    found = (position, template)
+                    break
+
+        for position, route in self.__other:
+            if found is not None and position > found[0]:
+                break
+            if route.matches(scope)[0] == Match.FULL:
+                found = (position, getattr(route, "path", path))
+                break
+
+        return found[1] if found is not None else None
+
+    @staticmethod
+    def __key(path: str) -> Tuple[Optional[str], int]:
+        """Get key of the bucket of the path.
+
+        Args:
+            path: Path of the request or template of the route.
+
+        Returns:
+            First segment or ``None``, if it is a parameter, and count of
+            segments.
+        """
+
+        segments = path.split("/")
+        first = segments[1] if len(segments) > 1 else ""
+        return (None if "{" in first else first), len(segments)
+
+
+class _PathMetrics:
+    """Labelled children of metrics of one method and path."""
+
+    __slots__ = ("requests", "in_progress", "duration", "responses", "exceptions")
+
+    def __init__(
+        self,
+        requests: Counter,
+        in_progress: Gauge,
+        duration: Histogram,
+    ):
+        self.requests = requests
+        self.in_progress = in_progress
+        self.duration = duration
+        self.responses: Dict[int, Counter] = {}
+        self.exceptions: Dict[str, Counter] = {}
+
+
+class PrometheusMiddleware:
+    """Middleware for collecting metrics from FastAPI application.
+
+    Notes:
+        Middleware is a plain ASGI application, so requests are not wrapped
+        into extra tasks and streams. Path template is resolved with the index
+        of routes of the application, which is built on the first request and
+        rebuilt, when routes are added. Labelled metrics are created once per
+        method and path template.
+
+        Duration of the request is measured until the whole response is sent.
+    """
+
+    app: ASGIApp
 
     __filter_unhandled_paths: bool
     __app_name: str
 
-    __INFO = Gauge("fastapi_app_info", "FastAPI application information.", ["app_name"])
+    __INFO = Gauge(
+        "fastapi_app_info",
+        "FastAPI application information.",
+        ["app_name"],
+        multiprocess_mode="livemax",
+    )
     __REQUESTS = Counter(
         "fastapi_requests_total",
         "Total count of requests by method and path.",
@@ -55,6 +174,7 @@ class PrometheusMiddleware(BaseHTTPMiddleware):
         "fastapi_requests_in_progress",
         "Gauge of requests by method and path currently being processed",
         ["method", "path", "app_name"],
+        multiprocess_mode="livesum",
     )
 
     def __init__(
@@ -63,83 +183,122 @@ class PrometheusMiddleware(BaseHTTPMiddleware):
         app_name: str = "api",
         filter_unhandled_paths: bool = True,
     ) -> None:
-        super().__init__(app)
+        self.app = app
         self.__app_name = app_name
         self.__INFO.labels(app_name=self.__app_name).inc()
         self.__filter_unhandled_paths = filter_unhandled_paths
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: RequestResponseEndpoint,
-    ) -> Response:
-        method = request.method
-        path_template, is_handled_path = self.__get_path_template(request)
-
-        if self.__is_path_filtered(is_handled_path):
-            return await call_next(request)
-
-        self.__REQUESTS_IN_PROGRESS.labels(
-            method=method,
-            path=path_template,
-            app_name=self.__app_name,
-        ).inc()
-        self.__REQUESTS.labels(
-            method=method,
-            path=path_template,
-            app_name=self.__app_name,
-        ).inc()
+        self.__index: Optional[_RouteIndex] = None
+        self.__metrics: Dict[Tuple[str, str], _PathMetrics] = {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        path_template = self.__get_path_template(scope)
+        if path_template is None:
+            if self.__filter_unhandled_paths:
+                await self.app(scope, receive, send)
+                return
+            path_template = scope["path"]
+            metrics = self.__create_metrics(method, path_template)
+        else:
+            metrics = self.__metrics.get((method, path_template))
+            if metrics is None:
+                metrics = self.__metrics[
+                    (method, path_template)
+                ] = self.__create_metrics(method, path_template)
+
+        status_code = 500
+        response_started = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, response_started
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                response_started = True
+            await send(message)
+
+        metrics.in_progress.inc()
+        metrics.requests.inc()
         before_time = time.perf_counter()
-        status_code = HTTP_500_INTERNAL_SERVER_ERROR
         try:
-            response = await call_next(request)
+            await self.app(scope, receive, send_wrapper)
         except (  # pylint: disable=broad-exception-caught
             BaseAPIException,
             Exception,
         ) as e:
-            self.__EXCEPTIONS.labels(
-                method=method,
-                path=path_template,
-                exception_type=type(e).__name__,
-                app_name=self.__app_name,
-            ).inc()
+            self.__get_exceptions(metrics, method, path_template, e).inc()
+            if response_started:
+                raise
+            request = Request(scope, receive)
             if isinstance(e, BaseAPIException):
-                return handle_api_exceptions(request=request, exc=e)
-            return handle_internal_exception(request=request, exc=e)
+                response = handle_api_exceptions(request=request, exc=e)
+            else:
+                response = handle_internal_exception(request=request, exc=e)
+            await response(scope, receive, send_wrapper)
         else:
-            status_code = response.status_code
             after_time = time.perf_counter()
-            span = trace.get_current_span()
-            trace_id = trace.format_trace_id(span.get_span_context().trace_id)
-
-            self.__REQUESTS_PROCESSING_TIME.labels(
-                method=method,
-                path=path_template,
-                app_name=self.__app_name,
-            ).observe(after_time - before_time, exemplar={"TraceID": trace_id})
+            context = trace.get_current_span().get_span_context()
+            metrics.duration.observe(
+                after_time - before_time,
+                exemplar=(
+                    {"TraceID": trace.format_trace_id(context.trace_id)}
+                    if context.is_valid
+                    else None
+                ),
+            )
         finally:
-            self.__RESPONSES.labels(
+            self.__get_responses(metrics, method, path_template, status_code).inc()
+            metrics.in_progress.dec()
+
+    def __get_path_template(self, scope: Scope) -> Optional[str]:
+        routes = scope["app"].routes
+        if self.__index is None or self.__index.size != len(routes):
+            self.__index = _RouteIndex(routes)
+        return self.__index.resolve(scope)
+
+    def __create_metrics(self, method: str, path: str) -> _PathMetrics:
+        labels = {"method": method, "path": path, "app_name": self.__app_name}
+        return _PathMetrics(
+            requests=self.__REQUESTS.labels(**labels),
+            in_progress=self.__REQUESTS_IN_PROGRESS.labels(**labels),
+            duration=self.__REQUESTS_PROCESSING_TIME.labels(**labels),
+        )
+
+    def __get_responses(
+        self,
+        metrics: _PathMetrics,
+        method: str,
+        path: str,
+        status_code: int,
+    ) -> Counter:
+        counter = metrics.responses.get(status_code)
+        if counter is None:
+            counter = metrics.responses[status_code] = self.__RESPONSES.labels(
                 method=method,
-                path=path_template,
+                path=path,
                 status_code=status_code,
                 app_name=self.__app_name,
-            ).inc()
-            self.__REQUESTS_IN_PROGRESS.labels(
+            )
+        return counter
+
+    def __get_exceptions(
+        self,
+        metrics: _PathMetrics,
+        method: str,
+        path: str,
+        exception: Exception,
+    ) -> Counter:
+        exception_type = type(exception).__name__
+        counter = metrics.exceptions.get(exception_type)
+        if counter is None:
+            counter = metrics.exceptions[exception_type] = self.__EXCEPTIONS.labels(
                 method=method,
-                path=path_template,
+                path=path,
+                exception_type=exception_type,
                 app_name=self.__app_name,
-            ).dec()
-
-        return response
-
-    @staticmethod
-    def __get_path_template(request: Request) -> Tuple[str, bool]:
-        for route in request.app.routes:
-            match, _ = route.matches(request.scope)
-            if match == Match.FULL:
-                return route.path, True
-
-        return request.url.path, False
-
-    def __is_path_filtered(self, is_handled_path: bool) -> bool:
-        return self.__filter_unhandled_paths and not is_handled_path
+            )
+        return counter
@@ -0,0 +1 @@
+"""Custom server responses."""
@@ -0,0 +1,435 @@
+"""Fast JSON responses of already validated models.
+
+By default FastAPI validates the value returned by the endpoint against
+``response_model`` once more, converts it with ``jsonable_encoder`` and only
+then dumps it with :func:`json.dumps`. Values returned by services are models,
+which were validated on construction, so :class:`.FastJSONRoute` skips this
+work and dumps them directly to bytes with an encoder, that is built once per
+response type and ``response_model_exclude``.
+
+Examples:
+    Fast mode is opted in per router::
+
+        >>> from fastapi import APIRouter
+        >>> router = APIRouter(prefix="/users", route_class=FastJSONRoute)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import typing
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+import orjson
+import pydantic
+from fastapi.datastructures import DefaultPlaceholder
+from fastapi.dependencies.models import Dependant
+from fastapi.encoders import jsonable_encoder
+from fastapi.routing import APIRoute
+from fastapi.utils import is_body_allowed_for_status_code
+from pydantic.json import custom_pydantic_encoder
+from starlette.responses import JSONResponse, Response
+from starlette.routing import request_response
+
+from app.pkg.models.base import BaseModel
+
+__all__ = ["FastJSONResponse", "FastJSONRoute", "get_encoder"]
+
+_Encode = Callable[[Any], Any]
+
+#: Normalized ``exclude``: name of field to ``True`` (the whole field is
+#: excluded) or to normalized ``exclude`` of the nested value.
+_Exclude = Dict[Union[str, int], Any]
+
+
+class _Fallback(Exception):
+    """Value does not match the response type, it must be serialized by
+    FastAPI."""
+
+
+class FastJSONResponse(Response):
+    """Response with JSON body, that is already rendered to bytes."""
+
+    media_type = "application/json"
+
+    def render(self, content: bytes) -> bytes:
+        return content
+
+
+class Encoder:
+    """Encoder of values of one response type to JSON bytes.
+
+    Models are converted to dicts of their fields without ``exclude``-d ones,
+    every other value is dumped by :mod:`orjson` as is. Values, which are not
+    supported by :mod:`orjson` (secrets, bytes, datetimes and dates), are
+    converted by ``json_encoders`` of the model config, like in
+    ``jsonable_encoder``.
+    """
+
+    __slots__ = ("encode", "default")
+
+    #: Callable[[Any], Any]: Conversion of value to the value, that is dumped
+    #: by :mod:`orjson`.
+    encode: _Encode
+
+    #: Callable[[Any], Any]: Conversion of values unsupported by
+    #: :mod:`orjson`.
+    default: _Encode
+
+    def __init__(self, tp: Any, exclude: Optional[_Exclude], by_alias: bool):
+        json_encoders = (
+            tp.__config__.json_encoders
+            if isinstance(tp, type) and issubclass(tp, pydantic.BaseModel)
+            else BaseModel.__config__.json_encoders
+        )
+        self.default = self.__build_default(json_encoders)
+        encode = self.__build(tp, exclude or {}, by_alias, top=True)
+        self.encode = encode or (lambda v: v)
+
+    def __call__(self, value: Any) -> bytes:
+        """Dump value to JSON.
+
+        Args:
+            value: Value returned by the endpoint.
+
+        Raises:
+            _Fallback: Value does not match the response type.
+
+        Returns:
+            JSON bytes.
+        """
+
+        try:
+            return orjson.dumps(
+                self.encode(value),
+                default=self.default,
+                option=orjson.OPT_PASSTHROUGH_DATETIME,
+            )
+        except orjson.JSONEncodeError as exc:
+            raise _Fallback from exc
+
+    @staticmethod
+    def __build_default(json_encoders: Dict[Any, _Encode]) -> _Encode:
+        """Build conversion of values unsupported by :mod:`orjson`.
+
+        Args:
+            json_encoders: ``json_encoders`` of the model config.
+
+        Returns:
+            Conversion, that uses ``json_encoders`` and standard encoders of
+            pydantic.
+        """
+
+        def default(v: Any) -> Any:
+            if isinstance(v, pydantic.BaseModel):
+                return jsonable_encoder(v)
+            return custom_pydantic_encoder(json_encoders, v)
+
+        return default
+
+    @staticmethod
+    def __build(
+        tp: Any,
+        exclude: _Exclude,
+        by_alias: bool,
+        top: bool = False,
+    ) -> Optional[_Encode]:
+        """Build conversion of value of the type.
+
+        Args:
+            tp: Type of value.
+            exclude: Normalized ``exclude`` of value.
+            by_alias: Use aliases of fields as keys.
+            top: Type is the response type. ``exclude`` of the response list
+                is applied to every item, like in ``jsonable_encoder``.
+
+        Raises:
+            TypeError: ``exclude`` is not supported for the type.
+
+        Returns:
+            Conversion or ``None``, if value is dumped as is.
+        """
+
+        origin = typing.get_origin(tp)
+        args = typing.get_args(tp)
+
+        if origin is typing.Union:
+            if len(args) == 2 and type(None) in args:
+                tp = args[0] if args[1] is type(None) else args[1]
+                inner = Encoder.__build(tp, exclude, by_alias, top)
+                if inner is None:
+                    return None
+                return lambda v: None if v is None else inner(v)
+            return Encoder.__unsupported(exclude)
+
+        if origin in (list, tuple, typing.get_origin(typing.Sequence)):
+            if not args or origin is tuple and not (len(args) == 2 and args[1] is ...):
+                return Encoder.__unsupported(exclude)
+            if not top:
+                if set(exclude) - {"__all__"}:
+                    raise TypeError("Only '__all__' is supported for items.")
+                exclude = exclude.get("__all__", {})
+            item = Encoder.__build(args[0], exclude, by_alias)
+            if item is None:
+                return None
+
+            def encode_list(v: Any) -> Any:
+                if not isinstance(v, (list, tuple)):
+                    raise _Fallback
+                return [item(ve) for ve in v]
+
+            return encode_list
+
+        if isinstance(tp, type) and issubclass(tp, pydantic.BaseModel):
+            return Encoder.__build_model(tp, exclude, by_alias)
+
+        return Encoder.__unsupported(exclude)
+
+    @staticmethod
+    def __build_model(
+        model: typing.Type[pydantic.BaseModel],
+        exclude: _Exclude,
+        by_alias: bool,
+    ) -> _Encode:
+        """Build conversion of model to dict of its fields.
+
+        Args:
+            model: Model class.
+            exclude: Normalized ``exclude`` of the model.
+            by_alias: Use aliases of fields as keys.
+
+        Returns:
+            Conversion of instance of ``model``.
+        """
+
+        fields: Tuple[Tuple[str, str, Optional[_Encode]], ...] = tuple(
+            (
+                field.alias if by_alias else name,
+                name,
+                Encoder.__build_field(field, exclude.get(name) or {}, by_alias),
+            )
+            for name, field in model.__fields__.items()
+            if exclude.get(name) is not True
+        )
+
+        def encode_model(v: Any) -> Any:
+            if not isinstance(v, model):
+                raise _Fallback
+            values = v.__dict__
+            try:
+                return {
+                    key: values[name] if encode is None else encode(values[name])
+                    for key, name, encode in fields
+                }
+            except KeyError as exc:
+                # Field was deleted from the instance.
+                raise _Fallback from exc
+
+        return encode_model
+
+    @staticmethod
+    def __build_field(
+        field: pydantic.fields.ModelField,
+        exclude: _Exclude,
+        by_alias: bool,
+    ) -> Optional[_Encode]:
+        """Build conversion of field value.
+
+        Args:
+            field: Field of model.
+            exclude: Normalized ``exclude`` of the field.
+            by_alias: Use aliases of fields as keys.
+
+        Returns:
+            Conversion of value or ``None``, if value is dumped as is.
+        """
+
+        if field.shape in (
+            pydantic.fields.SHAPE_SINGLETON,
+            pydantic.fields.SHAPE_LIST,
+            pydantic.fields.SHAPE_SEQUENCE,
+            pydantic.fields.SHAPE_TUPLE_ELLIPSIS,
+        ):
+            encode = Encoder.__build(field.outer_type_, exclude, by_alias)
+            if encode is None or not field.allow_none:
+                return encode
+            # ``Optional`` is stripped from ``outer_type_``.
+            return lambda v: None if v is None else encode(v)
+        return Encoder.__unsupported(exclude)
+
+    @staticmethod
+    def __unsupported(exclude: _Exclude) -> None:
+        """Check, that value of unsupported type may be dumped as is.
+
+        Args:
+            exclude: Normalized ``exclude`` of value.
+
+        Raises:
+            TypeError: ``exclude`` is given for the value.
+        """
+
+        if exclude:
+            raise TypeError("Exclude is supported only for models and lists.")
+
+
+def _normalize(exclude: Any) -> Any:
+    """Convert ``exclude`` to hashable normalized form.
+
+    Args:
+        exclude: Set or dict of excluded fields like in
+            :meth:`pydantic.BaseModel.dict`.
+
+    Returns:
+        Sorted tuple of pairs of field and ``True`` or nested ``exclude``.
+    """
+
+    if exclude is None:
+        return ()
+    if isinstance(exclude, (set, frozenset)):
+        return tuple(sorted(((k, True) for k in exclude), key=repr))
+    if isinstance(exclude, dict):
+        return tuple(
+            sorted(
+                (
+                    (k, True if v is True or v is ... else _normalize(v))
+                    for k, v in exclude.items()
+                ),
+                key=repr,
+            ),
+        )
+    raise TypeError(f"Unsupported exclude: {exclude!r}")
+
+
+def _thaw(exclude: Any) -> _Exclude:
+    """Convert normalized ``exclude`` back to dict.
+
+    Args:
+        exclude: Normalized ``exclude``.
+
+    Returns:
+        Dict of field to ``True`` or nested ``exclude``.
+    """
+
+    return {k: True if v is True else _thaw(v) for k, v in exclude}
+
+
+@functools.lru_cache(maxsize=None)
+def _get_encoder(tp: Any, exclude: Any, by_alias: bool) -> Encoder:
+    return Encoder(tp, _thaw(exclude), by_alias)
+
+
+def get_encoder(tp: Any, exclude: Any = None, by_alias: bool = True) -> Encoder:
+    """Get encoder of the response type, build it on the first call.
+
+    Args:
+        tp: Response type.
+        exclude: Excluded fields like ``response_model_exclude``.
+        by_alias: Use aliases of fields as keys.
+
+    Raises:
+        TypeError: ``exclude`` is not supported for the type.
+
+    Returns:
+        Encoder of values of ``tp``.
+    """
+
+    return _get_encoder(tp, _normalize(exclude), by_alias)
+
+
+class FastJSONRoute(APIRoute):
+    """Route, that dumps models returned by the endpoint directly to JSON.
+
+    Fast path is used only if the route has ``response_model``, default
+    response class and no ``response_model_include``,
+    ``response_model_exclude_unset``, ``response_model_exclude_defaults``
+    and ``response_model_exclude_none``, and endpoint does not use
+    ``Response`` parameter. Otherwise, and if the returned value does not match
+    the response type (e.g. endpoint returns dict), the value is serialized by
+    FastAPI as usual.
+
+    Warnings:
+        Returned models are not validated by ``response_model``, so they must
+        be built with validation, as services do.
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any):
+        super().__init__(path, endpoint, **kwargs)
+
+        encoder = self.__build_encoder()
+        if encoder is not None:
+            self.dependant.call = self.__wrap(self.dependant.call, encoder)
+            self.app = request_response(self.get_route_handler())
+
+    def __build_encoder(self) -> Optional[Encoder]:
+        """Build encoder of the response, if fast path is supported by the
+        route.
+
+        Returns:
+            Encoder or ``None``.
+        """
+
+        status_code = self.status_code or 200
+        if (
+            self.response_field is None
+            or not asyncio.iscoroutinefunction(self.dependant.call)
+            or not isinstance(self.response_class, DefaultPlaceholder)
+            or self.response_class.value is not JSONResponse
+            or self.response_model_include is not None
+            or self.response_model_exclude_unset
+            or self.response_model_exclude_defaults
+            or self.response_model_exclude_none
+            or not is_body_allowed_for_status_code(status_code)
+            or self.__uses_response(self.dependant)
+        ):
+            return None
+
+        try:
+            return get_encoder(
+                self.response_field.outer_type_,
+                exclude=self.response_model_exclude,
+                by_alias=self.response_model_by_alias,
+            )
+        except TypeError:
+            return None
+
+    @staticmethod
+    def __uses_response(dependant: Dependant) -> bool:
+        """Check, that endpoint or its dependencies use ``Response`` parameter.
+
+        Args:
+            dependant: Dependant of endpoint.
+
+        Returns:
+            True, if status code, headers or cookies may be set by parameter.
+        """
+
+        return dependant.response_param_name is not None or any(
+            FastJSONRoute.__uses_response(sub) for sub in dependant.dependencies
+        )
+
+    def __wrap(self, call: Callable[..., Any], encoder: Encoder) -> Callable[..., Any]:
+        """Wrap endpoint, so it returns rendered response.
+
+        Args:
+            call: Endpoint.
+            encoder: Encoder of the response.
+
+        Returns:
+            Wrapped endpoint.
+        """
+
+        status_code = self.status_code or 200
+
+        @functools.wraps(call)
+        async def endpoint(**values: Any) -> Any:
+            content = await call(**values)
+            if isinstance(content, Response):
+                return content
+            try:
+                body = encoder(content)
+            except _Fallback:
+                return content
+            return FastJSONResponse(content=body, status_code=status_code)
+
+        return endpoint
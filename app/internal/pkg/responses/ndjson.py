@@ -0,0 +1,79 @@
+"""Streaming response in newline delimited JSON format."""
+
+from typing import AbstractSet, AsyncIterator, List, Optional
+
+from starlette.background import BackgroundTask
+from starlette.responses import StreamingResponse
+
+from app.pkg.models.base import Model
+
+__all__ = ["NDJSONResponse"]
+
+
+class NDJSONResponse(StreamingResponse):
+    """Stream batches of models as newline delimited JSON.
+
+    Every model is serialized into one line. The body is sent with chunked
+    transfer encoding, one chunk per batch, so the first bytes reach the client
+    as soon as the first batch is fetched from the database.
+
+    Examples:
+        ::
+
+            >>> from fastapi import APIRouter
+            >>>
+            >>> router = APIRouter()
+            >>>
+            >>> @router.get("/export/", response_class=NDJSONResponse)
+            ... async def export_users(service=...):
+            ...     return NDJSONResponse(
+            ...         content=service.stream_all_users(),
+            ...         exclude={"password"},
+            ...     )
+    """
+
+    media_type = "application/x-ndjson"
+
+    def __init__(
+        self,
+        content: AsyncIterator[List[Model]],
+        exclude: Optional[AbstractSet[str]] = None,
+        status_code: int = 200,
+        headers: Optional[dict] = None,
+        background: Optional[BackgroundTask] = None,
+    ):
+        """Create response.
+
+        Args:
+            content: Async iterator of batches of models.
+            exclude: Fields of the models excluded from the output.
+            status_code: Response status code.
+            headers: Response headers.
+            background: Background task executed after the response is sent.
+        """
+
+        super().__init__(
+            content=self.__encode(content, exclude=exclude),
+            status_code=status_code,
+            headers=headers,
+            media_type=self.media_type,
+            background=background,
+        )
+
+    @staticmethod
+    async def __encode(
+        content: AsyncIterator[List[Model]],
+        exclude: Optional[AbstractSet[str]],
+    ) -> AsyncIterator[str]:
+        """Serialize every batch into one chunk of lines.
+
+        Args:
+            content: Async iterator of batches of models.
+            exclude: Fields of the models excluded from the output.
+
+        Returns:
+            Async iterator of chunks.
+        """
+
+        async for batch in content:
+            yield "".join(f"{model.json(exclude=exclude)}\n" for model in batch)
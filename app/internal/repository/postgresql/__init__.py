@@ -9,15 +9,39 @@ from app.internal.repository.postgresql.direction import DirectionRepository
 from app.internal.repository.postgresql.partners import PartnerRepository
 from app.internal.repository.postgresql.skill import SkillRepository
 from app.internal.repository.postgresql.skill_levels import SkillLevelRepository
+from app.pkg.cache import TokenIndex
+from app.pkg.settings import settings
 
 
 class Repositories(containers.DeclarativeContainer):
     """Container for postgresql repositories."""
 
+    configuration = providers.Configuration(
+        name="settings",
+        pydantic_settings=[settings],
+    )
+
+    contacts_token_index = providers.Singleton(
+        TokenIndex,
+        name="contacts",
+        maxsize=configuration.CACHE.TOKEN_INDEX_MAX_SIZE,
+    )
+    partner_token_index = providers.Singleton(
+        TokenIndex,
+        name="partners",
+        maxsize=configuration.CACHE.TOKEN_INDEX_MAX_SIZE,
+    )
+
     skill_levels_repository = providers.Factory(SkillLevelRepository)
     skill_repository = providers.Factory(SkillRepository)
     direction_repository = providers.Factory(DirectionRepository)
     city_repository = providers.Factory(CityRepository)
     country_repository = providers.Factory(CountryRepository)
-    contacts_repository = providers.Factory(ContactsRepository)
-    partner_repository = providers.Factory(PartnerRepository)
+    contacts_repository = providers.Factory(
+        ContactsRepository,
+        token_index=contacts_token_index,
+    )
+    partner_repository = providers.Factory(
+        PartnerRepository,
+        token_index=partner_token_index,
+    )
@@ -1,11 +1,17 @@
 """Repository for cities."""
 
-from typing import List
+from typing import AsyncIterator, List
 
-from app.internal.repository.postgresql.connection import get_connection
+from app.internal.repository.postgresql.connection import (
+    get_connection,
+    server_side_cursor,
+)
 from app.internal.repository.postgresql.handlers.collect_response import (
     collect_response,
+    collect_stream,
 )
+from app.internal.repository.postgresql.handlers.patch import patch_query
+from app.internal.repository.postgresql.handlers.unnest import unnest_params
 from app.internal.repository.repository import Repository
 from app.pkg import models
 
@@ -30,6 +36,83 @@ class CityRepository(Repository):
             return await cur.fetchone()
 
     @collect_response
+    async def create_many(
+        self,
+        cmds: List[models.CreateCityCommand],
+    ) -> List[models.City]:
+        q = """
+            with cmds as (
+                select * from unnest(
+                    %(name)s::text[],
+                    %(code)s::text[],
+                    %(country_id)s::int[]
+                )
+                with ordinality as cmds(name, code, country_id, ord)
+            ), created as (
+                insert into cities(
+                    name, code, country_id
+                )
+                select name, code, country_id from cmds order by ord
+                returning id, name, code, country_id
+            )
+            select
+                created.id, created.name, created.code, created.country_id
+            from created join cmds using (country_id, code)
+            order by cmds.ord
+        """
+        async with get_connection() as cur:
+            await cur.execute(q, unnest_params(cmds))
+            return await cur.fetchall()
+
+    @collect_response
+    async def upsert(self, cmd: models.CreateCityCommand) -> models.CityUpsert:
+        q = """
+            insert into cities(
+                name, code, country_id
+            ) values (%(name)s, %(code)s, %(country_id)s)
+            on conflict (country_id, code) do update
+            set
+                name = excluded.name
+            returning id, name, code, country_id, (xmax = 0) as created
+        """
+        async with get_connection() as cur:
+            await cur.execute(q, cmd.to_dict())
+            return await cur.fetchone()
+
+    @collect_response
+    async def upsert_many(
+        self,
+        cmds: List[models.CreateCityCommand],
+    ) -> List[models.CityUpsert]:
+        q = """
+            with cmds as (
+                select * from unnest(
+                    %(name)s::text[],
+                    %(code)s::text[],
+                    %(country_id)s::int[]
+                )
+                with ordinality as cmds(name, code, country_id, ord)
+            ), upserted as (
+                insert into cities(
+                    name, code, country_id
+                )
+                select name, code, country_id from cmds order by ord
+                on conflict (country_id, code) do update
+                set
+                    name = excluded.name
+                returning id, name, code, country_id, (xmax = 0) as created
+            )
+            select
+                upserted.id, upserted.name, upserted.code, upserted.country_id,
+                upserted.created
+            from upserted join cmds using (country_id, code)
+            order by cmds.ord
+        """
+        async with get_connection() as cur:
+            await cur.execute(q, unnest_params(cmds))
+            return await cur.fetchall()
+
+    @collect_response(trusted=True)
     async def read(self, query: models.ReadCityQuery) -> models.City:
         q = """
             select
@@ -37,11 +120,26 @@ class CityRepository(Repository):
             from cities
             where id = %(id)s
         """
-        async with get_connection() as cur:
+        async with get_connection(read_only=True) as cur:
             await cur.execute(q, query.to_dict())
             return await cur.fetchone()
 
-    @collect_response
+    @collect_response(trusted=True)
+    async def batch_read_all(
+        self,
+        query: models.ReadAllCityByIdQuery,
+    ) -> List[models.City]:
+        q = """
+            select
+                id, name, code, country_id
+            from cities
+            where id = ANY(%(ids)s)
+        """
+        async with get_connection(read_only=True) as cur:
+            await cur.execute(q, query.to_dict())
+            return await cur.fetchall()
+
+    @collect_response(trusted=True)
     async def read_by_country(
         self,
         query: models.ReadCityByCountryQuery,
@@ -52,21 +150,43 @@ class CityRepository(Repository):
             from cities
             where country_id = %(country_id)s
         """
-        async with get_connection() as cur:
+        async with get_connection(read_only=True) as cur:
             await cur.execute(q, query.to_dict())
             return await cur.fetchall()
 
-    @collect_response
-    async def read_all(self) -> List[models.City]:
+    @collect_response(trusted=True)
+    async def read_all(
+        self,
+        query: models.PaginationQuery,
+    ) -> List[models.City]:
         q = """
             select
                 id, name, code, country_id
             from cities
+            where id > %(after_id)s
+            order by id
+            limit %(limit)s
         """
-        async with get_connection() as cur:
-            await cur.execute(q)
+        async with get_connection(read_only=True) as cur:
+            await cur.execute(q, query.to_dict())
             return await cur.fetchall()
 
+    @collect_stream(trusted=True)
+    async def stream_all(
+        self,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[List[models.City]]:
+        q = """
+            select
+                id, name, code, country_id
+            from cities
+            order by id
+        """
+        async with get_connection(read_only=True) as cur:
+            async with server_side_cursor(cur, q, batch_size=batch_size) as batches:
+                async for rows in batches:
+                    yield rows
+
     @collect_response
     async def update(self, cmd: models.UpdateCityCommand) -> models.City:
         q = """
@@ -82,6 +202,14 @@ class CityRepository(Repository):
             await cur.execute(q, cmd.to_dict())
             return await cur.fetchone()
 
+    @collect_response
+    async def patch(self, cmd: models.PatchCityCommand) -> models.City:
+        values = cmd.to_patch()
+        q = patch_query("cities", values, returning="id, name, code, country_id")
+        async with get_connection() as cur:
+            await cur.execute(q, values)
+            return await cur.fetchone()
+
     @collect_response
     async def delete(self, cmd: models.DeleteCityCommand) -> models.City:
         q = """
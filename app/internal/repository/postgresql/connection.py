@@ -1,32 +1,63 @@
 """Create connection to postgresql."""
 
-from contextlib import asynccontextmanager
-from typing import Optional, Union
+import asyncio
+import itertools
+import time
+from contextlib import AsyncExitStack, asynccontextmanager, suppress
+from typing import AsyncIterator, List, Optional, Union
 
-from aiopg import Pool
+import psycopg2
+from aiopg import Connection, Pool
 from aiopg.pool import Cursor
 from dependency_injector.wiring import Provide, inject
 from psycopg2.extensions import cursor  # type: ignore
-from psycopg2.extras import RealDictCursor  # type: ignore
+from psycopg2.extras import RealDictCursor, RealDictRow  # type: ignore
 
 from app.pkg.connectors import Connectors
+from app.pkg.connectors.postgresql.instrumentation import TracedCursor, current_query
+from app.pkg.connectors.postgresql.monitor import get_pool_monitor
+from app.pkg.connectors.postgresql.prepared import PreparedCursor, get_statement_cache
+from app.pkg.connectors.postgresql.replicas import ReplicaSet
+from app.pkg.connectors.postgresql.routing import pin_to_primary, reads_from_replicas
+from app.pkg.connectors.postgresql.transaction import current_transaction
+from app.pkg.models.exceptions.repository import PoolAcquireTimeout
 
-__all__ = ["get_connection", "acquire_connection"]
+__all__ = [
+    "get_connection",
+    "acquire_connection",
+    "savepoint",
+    "server_side_cursor",
+]
+
+#: Iterator[int]: Numbers of savepoints and server-side cursors, so their names
+#: never clash on one connection.
+__names__ = itertools.count(1)
 
 
 @asynccontextmanager
-@inject
 async def get_connection(
-    pool: Pool = Provide[Connectors.postgresql.connector],
     return_pool: bool = False,
+    read_only: bool = False,
 ) -> Union[Cursor, Pool]:
     """Get async connection pool to postgresql.
 
     Args:
-        pool:
-            postgresql connection pool.
         return_pool:
             if True, return pool, else return connection.
+        read_only:
+            if True, connection may be acquired from a healthy read replica.
+            Use it only for ``select`` queries, that tolerate replication lag.
+
+    Notes:
+        After the first write (``read_only=False``) all following queries of
+        the same context (e.g. request) go to the primary, so the caller
+        always reads its own writes. Inside :func:`.read_from_primary` reads go
+        to the primary too. If replica can not give a connection,
+        query fails over to the primary.
+
+        Inside :class:`.UnitOfWork` the cursor of its transaction is returned,
+        so no connection is acquired. Failed query aborts the transaction,
+        unless it is run inside :func:`.savepoint`.
 
     Examples:
         If you have a function that contains a query in postgresql,
@@ -38,18 +69,98 @@ async def get_connection(
             ...     async with get_connection() as c:
             ...         await c.execute("SELECT * FROM users")
 
+        Read-only queries can be routed to a replica::
+
+            >>> async def read_users() -> None:
+            ...     async with get_connection(read_only=True) as c:
+            ...         await c.execute("SELECT * FROM users")
+
+    Returns:
+        Async connection to postgresql.
+    """
+
+    if not return_pool:
+        transaction = current_transaction()
+        if transaction is not None:
+            yield transaction
+            return
+
+    async with __connect(return_pool=return_pool, read_only=read_only) as connection:
+        yield connection
+
+
+@asynccontextmanager
+@inject
+async def __connect(
+    return_pool: bool,
+    read_only: bool,
+    pool: Pool = Provide[Connectors.postgresql.connector],
+    statement_cache_size: int = Provide[
+        Connectors.postgresql.configuration.POSTGRES.PREPARED_STATEMENTS_CACHE_SIZE
+    ],
+    replicas: ReplicaSet = Provide[Connectors.postgresql.replicas],
+) -> Union[Cursor, Pool]:
+    """Get pool or acquire connection of the primary or of a replica.
+
+    Args:
+        return_pool:
+            if True, return pool, else return connection.
+        read_only:
+            if True, connection may be acquired from a healthy read replica.
+        pool:
+            postgresql connection pool.
+        statement_cache_size:
+            Max count of prepared statements per connection. If ``0``, queries
+            are executed without preparing. Pools of asyncpg driver are created
+            with their own statement cache of the same size.
+        replicas:
+            Read replicas of postgresql.
+
     Returns:
         Async connection to postgresql.
     """
 
-    if not isinstance(pool, Pool):
+    # Resource gives future until the pool is created. Pool of any driver is
+    # not awaited.
+    if asyncio.isfuture(pool) or asyncio.iscoroutine(pool):
         pool = await pool
 
     if return_pool:
         yield pool
         return
 
-    async with acquire_connection(pool=pool, cursor_factory=None) as cur:
+    replica = None
+    if not read_only:
+        pin_to_primary()
+    elif reads_from_replicas():
+        if not isinstance(replicas, ReplicaSet):
+            replicas = await replicas
+        replica = replicas.choose()
+
+    async with AsyncExitStack() as stack:
+        cur = None
+        if replica is not None:
+            try:
+                cur = await stack.enter_async_context(
+                    acquire_connection(
+                        pool=replica.pool,
+                        cursor_factory=None,
+                        statement_cache_size=statement_cache_size,
+                    ),
+                )
+            except psycopg2.OperationalError:
+                replicas.mark_down(replica)
+            except PoolAcquireTimeout:
+                pass
+
+        if cur is None:
+            cur = await stack.enter_async_context(
+                acquire_connection(
+                    pool=pool,
+                    cursor_factory=None,
+                    statement_cache_size=statement_cache_size,
+                ),
+            )
         yield cur
 
 
@@ -57,6 +168,7 @@ async def get_connection(
 async def acquire_connection(
     pool: Pool,
     cursor_factory: Optional[cursor] = None,
+    statement_cache_size: int = 0,
 ) -> Cursor:
     """Acquire connection from pool.
 
@@ -65,6 +177,11 @@ async def acquire_connection(
             Getings from :func:`.get_connection` postgresql pool.
         cursor_factory:
             cursor factory.
+        statement_cache_size:
+            Max count of prepared statements per connection. If greater than
+            ``0``, cursor executes queries as prepared statements cached on the
+            connection. See :class:`.PreparedCursor`. Connections of asyncpg
+            driver prepare statements themselves, so it is ignored for them.
 
     Examples:
         If you have a function that contains a query in postgresql,
@@ -80,6 +197,15 @@ async def acquire_connection(
             ...         async with acquire_connection(__pool) as _cursor:
             ...             await _cursor.execute(q)
 
+    Notes:
+        Inside of repository methods waiting for connection, execute and fetch
+        of queries are timed as phases of the method. See
+        :class:`.QueryTrace`.
+
+    Raises:
+        PoolAcquireTimeout: Pool has no free connection during
+            ``POSTGRES.ACQUIRE_TIMEOUT``. See :class:`.PoolMonitor`.
+
     Returns:
         Async connection to postgresql.
     """
@@ -87,6 +213,157 @@ async def acquire_connection(
     if cursor_factory is None:
         cursor_factory = RealDictCursor
 
-    async with pool.acquire() as conn:
+    query = current_query()
+    started = time.time_ns()
+    async with get_pool_monitor(pool).acquire() as conn:
+        if query is not None:
+            query.record("acquire", started, time.time_ns())
         acquire_cursor = await conn.cursor(cursor_factory=cursor_factory)
-        yield acquire_cursor
+        if statement_cache_size > 0 and isinstance(conn, Connection):
+            acquire_cursor = PreparedCursor(
+                cursor=acquire_cursor,
+                cache=get_statement_cache(conn, maxsize=statement_cache_size),
+            )
+        yield TracedCursor(acquire_cursor)
+
+
+@asynccontextmanager
+async def server_side_cursor(
+    cur: Cursor,
+    query: str,
+    params: Optional[dict] = None,
+    batch_size: int = 1000,
+) -> AsyncIterator[AsyncIterator[List[RealDictRow]]]:
+    """Declare server-side cursor for query and fetch its rows in batches.
+
+    Notes:
+        aiopg does not support named cursors in async mode, so server-side cursor
+        is declared with ``DECLARE ... NO SCROLL CURSOR`` inside a transaction
+        and rows are read with ``FETCH FORWARD``. Only one batch is held in
+        memory at a time.
+
+        If the block is left with an exception (including closing of the
+        consuming generator), the transaction is rolled back, which also closes
+        the server-side cursor.
+
+        Inside :class:`.UnitOfWork` the cursor is declared in its transaction
+        and closed on exit of the block, the transaction is neither committed
+        nor rolled back.
+
+    Args:
+        cur:
+            Cursor from :func:`.get_connection`.
+        query:
+            Select query without trailing semicolon.
+        params:
+            Parameters of the query.
+        batch_size:
+            Number of rows fetched per round trip.
+
+    Examples:
+        ::
+
+            >>> async def stream_users():
+            ...     q = "select * from users order by id"
+            ...     async with get_connection() as cur:
+            ...         async with server_side_cursor(cur, q) as batches:
+            ...             async for rows in batches:
+            ...                 yield rows
+
+    Returns:
+        Async iterator of non-empty row batches.
+    """
+
+    cursor_name = f"stream_cursor_{next(__names__)}"
+
+    if current_transaction() is not None:
+        await cur.execute(f"declare {cursor_name} no scroll cursor for {query}", params)
+        try:
+            yield __fetch_batches(
+                cur=cur,
+                cursor_name=cursor_name,
+                batch_size=batch_size,
+            )
+        finally:
+            with suppress(psycopg2.Error):
+                await cur.execute(f"close {cursor_name}")
+        return
+
+    await cur.execute("begin")
+    try:
+        await cur.execute(f"declare {cursor_name} no scroll cursor for {query}", params)
+        yield __fetch_batches(cur=cur, cursor_name=cursor_name, batch_size=batch_size)
+    except BaseException:
+        with suppress(psycopg2.Error):
+            await cur.execute("rollback")
+        raise
+    await cur.execute("commit")
+
+
+@asynccontextmanager
+async def savepoint() -> AsyncIterator[None]:
+    """Roll back queries of the block, if it raises, keeping the transaction
+    of :class:`.UnitOfWork`.
+
+    Notes:
+        Savepoint costs two round trips, so it is used only where the caller
+        goes on after a failed query, e.g. retries of
+        :func:`.create_in_batches`. Outside of unit of work every query is
+        committed by itself, so nothing is done.
+
+    Examples:
+        ::
+
+            >>> async with UnitOfWork():
+            ...     try:
+            ...         async with savepoint():
+            ...             await repository.create_many(cmds=cmds)
+            ...     except UniqueViolation:
+            ...         ...
+
+    Returns:
+        Async context manager.
+    """
+
+    cur = current_transaction()
+    if cur is None:
+        yield
+        return
+
+    name = f"savepoint_{next(__names__)}"
+    await cur.execute(f"savepoint {name}")
+    try:
+        yield
+    except BaseException:
+        with suppress(psycopg2.Error):
+            await cur.execute(f"rollback to savepoint {name}")
+        raise
+    await cur.execute(f"release savepoint {name}")
+
+
+async def __fetch_batches(
+    cur: Cursor,
+    cursor_name: str,
+    batch_size: int,
+) -> AsyncIterator[List[RealDictRow]]:
+    """Fetch rows of declared cursor until it is exhausted.
+
+    Args:
+        cur:
+            Cursor with an open transaction.
+        cursor_name:
+            Name of the declared server-side cursor.
+        batch_size:
+            Number of rows fetched per round trip.
+
+    Returns:
+        Async iterator of non-empty row batches.
+    """
+
+    while True:
+        await cur.execute(f"fetch forward {int(batch_size)} from {cursor_name}")
+        rows = await cur.fetchall()
+        if rows:
+            yield rows
+        if len(rows) < batch_size:
+            return
@@ -1,13 +1,21 @@
 """Repository for contacts."""
 
-from typing import List
+from typing import AsyncIterator, List, Optional
 
-from app.internal.repository.postgresql.connection import get_connection
+from app.internal.repository.postgresql.connection import (
+    get_connection,
+    server_side_cursor,
+)
 from app.internal.repository.postgresql.handlers.collect_response import (
     collect_response,
+    collect_stream,
 )
+from app.internal.repository.postgresql.handlers.patch import patch_query
+from app.internal.repository.postgresql.handlers.unnest import unnest_params
 from app.internal.repository.repository import Repository
 from app.pkg import models
+from app.pkg.cache import TokenIndex, index_evict, index_lookup, index_store
+from app.pkg.connectors.postgresql.routing import read_from_primary
 
 __all__ = ["ContactsRepository"]
 
@@ -15,6 +23,13 @@ __all__ = ["ContactsRepository"]
 class ContactsRepository(Repository):
     """Contacts repository implementation."""
 
+    #: Optional[TokenIndex]: Index of entities by token.
+    token_index: Optional[TokenIndex]
+
+    def __init__(self, token_index: Optional[TokenIndex] = None):
+        self.token_index = token_index
+
+    @index_store
     @collect_response
     async def create(self, cmd: models.CreateContactsCommand) -> models.Contacts:
         q = """
@@ -34,6 +49,117 @@ class ContactsRepository(Repository):
             await cur.execute(q, cmd.to_dict(show_secrets=True))
             return await cur.fetchone()
 
+    @index_store
+    @collect_response
+    async def create_many(
+        self,
+        cmds: List[models.CreateContactsCommand],
+    ) -> List[models.Contacts]:
+        q = """
+            with cmds as (
+                select * from unnest(
+                    %(token)s::text[],
+                    %(email)s::text[],
+                    %(telegram_username)s::text[],
+                    %(telegram_user_id)s::bigint[],
+                    %(partner_id)s::int[]
+                )
+                with ordinality as cmds(
+                    token, email, telegram_username, telegram_user_id, partner_id, ord
+                )
+            ), created as (
+                insert into contacts(
+                    token, email, telegram_username, telegram_user_id, partner_id
+                )
+                select
+                    token, email, telegram_username, telegram_user_id, partner_id
+                from cmds
+                order by ord
+                returning
+                    id, token, email, telegram_username, telegram_user_id, partner_id
+            )
+            select
+                created.id, created.token, created.email, created.telegram_username,
+                created.telegram_user_id, created.partner_id
+            from created join cmds using (telegram_user_id)
+            order by cmds.ord
+        """
+        async with get_connection() as cur:
+            await cur.execute(q, unnest_params(cmds, show_secrets=True))
+            return await cur.fetchall()
+
+    @index_evict
+    @collect_response
+    async def upsert(self, cmd: models.CreateContactsCommand) -> models.ContactsUpsert:
+        q = """
+            insert into contacts(
+                token, email, telegram_username, telegram_user_id, partner_id
+            ) values (
+                %(token)s,
+                %(email)s,
+                %(telegram_username)s,
+                %(telegram_user_id)s,
+                %(partner_id)s
+            )
+            on conflict (telegram_user_id) do update
+            set
+                email = excluded.email,
+                telegram_username = excluded.telegram_username,
+                partner_id = excluded.partner_id
+            returning
+                id, token, email, telegram_username, telegram_user_id, partner_id,
+                (xmax = 0) as created
+        """
+        async with get_connection() as cur:
+            await cur.execute(q, cmd.to_dict(show_secrets=True))
+            return await cur.fetchone()
+
+    @index_evict
+    @collect_response
+    async def upsert_many(
+        self,
+        cmds: List[models.CreateContactsCommand],
+    ) -> List[models.ContactsUpsert]:
+        q = """
+            with cmds as (
+                select * from unnest(
+                    %(token)s::text[],
+                    %(email)s::text[],
+                    %(telegram_username)s::text[],
+                    %(telegram_user_id)s::bigint[],
+                    %(partner_id)s::int[]
+                )
+                with ordinality as cmds(
+                    token, email, telegram_username, telegram_user_id, partner_id, ord
+                )
+            ), upserted as (
+                insert into contacts(
+                    token, email, telegram_username, telegram_user_id, partner_id
+                )
+                select
+                    token, email, telegram_username, telegram_user_id, partner_id
+                from cmds
+                order by ord
+                on conflict (telegram_user_id) do update
+                set
+                    email = excluded.email,
+                    telegram_username = excluded.telegram_username,
+                    partner_id = excluded.partner_id
+                returning
+                    id, token, email, telegram_username, telegram_user_id, partner_id,
+                    (xmax = 0) as created
+            )
+            select
+                upserted.id, upserted.token, upserted.email, upserted.telegram_username,
+                upserted.telegram_user_id, upserted.partner_id, upserted.created
+            from upserted join cmds using (telegram_user_id)
+            order by cmds.ord
+        """
+        async with get_connection() as cur:
+            await cur.execute(q, unnest_params(cmds, show_secrets=True))
+            return await cur.fetchall()
+
+    @index_lookup
     @collect_response
     async def read(self, query: models.ReadContactsQuery) -> models.Contacts:
         q = """
@@ -47,9 +173,12 @@ class ContactsRepository(Repository):
             from contacts
             where token = %(token)s
         """
-        async with get_connection() as cur:
-            await cur.execute(q, query.to_dict(show_secrets=True))
-            return await cur.fetchone()
+        # Token is used right after create and before update, so it is read
+        # from the primary to not miss the fresh rows on a lagging replica.
+        with read_from_primary():
+            async with get_connection(read_only=True) as cur:
+                await cur.execute(q, query.to_dict(show_secrets=True))
+                return await cur.fetchone()
 
     @collect_response
     async def read_by_telegram_user_id(
@@ -67,9 +196,12 @@ class ContactsRepository(Repository):
             from contacts
             where telegram_user_id = %(telegram_user_id)s
         """
-        async with get_connection() as cur:
-            await cur.execute(q, query.to_dict())
-            return await cur.fetchone()
+        # Read from the primary, like token: contacts are looked up by telegram
+        # user right after they are created.
+        with read_from_primary():
+            async with get_connection(read_only=True) as cur:
+                await cur.execute(q, query.to_dict())
+                return await cur.fetchone()
 
     @collect_response
     async def read_by_id(self, query: models.ReadContactsByIdQuery) -> models.Contacts:
@@ -84,12 +216,30 @@ class ContactsRepository(Repository):
             from contacts
             where id = %(id)s
         """
-        async with get_connection() as cur:
+        async with get_connection(read_only=True) as cur:
             await cur.execute(q, query.to_dict())
             return await cur.fetchone()
 
     @collect_response
-    async def read_all(self) -> List[models.Contacts]:
+    async def batch_read_all(
+        self,
+        query: models.ReadAllContactsByIdQuery,
+    ) -> List[models.Contacts]:
+        q = """
+            select
+                id, token, email, telegram_username, telegram_user_id, partner_id
+            from contacts
+            where id = ANY(%(ids)s)
+        """
+        async with get_connection(read_only=True) as cur:
+            await cur.execute(q, query.to_dict())
+            return await cur.fetchall()
+
+    @collect_response
+    async def read_all(
+        self,
+        query: models.PaginationQuery,
+    ) -> List[models.Contacts]:
         q = """
             select
                 id,
@@ -99,11 +249,36 @@ class ContactsRepository(Repository):
                 telegram_user_id,
                 partner_id
             from contacts
+            where id > %(after_id)s
+            order by id
+            limit %(limit)s
         """
-        async with get_connection() as cur:
-            await cur.execute(q)
+        async with get_connection(read_only=True) as cur:
+            await cur.execute(q, query.to_dict())
             return await cur.fetchall()
 
+    @collect_stream
+    async def stream_all(
+        self,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[List[models.Contacts]]:
+        q = """
+            select
+                id,
+                token,
+                email,
+                telegram_username,
+                telegram_user_id,
+                partner_id
+            from contacts
+            order by id
+        """
+        async with get_connection(read_only=True) as cur:
+            async with server_side_cursor(cur, q, batch_size=batch_size) as batches:
+                async for rows in batches:
+                    yield rows
+
+    @index_store
     @collect_response
     async def update(self, cmd: models.UpdateContactsCommand) -> models.Contacts:
         q = """
@@ -119,6 +294,59 @@ class ContactsRepository(Repository):
             await cur.execute(q, cmd.to_dict(show_secrets=True))
             return await cur.fetchone()
 
+    @index_store
+    @collect_response
+    async def patch(self, cmd: models.PatchContactsCommand) -> models.Contacts:
+        values = cmd.to_patch(show_secrets=True)
+        q = patch_query(
+            "contacts",
+            values,
+            returning=(
+                "id, token, email, telegram_username, telegram_user_id, partner_id"
+            ),
+        )
+        async with get_connection() as cur:
+            await cur.execute(q, values)
+            return await cur.fetchone()
+
+    @index_evict
+    @collect_response
+    async def update_email(
+        self,
+        cmd: models.UpdateContactsEmailCommand,
+    ) -> models.ContactsEmailUpdate:
+        """Update email of contacts by token in one statement.
+
+        Notes:
+            Row is updated only if the email differs. Otherwise, the current
+            row is returned with ``changed`` set to ``False``. If there are no
+            contacts with the token, :class:`.EmptyResult` is raised.
+        """
+
+        q = """
+            with updated as (
+                update contacts
+                set email = %(email)s
+                where token = %(token)s and email is distinct from %(email)s
+                returning
+                    id, token, email, telegram_username, telegram_user_id, partner_id
+            )
+            select
+                id, token, email, telegram_username, telegram_user_id, partner_id,
+                true as changed
+            from updated
+            union all
+            select
+                id, token, email, telegram_username, telegram_user_id, partner_id,
+                false as changed
+            from contacts
+            where token = %(token)s and not exists (select from updated)
+        """
+        async with get_connection() as cur:
+            await cur.execute(q, cmd.to_dict(show_secrets=True))
+            return await cur.fetchone()
+
+    @index_evict
     @collect_response
     async def delete(self, cmd: models.DeleteContactsCommand) -> models.Contacts:
         q = """
@@ -1,11 +1,17 @@
 """Repository for countries."""
 
-from typing import List
+from typing import AsyncIterator, List
 
-from app.internal.repository.postgresql.connection import get_connection
+from app.internal.repository.postgresql.connection import (
+    get_connection,
+    server_side_cursor,
+)
 from app.internal.repository.postgresql.handlers.collect_response import (
     collect_response,
+    collect_stream,
 )
+from app.internal.repository.postgresql.handlers.patch import patch_query
+from app.internal.repository.postgresql.handlers.unnest import unnest_params
 from app.internal.repository.repository import Repository
 from app.pkg import models
 
@@ -30,6 +36,74 @@ class CountryRepository(Repository):
             return await cur.fetchone()
 
     @collect_response
+    async def create_many(
+        self,
+        cmds: List[models.CreateCountryCommand],
+    ) -> List[models.Country]:
+        q = """
+            with cmds as (
+                select * from unnest(%(name)s::text[], %(code)s::text[])
+                with ordinality as cmds(name, code, ord)
+            ), created as (
+                insert into countries(
+                    name, code
+                )
+                select name, code from cmds order by ord
+                returning id, name, code
+            )
+            select
+                created.id, created.name, created.code
+            from created join cmds using (code)
+            order by cmds.ord
+        """
+        async with get_connection() as cur:
+            await cur.execute(q, unnest_params(cmds))
+            return await cur.fetchall()
+
+    @collect_response
+    async def upsert(self, cmd: models.CreateCountryCommand) -> models.CountryUpsert:
+        q = """
+            insert into countries(
+                name, code
+            ) values (%(name)s, %(code)s)
+            on conflict (code) do update
+            set
+                name = excluded.name
+            returning id, name, code, (xmax = 0) as created
+        """
+        async with get_connection() as cur:
+            await cur.execute(q, cmd.to_dict())
+            return await cur.fetchone()
+
+    @collect_response
+    async def upsert_many(
+        self,
+        cmds: List[models.CreateCountryCommand],
+    ) -> List[models.CountryUpsert]:
+        q = """
+            with cmds as (
+                select * from unnest(%(name)s::text[], %(code)s::text[])
+                with ordinality as cmds(name, code, ord)
+            ), upserted as (
+                insert into countries(
+                    name, code
+                )
+                select name, code from cmds order by ord
+                on conflict (code) do update
+                set
+                    name = excluded.name
+                returning id, name, code, (xmax = 0) as created
+            )
+            select
+                upserted.id, upserted.name, upserted.code, upserted.created
+            from upserted join cmds using (code)
+            order by cmds.ord
+        """
+        async with get_connection() as cur:
+            await cur.execute(q, unnest_params(cmds))
+            return await cur.fetchall()
+
+    @collect_response(trusted=True)
     async def read(self, query: models.ReadCountryQuery) -> models.Country:
         q = """
             select
@@ -37,21 +111,58 @@ class CountryRepository(Repository):
             from countries
             where id = %(id)s
         """
-        async with get_connection() as cur:
+        async with get_connection(read_only=True) as cur:
             await cur.execute(q, query.to_dict())
             return await cur.fetchone()
 
-    @collect_response
-    async def read_all(self) -> List[models.Country]:
+    @collect_response(trusted=True)
+    async def batch_read_all(
+        self,
+        query: models.ReadAllCountryByIdQuery,
+    ) -> List[models.Country]:
         q = """
             select
                 id, name, code
             from countries
+            where id = ANY(%(ids)s)
         """
-        async with get_connection() as cur:
-            await cur.execute(q)
+        async with get_connection(read_only=True) as cur:
+            await cur.execute(q, query.to_dict())
+            return await cur.fetchall()
+
+    @collect_response(trusted=True)
+    async def read_all(
+        self,
+        query: models.PaginationQuery,
+    ) -> List[models.Country]:
+        q = """
+            select
+                id, name, code
+            from countries
+            where id > %(after_id)s
+            order by id
+            limit %(limit)s
+        """
+        async with get_connection(read_only=True) as cur:
+            await cur.execute(q, query.to_dict())
             return await cur.fetchall()
 
+    @collect_stream(trusted=True)
+    async def stream_all(
+        self,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[List[models.Country]]:
+        q = """
+            select
+                id, name, code
+            from countries
+            order by id
+        """
+        async with get_connection(read_only=True) as cur:
+            async with server_side_cursor(cur, q, batch_size=batch_size) as batches:
+                async for rows in batches:
+                    yield rows
+
     @collect_response
     async def update(self, cmd: models.UpdateCountryCommand) -> models.Country:
         q = """
@@ -66,6 +177,14 @@ class CountryRepository(Repository):
             await cur.execute(q, cmd.to_dict())
             return await cur.fetchone()
 
+    @collect_response
+    async def patch(self, cmd: models.PatchCountryCommand) -> models.Country:
+        values = cmd.to_patch()
+        q = patch_query("countries", values, returning="id, name, code")
+        async with get_connection() as cur:
+            await cur.execute(q, values)
+            return await cur.fetchone()
+
     @collect_response
     async def delete(self, cmd: models.DeleteCountryCommand) -> models.Country:
         q = """
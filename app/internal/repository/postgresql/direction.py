@@ -1,10 +1,16 @@
 """Repository for contacts."""
-from typing import List
+from typing import AsyncIterator, List
 
-from app.internal.repository.postgresql.connection import get_connection
+from app.internal.repository.postgresql.connection import (
+    get_connection,
+    server_side_cursor,
+)
 from app.internal.repository.postgresql.handlers.collect_response import (
     collect_response,
+    collect_stream,
 )
+from app.internal.repository.postgresql.handlers.patch import patch_query
+from app.internal.repository.postgresql.handlers.unnest import unnest_params
 from app.internal.repository.repository import Repository
 from app.pkg import models
 
@@ -29,6 +35,76 @@ class DirectionRepository(Repository):
             return await cur.fetchone()
 
     @collect_response
+    async def create_many(
+        self,
+        cmds: List[models.CreateDirectionCommand],
+    ) -> List[models.Direction]:
+        q = """
+            with cmds as (
+                select * from unnest(%(name)s::text[])
+                with ordinality as cmds(name, ord)
+            ), created as (
+                insert into directions(
+                    name
+                )
+                select name from cmds order by ord
+                returning id, name
+            )
+            select
+                created.id, created.name
+            from created join cmds using (name)
+            order by cmds.ord
+        """
+        async with get_connection() as cur:
+            await cur.execute(q, unnest_params(cmds))
+            return await cur.fetchall()
+
+    @collect_response
+    async def upsert(
+        self, cmd: models.CreateDirectionCommand
+    ) -> models.DirectionUpsert:
+        q = """
+            insert into directions(
+                name
+            ) values (%(name)s)
+            on conflict (name) do update
+            set
+                name = excluded.name
+            returning id, name, (xmax = 0) as created
+        """
+        async with get_connection() as cur:
+            await cur.execute(q, cmd.to_dict())
+            return await cur.fetchone()
+
+    @collect_response
+    async def upsert_many(
+        self,
+        cmds: List[models.CreateDirectionCommand],
+    ) -> List[models.DirectionUpsert]:
+        q = """
+            with cmds as (
+                select * from unnest(%(name)s::text[])
+                with ordinality as cmds(name, ord)
+            ), upserted as (
+                insert into directions(
+                    name
+                )
+                select name from cmds order by ord
+                on conflict (name) do update
+                set
+                    name = excluded.name
+                returning id, name, (xmax = 0) as created
+            )
+            select
+                upserted.id, upserted.name, upserted.created
+            from upserted join cmds using (name)
+            order by cmds.ord
+        """
+        async with get_connection() as cur:
+            await cur.execute(q, unnest_params(cmds))
+            return await cur.fetchall()
+
+    @collect_response(trusted=True)
     async def read(self, query: models.ReadDirectionQuery) -> models.Direction:
         q = """
             select
@@ -36,11 +112,11 @@ class DirectionRepository(Repository):
             from directions
             where id = %(id)s
         """
-        async with get_connection() as cur:
+        async with get_connection(read_only=True) as cur:
             await cur.execute(q, query.to_dict())
             return await cur.fetchone()
 
-    @collect_response
+    @collect_response(trusted=True)
     async def batch_read_all(
         self,
         query: models.ReadAllDirectionByIdQuery,
@@ -51,21 +127,43 @@ class DirectionRepository(Repository):
                 from directions
                 where id = ANY(%(ids)s)
             """
-        async with get_connection() as cur:
+        async with get_connection(read_only=True) as cur:
             await cur.execute(q, query.to_dict())
             return await cur.fetchall()
 
-    @collect_response
-    async def read_all(self) -> List[models.Direction]:
+    @collect_response(trusted=True)
+    async def read_all(
+        self,
+        query: models.PaginationQuery,
+    ) -> List[models.Direction]:
         q = """
             select
                 id, name
             from directions
+            where id > %(after_id)s
+            order by id
+            limit %(limit)s
         """
-        async with get_connection() as cur:
-            await cur.execute(q)
+        async with get_connection(read_only=True) as cur:
+            await cur.execute(q, query.to_dict())
             return await cur.fetchall()
 
+    @collect_stream(trusted=True)
+    async def stream_all(
+        self,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[List[models.Direction]]:
+        q = """
+            select
+                id, name
+            from directions
+            order by id
+        """
+        async with get_connection(read_only=True) as cur:
+            async with server_side_cursor(cur, q, batch_size=batch_size) as batches:
+                async for rows in batches:
+                    yield rows
+
     @collect_response
     async def update(self, cmd: models.UpdateDirectionCommand) -> models.Direction:
         q = """
@@ -79,6 +177,14 @@ class DirectionRepository(Repository):
             await cur.execute(q, cmd.to_dict())
             return await cur.fetchone()
 
+    @collect_response
+    async def patch(self, cmd: models.PatchDirectionCommand) -> models.Direction:
+        values = cmd.to_patch()
+        q = patch_query("directions", values, returning="id, name")
+        async with get_connection() as cur:
+            await cur.execute(q, values)
+            return await cur.fetchone()
+
     @collect_response
     async def delete(self, cmd: models.DeleteDirectionCommand) -> models.Direction:
         q = """
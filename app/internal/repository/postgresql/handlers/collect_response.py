@@ -1,26 +1,34 @@
 """Collect response from aiopg and convert it to an annotated model."""
 
 from functools import wraps
-from typing import List, Type, Union
-
-import pydantic
-from psycopg2.extras import RealDictRow  # type: ignore
+from typing import AsyncIterator, Callable, List, Optional, Type, Union, get_args
 
+from app.internal.repository.postgresql.handlers.decoder import build_decoder
 from app.internal.repository.postgresql.handlers.handle_exception import (
     handle_exception,
+    handle_stream_exception,
 )
+from app.pkg.connectors.postgresql.instrumentation import QueryInstrument, payload_size
 from app.pkg.models.base import Model
 from app.pkg.models.exceptions.repository import EmptyResult
 
-__all__ = ["collect_response"]
+__all__ = ["collect_response", "collect_stream"]
 
 
-def collect_response(fn):
+def collect_response(fn: Optional[Callable] = None, *, trusted: bool = False):
     """Convert response from aiopg to an annotated model.
 
+    Decoder of the response is built once, when the function is decorated,
+    from the return annotation of `fn`.
+
     Args:
         fn:
             Target function that contains a query in postgresql.
+        trusted:
+            Build models with ``construct`` and skip validation. Use it only
+            for queries, that select columns of the model as is from our own
+            schema. If the model has fields that psycopg2 can not return as is
+            (e.g. secrets or bytes), rows are validated anyway.
 
     Examples:
         If you have a function that contains a query in postgresql,
@@ -37,6 +45,17 @@ def collect_response(fn):
             ...        await cur.execute(q, query.to_dict(show_secrets=True))
             ...        return await cur.fetchone()
 
+        Rows of reference tables can be built without validation::
+
+            >>> @collect_response(trusted=True)
+            ... async def get_user_by_id(query: ReadUserByIdQuery) -> StrictUser:
+            ...    ...
+
+    Notes:
+        Every call is traced: pool acquire, execute, fetch and decode of rows
+        are observed in ``repository_query_duration_seconds`` and written as
+        child spans of the method. See :class:`.QueryInstrument`.
+
     Warnings:
         The function must return a single row or a list of rows in format like::
 
@@ -49,6 +68,12 @@ def collect_response(fn):
         EmptyResult: when a query of `fn` returns None.
     """
 
+    if fn is None:
+        return lambda func: collect_response(func, trusted=trusted)
+
+    decode = build_decoder(fn.__annotations__["return"], trusted=trusted)
+    instrument = QueryInstrument.of(fn.__qualname__)
+
     @wraps(fn)
     @handle_exception
     async def inner(
@@ -71,52 +96,114 @@ def collect_response(fn):
             The model that is specified in type hints of `fn`.
         """
 
-        response = await fn(*args, **kwargs)
-        if not response:
-            raise EmptyResult
+        with instrument.trace() as query:
+            response = await fn(*args, **kwargs)
+            if not response:
+                raise EmptyResult
 
-        return pydantic.parse_obj_as(
-            (ann := fn.__annotations__["return"]),
-            await __convert_response(response=response, annotations=str(ann)),
-        )
+            query.rows = len(response) if isinstance(response, list) else 1
+            if query.span.is_recording():
+                query.span.set_attribute(
+                    "db.response.payload_size",
+                    payload_size(response),
+                )
+            with query.phase("decode"):
+                return decode(response)
 
     return inner
 
 
-async def __convert_response(response: RealDictRow, annotations: str):
-    """Converts the response of the request to List of models or to a single
-    model.
+def collect_stream(fn: Optional[Callable] = None, *, trusted: bool = False):
+    """Convert batches of rows streamed from aiopg to annotated models.
+
+    Streaming counterpart of :func:`.collect_response`. ``fn`` must be an async
+    generator yielding batches of rows, and must be annotated as
+    ``AsyncIterator[List[Model]]``. Every batch is validated separately, so only
+    one batch is held in memory at a time.
 
     Args:
-        response:
-            Response of an aiopg query.
-        annotations:
-            Annotations of `fn`.
+        fn:
+            Target async generator that streams rows of a query in postgresql.
+        trusted:
+            Build models with ``construct``. See :func:`.collect_response`.
+
+    Examples:
+        ::
+
+            >>> from typing import AsyncIterator, List
+            >>> from app.pkg.models.user import StrictUser
+            >>> from app.internal.repository.postgresql.connection import (
+            ...     get_connection,
+            ...     server_side_cursor,
+            ... )
+            >>>
+            >>> @collect_stream
+            ... async def stream_users() -> AsyncIterator[List[StrictUser]]:
+            ...    q = "select * from users order by id"
+            ...    async with get_connection() as cur:
+            ...        async with server_side_cursor(cur, q) as batches:
+            ...            async for rows in batches:
+            ...                yield rows
+
+    Notes:
+        Unlike :func:`.collect_response`, empty result does not raise
+        :class:`.EmptyResult`: the stream just yields nothing.
+
+        The whole stream is traced as one call of the method. Queries are
+        timed only while the next batch is fetched, so queries of the
+        consumer between batches are not attributed to the stream.
 
     Returns:
-        List[`Model`] if List is specified in the type annotations,
-        or a single `Model` if `Model` is specified in the type annotations.
+        Async generator of batches of the model specified in type hints of `fn`.
     """
 
-    r = response.copy()
+    if fn is None:
+        return lambda func: collect_stream(func, trusted=trusted)
 
-    if annotations.replace("typing.", "").startswith("List"):
-        return [await __convert_memory_viewer(item) for item in r]
-    return await __convert_memory_viewer(r)
+    (batch_model,) = get_args(fn.__annotations__["return"])
+    decode = build_decoder(batch_model, trusted=trusted)
+    instrument = QueryInstrument.of(fn.__qualname__)
 
+    @wraps(fn)
+    @handle_stream_exception
+    async def inner(
+        *args: object,
+        **kwargs: object,
+    ) -> AsyncIterator[List[Type[Model]]]:
+        """Inner function of :func:`.collect_stream`.
 
-async def __convert_memory_viewer(r: RealDictRow):
-    """Convert memory viewer in bytes.
+        Args:
+            *args:
+                Positional arguments.
+            **kwargs:
+                Keyword arguments.
 
-    Notes:
-        aiopg returns memory viewer in query response,
-        when in database type of cell `bytes`.
+        Returns:
+            Async generator of batches of the annotated model.
+        """
 
-    Returns:
-        `RealDictRow` with converted memory viewer in bytes.
-    """
+        stream = fn(*args, **kwargs)
+        query = instrument.start()
+        error = None
+        try:
+            while True:
+                with query.activate():
+                    try:
+                        rows = await stream.__anext__()
+                    except StopAsyncIteration:
+                        break
+                query.rows += len(rows)
+                with query.phase("decode"):
+                    batch = decode(rows)
+                yield batch
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            try:
+                with query.activate():
+                    await stream.aclose()
+            finally:
+                query.finish(error)
 
-    for key, value in r.items():
-        if isinstance(value, memoryview):
-            r[key] = value.tobytes()
-    return r
+    return inner
@@ -0,0 +1,178 @@
+"""Decoders of aiopg rows into pydantic models.
+
+Decoders are built once per return annotation of repository method, so nothing
+is resolved on the hot path.
+"""
+
+import datetime
+from functools import lru_cache
+from typing import Any, Callable, List, Optional, get_args, get_origin
+
+import pydantic
+from psycopg2.extras import RealDictRow  # type: ignore
+from pydantic.fields import SHAPE_SINGLETON, ModelField
+from pydantic.types import SecretBytes, SecretStr
+
+from app.pkg.models.base import Model
+
+__all__ = ["build_decoder", "Decoder"]
+
+#: Callable[[Any], Any]: Convert response of an aiopg query to annotated type.
+Decoder = Callable[[Any], Any]
+
+#: tuple: Types returned by psycopg2 as is, so a row can be trusted without
+#: validation.
+__trusted_types__ = (bool, int, float, str, datetime.date, datetime.datetime)
+
+
+@lru_cache(maxsize=None)
+def build_decoder(annotation: Any, trusted: bool = False) -> Decoder:
+    """Build decoder for the return annotation of repository method.
+
+    Args:
+        annotation:
+            Return annotation, ``Model`` or ``List[Model]``.
+        trusted:
+            If ``True`` and all fields of the model are of types that psycopg2
+            returns as is, rows are passed to ``Model.construct`` without
+            validation. Otherwise, rows are validated.
+
+    Examples:
+        ::
+
+            >>> from typing import List
+            >>> from app.pkg import models
+            >>> decode = build_decoder(List[models.Country], trusted=True)
+            >>> decode([{"id": 1, "name": "Russia", "code": "RUS"}])
+            [Country(name='Russia', code='RUS', id=1)]
+
+    Notes:
+        In trusted mode rows must contain exactly the columns of the model:
+        ``construct`` does not drop extra keys and does not coerce values.
+
+    Returns:
+        Decoder, that accepts a single row or a list of rows.
+    """
+
+    if get_origin(annotation) in (list, List):
+        (model,) = get_args(annotation)
+        decode_row = __build_row_decoder(model=model, trusted=trusted)
+        if decode_row is None:
+            return __build_fallback_decoder(annotation)
+
+        def decode_rows(rows: List[RealDictRow]) -> List[Model]:
+            return [decode_row(row) for row in rows]
+
+        return decode_rows
+
+    decode_row = __build_row_decoder(model=annotation, trusted=trusted)
+    if decode_row is None:
+        return __build_fallback_decoder(annotation)
+    return decode_row
+
+
+def __build_row_decoder(model: Any, trusted: bool) -> Optional[Decoder]:
+    """Build decoder of a single row.
+
+    Args:
+        model: Annotated model.
+        trusted: Use ``construct`` when possible.
+
+    Returns:
+        Decoder of a single row or ``None``, if annotation is not a pydantic
+        model.
+    """
+
+    if not isinstance(model, type) or not issubclass(model, pydantic.BaseModel):
+        return None
+
+    fields = model.__fields__.values()
+    if trusted and __is_trusted(fields):
+
+        def build(row: RealDictRow) -> Model:
+            return model.construct(**row)
+
+    else:
+        build = model.parse_obj
+
+    if not any(__is_bytes(field) for field in fields):
+        return build
+
+    def decode_row(row: RealDictRow) -> Model:
+        return build(__convert_memory_viewer(row))
+
+    return decode_row
+
+
+def __build_fallback_decoder(annotation: Any) -> Decoder:
+    """Build decoder for annotations that are not a model or a list of models.
+
+    Args:
+        annotation: Return annotation.
+
+    Returns:
+        Decoder, that validates response with :func:`pydantic.parse_obj_as`.
+    """
+
+    def decode(response: Any) -> Any:
+        if isinstance(response, list):
+            response = [__convert_memory_viewer(row) for row in response]
+        elif isinstance(response, dict):
+            response = __convert_memory_viewer(response)
+        return pydantic.parse_obj_as(annotation, response)
+
+    return decode
+
+
+def __is_trusted(fields: List[ModelField]) -> bool:
+    """Check that values of all fields are stored in the model as returned by
+    psycopg2.
+
+    Args:
+        fields: Fields of the model.
+
+    Returns:
+        ``True`` if model can be built with ``construct``.
+    """
+
+    return all(
+        field.shape == SHAPE_SINGLETON
+        and not field.sub_fields
+        and isinstance(field.type_, type)
+        and issubclass(field.type_, __trusted_types__)
+        and not issubclass(field.type_, (SecretStr, SecretBytes))
+        for field in fields
+    )
+
+
+def __is_bytes(field: ModelField) -> bool:
+    """Check that field may contain value of ``bytea`` column.
+
+    Args:
+        field: Field of the model.
+
+    Returns:
+        ``True`` if memory viewers must be converted before decoding.
+    """
+
+    return not isinstance(field.type_, type) or issubclass(
+        field.type_,
+        (bytes, SecretBytes),
+    )
+
+
+def __convert_memory_viewer(r: RealDictRow) -> RealDictRow:
+    """Convert memory viewer in bytes.
+
+    Notes:
+        aiopg returns memory viewer in query response,
+        when in database type of cell `bytes`.
+
+    Returns:
+        `RealDictRow` with converted memory viewer in bytes.
+    """
+
+    for key, value in r.items():
+        if isinstance(value, memoryview):
+            r[key] = value.tobytes()
+    return r
@@ -1,14 +1,14 @@
 """Handle Postgresql Query Exceptions."""
 
-from typing import Callable
+from typing import AsyncIterator, Callable, Type, Union
 
 import psycopg2
 
-from app.pkg.models.base import Model
+from app.pkg.models.base import BaseAPIException, Model
 from app.pkg.models.exceptions.association import __aiopg__, __constrains__
 from app.pkg.models.exceptions.repository import DriverError
 
-__all__ = ["handle_exception"]
+__all__ = ["handle_exception", "handle_stream_exception"]
 
 
 def handle_exception(func: Callable[..., Model]):
@@ -64,12 +64,72 @@ def handle_exception(func: Callable[..., Model]):
         try:
             return await func(*args, **kwargs)
         except psycopg2.Error as error:
-            if exc := __constrains__.get(error.diag.constraint_name):
-                raise exc from error
+            raise __convert_exception(error) from error
 
-            if exc := __aiopg__.get(error.pgcode):
-                raise exc from error
+    return wrapper
+
+
+def handle_stream_exception(func: Callable[..., AsyncIterator[Model]]):
+    """Decorator Catching Postgresql Query Exceptions of async generators.
+
+    Same as :func:`.handle_exception`, but for functions that yield results,
+    like streaming methods of repositories.
+
+    Args:
+        func:
+            async generator function object.
+
+    Returns:
+        Async generator yielding the results of ``func``.
+
+    Raises:
+        UniqueViolation: The query violates the domain uniqueness constraints
+            of the database set.
+        DriverError: Any error during execution query on a database.
+    """
+
+    async def wrapper(*args: object, **kwargs: object) -> AsyncIterator[Model]:
+        """Inner function. Catching Postgresql Query Exceptions.
+
+        Args:
+            *args:
+                Positional arguments.
+            **kwargs:
+                Keyword arguments.
+
+        Returns:
+            Async generator yielding the results of ``func``.
+        """
 
-            raise DriverError(details=error.diag.message_detail) from error
+        stream = func(*args, **kwargs)
+        try:
+            async for item in stream:
+                yield item
+        except psycopg2.Error as error:
+            raise __convert_exception(error) from error
+        finally:
+            await stream.aclose()
 
     return wrapper
+
+
+def __convert_exception(
+    error: psycopg2.Error,
+) -> Union[Type[BaseAPIException], BaseAPIException]:
+    """Convert psycopg2 error to the API exception.
+
+    Args:
+        error: Error raised by the driver.
+
+    Returns:
+        Exception registered for the violated constraint, for the error code or
+        :class:`.DriverError`.
+    """
+
+    if exc := __constrains__.get(error.diag.constraint_name):
+        return exc
+
+    if exc := __aiopg__.get(error.pgcode):
+        return exc
+
+    return DriverError(details=error.diag.message_detail)
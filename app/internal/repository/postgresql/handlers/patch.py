@@ -0,0 +1,57 @@
+"""Build queries of sparse updates."""
+
+from functools import lru_cache
+from typing import Any, Mapping, Tuple
+
+__all__ = ["patch_query"]
+
+
+def patch_query(
+    table: str,
+    values: Mapping[str, Any],
+    returning: str,
+    key: str = "id",
+) -> str:
+    """Build update query, that sets only the given columns.
+
+    Text of the query is built once per table and set of columns, so the
+    number of distinct queries is bounded by fields of the command model.
+
+    Args:
+        table: Name of the table.
+        values: Values of set fields, see :meth:`.BasePatchModel.to_patch`.
+            Must contain ``key``.
+        returning: Returned columns.
+        key: Column, that identifies the row.
+
+    Examples:
+        ::
+
+            >>> patch_query("cities", {"id": 1, "code": "MSK"}, "id, name, code")
+            'update cities set code = %(code)s where id = %(id)s returning id, name, code'
+
+    Notes:
+        If no columns are set, the query only reads the row, so nothing is
+        written.
+
+    Returns:
+        Query with named parameters of ``values``.
+    """
+
+    return __build(
+        table,
+        tuple(column for column in values if column != key),
+        returning,
+        key,
+    )
+
+
+@lru_cache(maxsize=None)
+def __build(table: str, columns: Tuple[str, ...], returning: str, key: str) -> str:
+    if not columns:
+        return f"select {returning} from {table} where {key} = %({key})s"
+    assignments = ", ".join(f"{column} = %({column})s" for column in columns)
+    return (
+        f"update {table} set {assignments} "
+        f"where {key} = %({key})s returning {returning}"
+    )
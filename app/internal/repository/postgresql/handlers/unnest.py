@@ -0,0 +1,49 @@
+"""Build parameters of multi-row queries."""
+
+from typing import Any, Dict, List, Sequence
+
+from app.pkg.models.base import Model
+
+__all__ = ["unnest_params"]
+
+
+def unnest_params(cmds: Sequence[Model], show_secrets: bool = False) -> Dict[str, List]:
+    """Transpose commands into one array per column.
+
+    psycopg2 adapts lists to postgresql arrays, so the batch is sent as one
+    parameter per column and expanded back into rows with ``unnest``. The text
+    of the query does not depend on the size of the batch, so it is prepared
+    once.
+
+    Args:
+        cmds: Non-empty sequence of commands.
+        show_secrets: Reveal secret values. See :meth:`.BaseModel.to_dict`.
+
+    Examples:
+        ::
+
+            >>> from app.pkg import models
+            >>> unnest_params([
+            ...     models.CreateCountryCommand(name="Russia", code="RUS"),
+            ...     models.CreateCountryCommand(name="Belarus", code="BLR"),
+            ... ])
+            {'name': ['Russia', 'Belarus'], 'code': ['RUS', 'BLR']}
+
+            Then use them in query::
+
+            >>> q = \"""
+            ...     insert into countries(name, code)
+            ...     select * from unnest(%(name)s::text[], %(code)s::text[])
+            ...     returning id, name, code
+            ... \"""
+
+    Returns:
+        Mapping of column name to list of values in order of ``cmds``.
+    """
+
+    rows = [cmd.to_dict(show_secrets=show_secrets) for cmd in cmds]
+    params: Dict[str, List[Any]] = {key: [] for key in rows[0]}
+    for row in rows:
+        for key, column in params.items():
+            column.append(row[key])
+    return params
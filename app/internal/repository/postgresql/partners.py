@@ -1,12 +1,20 @@
 """Repository for partners."""
-from typing import List
+from typing import AsyncIterator, List, Optional
 
-from app.internal.repository.postgresql.connection import get_connection
+from app.internal.repository.postgresql.connection import (
+    get_connection,
+    server_side_cursor,
+)
 from app.internal.repository.postgresql.handlers.collect_response import (
     collect_response,
+    collect_stream,
 )
+from app.internal.repository.postgresql.handlers.patch import patch_query
+from app.internal.repository.postgresql.handlers.unnest import unnest_params
 from app.internal.repository.repository import Repository
 from app.pkg import models
+from app.pkg.cache import TokenIndex, index_evict, index_lookup, index_store
+from app.pkg.connectors.postgresql.routing import read_from_primary
 
 __all__ = ["PartnerRepository"]
 
@@ -14,6 +22,13 @@ __all__ = ["PartnerRepository"]
 class PartnerRepository(Repository):
     """Repository for partners."""
 
+    #: Optional[TokenIndex]: Index of entities by token.
+    token_index: Optional[TokenIndex]
+
+    def __init__(self, token_index: Optional[TokenIndex] = None):
+        self.token_index = token_index
+
+    @index_store
     @collect_response
     async def create(self, cmd: models.CreatePartnerCommand) -> models.Partner:
         q = """
@@ -30,7 +45,78 @@ class PartnerRepository(Repository):
             await cur.execute(q, cmd.to_dict())
             return await cur.fetchone()
 
+    @index_store
     @collect_response
+    async def create_many(
+        self,
+        cmds: List[models.CreatePartnerCommand],
+    ) -> List[models.Partner]:
+        q = """
+            with cmds as (
+                select * from unnest(%(name)s::text[], %(token)s::text[])
+                with ordinality as cmds(name, token, ord)
+            ), created as (
+                insert into partners(
+                    name, token
+                )
+                select name, token from cmds order by ord
+                returning id, name, token
+            )
+            select
+                created.id, created.name, created.token
+            from created join cmds using (name)
+            order by cmds.ord
+        """
+        async with get_connection() as cur:
+            await cur.execute(q, unnest_params(cmds))
+            return await cur.fetchall()
+
+    @index_evict
+    @collect_response
+    async def upsert(self, cmd: models.CreatePartnerCommand) -> models.PartnerUpsert:
+        q = """
+            insert into partners(
+                name, token
+            ) values (%(name)s, %(token)s)
+            on conflict (name) do update
+            set
+                name = excluded.name
+            returning id, name, token, (xmax = 0) as created
+        """
+        async with get_connection() as cur:
+            await cur.execute(q, cmd.to_dict())
+            return await cur.fetchone()
+
+    @index_evict
+    @collect_response
+    async def upsert_many(
+        self,
+        cmds: List[models.CreatePartnerCommand],
+    ) -> List[models.PartnerUpsert]:
+        q = """
+            with cmds as (
+                select * from unnest(%(name)s::text[], %(token)s::text[])
+                with ordinality as cmds(name, token, ord)
+            ), upserted as (
+                insert into partners(
+                    name, token
+                )
+                select name, token from cmds order by ord
+                on conflict (name) do update
+                set
+                    name = excluded.name
+                returning id, name, token, (xmax = 0) as created
+            )
+            select
+                upserted.id, upserted.name, upserted.token, upserted.created
+            from upserted join cmds using (name)
+            order by cmds.ord
+        """
+        async with get_connection() as cur:
+            await cur.execute(q, unnest_params(cmds))
+            return await cur.fetchall()
+
+    @collect_response(trusted=True)
     async def read(self, query: models.ReadPartnerQuery) -> models.Partner:
         q = """
             select
@@ -38,11 +124,27 @@ class PartnerRepository(Repository):
             from partners
             where id = %(id)s
         """
-        async with get_connection() as cur:
+        async with get_connection(read_only=True) as cur:
             await cur.execute(q, query.to_dict())
             return await cur.fetchone()
 
-    @collect_response
+    @collect_response(trusted=True)
+    async def batch_read_all(
+        self,
+        query: models.ReadAllPartnerByIdQuery,
+    ) -> List[models.Partner]:
+        q = """
+            select
+                id, name, token
+            from partners
+            where id = ANY(%(ids)s)
+        """
+        async with get_connection(read_only=True) as cur:
+            await cur.execute(q, query.to_dict())
+            return await cur.fetchall()
+
+    @index_lookup
+    @collect_response(trusted=True)
     async def read_by_token(
         self,
         query: models.ReadPartnerByTokenQuery,
@@ -53,21 +155,47 @@ class PartnerRepository(Repository):
             from partners
             where token = %(token)s
         """
-        async with get_connection() as cur:
-            await cur.execute(q, query.to_dict())
-            return await cur.fetchone()
+        # Token authenticates just created partners, so it is read from the
+        # primary to not miss the fresh rows on a lagging replica.
+        with read_from_primary():
+            async with get_connection(read_only=True) as cur:
+                await cur.execute(q, query.to_dict())
+                return await cur.fetchone()
 
-    @collect_response
-    async def read_all(self) -> List[models.Partner]:
+    @collect_response(trusted=True)
+    async def read_all(
+        self,
+        query: models.PaginationQuery,
+    ) -> List[models.Partner]:
         q = """
             select
                 id, name, token
             from partners
+            where id > %(after_id)s
+            order by id
+            limit %(limit)s
         """
-        async with get_connection() as cur:
-            await cur.execute(q)
+        async with get_connection(read_only=True) as cur:
+            await cur.execute(q, query.to_dict())
             return await cur.fetchall()
 
+    @collect_stream(trusted=True)
+    async def stream_all(
+        self,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[List[models.Partner]]:
+        q = """
+            select
+                id, name, token
+            from partners
+            order by id
+        """
+        async with get_connection(read_only=True) as cur:
+            async with server_side_cursor(cur, q, batch_size=batch_size) as batches:
+                async for rows in batches:
+                    yield rows
+
+    @index_store
     @collect_response
     async def update(self, cmd: models.UpdatePartnerCommand) -> models.Partner:
         q = """
@@ -82,6 +210,16 @@ class PartnerRepository(Repository):
             await cur.execute(q, cmd.to_dict())
             return await cur.fetchone()
 
+    @index_store
+    @collect_response
+    async def patch(self, cmd: models.PatchPartnerCommand) -> models.Partner:
+        values = cmd.to_patch()
+        q = patch_query("partners", values, returning="id, name, token")
+        async with get_connection() as cur:
+            await cur.execute(q, values)
+            return await cur.fetchone()
+
+    @index_evict
     @collect_response
     async def delete(self, cmd: models.DeletePartnerCommand) -> models.Partner:
         q = """
@@ -1,11 +1,17 @@
 """Repository for skill model."""
 
-from typing import List
+from typing import AsyncIterator, List
 
-from app.internal.repository.postgresql.connection import get_connection
+from app.internal.repository.postgresql.connection import (
+    get_connection,
+    server_side_cursor,
+)
 from app.internal.repository.postgresql.handlers.collect_response import (
     collect_response,
+    collect_stream,
 )
+from app.internal.repository.postgresql.handlers.patch import patch_query
+from app.internal.repository.postgresql.handlers.unnest import unnest_params
 from app.internal.repository.repository import Repository
 from app.pkg import models
 
@@ -30,6 +36,74 @@ class SkillRepository(Repository):
             return await cur.fetchone()
 
     @collect_response
+    async def create_many(
+        self,
+        cmds: List[models.CreateSkillCommand],
+    ) -> List[models.Skill]:
+        q = """
+            with cmds as (
+                select * from unnest(%(name)s::text[])
+                with ordinality as cmds(name, ord)
+            ), created as (
+                insert into skills(
+                    name
+                )
+                select name from cmds order by ord
+                returning id, name
+            )
+            select
+                created.id, created.name
+            from created join cmds using (name)
+            order by cmds.ord
+        """
+        async with get_connection() as cur:
+            await cur.execute(q, unnest_params(cmds))
+            return await cur.fetchall()
+
+    @collect_response
+    async def upsert(self, cmd: models.CreateSkillCommand) -> models.SkillUpsert:
+        q = """
+            insert into skills(
+                name
+            ) values (%(name)s)
+            on conflict (name) do update
+            set
+                name = excluded.name
+            returning id, name, (xmax = 0) as created
+        """
+        async with get_connection() as cur:
+            await cur.execute(q, cmd.to_dict())
+            return await cur.fetchone()
+
+    @collect_response
+    async def upsert_many(
+        self,
+        cmds: List[models.CreateSkillCommand],
+    ) -> List[models.SkillUpsert]:
+        q = """
+            with cmds as (
+                select * from unnest(%(name)s::text[])
+                with ordinality as cmds(name, ord)
+            ), upserted as (
+                insert into skills(
+                    name
+                )
+                select name from cmds order by ord
+                on conflict (name) do update
+                set
+                    name = excluded.name
+                returning id, name, (xmax = 0) as created
+            )
+            select
+                upserted.id, upserted.name, upserted.created
+            from upserted join cmds using (name)
+            order by cmds.ord
+        """
+        async with get_connection() as cur:
+            await cur.execute(q, unnest_params(cmds))
+            return await cur.fetchall()
+
+    @collect_response(trusted=True)
     async def read(self, query: models.ReadSkillQuery) -> models.Skill:
         q = """
             select
@@ -37,11 +111,11 @@ class SkillRepository(Repository):
             from skills
             where id = %(id)s
         """
-        async with get_connection() as cur:
+        async with get_connection(read_only=True) as cur:
             await cur.execute(q, query.to_dict())
             return await cur.fetchone()
 
-    @collect_response
+    @collect_response(trusted=True)
     async def batch_read_all(
         self,
         query: models.ReadAllSkillByIdQuery,
@@ -52,21 +126,43 @@ class SkillRepository(Repository):
                 from skills
                 where id = ANY(%(ids)s)
             """
-        async with get_connection() as cur:
+        async with get_connection(read_only=True) as cur:
             await cur.execute(q, query.to_dict())
             return await cur.fetchall()
 
-    @collect_response
-    async def read_all(self) -> List[models.Skill]:
+    @collect_response(trusted=True)
+    async def read_all(
+        self,
+        query: models.PaginationQuery,
+    ) -> List[models.Skill]:
         q = """
             select
                 id, name
             from skills
+            where id > %(after_id)s
+            order by id
+            limit %(limit)s
         """
-        async with get_connection() as cur:
-            await cur.execute(q)
+        async with get_connection(read_only=True) as cur:
+            await cur.execute(q, query.to_dict())
             return await cur.fetchall()
 
+    @collect_stream(trusted=True)
+    async def stream_all(
+        self,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[List[models.Skill]]:
+        q = """
+            select
+                id, name
+            from skills
+            order by id
+        """
+        async with get_connection(read_only=True) as cur:
+            async with server_side_cursor(cur, q, batch_size=batch_size) as batches:
+                async for rows in batches:
+                    yield rows
+
     @collect_response
     async def update(self, cmd: models.UpdateSkillCommand) -> models.Skill:
         q = """
@@ -80,6 +176,14 @@ class SkillRepository(Repository):
             await cur.execute(q, cmd.to_dict())
             return await cur.fetchone()
 
+    @collect_response
+    async def patch(self, cmd: models.PatchSkillCommand) -> models.Skill:
+        values = cmd.to_patch()
+        q = patch_query("skills", values, returning="id, name")
+        async with get_connection() as cur:
+            await cur.execute(q, values)
+            return await cur.fetchone()
+
     @collect_response
     async def delete(self, cmd: models.DeleteSkillCommand) -> models.Skill:
         q = """
@@ -1,11 +1,17 @@
 """Repository for skill levels."""
 
-from typing import List
+from typing import AsyncIterator, List
 
-from app.internal.repository.postgresql.connection import get_connection
+from app.internal.repository.postgresql.connection import (
+    get_connection,
+    server_side_cursor,
+)
 from app.internal.repository.postgresql.handlers.collect_response import (
     collect_response,
+    collect_stream,
 )
+from app.internal.repository.postgresql.handlers.patch import patch_query
+from app.internal.repository.postgresql.handlers.unnest import unnest_params
 from app.internal.repository.repository import Repository
 from app.pkg import models
 
@@ -31,6 +37,76 @@ class SkillLevelRepository(Repository):
             return await cur.fetchone()
 
     @collect_response
+    async def create_many(
+        self,
+        cmds: List[models.CreateSkillLevelCommand],
+    ) -> List[models.SkillLevel]:
+        q = """
+            with cmds as (
+                select * from unnest(%(level)s::int[], %(description)s::text[])
+                with ordinality as cmds(level, description, ord)
+            ), created as (
+                insert into skill_levels(
+                    level, description
+                )
+                select level, description from cmds order by ord
+                returning id, level, description
+            )
+            select
+                created.id, created.level, created.description
+            from created join cmds using (level)
+            order by cmds.ord
+        """
+        async with get_connection() as cur:
+            await cur.execute(q, unnest_params(cmds))
+            return await cur.fetchall()
+
+    @collect_response
+    async def upsert(
+        self, cmd: models.CreateSkillLevelCommand
+    ) -> models.SkillLevelUpsert:
+        q = """
+            insert into skill_levels(
+                level, description
+            ) values (%(level)s, %(description)s)
+            on conflict (level) do update
+            set
+                description = excluded.description
+            returning id, level, description, (xmax = 0) as created
+        """
+        async with get_connection() as cur:
+            await cur.execute(q, cmd.to_dict())
+            return await cur.fetchone()
+
+    @collect_response
+    async def upsert_many(
+        self,
+        cmds: List[models.CreateSkillLevelCommand],
+    ) -> List[models.SkillLevelUpsert]:
+        q = """
+            with cmds as (
+                select * from unnest(%(level)s::int[], %(description)s::text[])
+                with ordinality as cmds(level, description, ord)
+            ), upserted as (
+                insert into skill_levels(
+                    level, description
+                )
+                select level, description from cmds order by ord
+                on conflict (level) do update
+                set
+                    description = excluded.description
+                returning id, level, description, (xmax = 0) as created
+            )
+            select
+                upserted.id, upserted.level, upserted.description, upserted.created
+            from upserted join cmds using (level)
+            order by cmds.ord
+        """
+        async with get_connection() as cur:
+            await cur.execute(q, unnest_params(cmds))
+            return await cur.fetchall()
+
+    @collect_response(trusted=True)
     async def read(self, query: models.ReadSkillLevelQuery) -> models.SkillLevel:
         q = """
             select
@@ -38,21 +114,58 @@ class SkillLevelRepository(Repository):
             from skill_levels
             where id = %(id)s;
         """
-        async with get_connection() as cur:
+        async with get_connection(read_only=True) as cur:
             await cur.execute(q, query.to_dict())
             return await cur.fetchone()
 
-    @collect_response
-    async def read_all(self) -> List[models.SkillLevel]:
+    @collect_response(trusted=True)
+    async def batch_read_all(
+        self,
+        query: models.ReadAllSkillLevelByIdQuery,
+    ) -> List[models.SkillLevel]:
         q = """
             select
                 id, level, description
-            from skill_levels;
+            from skill_levels
+            where id = ANY(%(ids)s)
         """
-        async with get_connection() as cur:
-            await cur.execute(q)
+        async with get_connection(read_only=True) as cur:
+            await cur.execute(q, query.to_dict())
+            return await cur.fetchall()
+
+    @collect_response(trusted=True)
+    async def read_all(
+        self,
+        query: models.PaginationQuery,
+    ) -> List[models.SkillLevel]:
+        q = """
+            select
+                id, level, description
+            from skill_levels
+            where id > %(after_id)s
+            order by id
+            limit %(limit)s
+        """
+        async with get_connection(read_only=True) as cur:
+            await cur.execute(q, query.to_dict())
             return await cur.fetchall()
 
+    @collect_stream(trusted=True)
+    async def stream_all(
+        self,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[List[models.SkillLevel]]:
+        q = """
+            select
+                id, level, description
+            from skill_levels
+            order by id
+        """
+        async with get_connection(read_only=True) as cur:
+            async with server_side_cursor(cur, q, batch_size=batch_size) as batches:
+                async for rows in batches:
+                    yield rows
+
     @collect_response
     async def update(self, cmd: models.UpdateSkillLevelCommand) -> models.SkillLevel:
         q = """
@@ -67,6 +180,14 @@ class SkillLevelRepository(Repository):
             await cur.execute(q, cmd.to_dict())
             return await cur.fetchone()
 
+    @collect_response
+    async def patch(self, cmd: models.PatchSkillLevelCommand) -> models.SkillLevel:
+        values = cmd.to_patch()
+        q = patch_query("skill_levels", values, returning="id, level, description")
+        async with get_connection() as cur:
+            await cur.execute(q, values)
+            return await cur.fetchone()
+
     @collect_response
     async def delete(self, cmd: models.DeleteSkillLevelCommand) -> models.SkillLevel:
         q = """
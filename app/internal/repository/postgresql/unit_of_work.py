@@ -0,0 +1,93 @@
+"""Unit of work: one pooled connection and transaction for several repository
+calls."""
+
+from contextlib import AsyncExitStack, suppress
+from typing import Any, List, Optional
+
+import psycopg2
+
+from app.internal.repository.postgresql.connection import get_connection
+from app.pkg.connectors.postgresql.transaction import (
+    bind_transaction,
+    current_transaction,
+    run_on_commit,
+)
+
+__all__ = ["UnitOfWork"]
+
+
+class UnitOfWork:
+    """Run all repository calls of the block in one transaction on one
+    connection of the primary.
+
+    Connection is acquired on enter and bound to the current context, so
+    :func:`.get_connection` returns the same cursor to every repository
+    method called inside the block. Transaction is committed when the block
+    exits normally and rolled back when it raises.
+
+    Notes:
+        Unit of work entered inside another one joins the outer transaction.
+
+        Failed query aborts the transaction. Calls, which errors are caught
+        by the block, must run inside :func:`.savepoint`, e.g. batch methods
+        retry failed chunks by halves.
+
+        Services of the application do not use unit of work yet. It is
+        provided by ``Services.unit_of_work`` for flows, which must write
+        several rows atomically.
+
+        Tasks started inside the block (e.g. with ``asyncio.gather``) inherit
+        the connection, but must not run queries concurrently, because one
+        connection runs one query at a time.
+
+        Inside the block, single-flight, read-through cache and token index
+        neither serve nor store values, because the values may be not
+        committed yet. Invalidations of read-through cache are deferred until
+        commit, see :func:`.on_commit`.
+
+    Examples:
+        ::
+
+            >>> class ContactsService:
+            ...     unit_of_work: UnitOfWork
+            ...
+            ...     async def update_contacts(self, token, cmd):
+            ...         async with self.unit_of_work:
+            ...             contacts = await self.repository.read(...)
+            ...             return await self.repository.update(...)
+    """
+
+    def __init__(self):
+        self.__stacks: List[Optional[AsyncExitStack]] = []
+
+    @property
+    def cursor(self) -> Any:
+        """Cursor of the transaction of the current context."""
+
+        return current_transaction()
+
+    async def __aenter__(self) -> "UnitOfWork":
+        if current_transaction() is not None:
+            self.__stacks.append(None)
+            return self
+
+        async with AsyncExitStack() as stack:
+            cur = await stack.enter_async_context(get_connection())
+            await cur.execute("begin")
+            stack.enter_context(bind_transaction(cur))
+            self.__stacks.append(stack.pop_all())
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        stack = self.__stacks.pop()
+        if stack is None:
+            return
+
+        async with stack:
+            cur = current_transaction()
+            if exc_type is None:
+                await cur.execute("commit")
+                await run_on_commit()
+            else:
+                with suppress(psycopg2.Error):
+                    await cur.execute("rollback")
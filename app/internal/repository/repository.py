@@ -1,7 +1,7 @@
 """Abstract repository interface."""
 
 from abc import ABC
-from typing import List, TypeVar
+from typing import AsyncIterator, List, TypeVar
 
 from app.pkg.models.base import Model
 
@@ -23,6 +23,7 @@ class Repository(ABC):
         ...     DeleteUserCommand,
         ...     ReadUserByIdQuery,
         ... )
+        >>> from app.pkg.models import PaginationQuery
         >>> class UserRepository(Repository):
         ...     async def create(self, cmd: CreateUserCommand) -> StrictUser:
         ...         ...
@@ -30,7 +31,10 @@ class Repository(ABC):
         ...     async def read(self, query: ReadUserByIdQuery) -> StrictUser:
         ...         ...
         ...
-        ...     async def read_all(self) -> List[StrictUser]:
+        ...     async def read_all(
+        ...         self,
+        ...         query: PaginationQuery,
+        ...     ) -> List[StrictUser]:
         ...         ...
         ...
         ...     async def update(self, cmd: UpdateUserCommand) -> StrictUser:
@@ -65,6 +69,54 @@ class Repository(ABC):
         """
         raise NotImplementedError
 
+    async def create_many(self, cmds: List[Model]) -> List[Model]:
+        """Create models with one query.
+
+        Args:
+            cmds (List[Model]): Non-empty list of commands for create models.
+
+        Notes: Batch is atomic: if any row violates a constraint, no rows are
+            created and the exception of the violated constraint is raised.
+
+        Returns:
+            List of the parent models in order of ``cmds``.
+        """
+
+        raise NotImplementedError
+
+    async def upsert(self, cmd: Model) -> Model:
+        """Create model or update existing model with the same natural key.
+
+        Args:
+            cmd (Model): Specific command for create model.
+
+        Notes: Must be one ``insert ... on conflict (...) do update`` query on
+            the unique natural key of the table, e.g. ``code`` of countries.
+            Returned model has ``created`` field, which is ``False`` if the
+            existing row was updated.
+
+        Returns:
+            Type of the parent model with ``created`` field.
+        """
+
+        raise NotImplementedError
+
+    async def upsert_many(self, cmds: List[Model]) -> List[Model]:
+        """Create or update models with one query.
+
+        Args:
+            cmds (List[Model]): Non-empty list of commands for create models.
+
+        Notes: Batch is atomic, like :meth:`.create_many`. Commands with the
+            same natural key in one batch raise :class:`.RepeatedKey`.
+
+        Returns:
+            List of the parent models with ``created`` field in order of
+            ``cmds``.
+        """
+
+        raise NotImplementedError
+
     async def read(self, query: Model) -> Model:
         """Read model.
 
@@ -78,10 +130,52 @@ class Repository(ABC):
 
         raise NotImplementedError
 
-    async def read_all(self) -> List[Model]:
-        """Read all rows."""
+    async def batch_read_all(self, query: Model) -> List[Model]:
+        """Read models by list of ids with one query.
+
+        Args:
+            query (Model): Query with ``ids`` field.
+
+        Notes: Missing ids are skipped, order of rows is not defined.
+
+        Returns:
+            List of the parent models.
+        """
+
+        raise NotImplementedError
+
+    async def read_all(self, query: Model) -> List[Model]:
+        """Read one page of rows using keyset pagination.
+
+        Args:
+            query (Model): Pagination query. Must contain ``limit`` and
+                ``after_id`` fields.
+
+        Notes: Rows must be ordered by ``id`` and filtered with
+            ``id > after_id``, so the cost of the query does not depend on
+            page number.
+
+        Returns:
+            List of the parent models, at most ``limit`` rows.
+        """
+
+        raise NotImplementedError
+
+    async def stream_all(self, batch_size: int = 1000) -> AsyncIterator[List[Model]]:
+        """Stream all rows ordered by ``id`` in batches.
+
+        Args:
+            batch_size (int): Number of rows in one batch.
+
+        Notes: Implementation must be an async generator and must not hold more
+            than one batch in memory.
+
+        Returns:
+            Async iterator of batches of the parent models.
+        """
 
         raise NotImplementedError
+        yield  # pragma: no cover
 
     async def update(self, cmd: Model) -> Model:
         """Update model.
@@ -95,6 +189,23 @@ class Repository(ABC):
 
         raise NotImplementedError
 
+    async def patch(self, cmd: Model) -> Model:
+        """Update only fields, that are set in the command.
+
+        Args:
+            cmd (Model): Sparse command inherited from ``BasePatchModel``. Must
+                contain id of the model for update.
+
+        Notes: Only set fields become ``SET`` clauses (see
+            :func:`.patch_query`), so other columns and their indexes are not
+            rewritten. Command without set fields only reads the row.
+
+        Returns:
+            Type of the parent model.
+        """
+
+        raise NotImplementedError
+
     async def delete(self, cmd: Model) -> Model:
         """Delete model.
 
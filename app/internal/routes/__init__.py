@@ -11,6 +11,7 @@ Examples:
 
 from fastapi import APIRouter
 
+from app.internal.pkg.responses.fast_json import FastJSONRoute
 from app.pkg.models.core.routes import Routes
 from app.pkg.models.exceptions import (
     city,
@@ -35,6 +36,7 @@ __all__ = [
 city_router = APIRouter(
     prefix="/country/city",
     tags=["City"],
+    route_class=FastJSONRoute,
     responses={
         **city.CityNotFound.generate_openapi(),
         **city.NoCityFoundForCountry.generate_openapi(),
@@ -47,6 +49,7 @@ city_router = APIRouter(
 contacts_router = APIRouter(
     prefix="/users/contacts",
     tags=["Contacts"],
+    route_class=FastJSONRoute,
     responses={
         **contacts.ContactsNotFound.generate_openapi(),
     },
@@ -56,6 +59,7 @@ contacts_router = APIRouter(
 country_router = APIRouter(
     prefix="/country",
     tags=["Country"],
+    route_class=FastJSONRoute,
     responses={
         **country.CountryNameAlreadyExists.generate_openapi(),
         **country.CountryCodeAlreadyExists.generate_openapi(),
@@ -66,6 +70,7 @@ country_router = APIRouter(
 direction_router = APIRouter(
     prefix="/skills/direction",
     tags=["Direction"],
+    route_class=FastJSONRoute,
     responses={
         **direction.DirectionNameAlreadyExists.generate_openapi(),
         **direction.DirectionNotFound.generate_openapi(),
@@ -76,6 +81,7 @@ direction_router = APIRouter(
 skill_router = APIRouter(
     prefix="/skills",
     tags=["Skills"],
+    route_class=FastJSONRoute,
     responses={
         **skill.SkillNameAlreadyExists.generate_openapi(),
         **skill.SkillNotFound.generate_openapi(),
@@ -86,6 +92,7 @@ skill_router = APIRouter(
 skill_levels_router = APIRouter(
     prefix="/skills/levels",
     tags=["Skill levels"],
+    route_class=FastJSONRoute,
     responses={
         **skill_levels.SkillLevelAlreadyExists.generate_openapi(),
     },
@@ -94,6 +101,7 @@ skill_levels_router = APIRouter(
 partners_router = APIRouter(
     prefix="/partners",
     tags=["Partner"],
+    route_class=FastJSONRoute,
     responses={
         **partners.PartnerNotFound.generate_openapi(),
     },
@@ -4,29 +4,46 @@
 from typing import List
 
 from dependency_injector.wiring import Provide, inject
-from fastapi import Depends, status
+from fastapi import Body, Depends, status
 
+from app.internal.pkg.middlewares.pagination import pagination_query
 from app.internal.pkg.middlewares.token_based_verification import (
     token_based_verification,
 )
+from app.internal.pkg.responses.ndjson import NDJSONResponse
 from app.internal.routes import city_router
 from app.internal.services import Services
 from app.internal.services.city import CityService
 from app.pkg import models
 
 
+@city_router.get(
+    "/export/",
+    response_class=NDJSONResponse,
+    status_code=status.HTTP_200_OK,
+    description="Export all city ordered by id as newline delimited JSON",
+    dependencies=[Depends(token_based_verification)],
+)
+@inject
+async def export_cities(
+    city_service: CityService = Depends(Provide[Services.city_service]),
+):
+    return NDJSONResponse(content=city_service.stream_all_cities())
+
+
 @city_router.get(
     "/",
-    response_model=List[models.City],
+    response_model=models.Page[models.City],
     status_code=status.HTTP_200_OK,
-    description="Get all city",
+    description="Get page of city ordered by id",
     dependencies=[Depends(token_based_verification)],
 )
 @inject
 async def read_all_city(
+    query: models.PaginationQuery = Depends(pagination_query),
     city_service: CityService = Depends(Provide[Services.city_service]),
 ):
-    return await city_service.read_all_cities()
+    return await city_service.read_all_cities(query=query)
 
 
 @city_router.get(
@@ -60,6 +77,59 @@ async def create_city(
     return await city_service.create_city(cmd=cmd)
 
 
+@city_router.post(
+    "/batch/",
+    response_model=List[models.BatchItem[models.City]],
+    status_code=status.HTTP_200_OK,
+    description="Create cities in batch with per-item errors",
+    dependencies=[Depends(token_based_verification)],
+)
+@inject
+async def create_many_cities(
+    cmds: List[models.CreateCityCommand] = Body(
+        ...,
+        min_items=1,
+        max_items=models.BatchFields.max_items,
+    ),
+    city_service: CityService = Depends(Provide[Services.city_service]),
+):
+    return await city_service.create_many_cities(cmds=cmds)
+
+
+@city_router.post(
+    "/upsert/",
+    response_model=models.CityUpsert,
+    status_code=status.HTTP_200_OK,
+    description="Create or update city by natural key",
+    dependencies=[Depends(token_based_verification)],
+)
+@inject
+async def upsert_city(
+    cmd: models.CreateCityCommand,
+    city_service: CityService = Depends(Provide[Services.city_service]),
+):
+    return await city_service.upsert_city(cmd=cmd)
+
+
+@city_router.post(
+    "/upsert/batch/",
+    response_model=List[models.BatchItem[models.CityUpsert]],
+    status_code=status.HTTP_200_OK,
+    description="Create or update cities in batch with per-item errors",
+    dependencies=[Depends(token_based_verification)],
+)
+@inject
+async def upsert_many_cities(
+    cmds: List[models.CreateCityCommand] = Body(
+        ...,
+        min_items=1,
+        max_items=models.BatchFields.max_items,
+    ),
+    city_service: CityService = Depends(Provide[Services.city_service]),
+):
+    return await city_service.upsert_many_cities(cmds=cmds)
+
+
 @city_router.put(
     "/",
     response_model=models.City,
@@ -75,6 +145,21 @@ async def update_city(
     return await city_service.update_city(cmd=cmd)
 
 
+@city_router.patch(
+    "/",
+    response_model=models.City,
+    status_code=status.HTTP_200_OK,
+    description="Update fields of city, that are set in the body",
+    dependencies=[Depends(token_based_verification)],
+)
+@inject
+async def patch_city(
+    cmd: models.PatchCityCommand,
+    city_service: CityService = Depends(Provide[Services.city_service]),
+):
+    return await city_service.patch_city(cmd=cmd)
+
+
 @city_router.delete(
     "/{city_id:int}/",
     response_model=models.City,
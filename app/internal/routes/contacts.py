@@ -3,12 +3,14 @@
 from typing import List
 
 from dependency_injector.wiring import Provide, inject
-from fastapi import Depends, status
+from fastapi import Body, Depends, status
 from pydantic.types import SecretStr
 
+from app.internal.pkg.middlewares.pagination import pagination_query
 from app.internal.pkg.middlewares.token_based_verification import (
     token_based_verification,
 )
+from app.internal.pkg.responses.ndjson import NDJSONResponse
 from app.internal.routes import contacts_router
 from app.internal.services import Services
 from app.internal.services.contacts import ContactsService
@@ -16,19 +18,37 @@ from app.pkg import models
 from app.pkg.models.exceptions import contacts
 
 
+@contacts_router.get(
+    "/export/",
+    response_class=NDJSONResponse,
+    status_code=status.HTTP_200_OK,
+    description="Export all contacts ordered by id as newline delimited JSON",
+    dependencies=[Depends(token_based_verification)],
+)
+@inject
+async def export_contacts(
+    contacts_service: ContactsService = Depends(Provide[Services.contacts_service]),
+):
+    return NDJSONResponse(
+        content=contacts_service.stream_all_contacts(),
+        exclude={"token", "telegram_user_id"},
+    )
+
+
 @contacts_router.get(
     "/",
-    response_model=List[models.Contacts],
-    response_model_exclude={"token", "telegram_user_id"},
+    response_model=models.Page[models.Contacts],
+    response_model_exclude={"items": {"__all__": {"token", "telegram_user_id"}}},
     status_code=status.HTTP_200_OK,
-    description="Get all contacts",
+    description="Get page of contacts ordered by id",
     dependencies=[Depends(token_based_verification)],
 )
 @inject
 async def read_all_contacts(
+    query: models.PaginationQuery = Depends(pagination_query),
     contacts_service: ContactsService = Depends(Provide[Services.contacts_service]),
 ):
-    return await contacts_service.read_all_contacts()
+    return await contacts_service.read_all_contacts(query=query)
 
 
 @contacts_router.get(
@@ -91,6 +111,69 @@ async def create_contacts(
     return await contacts_service.create_contacts(cmd=cmd)
 
 
+@contacts_router.post(
+    "/batch/",
+    response_model=List[models.BatchItem[models.Contacts]],
+    response_model_exclude={"item": {"token", "telegram_user_id"}},
+    status_code=status.HTTP_200_OK,
+    description="Create contacts in batch with per-item errors",
+    dependencies=[Depends(token_based_verification)],
+)
+@inject
+async def create_many_contacts(
+    cmds: List[models.CreateContactsCommand] = Body(
+        ...,
+        min_items=1,
+        max_items=models.BatchFields.max_items,
+    ),
+    contacts_service: ContactsService = Depends(Provide[Services.contacts_service]),
+):
+    return await contacts_service.create_many_contacts(cmds=cmds)
+
+
+@contacts_router.post(
+    "/upsert/",
+    response_model=models.ContactsUpsert,
+    response_model_exclude={"token", "telegram_user_id"},
+    status_code=status.HTTP_200_OK,
+    description="Create or update contacts by natural key",
+    dependencies=[Depends(token_based_verification)],
+    responses={
+        **contacts.ContactsNotFound.generate_openapi(),
+        **contacts.TelegramIdAlreadyExists.generate_openapi(),
+        **contacts.TelegramUsernameAlreadyExists.generate_openapi(),
+        **contacts.TokenAlreadyExists.generate_openapi(),
+        **contacts.EmailAlreadyExists.generate_openapi(),
+    },
+)
+@inject
+async def upsert_contacts(
+    cmd: models.CreateContactsCommand,
+    contacts_service: ContactsService = Depends(Provide[Services.contacts_service]),
+):
+    return await contacts_service.upsert_contacts(cmd=cmd)
+
+
+@contacts_router.post(
+    "/upsert/batch/",
+    response_model=List[models.BatchItem[models.ContactsUpsert]],
+    response_model_exclude={"item": {"token", "telegram_user_id"}},
+    status_code=status.HTTP_200_OK,
+    description="Create or update contacts in batch with per-item errors",
+    dependencies=[Depends(token_based_verification)],
+)
+@inject
+async def upsert_many_contacts(
+    cmds: List[models.CreateContactsCommand] = Body(
+        ...,
+        min_items=1,
+        max_items=models.BatchFields.max_items,
+    ),
+    contacts_service: ContactsService = Depends(Provide[Services.contacts_service]),
+):
+    return await contacts_service.upsert_many_contacts(cmds=cmds)
+
+
 @contacts_router.put(
     "/{token:str}",
     response_model=models.Contacts,
@@ -3,28 +3,44 @@
 from typing import List
 
 from dependency_injector.wiring import Provide, inject
-from fastapi import Depends, status
+from fastapi import Body, Depends, status
 
+from app.internal.pkg.middlewares.pagination import pagination_query
 from app.internal.pkg.middlewares.token_based_verification import (
     token_based_verification,
 )
+from app.internal.pkg.responses.ndjson import NDJSONResponse
 from app.internal.routes import country_router
 from app.internal.services import Services
 from app.internal.services.country import CountryService
 from app.pkg import models
 
 
+@country_router.get(
+    "/export/",
+    response_class=NDJSONResponse,
+    status_code=status.HTTP_200_OK,
+    description="Export all country ordered by id as newline delimited JSON",
+)
+@inject
+async def export_countries(
+    country_service: CountryService = Depends(Provide[Services.country_service]),
+):
+    return NDJSONResponse(content=country_service.stream_all_countries())
+
+
 @country_router.get(
     "/",
-    response_model=List[models.Country],
+    response_model=models.Page[models.Country],
     status_code=status.HTTP_200_OK,
-    description="Get all country",
+    description="Get page of country ordered by id",
 )
 @inject
 async def read_all_country(
+    query: models.PaginationQuery = Depends(pagination_query),
     country_service: CountryService = Depends(Provide[Services.country_service]),
 ):
-    return await country_service.read_all_countries()
+    return await country_service.read_all_countries(query=query)
 
 
 @country_router.get(
@@ -59,6 +75,59 @@ async def create_country(
     return await country_service.create_country(cmd=cmd)
 
 
+@country_router.post(
+    "/batch/",
+    response_model=List[models.BatchItem[models.Country]],
+    status_code=status.HTTP_200_OK,
+    description="Create countries in batch with per-item errors",
+    dependencies=[Depends(token_based_verification)],
+)
+@inject
+async def create_many_countries(
+    cmds: List[models.CreateCountryCommand] = Body(
+        ...,
+        min_items=1,
+        max_items=models.BatchFields.max_items,
+    ),
+    country_service: CountryService = Depends(Provide[Services.country_service]),
+):
+    return await country_service.create_many_countries(cmds=cmds)
+
+
+@country_router.post(
+    "/upsert/",
+    response_model=models.CountryUpsert,
+    status_code=status.HTTP_200_OK,
+    description="Create or update country by natural key",
+    dependencies=[Depends(token_based_verification)],
+)
+@inject
+async def upsert_country(
+    cmd: models.CreateCountryCommand,
+    country_service: CountryService = Depends(Provide[Services.country_service]),
+):
+    return await country_service.upsert_country(cmd=cmd)
+
+
+@country_router.post(
+    "/upsert/batch/",
+    response_model=List[models.BatchItem[models.CountryUpsert]],
+    status_code=status.HTTP_200_OK,
+    description="Create or update countries in batch with per-item errors",
+    dependencies=[Depends(token_based_verification)],
+)
+@inject
+async def upsert_many_countries(
+    cmds: List[models.CreateCountryCommand] = Body(
+        ...,
+        min_items=1,
+        max_items=models.BatchFields.max_items,
+    ),
+    country_service: CountryService = Depends(Provide[Services.country_service]),
+):
+    return await country_service.upsert_many_countries(cmds=cmds)
+
+
 @country_router.put(
     "/",
     response_model=models.Country,
@@ -74,6 +143,21 @@ async def update_country(
     return await country_service.update_country(cmd=cmd)
 
 
+@country_router.patch(
+    "/",
+    response_model=models.Country,
+    status_code=status.HTTP_200_OK,
+    description="Update fields of country, that are set in the body",
+    dependencies=[Depends(token_based_verification)],
+)
+@inject
+async def patch_country(
+    cmd: models.PatchCountryCommand,
+    country_service: CountryService = Depends(Provide[Services.country_service]),
+):
+    return await country_service.patch_country(cmd=cmd)
+
+
 @country_router.delete(
     "/{country_id:int}/",
     status_code=status.HTTP_204_NO_CONTENT,
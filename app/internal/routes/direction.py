@@ -3,28 +3,44 @@
 from typing import List
 
 from dependency_injector.wiring import Provide, inject
-from fastapi import Depends, status
+from fastapi import Body, Depends, status
 
+from app.internal.pkg.middlewares.pagination import pagination_query
 from app.internal.pkg.middlewares.token_based_verification import (
     token_based_verification,
 )
+from app.internal.pkg.responses.ndjson import NDJSONResponse
 from app.internal.routes import direction_router
 from app.internal.services import Services
 from app.internal.services.direction import DirectionService
 from app.pkg import models
 
 
+@direction_router.get(
+    "/export/",
+    response_class=NDJSONResponse,
+    status_code=status.HTTP_200_OK,
+    description="Export all directions ordered by id as newline delimited JSON",
+)
+@inject
+async def export_directions(
+    direction_service: DirectionService = Depends(Provide[Services.direction_service]),
+):
+    return NDJSONResponse(content=direction_service.stream_all_directions())
+
+
 @direction_router.get(
     "/",
-    response_model=List[models.Direction],
+    response_model=models.Page[models.Direction],
     status_code=status.HTTP_200_OK,
-    description="Get all directions",
+    description="Get page of directions ordered by id",
 )
 @inject
 async def read_all_directions(
+    query: models.PaginationQuery = Depends(pagination_query),
     direction_service: DirectionService = Depends(Provide[Services.direction_service]),
 ):
-    return await direction_service.read_all_directions()
+    return await direction_service.read_all_directions(query=query)
 
 
 @direction_router.get(
@@ -59,6 +75,59 @@ async def create_direction(
     return await direction_service.create_direction(cmd=cmd)
 
 
+@direction_router.post(
+    "/batch/",
+    response_model=List[models.BatchItem[models.Direction]],
+    status_code=status.HTTP_200_OK,
+    description="Create directions in batch with per-item errors",
+    dependencies=[Depends(token_based_verification)],
+)
+@inject
+async def create_many_directions(
+    cmds: List[models.CreateDirectionCommand] = Body(
+        ...,
+        min_items=1,
+        max_items=models.BatchFields.max_items,
+    ),
+    direction_service: DirectionService = Depends(Provide[Services.direction_service]),
+):
+    return await direction_service.create_many_directions(cmds=cmds)
+
+
+@direction_router.post(
+    "/upsert/",
+    response_model=models.DirectionUpsert,
+    status_code=status.HTTP_200_OK,
+    description="Create or update direction by natural key",
+    dependencies=[Depends(token_based_verification)],
+)
+@inject
+async def upsert_direction(
+    cmd: models.CreateDirectionCommand,
+    direction_service: DirectionService = Depends(Provide[Services.direction_service]),
+):
+    return await direction_service.upsert_direction(cmd=cmd)
+
+
+@direction_router.post(
+    "/upsert/batch/",
+    response_model=List[models.BatchItem[models.DirectionUpsert]],
+    status_code=status.HTTP_200_OK,
+    description="Create or update directions in batch with per-item errors",
+    dependencies=[Depends(token_based_verification)],
+)
+@inject
+async def upsert_many_directions(
+    cmds: List[models.CreateDirectionCommand] = Body(
+        ...,
+        min_items=1,
+        max_items=models.BatchFields.max_items,
+    ),
+    direction_service: DirectionService = Depends(Provide[Services.direction_service]),
+):
+    return await direction_service.upsert_many_directions(cmds=cmds)
+
+
 @direction_router.put(
     "/",
     response_model=models.Direction,
@@ -74,6 +143,21 @@ async def update_direction(
     return await direction_service.update_direction(cmd=cmd)
 
 
+@direction_router.patch(
+    "/",
+    response_model=models.Direction,
+    status_code=status.HTTP_200_OK,
+    description="Update fields of direction, that are set in the body",
+    dependencies=[Depends(token_based_verification)],
+)
+@inject
+async def patch_direction(
+    cmd: models.PatchDirectionCommand,
+    direction_service: DirectionService = Depends(Provide[Services.direction_service]),
+):
+    return await direction_service.patch_direction(cmd=cmd)
+
+
 @direction_router.delete(
     "/{direction_id:int}/",
     response_model=models.Direction,
@@ -4,11 +4,13 @@
 from typing import List
 
 from dependency_injector.wiring import Provide, inject
-from fastapi import Depends, status
+from fastapi import Body, Depends, status
 
+from app.internal.pkg.middlewares.pagination import pagination_query
 from app.internal.pkg.middlewares.token_based_verification import (
     token_based_verification,
 )
+from app.internal.pkg.responses.ndjson import NDJSONResponse
 from app.internal.routes import partners_router
 from app.internal.services import Services
 from app.internal.services.partners import PartnerService
@@ -16,6 +18,20 @@ from app.pkg import models
 from app.pkg.models.exceptions import partners
 
 
+@partners_router.get(
+    "/export/",
+    response_class=NDJSONResponse,
+    status_code=status.HTTP_200_OK,
+    description="Export all partners ordered by id as newline delimited JSON",
+    dependencies=[Depends(token_based_verification)],
+)
+@inject
+async def export_partners(
+    partners_service: PartnerService = Depends(Provide[Services.partner_service]),
+):
+    return NDJSONResponse(content=partners_service.stream_all_partners())
+
+
 @partners_router.post(
     "/",
     response_model=models.Partner,
@@ -35,6 +51,63 @@ async def create_partner(
     return await partners_service.create_partner(cmd=cmd)
 
 
+@partners_router.post(
+    "/batch/",
+    response_model=List[models.BatchItem[models.Partner]],
+    status_code=status.HTTP_200_OK,
+    description="Create partners in batch with per-item errors",
+    dependencies=[Depends(token_based_verification)],
+)
+@inject
+async def create_many_partners(
+    cmds: List[models.CreatePartnerCommand] = Body(
+        ...,
+        min_items=1,
+        max_items=models.BatchFields.max_items,
+    ),
+    partners_service: PartnerService = Depends(Provide[Services.partner_service]),
+):
+    return await partners_service.create_many_partners(cmds=cmds)
+
+
+@partners_router.post(
+    "/upsert/",
+    response_model=models.PartnerUpsert,
+    status_code=status.HTTP_200_OK,
+    description="Create or update partner by natural key",
+    dependencies=[Depends(token_based_verification)],
+    responses={
+        **partners.PartnerTokenAlreadyExists.generate_openapi(),
+        **partners.PartnerNameAlreadyExists.generate_openapi(),
+    },
+)
+@inject
+async def upsert_partner(
+    cmd: models.CreatePartnerCommand,
+    partners_service: PartnerService = Depends(Provide[Services.partner_service]),
+):
+    return await partners_service.upsert_partner(cmd=cmd)
+
+
+@partners_router.post(
+    "/upsert/batch/",
+    response_model=List[models.BatchItem[models.PartnerUpsert]],
+    status_code=status.HTTP_200_OK,
+    description="Create or update partners in batch with per-item errors",
+    dependencies=[Depends(token_based_verification)],
+)
+@inject
+async def upsert_many_partners(
+    cmds: List[models.CreatePartnerCommand] = Body(
+        ...,
+        min_items=1,
+        max_items=models.BatchFields.max_items,
+    ),
+    partners_service: PartnerService = Depends(Provide[Services.partner_service]),
+):
+    return await partners_service.upsert_many_partners(cmds=cmds)
+
+
 @partners_router.get(
     "/{token:str}/",
     response_model=models.Partner,
@@ -53,23 +126,24 @@ async def read_partner_by_token(
 
 @partners_router.get(
     "/",
-    response_model=List[models.Partner],
+    response_model=models.Page[models.Partner],
     status_code=status.HTTP_200_OK,
-    description="Read all partners",
+    description="Read page of partners ordered by id",
     dependencies=[Depends(token_based_verification)],
 )
 @inject
 async def read_all_partners(
+    query: models.PaginationQuery = Depends(pagination_query),
     partners_service: PartnerService = Depends(Provide[Services.partner_service]),
 ):
-    return await partners_service.read_all_partner()
+    return await partners_service.read_all_partner(query=query)
 
 
 @partners_router.patch(
     "/",
     response_model=models.Partner,
     status_code=status.HTTP_200_OK,
-    description="Update partner",
+    description="Update fields of partner, that are set in the body",
     dependencies=[Depends(token_based_verification)],
     responses={
         **partners.PartnerTokenAlreadyExists.generate_openapi(),
@@ -77,11 +151,11 @@ async def read_all_partners(
     },
 )
 @inject
-async def update_partner(
-    cmd: models.UpdatePartnerCommand,
+async def patch_partner(
+    cmd: models.PatchPartnerCommand,
     partners_service: PartnerService = Depends(Provide[Services.partner_service]),
 ):
-    return await partners_service.update_partner(cmd=cmd)
+    return await partners_service.patch_partner(cmd=cmd)
 
 
 @partners_router.delete(
@@ -3,28 +3,44 @@
 from typing import List
 
 from dependency_injector.wiring import Provide, inject
-from fastapi import Depends, status
+from fastapi import Body, Depends, status
 
+from app.internal.pkg.middlewares.pagination import pagination_query
 from app.internal.pkg.middlewares.token_based_verification import (
     token_based_verification,
 )
+from app.internal.pkg.responses.ndjson import NDJSONResponse
 from app.internal.routes import skill_router
 from app.internal.services import Services
 from app.internal.services.skill import SkillService
 from app.pkg import models
 
 
+@skill_router.get(
+    "/export/",
+    response_class=NDJSONResponse,
+    status_code=status.HTTP_200_OK,
+    description="Export all skills ordered by id as newline delimited JSON",
+)
+@inject
+async def export_skills(
+    skill_service: SkillService = Depends(Provide[Services.skill_service]),
+):
+    return NDJSONResponse(content=skill_service.stream_all_skills())
+
+
 @skill_router.get(
     "/",
-    response_model=List[models.Skill],
+    response_model=models.Page[models.Skill],
     status_code=status.HTTP_200_OK,
-    description="Get all skills",
+    description="Get page of skills ordered by id",
 )
 @inject
 async def read_all_skills(
+    query: models.PaginationQuery = Depends(pagination_query),
     skill_service: SkillService = Depends(Provide[Services.skill_service]),
 ):
-    return await skill_service.read_all_skills()
+    return await skill_service.read_all_skills(query=query)
 
 
 @skill_router.get(
@@ -59,6 +75,59 @@ async def create_skill(
     return await skill_service.create_skill(cmd=cmd)
 
 
+@skill_router.post(
+    "/batch/",
+    response_model=List[models.BatchItem[models.Skill]],
+    status_code=status.HTTP_200_OK,
+    description="Create skills in batch with per-item errors",
+    dependencies=[Depends(token_based_verification)],
+)
+@inject
+async def create_many_skills(
+    cmds: List[models.CreateSkillCommand] = Body(
+        ...,
+        min_items=1,
+        max_items=models.BatchFields.max_items,
+    ),
+    skill_service: SkillService = Depends(Provide[Services.skill_service]),
+):
+    return await skill_service.create_many_skills(cmds=cmds)
+
+
+@skill_router.post(
+    "/upsert/",
+    response_model=models.SkillUpsert,
+    status_code=status.HTTP_200_OK,
+    description="Create or update skill by natural key",
+    dependencies=[Depends(token_based_verification)],
+)
+@inject
+async def upsert_skill(
+    cmd: models.CreateSkillCommand,
+    skill_service: SkillService = Depends(Provide[Services.skill_service]),
+):
+    return await skill_service.upsert_skill(cmd=cmd)
+
+
+@skill_router.post(
+    "/upsert/batch/",
+    response_model=List[models.BatchItem[models.SkillUpsert]],
+    status_code=status.HTTP_200_OK,
+    description="Create or update skills in batch with per-item errors",
+    dependencies=[Depends(token_based_verification)],
+)
+@inject
+async def upsert_many_skills(
+    cmds: List[models.CreateSkillCommand] = Body(
+        ...,
+        min_items=1,
+        max_items=models.BatchFields.max_items,
+    ),
+    skill_service: SkillService = Depends(Provide[Services.skill_service]),
+):
+    return await skill_service.upsert_many_skills(cmds=cmds)
+
+
 @skill_router.put(
     "/",
     response_model=models.Skill,
@@ -74,6 +143,21 @@ async def update_skill(
     return await skill_service.update_skill(cmd=cmd)
 
 
+@skill_router.patch(
+    "/",
+    response_model=models.Skill,
+    status_code=status.HTTP_200_OK,
+    description="Update fields of skill, that are set in the body",
+    dependencies=[Depends(token_based_verification)],
+)
+@inject
+async def patch_skill(
+    cmd: models.PatchSkillCommand,
+    skill_service: SkillService = Depends(Provide[Services.skill_service]),
+):
+    return await skill_service.patch_skill(cmd=cmd)
+
+
 @skill_router.delete(
     "/{skill_id:int}/",
     response_model=models.Skill,
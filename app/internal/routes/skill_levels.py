@@ -3,30 +3,48 @@
 from typing import List
 
 from dependency_injector.wiring import Provide, inject
-from fastapi import Depends, status
+from fastapi import Body, Depends, status
 
+from app.internal.pkg.middlewares.pagination import pagination_query
 from app.internal.pkg.middlewares.token_based_verification import (
     token_based_verification,
 )
+from app.internal.pkg.responses.ndjson import NDJSONResponse
 from app.internal.routes import skill_levels_router
 from app.internal.services import Services
 from app.internal.services.skill_levels import SkillLevelService
 from app.pkg import models
 
 
+@skill_levels_router.get(
+    "/export/",
+    response_class=NDJSONResponse,
+    status_code=status.HTTP_200_OK,
+    description="Export all skill levels ordered by id as newline delimited JSON",
+)
+@inject
+async def export_skill_levels(
+    skill_level_service: SkillLevelService = Depends(
+        Provide[Services.skill_levels_service],
+    ),
+):
+    return NDJSONResponse(content=skill_level_service.stream_all_skill_levels())
+
+
 @skill_levels_router.get(
     "/",
-    response_model=List[models.SkillLevel],
+    response_model=models.Page[models.SkillLevel],
     status_code=status.HTTP_200_OK,
-    description="Get all skill levels",
+    description="Get page of skill levels ordered by id",
 )
 @inject
 async def read_all_skill_levels(
+    query: models.PaginationQuery = Depends(pagination_query),
     skill_level_service: SkillLevelService = Depends(
         Provide[Services.skill_levels_service],
     ),
 ):
-    return await skill_level_service.read_all_skill_levels()
+    return await skill_level_service.read_all_skill_levels(query=query)
 
 
 @skill_levels_router.get(
@@ -65,6 +83,65 @@ async def create_skill_level(
     return await skill_level_service.create_skill_level(cmd=cmd)
 
 
+@skill_levels_router.post(
+    "/batch/",
+    response_model=List[models.BatchItem[models.SkillLevel]],
+    status_code=status.HTTP_200_OK,
+    description="Create skill levels in batch with per-item errors",
+    dependencies=[Depends(token_based_verification)],
+)
+@inject
+async def create_many_skill_levels(
+    cmds: List[models.CreateSkillLevelCommand] = Body(
+        ...,
+        min_items=1,
+        max_items=models.BatchFields.max_items,
+    ),
+    skill_level_service: SkillLevelService = Depends(
+        Provide[Services.skill_levels_service],
+    ),
+):
+    return await skill_level_service.create_many_skill_levels(cmds=cmds)
+
+
+@skill_levels_router.post(
+    "/upsert/",
+    response_model=models.SkillLevelUpsert,
+    status_code=status.HTTP_200_OK,
+    description="Create or update skill level by natural key",
+    dependencies=[Depends(token_based_verification)],
+)
+@inject
+async def upsert_skill_level(
+    cmd: models.CreateSkillLevelCommand,
+    skill_level_service: SkillLevelService = Depends(
+        Provide[Services.skill_levels_service],
+    ),
+):
+    return await skill_level_service.upsert_skill_level(cmd=cmd)
+
+
+@skill_levels_router.post(
+    "/upsert/batch/",
+    response_model=List[models.BatchItem[models.SkillLevelUpsert]],
+    status_code=status.HTTP_200_OK,
+    description="Create or update skill levels in batch with per-item errors",
+    dependencies=[Depends(token_based_verification)],
+)
+@inject
+async def upsert_many_skill_levels(
+    cmds: List[models.CreateSkillLevelCommand] = Body(
+        ...,
+        min_items=1,
+        max_items=models.BatchFields.max_items,
+    ),
+    skill_level_service: SkillLevelService = Depends(
+        Provide[Services.skill_levels_service],
+    ),
+):
+    return await skill_level_service.upsert_many_skill_levels(cmds=cmds)
+
+
 @skill_levels_router.put(
     "/",
     response_model=models.SkillLevel,
@@ -82,6 +159,23 @@ async def update_skill_level(
     return await skill_level_service.update_skill_level(cmd=cmd)
 
 
+@skill_levels_router.patch(
+    "/",
+    response_model=models.SkillLevel,
+    status_code=status.HTTP_200_OK,
+    description="Update fields of skill level, that are set in the body",
+    dependencies=[Depends(token_based_verification)],
+)
+@inject
+async def patch_skill_level(
+    cmd: models.PatchSkillLevelCommand,
+    skill_level_service: SkillLevelService = Depends(
+        Provide[Services.skill_levels_service],
+    ),
+):
+    return await skill_level_service.patch_skill_level(cmd=cmd)
+
+
 @skill_levels_router.delete(
     "/{skill_level_id:int}",
     response_model=models.SkillLevel,
@@ -3,13 +3,17 @@
 from dependency_injector import containers, providers
 
 from app.internal.repository import Repositories, postgresql
+from app.internal.repository.postgresql.unit_of_work import UnitOfWork
 from app.internal.services.city import CityService
 from app.internal.services.contacts import ContactsService
 from app.internal.services.country import CountryService
 from app.internal.services.direction import DirectionService
+from app.internal.services.loader import by_id_loader
 from app.internal.services.partners import PartnerService
 from app.internal.services.skill import SkillService
 from app.internal.services.skill_levels import SkillLevelService
+from app.pkg import models
+from app.pkg.cache import Cache
 
 
 class Services(containers.DeclarativeContainer):
@@ -19,37 +23,100 @@ class Services(containers.DeclarativeContainer):
         Repositories.postgres,
     )  # type: ignore
 
+    cache = providers.Container(Cache)
+
+    #: Unit of work shares one connection and transaction between repository
+    #: calls of the block.
+    unit_of_work = providers.Factory(UnitOfWork)
+
+    #: Loaders of models by id are process-wide, so reads of concurrent
+    #: requests are coalesced into one query.
+    skill_levels_loader = providers.Singleton(
+        by_id_loader,
+        repository=repositories.skill_levels_repository,
+        query=models.ReadAllSkillLevelByIdQuery,
+    )
+    skill_loader = providers.Singleton(
+        by_id_loader,
+        repository=repositories.skill_repository,
+        query=models.ReadAllSkillByIdQuery,
+    )
+    direction_loader = providers.Singleton(
+        by_id_loader,
+        repository=repositories.direction_repository,
+        query=models.ReadAllDirectionByIdQuery,
+    )
+    city_loader = providers.Singleton(
+        by_id_loader,
+        repository=repositories.city_repository,
+        query=models.ReadAllCityByIdQuery,
+    )
+    country_loader = providers.Singleton(
+        by_id_loader,
+        repository=repositories.country_repository,
+        query=models.ReadAllCountryByIdQuery,
+    )
+    contacts_loader = providers.Singleton(
+        by_id_loader,
+        repository=repositories.contacts_repository,
+        query=models.ReadAllContactsByIdQuery,
+    )
+    partner_loader = providers.Singleton(
+        by_id_loader,
+        repository=repositories.partner_repository,
+        query=models.ReadAllPartnerByIdQuery,
+    )
+
     skill_levels_service = providers.Factory(
         SkillLevelService,
         skill_level_repository=repositories.skill_levels_repository,
+        cache=cache.cache,
+        single_flight=cache.single_flight,
+        loader=skill_levels_loader,
     )
 
     skill_service = providers.Factory(
         SkillService,
         skill_repository=repositories.skill_repository,
+        cache=cache.cache,
+        single_flight=cache.single_flight,
+        loader=skill_loader,
     )
 
     direction_service = providers.Factory(
         DirectionService,
         direction_repository=repositories.direction_repository,
+        cache=cache.cache,
+        single_flight=cache.single_flight,
+        loader=direction_loader,
     )
 
     city_service = providers.Factory(
         CityService,
         city_repository=repositories.city_repository,
+        cache=cache.cache,
+        single_flight=cache.single_flight,
+        loader=city_loader,
     )
 
     country_service = providers.Factory(
         CountryService,
         country_repository=repositories.country_repository,
+        cache=cache.cache,
+        single_flight=cache.single_flight,
+        loader=country_loader,
     )
 
     contacts_service = providers.Factory(
         ContactsService,
         contacts_repository=repositories.contacts_repository,
+        single_flight=cache.single_flight,
+        loader=contacts_loader,
     )
 
     partner_service = providers.Factory(
         PartnerService,
         partner_repository=repositories.partner_repository,
+        single_flight=cache.single_flight,
+        loader=partner_loader,
     )
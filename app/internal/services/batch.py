@@ -0,0 +1,87 @@
+"""Run batch commands with per-command errors."""
+
+from typing import Awaitable, Callable, List, Sequence, TypeVar
+
+from app.internal.repository.postgresql.connection import savepoint
+from app.pkg import models
+from app.pkg.models.base import BaseAPIException, Model
+from app.pkg.models.exceptions.repository import DriverError
+
+__all__ = ["create_in_batches"]
+
+_Cmd = TypeVar("_Cmd", bound=Model)
+_Item = TypeVar("_Item", bound=Model)
+
+
+async def create_in_batches(
+    cmds: Sequence[_Cmd],
+    create_many: Callable[[List[_Cmd]], Awaitable[List[_Item]]],
+    create_one: Callable[[_Cmd], Awaitable[_Item]],
+    chunk_size: int = 1000,
+) -> List[models.BatchItem[_Item]]:
+    """Create models with multi-row queries, isolating failed commands.
+
+    Commands are inserted by chunks of ``chunk_size`` rows with one query per
+    chunk. Chunk is atomic, so when it fails, it is split in halves and each
+    half is retried, until the failed commands are left alone. Single command
+    is created with ``create_one``, so its error is mapped exactly as for the
+    single create endpoint. Clean chunks cost one round-trip, and each failed
+    command costs about ``log2(chunk_size)`` round-trips.
+
+    Notes:
+        Only errors mapped from constraints (see ``__constrains__``) are
+        reported per command. :class:`.DriverError` means that the database
+        is not available or the query is broken, so it aborts the whole batch.
+
+        Inside :class:`.UnitOfWork` every chunk runs in a savepoint, so failed
+        chunk is rolled back alone and retries run in the same transaction.
+
+    Args:
+        cmds: Commands for create.
+        create_many: Repository method that creates a list of models atomically.
+        create_one: Service method that creates one model.
+        chunk_size: Max count of rows in one query.
+
+    Returns:
+        Result of every command in order of ``cmds``.
+    """
+
+    results: List[models.BatchItem[_Item]] = []
+
+    async def create(offset: int, chunk: List[_Cmd]) -> None:
+        if len(chunk) == 1:
+            try:
+                async with savepoint():
+                    item = await create_one(chunk[0])
+            except DriverError:
+                raise
+            except BaseAPIException as error:
+                results.append(
+                    models.BatchItem.construct(
+                        index=offset,
+                        error=models.BatchError.from_exception(error),
+                    ),
+                )
+            else:
+                results.append(models.BatchItem.construct(index=offset, item=item))
+            return
+
+        try:
+            async with savepoint():
+                items = await create_many(chunk)
+        except DriverError:
+            raise
+        except BaseAPIException:
+            middle = len(chunk) // 2
+            await create(offset, chunk[:middle])
+            await create(offset + middle, chunk[middle:])
+            return
+
+        results.extend(
+            models.BatchItem.construct(index=offset + i, item=item)
+            for i, item in enumerate(items)
+        )
+
+    for start in range(0, len(cmds), chunk_size):
+        await create(start, list(cmds[start : start + chunk_size]))
+    return results
@@ -5,7 +5,17 @@ import typing
 
 from app.internal.repository.postgresql import city
 from app.internal.repository.repository import BaseRepository
+from app.internal.services.batch import create_in_batches
+from app.internal.services.loader import by_id_loader
 from app.pkg import models
+from app.pkg.cache import (
+    ReadThroughCache,
+    SingleFlight,
+    cached,
+    invalidates,
+    single_flight,
+)
+from app.pkg.dataloader import DataLoader
 from app.pkg.models.exceptions.city import CityNotFound, NoCityFoundForCountry
 from app.pkg.models.exceptions.repository import EmptyResult
 
@@ -18,9 +28,32 @@ class CityService:
     #: CityRepository: CityRepository repository implementation.
     repository: city.CityRepository
 
-    def __init__(self, city_repository: BaseRepository):
-        self.repository = city_repository
+    #: Optional[ReadThroughCache]: Cache of cities. ``None`` disables caching.
+    cache: typing.Optional[ReadThroughCache]
+
+    #: Optional[SingleFlight]: Shares identical in-flight reads.
+    single_flight: typing.Optional[SingleFlight]
+
+    #: DataLoader[int, City]: Coalesces reads of cities by id. Shared by all
+    #: requests of the process.
+    loader: DataLoader[int, models.City]
 
+    def __init__(
+        self,
+        city_repository: BaseRepository,
+        cache: typing.Optional[ReadThroughCache] = None,
+        single_flight: typing.Optional[SingleFlight] = None,
+        loader: typing.Optional[DataLoader] = None,
+    ):
+        self.repository = city_repository
+        self.cache = cache
+        self.single_flight = single_flight
+        self.loader = loader or by_id_loader(
+            repository=self.repository,
+            query=models.ReadAllCityByIdQuery,
+        )
+
+    @invalidates("cities")
     async def create_city(self, cmd: models.CreateCityCommand) -> models.City:
         """Create city.
 
@@ -32,6 +65,60 @@ class CityService:
         """
         return await self.repository.create(cmd=cmd)
 
+    @invalidates("cities")
+    async def create_many_cities(
+        self,
+        cmds: typing.List[models.CreateCityCommand],
+    ) -> typing.List[models.BatchItem[models.City]]:
+        """Create cities in batch.
+
+        Args:
+            cmds: List of CreateCityCommand commands.
+
+        Returns:
+            List[BatchItem[City]]: Created cities or errors in order of
+                ``cmds``.
+        """
+        return await create_in_batches(
+            cmds=cmds,
+            create_many=lambda chunk: self.repository.create_many(cmds=chunk),
+            create_one=lambda cmd: self.create_city(cmd=cmd),
+        )
+
+    @invalidates("cities")
+    async def upsert_city(self, cmd: models.CreateCityCommand) -> models.CityUpsert:
+        """Create city or update city with the same natural key.
+
+        Args:
+            cmd: CreateCityCommand command.
+
+        Returns:
+            CityUpsert: Created or updated city.
+        """
+        return await self.repository.upsert(cmd=cmd)
+
+    @invalidates("cities")
+    async def upsert_many_cities(
+        self,
+        cmds: typing.List[models.CreateCityCommand],
+    ) -> typing.List[models.BatchItem[models.CityUpsert]]:
+        """Create or update cities in batch.
+
+        Args:
+            cmds: List of CreateCityCommand commands.
+
+        Returns:
+            List[BatchItem[CityUpsert]]: Created or updated cities or errors
+                in order of ``cmds``.
+        """
+        return await create_in_batches(
+            cmds=cmds,
+            create_many=lambda chunk: self.repository.upsert_many(cmds=chunk),
+            create_one=lambda cmd: self.upsert_city(cmd=cmd),
+        )
+
+    @cached("cities")
+    @single_flight
     async def read_city(self, query: models.ReadCityQuery) -> models.City:
         """Read city.
 
@@ -41,11 +128,13 @@ class CityService:
         Returns:
             City: Read city.
         """
-        try:
-            return await self.repository.read(query=query)
-        except EmptyResult as e:
-            raise CityNotFound from e
+        city = await self.loader.load(query.id)
+        if city is None:
+            raise CityNotFound
+        return city
 
+    @cached("cities")
+    @single_flight
     async def read_cities_by_country(
         self,
         query: models.ReadCityByCountryQuery,
@@ -63,17 +152,42 @@ class CityService:
         except EmptyResult as e:
             raise NoCityFoundForCountry from e
 
-    async def read_all_cities(self) -> typing.List[models.City]:
-        """Read all cities.
+    @cached("cities")
+    @single_flight
+    async def read_all_cities(
+        self,
+        query: models.PaginationQuery,
+    ) -> models.Page[models.City]:
+        """Read page of cities.
+
+        Args:
+            query: PaginationQuery query.
 
         Returns:
-            List[City]: Read all cities.
+            Page[City]: Read page of cities.
+                Page after the last row is empty.
         """
         try:
-            return await self.repository.read_all()
-        except EmptyResult as e:
-            raise CityNotFound from e
+            items = await self.repository.read_all(query=query)
+        except EmptyResult:
+            items = []
+        return models.Page[models.City].from_items(items=items, query=query)
+
+    def stream_all_cities(
+        self,
+        batch_size: int = 1000,
+    ) -> typing.AsyncIterator[typing.List[models.City]]:
+        """Stream all cities ordered by id.
+
+        Args:
+            batch_size: Number of cities in one batch.
 
+        Returns:
+            AsyncIterator[List[City]]: Batches of cities.
+        """
+        return self.repository.stream_all(batch_size=batch_size)
+
+    @invalidates("cities")
     async def update_city(self, cmd: models.UpdateCityCommand) -> models.City:
         """Update city.
 
@@ -86,6 +200,20 @@ class CityService:
 
         return await self.repository.update(cmd=cmd)
 
+    @invalidates("cities")
+    async def patch_city(self, cmd: models.PatchCityCommand) -> models.City:
+        """Update fields of city, that are set in the command.
+
+        Args:
+            cmd: PatchCityCommand command.
+
+        Returns:
+            City: Updated city.
+        """
+
+        return await self.repository.patch(cmd=cmd)
+
+    @invalidates("cities")
     async def delete_city(self, cmd: models.DeleteCityCommand) -> models.City:
         """Delete city.
 
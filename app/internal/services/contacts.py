@@ -1,13 +1,16 @@
 """Service for manage contacts."""
 
-
 import typing
 
 from pydantic.types import SecretStr
 
 from app.internal.repository.postgresql import contacts
 from app.internal.repository.repository import BaseRepository
+from app.internal.services.batch import create_in_batches
+from app.internal.services.loader import by_id_loader
 from app.pkg import models
+from app.pkg.cache import SingleFlight, single_flight
+from app.pkg.dataloader import DataLoader
 from app.pkg.models.exceptions.contacts import ContactsNotFound, EmailNotChanged
 from app.pkg.models.exceptions.repository import EmptyResult
 
@@ -20,8 +23,25 @@ class ContactsService:
     #: ContactsRepository: ContactsRepository repository implementation.
     repository: contacts.ContactsRepository
 
-    def __init__(self, contacts_repository: BaseRepository):
+    #: DataLoader[int, Contacts]: Coalesces reads of contacts by id. Shared by all
+    #: requests of the process.
+    loader: DataLoader[int, models.Contacts]
+
+    #: Optional[SingleFlight]: Shares identical in-flight reads.
+    single_flight: typing.Optional[SingleFlight]
+
+    def __init__(
+        self,
+        contacts_repository: BaseRepository,
+        single_flight: typing.Optional[SingleFlight] = None,
+        loader: typing.Optional[DataLoader] = None,
+    ):
         self.repository = contacts_repository
+        self.single_flight = single_flight
+        self.loader = loader or by_id_loader(
+            repository=self.repository,
+            query=models.ReadAllContactsByIdQuery,
+        )
 
     async def create_contacts(
         self,
@@ -37,6 +57,59 @@ class ContactsService:
         """
         return await self.repository.create(cmd=cmd)
 
+    async def create_many_contacts(
+        self,
+        cmds: typing.List[models.CreateContactsCommand],
+    ) -> typing.List[models.BatchItem[models.Contacts]]:
+        """Create contacts in batch.
+
+        Args:
+            cmds: List of CreateContactsCommand commands.
+
+        Returns:
+            List[BatchItem[Contacts]]: Created contacts or errors in order of
+                ``cmds``.
+        """
+        return await create_in_batches(
+            cmds=cmds,
+            create_many=lambda chunk: self.repository.create_many(cmds=chunk),
+            create_one=lambda cmd: self.create_contacts(cmd=cmd),
+        )
+
+    async def upsert_contacts(
+        self,
+        cmd: models.CreateContactsCommand,
+    ) -> models.ContactsUpsert:
+        """Create contacts or update contacts with the same natural key.
+
+        Args:
+            cmd: CreateContactsCommand command.
+
+        Returns:
+            ContactsUpsert: Created or updated contacts.
+        """
+        return await self.repository.upsert(cmd=cmd)
+
+    async def upsert_many_contacts(
+        self,
+        cmds: typing.List[models.CreateContactsCommand],
+    ) -> typing.List[models.BatchItem[models.ContactsUpsert]]:
+        """Create or update contacts in batch.
+
+        Args:
+            cmds: List of CreateContactsCommand commands.
+
+        Returns:
+            List[BatchItem[ContactsUpsert]]: Created or updated contacts or errors
+                in order of ``cmds``.
+        """
+        return await create_in_batches(
+            cmds=cmds,
+            create_many=lambda chunk: self.repository.upsert_many(cmds=chunk),
+            create_one=lambda cmd: self.upsert_contacts(cmd=cmd),
+        )
+
+    @single_flight
     async def read_contacts_by_telegram_user_id(
         self,
         query: models.ReadContactsByTelegramUserIdQuery,
@@ -54,6 +127,7 @@ class ContactsService:
         except EmptyResult as e:
             raise ContactsNotFound from e
 
+    @single_flight
     async def read_contacts_by_id(
         self,
         query: models.ReadContactsByIdQuery,
@@ -66,11 +140,12 @@ class ContactsService:
         Returns:
             Contacts: Read contacts.
         """
-        try:
-            return await self.repository.read_by_id(query=query)
-        except EmptyResult as e:
-            raise ContactsNotFound from e
+        contacts = await self.loader.load(query.id)
+        if contacts is None:
+            raise ContactsNotFound
+        return contacts
 
+    @single_flight
     async def read_by_token(self, query: models.ReadContactsQuery) -> models.Contacts:
         """Read contacts by token.
 
@@ -85,45 +160,86 @@ class ContactsService:
         except EmptyResult as e:
             raise ContactsNotFound from e
 
-    async def read_all_contacts(self) -> typing.List[models.Contacts]:
-        """Read all contacts.
+    @single_flight
+    async def read_all_contacts(
+        self,
+        query: models.PaginationQuery,
+    ) -> models.Page[models.Contacts]:
+        """Read page of contacts.
+
+        Args:
+            query: PaginationQuery query.
 
         Returns:
-            List[Contacts]: Read all contacts.
+            Page[Contacts]: Read page of contacts.
+                Page after the last row is empty.
         """
         try:
-            return await self.repository.read_all()
-        except EmptyResult as e:
-            raise ContactsNotFound from e
+            items = await self.repository.read_all(query=query)
+        except EmptyResult:
+            items = []
+        return models.Page[models.Contacts].from_items(items=items, query=query)
+
+    def stream_all_contacts(
+        self,
+        batch_size: int = 1000,
+    ) -> typing.AsyncIterator[typing.List[models.Contacts]]:
+        """Stream all contacts ordered by id.
+
+        Args:
+            batch_size: Number of contacts in one batch.
+
+        Returns:
+            AsyncIterator[List[Contacts]]: Batches of contacts.
+        """
+        return self.repository.stream_all(batch_size=batch_size)
 
     async def update_contacts(
         self,
         token: SecretStr,
         cmd: models.UpdateEmailCommand,
     ) -> models.Contacts:
-        """Update contacts.
+        """Update email of contacts.
 
         Args:
             token: Contacts token.
-            cmd: UpdateContactsCommand command.
+            cmd: UpdateEmailCommand command.
+
+        Notes:
+            Lookup by token, comparison of emails and update are done by one
+            statement, see :meth:`.ContactsRepository.update_email`.
+
+        Raises:
+            ContactsNotFound: There are no contacts with the token.
+            EmailNotChanged: Contacts already have the email.
 
         Returns:
             Contacts: Updated contacts.
         """
         try:
-            token_holder = await self.read_by_token(
-                query=models.ReadContactsQuery(token=token),
+            contacts = await self.repository.update_email(
+                cmd=models.UpdateContactsEmailCommand(token=token, email=cmd.email),
             )
         except EmptyResult as e:
             raise ContactsNotFound from e
-        else:
-            if token_holder.email == cmd.email:
-                raise EmailNotChanged
-            token_holder.email = cmd.email
 
-            return await self.repository.update(
-                cmd=token_holder.migrate(models.UpdateContactsCommand),
-            )
+        if not contacts.changed:
+            raise EmailNotChanged
+        return contacts
+
+    async def patch_contacts(self, cmd: models.PatchContactsCommand) -> models.Contacts:
+        """Update fields of contacts, that are set in the command.
+
+        Args:
+            cmd: PatchContactsCommand command.
+
+        Returns:
+            Contacts: Updated contacts.
+        """
+        try:
+            return await self.repository.patch(cmd=cmd)
+        except EmptyResult as e:
+            raise ContactsNotFound from e
 
     async def delete_contacts(
         self,
@@ -4,7 +4,17 @@ import typing
 
 from app.internal.repository.postgresql import country
 from app.internal.repository.repository import BaseRepository
+from app.internal.services.batch import create_in_batches
+from app.internal.services.loader import by_id_loader
 from app.pkg import models
+from app.pkg.cache import (
+    ReadThroughCache,
+    SingleFlight,
+    cached,
+    invalidates,
+    single_flight,
+)
+from app.pkg.dataloader import DataLoader
 from app.pkg.models.exceptions.country import CountryNameAlreadyExists, CountryNotFound
 from app.pkg.models.exceptions.repository import EmptyResult, UniqueViolation
 
@@ -17,9 +27,32 @@ class CountryService:
     #: CountryRepository: CountryRepository repository implementation.
     repository: country.CountryRepository
 
-    def __init__(self, country_repository: BaseRepository):
-        self.repository = country_repository
+    #: Optional[ReadThroughCache]: Cache of countries. ``None`` disables caching.
+    cache: typing.Optional[ReadThroughCache]
+
+    #: Optional[SingleFlight]: Shares identical in-flight reads.
+    single_flight: typing.Optional[SingleFlight]
+
+    #: DataLoader[int, Country]: Coalesces reads of countries by id. Shared by all
+    #: requests of the process.
+    loader: DataLoader[int, models.Country]
 
+    def __init__(
+        self,
+        country_repository: BaseRepository,
+        cache: typing.Optional[ReadThroughCache] = None,
+        single_flight: typing.Optional[SingleFlight] = None,
+        loader: typing.Optional[DataLoader] = None,
+    ):
+        self.repository = country_repository
+        self.cache = cache
+        self.single_flight = single_flight
+        self.loader = loader or by_id_loader(
+            repository=self.repository,
+            query=models.ReadAllCountryByIdQuery,
+        )
+
+    @invalidates("countries")
     async def create_country(self, cmd: models.CreateCountryCommand) -> models.Country:
         """Create country.
 
@@ -34,6 +67,63 @@ class CountryService:
         except UniqueViolation as e:
             raise CountryNameAlreadyExists from e
 
+    @invalidates("countries")
+    async def create_many_countries(
+        self,
+        cmds: typing.List[models.CreateCountryCommand],
+    ) -> typing.List[models.BatchItem[models.Country]]:
+        """Create countries in batch.
+
+        Args:
+            cmds: List of CreateCountryCommand commands.
+
+        Returns:
+            List[BatchItem[Country]]: Created countries or errors in order of
+                ``cmds``.
+        """
+        return await create_in_batches(
+            cmds=cmds,
+            create_many=lambda chunk: self.repository.create_many(cmds=chunk),
+            create_one=lambda cmd: self.create_country(cmd=cmd),
+        )
+
+    @invalidates("countries")
+    async def upsert_country(
+        self,
+        cmd: models.CreateCountryCommand,
+    ) -> models.CountryUpsert:
+        """Create country or update country with the same natural key.
+
+        Args:
+            cmd: CreateCountryCommand command.
+
+        Returns:
+            CountryUpsert: Created or updated country.
+        """
+        return await self.repository.upsert(cmd=cmd)
+
+    @invalidates("countries")
+    async def upsert_many_countries(
+        self,
+        cmds: typing.List[models.CreateCountryCommand],
+    ) -> typing.List[models.BatchItem[models.CountryUpsert]]:
+        """Create or update countries in batch.
+
+        Args:
+            cmds: List of CreateCountryCommand commands.
+
+        Returns:
+            List[BatchItem[CountryUpsert]]: Created or updated countries or errors
+                in order of ``cmds``.
+        """
+        return await create_in_batches(
+            cmds=cmds,
+            create_many=lambda chunk: self.repository.upsert_many(cmds=chunk),
+            create_one=lambda cmd: self.upsert_country(cmd=cmd),
+        )
+
+    @cached("countries")
+    @single_flight
     async def read_country(self, query: models.ReadCountryQuery) -> models.Country:
         """Read country.
 
@@ -43,16 +133,47 @@ class CountryService:
         Returns:
             Country: Read country.
         """
-        return await self.repository.read(query=query)
+        country = await self.loader.load(query.id)
+        if country is None:
+            raise CountryNotFound
+        return country
+
+    @cached("countries")
+    @single_flight
+    async def read_all_countries(
+        self,
+        query: models.PaginationQuery,
+    ) -> models.Page[models.Country]:
+        """Read page of countries.
+
+        Args:
+            query: PaginationQuery query.
+
+        Returns:
+            Page[Country]: Read page of countries.
+                Page after the last row is empty.
+        """
+        try:
+            items = await self.repository.read_all(query=query)
+        except EmptyResult:
+            items = []
+        return models.Page[models.Country].from_items(items=items, query=query)
 
-    async def read_all_countries(self) -> typing.List[models.Country]:
-        """Read all countries.
+    def stream_all_countries(
+        self,
+        batch_size: int = 1000,
+    ) -> typing.AsyncIterator[typing.List[models.Country]]:
+        """Stream all countries ordered by id.
+
+        Args:
+            batch_size: Number of countries in one batch.
 
         Returns:
-            List[Country]: Read all countries.
+            AsyncIterator[List[Country]]: Batches of countries.
         """
-        return await self.repository.read_all()
+        return self.repository.stream_all(batch_size=batch_size)
 
+    @invalidates("countries")
     async def update_country(self, cmd: models.UpdateCountryCommand) -> models.Country:
         """Update country.
 
@@ -67,6 +188,22 @@ class CountryService:
         except EmptyResult as e:
             raise CountryNotFound from e
 
+    @invalidates("countries")
+    async def patch_country(self, cmd: models.PatchCountryCommand) -> models.Country:
+        """Update fields of country, that are set in the command.
+
+        Args:
+            cmd: PatchCountryCommand command.
+
+        Returns:
+            Country: Updated country.
+        """
+        try:
+            return await self.repository.patch(cmd=cmd)
+        except EmptyResult as e:
+            raise CountryNotFound from e
+
+    @invalidates("countries")
     async def delete_country(self, cmd: models.DeleteCountryCommand) -> models.Country:
         """Delete country.
 
@@ -5,7 +5,17 @@ import typing
 
 from app.internal.repository.postgresql import direction
 from app.internal.repository.repository import BaseRepository
+from app.internal.services.batch import create_in_batches
+from app.internal.services.loader import by_id_loader
 from app.pkg import models
+from app.pkg.cache import (
+    ReadThroughCache,
+    SingleFlight,
+    cached,
+    invalidates,
+    single_flight,
+)
+from app.pkg.dataloader import DataLoader
 from app.pkg.models.exceptions.direction import (
     DirectionNameAlreadyExists,
     DirectionNotFound,
@@ -21,9 +31,32 @@ class DirectionService:
     #: DirectionRepository: DirectionRepository repository implementation.
     repository: direction.DirectionRepository
 
-    def __init__(self, direction_repository: BaseRepository):
-        self.repository = direction_repository
+    #: Optional[ReadThroughCache]: Cache of directions. ``None`` disables caching.
+    cache: typing.Optional[ReadThroughCache]
+
+    #: Optional[SingleFlight]: Shares identical in-flight reads.
+    single_flight: typing.Optional[SingleFlight]
+
+    #: DataLoader[int, Direction]: Coalesces reads of directions by id. Shared by all
+    #: requests of the process.
+    loader: DataLoader[int, models.Direction]
 
+    def __init__(
+        self,
+        direction_repository: BaseRepository,
+        cache: typing.Optional[ReadThroughCache] = None,
+        single_flight: typing.Optional[SingleFlight] = None,
+        loader: typing.Optional[DataLoader] = None,
+    ):
+        self.repository = direction_repository
+        self.cache = cache
+        self.single_flight = single_flight
+        self.loader = loader or by_id_loader(
+            repository=self.repository,
+            query=models.ReadAllDirectionByIdQuery,
+        )
+
+    @invalidates("directions")
     async def create_direction(
         self,
         cmd: models.CreateDirectionCommand,
@@ -41,6 +74,63 @@ class DirectionService:
         except UniqueViolation as e:
             raise DirectionNameAlreadyExists from e
 
+    @invalidates("directions")
+    async def create_many_directions(
+        self,
+        cmds: typing.List[models.CreateDirectionCommand],
+    ) -> typing.List[models.BatchItem[models.Direction]]:
+        """Create directions in batch.
+
+        Args:
+            cmds: List of CreateDirectionCommand commands.
+
+        Returns:
+            List[BatchItem[Direction]]: Created directions or errors in order of
+                ``cmds``.
+        """
+        return await create_in_batches(
+            cmds=cmds,
+            create_many=lambda chunk: self.repository.create_many(cmds=chunk),
+            create_one=lambda cmd: self.create_direction(cmd=cmd),
+        )
+
+    @invalidates("directions")
+    async def upsert_direction(
+        self,
+        cmd: models.CreateDirectionCommand,
+    ) -> models.DirectionUpsert:
+        """Create direction or update direction with the same natural key.
+
+        Args:
+            cmd: CreateDirectionCommand command.
+
+        Returns:
+            DirectionUpsert: Created or updated direction.
+        """
+        return await self.repository.upsert(cmd=cmd)
+
+    @invalidates("directions")
+    async def upsert_many_directions(
+        self,
+        cmds: typing.List[models.CreateDirectionCommand],
+    ) -> typing.List[models.BatchItem[models.DirectionUpsert]]:
+        """Create or update directions in batch.
+
+        Args:
+            cmds: List of CreateDirectionCommand commands.
+
+        Returns:
+            List[BatchItem[DirectionUpsert]]: Created or updated directions or errors
+                in order of ``cmds``.
+        """
+        return await create_in_batches(
+            cmds=cmds,
+            create_many=lambda chunk: self.repository.upsert_many(cmds=chunk),
+            create_one=lambda cmd: self.upsert_direction(cmd=cmd),
+        )
+
+    @cached("directions")
+    @single_flight
     async def read_direction(
         self,
         query: models.ReadDirectionQuery,
@@ -53,8 +143,13 @@ class DirectionService:
         Returns:
             Direction: Read direction.
         """
-        return await self.repository.read(query=query)
+        direction = await self.loader.load(query.id)
+        if direction is None:
+            raise DirectionNotFound
+        return direction
 
+    @cached("directions")
+    @single_flight
     async def read_all_direction_by_ids(
         self,
         query: models.ReadAllDirectionByIdQuery,
@@ -72,17 +167,42 @@ class DirectionService:
         except EmptyResult as e:
             raise DirectionNotFound from e
 
-    async def read_all_directions(self) -> typing.List[models.Direction]:
-        """Read all directions.
+    @cached("directions")
+    @single_flight
+    async def read_all_directions(
+        self,
+        query: models.PaginationQuery,
+    ) -> models.Page[models.Direction]:
+        """Read page of directions.
+
+        Args:
+            query: PaginationQuery query.
 
         Returns:
-            List[Direction]: Read all directions.
+            Page[Direction]: Read page of directions.
+                Page after the last row is empty.
         """
         try:
-            return await self.repository.read_all()
-        except EmptyResult as e:
-            raise DirectionNotFound from e
+            items = await self.repository.read_all(query=query)
+        except EmptyResult:
+            items = []
+        return models.Page[models.Direction].from_items(items=items, query=query)
+
+    def stream_all_directions(
+        self,
+        batch_size: int = 1000,
+    ) -> typing.AsyncIterator[typing.List[models.Direction]]:
+        """Stream all directions ordered by id.
+
+        Args:
+            batch_size: Number of directions in one batch.
+
+        Returns:
+            AsyncIterator[List[Direction]]: Batches of directions.
+        """
+        return self.repository.stream_all(batch_size=batch_size)
 
+    @invalidates("directions")
     async def update_direction(
         self,
         cmd: models.UpdateDirectionCommand,
@@ -97,6 +217,25 @@ class DirectionService:
         """
         return await self.repository.update(cmd=cmd)
 
+    @invalidates("directions")
+    async def patch_direction(
+        self,
+        cmd: models.PatchDirectionCommand,
+    ) -> models.Direction:
+        """Update fields of direction, that are set in the command.
+
+        Args:
+            cmd: PatchDirectionCommand command.
+
+        Returns:
+            Direction: Updated direction.
+        """
+        try:
+            return await self.repository.patch(cmd=cmd)
+        except EmptyResult as e:
+            raise DirectionNotFound from e
+
+    @invalidates("directions")
     async def delete_direction(
         self,
         cmd: models.DeleteDirectionCommand,
@@ -0,0 +1,67 @@
+"""Process-wide loaders of models by id."""
+
+from typing import List, Optional, Type
+
+from app.internal.repository.repository import BaseRepository
+from app.pkg.connectors.postgresql.routing import (
+    pinned_to_primary,
+    reads_from_replicas,
+)
+from app.pkg.connectors.postgresql.transaction import in_transaction
+from app.pkg.dataloader import DataLoader
+from app.pkg.models.base import Model
+from app.pkg.models.exceptions.repository import EmptyResult
+
+__all__ = ["by_id_loader"]
+
+
+def __routing_scope() -> Optional[str]:
+    """Get scope of reads of the current context for :class:`.DataLoader`.
+
+    Reads inside :class:`.UnitOfWork` must use its transaction, and reads of
+    context pinned to the primary must see its own writes, so they are not
+    coalesced with reads of other requests. Other reads are coalesced with
+    reads of the same routing, so batch opened inside
+    :func:`.read_from_primary` (e.g. miss of read-through cache) runs on the
+    primary.
+
+    Returns:
+        ``"replicas"`` or ``"primary"``, ``None`` if the read is not coalesced.
+    """
+
+    if in_transaction() or pinned_to_primary():
+        return None
+    return "replicas" if reads_from_replicas() else "primary"
+
+
+def by_id_loader(repository: BaseRepository, query: Type[Model]) -> DataLoader:
+    """Create loader, that reads models by ids with ``batch_read_all``.
+
+    Loader is created once per repository (see :class:`.Services`), so reads
+    of concurrent requests are coalesced into one query.
+
+    Args:
+        repository: Repository with ``batch_read_all`` method.
+        query: Model of the query of ``batch_read_all`` with ``ids`` field.
+
+    Examples:
+        ::
+
+            >>> loader = by_id_loader(
+            ...     repository=CountryRepository(),
+            ...     query=models.ReadAllCountryByIdQuery,
+            ... )
+            >>> await loader.load(1)
+            Country(id=1, ...)
+
+    Returns:
+        DataLoader of models by id.
+    """
+
+    async def batch_read(ids: List[int]) -> List[Model]:
+        try:
+            return await repository.batch_read_all(query=query(ids=ids))
+        except EmptyResult:
+            return []
+
+    return DataLoader(batch_load=batch_read, scope=__routing_scope)
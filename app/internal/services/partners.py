@@ -1,9 +1,14 @@
 """Service for manage partners."""
+
 import typing
 
 from app.internal.repository.postgresql import partners
 from app.internal.repository.repository import BaseRepository
+from app.internal.services.batch import create_in_batches
+from app.internal.services.loader import by_id_loader
 from app.pkg import models
+from app.pkg.cache import SingleFlight, single_flight
+from app.pkg.dataloader import DataLoader
 from app.pkg.models.exceptions.partners import PartnerNameAlreadyExists, PartnerNotFound
 from app.pkg.models.exceptions.repository import EmptyResult, UniqueViolation
 
@@ -16,8 +21,25 @@ class PartnerService:
     #: PartnerRepository: PartnerRepository repository implementation.
     repository: partners.PartnerRepository
 
-    def __init__(self, partner_repository: BaseRepository):
+    #: DataLoader[int, Partner]: Coalesces reads of partners by id. Shared by all
+    #: requests of the process.
+    loader: DataLoader[int, models.Partner]
+
+    #: Optional[SingleFlight]: Shares identical in-flight reads.
+    single_flight: typing.Optional[SingleFlight]
+
+    def __init__(
+        self,
+        partner_repository: BaseRepository,
+        single_flight: typing.Optional[SingleFlight] = None,
+        loader: typing.Optional[DataLoader] = None,
+    ):
         self.repository = partner_repository
+        self.single_flight = single_flight
+        self.loader = loader or by_id_loader(
+            repository=self.repository,
+            query=models.ReadAllPartnerByIdQuery,
+        )
 
     async def create_partner(
         self,
@@ -36,6 +58,59 @@ class PartnerService:
         except UniqueViolation as e:
             raise PartnerNameAlreadyExists from e
 
+    async def create_many_partners(
+        self,
+        cmds: typing.List[models.CreatePartnerCommand],
+    ) -> typing.List[models.BatchItem[models.Partner]]:
+        """Create partners in batch.
+
+        Args:
+            cmds: List of CreatePartnerCommand commands.
+
+        Returns:
+            List[BatchItem[Partner]]: Created partners or errors in order of
+                ``cmds``.
+        """
+        return await create_in_batches(
+            cmds=cmds,
+            create_many=lambda chunk: self.repository.create_many(cmds=chunk),
+            create_one=lambda cmd: self.create_partner(cmd=cmd),
+        )
+
+    async def upsert_partner(
+        self,
+        cmd: models.CreatePartnerCommand,
+    ) -> models.PartnerUpsert:
+        """Create partner or update partner with the same natural key.
+
+        Args:
+            cmd: CreatePartnerCommand command.
+
+        Returns:
+            PartnerUpsert: Created or updated partner.
+        """
+        return await self.repository.upsert(cmd=cmd)
+
+    async def upsert_many_partners(
+        self,
+        cmds: typing.List[models.CreatePartnerCommand],
+    ) -> typing.List[models.BatchItem[models.PartnerUpsert]]:
+        """Create or update partners in batch.
+
+        Args:
+            cmds: List of CreatePartnerCommand commands.
+
+        Returns:
+            List[BatchItem[PartnerUpsert]]: Created or updated partners or errors
+                in order of ``cmds``.
+        """
+        return await create_in_batches(
+            cmds=cmds,
+            create_many=lambda chunk: self.repository.upsert_many(cmds=chunk),
+            create_one=lambda cmd: self.upsert_partner(cmd=cmd),
+        )
+
+    @single_flight
     async def read_partner(self, query: models.ReadPartnerQuery) -> models.Partner:
         """Read partners.
 
@@ -45,11 +120,12 @@ class PartnerService:
         Returns:
             Partner: Read partners.
         """
-        try:
-            return await self.repository.read(query=query)
-        except EmptyResult as e:
-            raise PartnerNotFound from e
+        partner = await self.loader.load(query.id)
+        if partner is None:
+            raise PartnerNotFound
+        return partner
 
+    @single_flight
     async def read_partner_by_token(
         self,
         query: models.ReadPartnerByTokenQuery,
@@ -67,15 +143,39 @@ class PartnerService:
         except EmptyResult as e:
             raise PartnerNotFound from e
 
+    @single_flight
     async def read_all_partner(
         self,
-    ) -> typing.List[models.Partner]:
-        """Read all partners.
+        query: models.PaginationQuery,
+    ) -> models.Page[models.Partner]:
+        """Read page of partners.
+
+        Args:
+            query: PaginationQuery query.
+
+        Returns:
+            Page[Partner]: Read partners.
+                Page after the last row is empty.
+        """
+        try:
+            items = await self.repository.read_all(query=query)
+        except EmptyResult:
+            items = []
+        return models.Page[models.Partner].from_items(items=items, query=query)
+
+    def stream_all_partners(
+        self,
+        batch_size: int = 1000,
+    ) -> typing.AsyncIterator[typing.List[models.Partner]]:
+        """Stream all partners ordered by id.
+
+        Args:
+            batch_size: Number of partners in one batch.
 
         Returns:
-            typing.List[Partner]: Read partners.
+            AsyncIterator[List[Partner]]: Batches of partners.
         """
-        return await self.repository.read_all()
+        return self.repository.stream_all(batch_size=batch_size)
 
     async def update_partner(
         self,
@@ -91,6 +191,20 @@ class PartnerService:
         """
         return await self.repository.update(cmd=cmd)
 
+    async def patch_partner(
+        self,
+        cmd: models.PatchPartnerCommand,
+    ) -> models.Partner:
+        """Update fields of partners, that are set in the command.
+
+        Args:
+            cmd: PatchPartnerCommand command.
+
+        Returns:
+            Partner: Updated partners.
+        """
+        return await self.repository.patch(cmd=cmd)
+
     async def delete_partner(
         self,
         cmd: models.DeletePartnerCommand,
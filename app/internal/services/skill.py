@@ -5,7 +5,17 @@ import typing
 
 from app.internal.repository.postgresql import skill
 from app.internal.repository.repository import BaseRepository
+from app.internal.services.batch import create_in_batches
+from app.internal.services.loader import by_id_loader
 from app.pkg import models
+from app.pkg.cache import (
+    ReadThroughCache,
+    SingleFlight,
+    cached,
+    invalidates,
+    single_flight,
+)
+from app.pkg.dataloader import DataLoader
 from app.pkg.models.exceptions.repository import EmptyResult, UniqueViolation
 from app.pkg.models.exceptions.skill import SkillNameAlreadyExists, SkillNotFound
 
@@ -18,9 +28,32 @@ class SkillService:
     #: SkillRepository: SkillRepository repository implementation.
     repository: skill.SkillRepository
 
-    def __init__(self, skill_repository: BaseRepository):
-        self.repository = skill_repository
+    #: Optional[ReadThroughCache]: Cache of skills. ``None`` disables caching.
+    cache: typing.Optional[ReadThroughCache]
+
+    #: Optional[SingleFlight]: Shares identical in-flight reads.
+    single_flight: typing.Optional[SingleFlight]
 
+    #: DataLoader[int, Skill]: Coalesces reads of skills by id. Shared by all
+    #: requests of the process.
+    loader: DataLoader[int, models.Skill]
+
+    def __init__(
+        self,
+        skill_repository: BaseRepository,
+        cache: typing.Optional[ReadThroughCache] = None,
+        single_flight: typing.Optional[SingleFlight] = None,
+        loader: typing.Optional[DataLoader] = None,
+    ):
+        self.repository = skill_repository
+        self.cache = cache
+        self.single_flight = single_flight
+        self.loader = loader or by_id_loader(
+            repository=self.repository,
+            query=models.ReadAllSkillByIdQuery,
+        )
+
+    @invalidates("skills")
     async def create_skill(self, cmd: models.CreateSkillCommand) -> models.Skill:
         """Create skill.
 
@@ -35,6 +68,60 @@ class SkillService:
         except UniqueViolation as e:
             raise SkillNameAlreadyExists from e
 
+    @invalidates("skills")
+    async def create_many_skills(
+        self,
+        cmds: typing.List[models.CreateSkillCommand],
+    ) -> typing.List[models.BatchItem[models.Skill]]:
+        """Create skills in batch.
+
+        Args:
+            cmds: List of CreateSkillCommand commands.
+
+        Returns:
+            List[BatchItem[Skill]]: Created skills or errors in order of
+                ``cmds``.
+        """
+        return await create_in_batches(
+            cmds=cmds,
+            create_many=lambda chunk: self.repository.create_many(cmds=chunk),
+            create_one=lambda cmd: self.create_skill(cmd=cmd),
+        )
+
+    @invalidates("skills")
+    async def upsert_skill(self, cmd: models.CreateSkillCommand) -> models.SkillUpsert:
+        """Create skill or update skill with the same natural key.
+
+        Args:
+            cmd: CreateSkillCommand command.
+
+        Returns:
+            SkillUpsert: Created or updated skill.
+        """
+        return await self.repository.upsert(cmd=cmd)
+
+    @invalidates("skills")
+    async def upsert_many_skills(
+        self,
+        cmds: typing.List[models.CreateSkillCommand],
+    ) -> typing.List[models.BatchItem[models.SkillUpsert]]:
+        """Create or update skills in batch.
+
+        Args:
+            cmds: List of CreateSkillCommand commands.
+
+        Returns:
+            List[BatchItem[SkillUpsert]]: Created or updated skills or errors
+                in order of ``cmds``.
+        """
+        return await create_in_batches(
+            cmds=cmds,
+            create_many=lambda chunk: self.repository.upsert_many(cmds=chunk),
+            create_one=lambda cmd: self.upsert_skill(cmd=cmd),
+        )
+
+    @cached("skills")
+    @single_flight
     async def read_skill(self, query: models.ReadSkillQuery) -> models.Skill:
         """Read skill.
 
@@ -44,11 +131,13 @@ class SkillService:
         Returns:
             Skill: Read skill.
         """
-        try:
-            return await self.repository.read(query=query)
-        except EmptyResult as e:
-            raise SkillNotFound from e
+        skill = await self.loader.load(query.id)
+        if skill is None:
+            raise SkillNotFound
+        return skill
 
+    @cached("skills")
+    @single_flight
     async def batch_read_all_skills(
         self,
         query: models.ReadAllSkillByIdQuery,
@@ -66,14 +155,42 @@ class SkillService:
         except EmptyResult as e:
             raise SkillNotFound from e
 
-    async def read_all_skills(self) -> typing.List[models.Skill]:
-        """Read all skills.
+    @cached("skills")
+    @single_flight
+    async def read_all_skills(
+        self,
+        query: models.PaginationQuery,
+    ) -> models.Page[models.Skill]:
+        """Read page of skills.
+
+        Args:
+            query: PaginationQuery query.
+
+        Returns:
+            Page[Skill]: Read page of skills.
+                Page after the last row is empty.
+        """
+        try:
+            items = await self.repository.read_all(query=query)
+        except EmptyResult:
+            items = []
+        return models.Page[models.Skill].from_items(items=items, query=query)
+
+    def stream_all_skills(
+        self,
+        batch_size: int = 1000,
+    ) -> typing.AsyncIterator[typing.List[models.Skill]]:
+        """Stream all skills ordered by id.
+
+        Args:
+            batch_size: Number of skills in one batch.
 
         Returns:
-            List[Skill]: Read all skills.
+            AsyncIterator[List[Skill]]: Batches of skills.
         """
-        return await self.repository.read_all()
+        return self.repository.stream_all(batch_size=batch_size)
 
+    @invalidates("skills")
     async def update_skill(self, cmd: models.UpdateSkillCommand) -> models.Skill:
         """Update skill.
 
@@ -85,6 +202,22 @@ class SkillService:
         """
         return await self.repository.update(cmd=cmd)
 
+    @invalidates("skills")
+    async def patch_skill(self, cmd: models.PatchSkillCommand) -> models.Skill:
+        """Update fields of skill, that are set in the command.
+
+        Args:
+            cmd: PatchSkillCommand command.
+
+        Returns:
+            Skill: Updated skill.
+        """
+        try:
+            return await self.repository.patch(cmd=cmd)
+        except EmptyResult as e:
+            raise SkillNotFound from e
+
+    @invalidates("skills")
     async def delete_skill(self, cmd: models.DeleteSkillCommand) -> None:
         """Delete skill.
 
@@ -4,7 +4,17 @@ import typing
 
 from app.internal.repository.postgresql import skill_levels
 from app.internal.repository.repository import BaseRepository
+from app.internal.services.batch import create_in_batches
+from app.internal.services.loader import by_id_loader
 from app.pkg import models
+from app.pkg.cache import (
+    ReadThroughCache,
+    SingleFlight,
+    cached,
+    invalidates,
+    single_flight,
+)
+from app.pkg.dataloader import DataLoader
 from app.pkg.models.exceptions.repository import EmptyResult, UniqueViolation
 from app.pkg.models.exceptions.skill_levels import (
     SkillLevelAlreadyExists,
@@ -20,9 +30,32 @@ class SkillLevelService:
     #: SkillLevelRepository: SkillLevelRepository repository implementation.
     repository: skill_levels.SkillLevelRepository
 
-    def __init__(self, skill_level_repository: BaseRepository):
-        self.repository = skill_level_repository
+    #: Optional[ReadThroughCache]: Cache of skill levels. ``None`` disables caching.
+    cache: typing.Optional[ReadThroughCache]
+
+    #: Optional[SingleFlight]: Shares identical in-flight reads.
+    single_flight: typing.Optional[SingleFlight]
+
+    #: DataLoader[int, SkillLevel]: Coalesces reads of skill levels by id. Shared by all
+    #: requests of the process.
+    loader: DataLoader[int, models.SkillLevel]
 
+    def __init__(
+        self,
+        skill_level_repository: BaseRepository,
+        cache: typing.Optional[ReadThroughCache] = None,
+        single_flight: typing.Optional[SingleFlight] = None,
+        loader: typing.Optional[DataLoader] = None,
+    ):
+        self.repository = skill_level_repository
+        self.cache = cache
+        self.single_flight = single_flight
+        self.loader = loader or by_id_loader(
+            repository=self.repository,
+            query=models.ReadAllSkillLevelByIdQuery,
+        )
+
+    @invalidates("skill_levels")
     async def create_skill_level(
         self,
         cmd: models.CreateSkillLevelCommand,
@@ -37,6 +70,63 @@ class SkillLevelService:
         """
         return await self.repository.create(cmd=cmd)
 
+    @invalidates("skill_levels")
+    async def create_many_skill_levels(
+        self,
+        cmds: typing.List[models.CreateSkillLevelCommand],
+    ) -> typing.List[models.BatchItem[models.SkillLevel]]:
+        """Create skill levels in batch.
+
+        Args:
+            cmds: List of CreateSkillLevelCommand commands.
+
+        Returns:
+            List[BatchItem[SkillLevel]]: Created skill levels or errors in order of
+                ``cmds``.
+        """
+        return await create_in_batches(
+            cmds=cmds,
+            create_many=lambda chunk: self.repository.create_many(cmds=chunk),
+            create_one=lambda cmd: self.create_skill_level(cmd=cmd),
+        )
+
+    @invalidates("skill_levels")
+    async def upsert_skill_level(
+        self,
+        cmd: models.CreateSkillLevelCommand,
+    ) -> models.SkillLevelUpsert:
+        """Create skill level or update skill level with the same natural key.
+
+        Args:
+            cmd: CreateSkillLevelCommand command.
+
+        Returns:
+            SkillLevelUpsert: Created or updated skill level.
+        """
+        return await self.repository.upsert(cmd=cmd)
+
+    @invalidates("skill_levels")
+    async def upsert_many_skill_levels(
+        self,
+        cmds: typing.List[models.CreateSkillLevelCommand],
+    ) -> typing.List[models.BatchItem[models.SkillLevelUpsert]]:
+        """Create or update skill levels in batch.
+
+        Args:
+            cmds: List of CreateSkillLevelCommand commands.
+
+        Returns:
+            List[BatchItem[SkillLevelUpsert]]: Created or updated skill levels
+                or errors in order of ``cmds``.
+        """
+        return await create_in_batches(
+            cmds=cmds,
+            create_many=lambda chunk: self.repository.upsert_many(cmds=chunk),
+            create_one=lambda cmd: self.upsert_skill_level(cmd=cmd),
+        )
+
+    @cached("skill_levels")
+    @single_flight
     async def read_skill_level(
         self,
         query: models.ReadSkillLevelQuery,
@@ -49,19 +139,47 @@ class SkillLevelService:
         Returns:
             SkillLevel: Read skill level.
         """
-        return await self.repository.read(query=query)
+        skill_level = await self.loader.load(query.id)
+        if skill_level is None:
+            raise SkillLevelNotFound
+        return skill_level
+
+    @cached("skill_levels")
+    @single_flight
+    async def read_all_skill_levels(
+        self,
+        query: models.PaginationQuery,
+    ) -> models.Page[models.SkillLevel]:
+        """Read page of skill levels.
 
-    async def read_all_skill_levels(self) -> typing.List[models.SkillLevel]:
-        """Read all skill levels.
+        Args:
+            query: PaginationQuery query.
 
         Returns:
-            List[SkillLevel]: Read all skill levels.
+            Page[SkillLevel]: Read page of skill levels.
+                Page after the last row is empty.
         """
         try:
-            return await self.repository.read_all()
-        except EmptyResult as e:
-            raise SkillLevelNotFound from e
+            items = await self.repository.read_all(query=query)
+        except EmptyResult:
+            items = []
+        return models.Page[models.SkillLevel].from_items(items=items, query=query)
+
+    def stream_all_skill_levels(
+        self,
+        batch_size: int = 1000,
+    ) -> typing.AsyncIterator[typing.List[models.SkillLevel]]:
+        """Stream all skill levels ordered by id.
 
+        Args:
+            batch_size: Number of skill levels in one batch.
+
+        Returns:
+            AsyncIterator[List[SkillLevel]]: Batches of skill levels.
+        """
+        return self.repository.stream_all(batch_size=batch_size)
+
+    @invalidates("skill_levels")
     async def update_skill_level(
         self,
         cmd: models.UpdateSkillLevelCommand,
@@ -79,6 +197,27 @@ class SkillLevelService:
         except UniqueViolation as e:
             raise SkillLevelAlreadyExists from e
 
+    @invalidates("skill_levels")
+    async def patch_skill_level(
+        self,
+        cmd: models.PatchSkillLevelCommand,
+    ) -> models.SkillLevel:
+        """Update fields of skill level, that are set in the command.
+
+        Args:
+            cmd: PatchSkillLevelCommand command.
+
+        Returns:
+            SkillLevel: Updated skill level.
+        """
+        try:
+            return await self.repository.patch(cmd=cmd)
+        except EmptyResult as e:
+            raise SkillLevelNotFound from e
+        except UniqueViolation as e:
+            raise SkillLevelAlreadyExists from e
+
+    @invalidates("skill_levels")
     async def delete_skill_level(
         self,
         cmd: models.DeleteSkillLevelCommand,
@@ -0,0 +1,79 @@
+"""Cache of read-mostly data and single-flight of in-flight reads.
+
+Backend is selected by :attr:`.Settings.CACHE.BACKEND`, scope of single-flight
+by :attr:`.Settings.CACHE.SINGLE_FLIGHT`.
+"""
+
+from dependency_injector import containers, providers
+
+from app.pkg.cache.backends import BaseCacheBackend, MemoryBackend, RedisBackend
+from app.pkg.cache.invalidation import CacheInvalidator
+from app.pkg.cache.read_through import ReadThroughCache, cached, invalidates
+from app.pkg.cache.single_flight import SingleFlight, single_flight
+from app.pkg.cache.token_index import (
+    TokenIndex,
+    index_evict,
+    index_lookup,
+    index_store,
+)
+from app.pkg.models.core.cache import CacheBackend, SingleFlightScope
+from app.pkg.settings import settings
+
+__all__ = [
+    "Cache",
+    "CacheInvalidator",
+    "ReadThroughCache",
+    "BaseCacheBackend",
+    "MemoryBackend",
+    "RedisBackend",
+    "SingleFlight",
+    "TokenIndex",
+    "cached",
+    "index_evict",
+    "index_lookup",
+    "index_store",
+    "invalidates",
+    "single_flight",
+]
+
+
+class Cache(containers.DeclarativeContainer):
+    """Declarative container with read-through cache and single-flight."""
+
+    configuration = providers.Configuration(
+        name="settings",
+        pydantic_settings=[settings],
+    )
+
+    backend = providers.Selector(
+        configuration.CACHE.BACKEND,
+        **{
+            CacheBackend.MEMORY.value: providers.Singleton(
+                MemoryBackend,
+                maxsize=configuration.CACHE.MAX_SIZE,
+            ),
+            CacheBackend.REDIS.value: providers.Singleton(
+                RedisBackend,
+                host=configuration.CACHE.REDIS_HOST,
+                port=configuration.CACHE.REDIS_PORT,
+                db=configuration.CACHE.REDIS_DB,
+                password=configuration.CACHE.REDIS_PASSWORD,
+                namespace=configuration.CACHE.NAMESPACE,
+            ),
+        },
+    )
+
+    cache = providers.Singleton(
+        ReadThroughCache,
+        backend=backend,
+        ttl=configuration.CACHE.TTL,
+    )
+
+    single_flight = providers.Selector(
+        configuration.CACHE.SINGLE_FLIGHT,
+        **{
+            SingleFlightScope.PROCESS.value: providers.Singleton(SingleFlight),
+            SingleFlightScope.REQUEST.value: providers.Factory(SingleFlight),
+            SingleFlightScope.DISABLED.value: providers.Object(None),
+        },
+    )
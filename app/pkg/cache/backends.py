@@ -0,0 +1,166 @@
+"""Storages of cached values."""
+
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from aiocache import RedisCache
+from aiocache.serializers import PickleSerializer, StringSerializer
+from pydantic.types import SecretStr
+
+__all__ = ["BaseCacheBackend", "MemoryBackend", "RedisBackend"]
+
+
+class BaseCacheBackend(ABC):
+    """Base storage of cached values.
+
+    Besides values, backend stores versions of tags. Version of tag is a part of
+    key of every value cached with this tag, so incrementing it invalidates all
+    such values at once.
+    """
+
+    #: bool: Values and versions of tags are shared by all workers.
+    shared: bool = False
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[Any]:
+        """Get value.
+
+        Args:
+            key: Key of value.
+
+        Returns:
+            Cached value or ``None`` if it is missing or expired.
+        """
+
+    @abstractmethod
+    async def set(self, key: str, value: Any, ttl: int) -> None:
+        """Set value.
+
+        Args:
+            key: Key of value.
+            value: Value to cache.
+            ttl: Time to live of value in seconds.
+        """
+
+    @abstractmethod
+    async def get_versions(self, tags: Iterable[str]) -> List[int]:
+        """Get current versions of tags.
+
+        Args:
+            tags: Names of tags.
+
+        Returns:
+            Versions of tags in the same order. Unknown tags have version ``0``.
+        """
+
+    @abstractmethod
+    async def increment(self, tags: Iterable[str]) -> None:
+        """Increment versions of tags.
+
+        Args:
+            tags: Names of tags.
+        """
+
+    async def close(self) -> None:
+        """Close connections of backend."""
+
+
+class MemoryBackend(BaseCacheBackend):
+    """In-process LRU cache with TTL.
+
+    Warnings:
+        Values are stored as is, so they must not be mutated by the caller.
+        Versions of tags are local to the process.
+    """
+
+    #: int: Max count of cached values.
+    maxsize: int
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.__values: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self.__versions: Dict[str, int] = {}
+
+    async def get(self, key: str) -> Optional[Any]:
+        item = self.__values.get(key)
+        if item is None:
+            return None
+
+        expires_at, value = item
+        if expires_at < time.monotonic():
+            del self.__values[key]
+            return None
+
+        self.__values.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: Any, ttl: int) -> None:
+        self.__values[key] = (time.monotonic() + ttl, value)
+        self.__values.move_to_end(key)
+        while len(self.__values) > self.maxsize:
+            self.__values.popitem(last=False)
+
+    async def get_versions(self, tags: Iterable[str]) -> List[int]:
+        return [self.__versions.get(tag, 0) for tag in tags]
+
+    async def increment(self, tags: Iterable[str]) -> None:
+        for tag in tags:
+            self.__versions[tag] = self.__versions.get(tag, 0) + 1
+
+
+class RedisBackend(BaseCacheBackend):
+    """Redis cache based on :class:`aiocache.RedisCache`.
+
+    Values are pickled. Versions of tags are stored as redis counters, so
+    invalidation is shared by all workers.
+    """
+
+    shared = True
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        db: int,
+        namespace: str,
+        password: Optional[SecretStr] = None,
+    ):
+        if password is not None:
+            password = password.get_secret_value()
+
+        self.__values = RedisCache(
+            serializer=PickleSerializer(),
+            endpoint=host,
+            port=port,
+            db=db,
+            password=password,
+            namespace=f"{namespace}:values:",
+        )
+        self.__versions = RedisCache(
+            serializer=StringSerializer(),
+            endpoint=host,
+            port=port,
+            db=db,
+            password=password,
+            namespace=f"{namespace}:tags:",
+        )
+
+    async def get(self, key: str) -> Optional[Any]:
+        return await self.__values.get(key)
+
+    async def set(self, key: str, value: Any, ttl: int) -> None:
+        await self.__values.set(key, value, ttl=ttl)
+
+    async def get_versions(self, tags: Iterable[str]) -> List[int]:
+        versions = await self.__versions.multi_get(list(tags))
+        return [int(version or 0) for version in versions]
+
+    async def increment(self, tags: Iterable[str]) -> None:
+        for tag in tags:
+            await self.__versions.increment(tag)
+
+    async def close(self) -> None:
+        await self.__values.close()
+        await self.__versions.close()
@@ -0,0 +1,50 @@
+"""Invalidation of in-process cache by changes of rows in other workers."""
+
+from typing import Iterable, Tuple
+
+from app.pkg.cache.read_through import ReadThroughCache
+from app.pkg.connectors.postgresql.notifications import RowChange, RowChangeSubscriber
+
+__all__ = ["CacheInvalidator"]
+
+
+class CacheInvalidator(RowChangeSubscriber):
+    """Invalidate tags of :class:`.ReadThroughCache` by changes of rows of
+    the table received from :class:`.RowChangeListener`.
+
+    Values are invalidated after the change is committed by any worker, so
+    they may have long TTL. While changes are not delivered, tags are
+    suspended and values are loaded without cache.
+
+    Notes:
+        Subscriber is needed only for backend, which versions of tags are
+        local to the process (see :attr:`.BaseCacheBackend.shared`).
+
+    Examples:
+        ::
+
+            >>> await listener.subscribe(
+            ...     "countries",
+            ...     CacheInvalidator(cache=cache, tags=("countries",)),
+            ... )
+    """
+
+    #: ReadThroughCache: Invalidated cache.
+    cache: ReadThroughCache
+
+    #: Tuple[str, ...]: Tags of values read from the table.
+    tags: Tuple[str, ...]
+
+    def __init__(self, cache: ReadThroughCache, tags: Iterable[str]):
+        self.cache = cache
+        self.tags = tuple(tags)
+
+    async def on_change(self, change: RowChange) -> None:
+        await self.cache.invalidate(*self.tags)
+
+    async def on_connect(self) -> None:
+        await self.cache.invalidate(*self.tags)
+        self.cache.resume(*self.tags)
+
+    def on_disconnect(self) -> None:
+        self.cache.suspend(*self.tags)
@@ -0,0 +1,39 @@
+"""Keys of calls of service methods."""
+
+import hashlib
+import json
+from typing import Any, Tuple
+
+from app.pkg.models.base import BaseModel
+
+__all__ = ["build_key"]
+
+
+def build_key(args: Tuple[Any, ...], kwargs: dict) -> str:
+    """Build key of a call from its arguments.
+
+    Models are serialized with :meth:`.BaseModel.to_dict` with revealed
+    secrets, so queries by different tokens never share a key.
+
+    Args:
+        args: Positional arguments.
+        kwargs: Keyword arguments.
+
+    Returns:
+        Digest of the arguments.
+    """
+
+    def serialize(value: Any) -> Any:
+        if isinstance(value, BaseModel):
+            return [type(value).__name__, value.to_dict(show_secrets=True)]
+        return repr(value)
+
+    payload = json.dumps(
+        [
+            [serialize(arg) for arg in args],
+            {k: serialize(v) for k, v in kwargs.items()},
+        ],
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
@@ -0,0 +1,252 @@
+"""Read-through cache with tag based invalidation."""
+
+from functools import partial, wraps
+from typing import Any, Awaitable, Callable, Iterable, Optional, Set
+
+from prometheus_client import Counter
+
+from app.pkg.cache.backends import BaseCacheBackend
+from app.pkg.cache.keys import build_key
+from app.pkg.connectors.postgresql.routing import read_from_primary
+from app.pkg.connectors.postgresql.transaction import in_transaction, on_commit
+from app.pkg.logger import get_logger
+
+__all__ = ["ReadThroughCache", "cached", "invalidates"]
+
+logger = get_logger(__name__)
+
+
+class ReadThroughCache:
+    """Read-through cache.
+
+    Value is loaded with ``loader`` on the first read and served from backend
+    until its TTL expires or one of its tags is invalidated.
+
+    Notes:
+        Cache never breaks reads: if backend is not available, value is loaded
+        with ``loader`` and the error is logged.
+
+        Value, that is cached on miss, is loaded from the primary (see
+        :func:`.read_from_primary`), so a lagging replica never fills the cache
+        with a stale row. Not cached loads may still be served by replicas.
+
+    Examples:
+        ::
+
+            >>> from app.pkg.cache.backends import MemoryBackend
+            >>> cache = ReadThroughCache(backend=MemoryBackend(maxsize=128), ttl=60)
+            >>> async def read_countries():
+            ...     return await cache.get_or_load(
+            ...         name="countries",
+            ...         key="all",
+            ...         loader=repository.read_all,
+            ...         tags=("countries",),
+            ...     )
+            >>> async def create_country(cmd):
+            ...     country = await repository.create(cmd=cmd)
+            ...     await cache.invalidate("countries")
+            ...     return country
+    """
+
+    #: BaseCacheBackend: Storage of cached values.
+    backend: BaseCacheBackend
+
+    #: int: Default time to live of values in seconds.
+    ttl: int
+
+    __REQUESTS = Counter(
+        "cache_requests_total",
+        "Total count of cache lookups by cached function and result.",
+        ["name", "result"],
+    )
+    __INVALIDATIONS = Counter(
+        "cache_invalidations_total",
+        "Total count of invalidations by tag.",
+        ["tag"],
+    )
+
+    def __init__(self, backend: BaseCacheBackend, ttl: int):
+        self.backend = backend
+        self.ttl = ttl
+        self.__suspended: Set[str] = set()
+
+    async def get_or_load(
+        self,
+        name: str,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        tags: Iterable[str] = (),
+        ttl: Optional[int] = None,
+    ) -> Any:
+        """Get value from cache or load and cache it.
+
+        Args:
+            name: Name of cached function. Used as metrics label.
+            key: Key of value inside ``name``.
+            loader: Coroutine function, that loads value on miss.
+            tags: Tags of value. Invalidation of any of them drops the value.
+            ttl: Time to live of value in seconds. Defaults to :attr:`.ttl`.
+
+        Returns:
+            Cached or loaded value.
+        """
+
+        tags = tuple(tags)
+        if self.__suspended.intersection(tags):
+            self.__REQUESTS.labels(name=name, result="bypass").inc()
+            return await loader()
+
+        try:
+            versions = await self.backend.get_versions(tags)
+            full_key = f"{name}:{key}:{'.'.join(map(str, versions))}"
+            value = await self.backend.get(full_key)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.warning("Cache lookup of %s failed: %r", name, e)
+            self.__REQUESTS.labels(name=name, result="error").inc()
+            return await loader()
+
+        if value is not None:
+            self.__REQUESTS.labels(name=name, result="hit").inc()
+            return value
+
+        self.__REQUESTS.labels(name=name, result="miss").inc()
+        with read_from_primary():
+            value = await loader()
+        try:
+            await self.backend.set(full_key, value, ttl=ttl or self.ttl)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.warning("Cache store of %s failed: %r", name, e)
+        return value
+
+    async def invalidate(self, *tags: str) -> None:
+        """Invalidate all values cached with any of ``tags``.
+
+        Args:
+            *tags: Tags to invalidate.
+
+        Returns:
+            None
+        """
+
+        try:
+            await self.backend.increment(tags)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.error("Cache invalidation of %s failed: %r", tags, e)
+            return
+
+        for tag in tags:
+            self.__INVALIDATIONS.labels(tag=tag).inc()
+
+    def suspend(self, *tags: str) -> None:
+        """Load values with any of ``tags`` without cache until :meth:`.resume`.
+
+        Used while invalidations of ``tags`` may be lost.
+
+        Args:
+            *tags: Tags to suspend.
+        """
+
+        self.__suspended.update(tags)
+
+    def resume(self, *tags: str) -> None:
+        """Cache values with ``tags`` again.
+
+        Args:
+            *tags: Tags to resume.
+        """
+
+        self.__suspended.difference_update(tags)
+
+    async def close(self) -> None:
+        """Close connections of backend."""
+
+        await self.backend.close()
+
+
+def cached(*tags: str, ttl: Optional[int] = None):
+    """Cache result of service method in ``self.cache``.
+
+    Key of value is built from the method name and its arguments. Models are
+    serialized with :meth:`.BaseModel.to_dict`. If ``self.cache`` is ``None``
+    or method is called inside :class:`.UnitOfWork`, method is called as is.
+
+    Args:
+        *tags: Tags of cached values.
+        ttl: Time to live of values in seconds.
+
+    Examples:
+        ::
+
+            >>> class CountryService:
+            ...     cache: ReadThroughCache
+            ...
+            ...     @cached("countries")
+            ...     async def read_country(self, query):
+            ...         return await self.repository.read(query=query)
+
+    Returns:
+        Decorator of the method.
+    """
+
+    def decorator(fn):
+        name = fn.__qualname__
+
+        @wraps(fn)
+        async def inner(self, *args, **kwargs):
+            if self.cache is None or in_transaction():
+                return await fn(self, *args, **kwargs)
+
+            return await self.cache.get_or_load(
+                name=name,
+                key=build_key(args, kwargs),
+                loader=lambda: fn(self, *args, **kwargs),
+                tags=tags,
+                ttl=ttl,
+            )
+
+        return inner
+
+    return decorator
+
+
+def invalidates(*tags: str):
+    """Invalidate ``tags`` in ``self.cache`` after successful call of service
+    method.
+
+    Args:
+        *tags: Tags to invalidate.
+
+    Notes:
+        Inside :class:`.UnitOfWork` tags are invalidated after commit.
+        Otherwise, another worker could load the old committed row before
+        commit and cache it under the new version of the tags.
+
+    Examples:
+        ::
+
+            >>> class CountryService:
+            ...     cache: ReadThroughCache
+            ...
+            ...     @invalidates("countries")
+            ...     async def create_country(self, cmd):
+            ...         return await self.repository.create(cmd=cmd)
+
+    Returns:
+        Decorator of the method.
+    """
+
+    def decorator(fn):
+        @wraps(fn)
+        async def inner(self, *args, **kwargs):
+            result = await fn(self, *args, **kwargs)
+            if self.cache is None:
+                return result
+            if in_transaction():
+                on_commit(partial(self.cache.invalidate, *tags))
+            else:
+                await self.cache.invalidate(*tags)
+            return result
+
+        return inner
+
+    return decorator
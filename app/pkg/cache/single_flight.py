@@ -0,0 +1,148 @@
+"""Single-flight: share one in-flight call between identical concurrent calls."""
+
+import asyncio
+from functools import partial, wraps
+from typing import Any, Awaitable, Callable, Dict, Tuple
+
+from prometheus_client import Counter, Gauge
+
+from app.pkg.cache.keys import build_key
+from app.pkg.connectors.postgresql.routing import (
+    pinned_to_primary,
+    reads_from_replicas,
+)
+from app.pkg.connectors.postgresql.transaction import in_transaction
+
+__all__ = ["SingleFlight", "single_flight"]
+
+
+class SingleFlight:
+    """Group of in-flight calls.
+
+    The first call with a key (leader) starts the call in a separate task,
+    and all calls with the same key, that come until the task is done
+    (followers), await the same task. So a burst of identical reads costs one
+    query and one connection of the pool.
+
+    Notes:
+        Task is shielded from cancellation of the callers: when the client of
+        the leader disconnects, followers still get the result.
+
+    Warnings:
+        All callers get the same result object, so it must not be mutated.
+
+    Examples:
+        ::
+
+            >>> flights = SingleFlight()
+            >>> await asyncio.gather(
+            ...     flights.do("read_partner", "1", lambda: repository.read(...)),
+            ...     flights.do("read_partner", "1", lambda: repository.read(...)),
+            ... )  # Repository is called once.
+    """
+
+    __CALLS = Counter(
+        "single_flight_calls_total",
+        "Total count of calls by function and role: leader or follower.",
+        ["name", "role"],
+    )
+    __IN_FLIGHT = Gauge(
+        "single_flight_in_flight",
+        "Count of calls in flight by function.",
+        ["name"],
+        multiprocess_mode="livesum",
+    )
+
+    def __init__(self):
+        self.__flights: Dict[Tuple[str, str], asyncio.Future] = {}
+
+    async def do(
+        self,
+        name: str,
+        key: str,
+        fn: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Call ``fn`` or join the identical call in flight.
+
+        Args:
+            name: Name of called function. Used as metrics label.
+            key: Key of the call inside ``name``.
+            fn: Coroutine function to call.
+
+        Returns:
+            Result of the call.
+
+        Raises:
+            Exception: Any exception raised by ``fn``.
+        """
+
+        flight = self.__flights.get((name, key))
+        if flight is None:
+            flight = asyncio.ensure_future(fn())
+            self.__flights[(name, key)] = flight
+            self.__IN_FLIGHT.labels(name=name).inc()
+            flight.add_done_callback(partial(self.__land, name, key))
+            self.__CALLS.labels(name=name, role="leader").inc()
+        else:
+            self.__CALLS.labels(name=name, role="follower").inc()
+
+        return await asyncio.shield(flight)
+
+    def __land(self, name: str, key: str, flight: asyncio.Future) -> None:
+        """Forget finished call.
+
+        Args:
+            name: Name of called function.
+            key: Key of the call.
+            flight: Finished task.
+        """
+
+        self.__flights.pop((name, key), None)
+        self.__IN_FLIGHT.labels(name=name).dec()
+        if not flight.cancelled():
+            # Mark exception as retrieved, if all callers were cancelled.
+            flight.exception()
+
+
+def single_flight(fn):
+    """Share in-flight calls of service method in ``self.single_flight``.
+
+    Key of the call is built from the method name, its arguments and routing
+    of reads (replicas or the primary), models are serialized with
+    :meth:`.BaseModel.to_dict`. If ``self.single_flight`` is ``None``, method
+    is called inside :class:`.UnitOfWork` or by context pinned to the primary,
+    method is called as is. So not committed values are not shared, and a
+    caller never joins a read, that was started before its own write.
+
+    Args:
+        fn: Service method.
+
+    Examples:
+        ::
+
+            >>> class PartnerService:
+            ...     single_flight: SingleFlight
+            ...
+            ...     @single_flight
+            ...     async def read_partner_by_token(self, query):
+            ...         return await self.repository.read_by_token(query=query)
+
+    Returns:
+        Decorated method.
+    """
+
+    name = fn.__qualname__
+
+    @wraps(fn)
+    async def inner(self, *args, **kwargs):
+        if self.single_flight is None or in_transaction() or pinned_to_primary():
+            return await fn(self, *args, **kwargs)
+
+        routing = "replicas" if reads_from_replicas() else "primary"
+        return await self.single_flight.do(
+            name=name,
+            key=f"{routing}:{build_key(args, kwargs)}",
+            fn=lambda: fn(self, *args, **kwargs),
+        )
+
+    return inner
@@ -0,0 +1,315 @@
+"""In-process index of entities by their token."""
+
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from prometheus_client import Counter, Gauge
+from pydantic.types import SecretStr
+
+from app.pkg.connectors.postgresql.notifications import RowChange, RowChangeSubscriber
+from app.pkg.connectors.postgresql.transaction import in_transaction
+from app.pkg.logger import get_logger
+from app.pkg.models.base import Model
+
+__all__ = ["TokenIndex", "index_evict", "index_lookup", "index_store"]
+
+logger = get_logger(__name__)
+
+
+class TokenIndex(RowChangeSubscriber):
+    """LRU index of entities by token.
+
+    Entity is stored with its ``id``, so entity is dropped by changes of
+    its row received from :class:`.RowChangeListener`, and the old token is
+    dropped when entity is stored with the new one.
+
+    Notes:
+        Index is disabled while changes are not delivered (listening connection
+        is lost), so it never serves values, that may be changed by other
+        workers.
+
+        :attr:`.generation` is incremented by every drop and write. Entity read
+        from the database is stored only if generation is not changed during
+        the read, so concurrent change is never overwritten by the old row.
+
+    Warnings:
+        Entities are shared by all readers, so they must not be mutated.
+
+    Examples:
+        ::
+
+            >>> index = TokenIndex(name="partners", maxsize=10000)
+            >>> index.put(partner)
+            >>> index.get(partner.token) is partner
+            True
+    """
+
+    __REQUESTS = Counter(
+        "token_index_requests_total",
+        "Total count of lookups in token index by index and result.",
+        ["index", "result"],
+    )
+    __SIZE = Gauge(
+        "token_index_size",
+        "Count of entities in token index.",
+        ["index"],
+        multiprocess_mode="livesum",
+    )
+
+    #: str: Name of index. Used as metrics label.
+    name: str
+
+    #: int: Max count of entities. ``0`` disables index.
+    maxsize: int
+
+    #: bool: Index serves and stores entities.
+    enabled: bool
+
+    #: int: Count of drops and writes of entities.
+    generation: int
+
+    def __init__(self, name: str, maxsize: int):
+        self.name = name
+        self.maxsize = maxsize
+        self.enabled = maxsize > 0
+        self.generation = 0
+
+        self.__entities: "OrderedDict[str, Model]" = OrderedDict()
+        self.__tokens: Dict[int, str] = {}
+
+    def get(self, token: Any) -> Optional[Model]:
+        """Get entity by token.
+
+        Args:
+            token: Token of entity. ``SecretStr`` or ``str``.
+
+        Returns:
+            Entity or ``None`` if it is not indexed.
+        """
+
+        if not self.enabled:
+            return None
+
+        key = self.key(token)
+        entity = self.__entities.get(key)
+        if entity is None:
+            self.__REQUESTS.labels(index=self.name, result="miss").inc()
+            return None
+
+        self.__entities.move_to_end(key)
+        self.__REQUESTS.labels(index=self.name, result="hit").inc()
+        return entity
+
+    def put(self, entity: Model, generation: Optional[int] = None) -> None:
+        """Store entity.
+
+        Args:
+            entity: Entity with ``id`` and ``token``.
+            generation: :attr:`.generation` before entity was read. Entity is
+                not stored if any entity was dropped or written since then.
+                ``None`` for entity, that is just written.
+        """
+
+        if not self.enabled or generation not in (None, self.generation):
+            return
+        if generation is None:
+            # Entity is written, so reads started before must not store the
+            # old row.
+            self.generation += 1
+
+        key = self.key(entity.token)
+        old_key = self.__tokens.get(entity.id)
+        if old_key is not None and old_key != key:
+            self.__entities.pop(old_key, None)
+
+        self.__entities[key] = entity
+        self.__entities.move_to_end(key)
+        self.__tokens[entity.id] = key
+        while len(self.__entities) > self.maxsize:
+            _, evicted = self.__entities.popitem(last=False)
+            self.__tokens.pop(evicted.id, None)
+        self.__SIZE.labels(index=self.name).set(len(self.__entities))
+
+    def discard(self, entity_id: int) -> None:
+        """Drop entity by id.
+
+        Args:
+            entity_id: Id of entity.
+        """
+
+        self.generation += 1
+        key = self.__tokens.pop(entity_id, None)
+        if key is not None:
+            self.__entities.pop(key, None)
+            self.__SIZE.labels(index=self.name).set(len(self.__entities))
+
+    def clear(self) -> None:
+        """Drop all entities."""
+
+        self.generation += 1
+        self.__entities.clear()
+        self.__tokens.clear()
+        self.__SIZE.labels(index=self.name).set(0)
+
+    async def warm(self, batches: AsyncIterator[List[Model]]) -> None:
+        """Fill index with entities until it is full.
+
+        Args:
+            batches: Async iterator of batches of entities, e.g.
+                ``repository.stream_all()``.
+        """
+
+        try:
+            while self.enabled and len(self.__entities) < self.maxsize:
+                generation = self.generation
+                try:
+                    batch = await batches.__anext__()
+                except StopAsyncIteration:
+                    break
+                for entity in batch[: self.maxsize - len(self.__entities)]:
+                    self.put(entity, generation=generation)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.warning("Warming of %s token index failed: %r", self.name, e)
+        finally:
+            await batches.aclose()
+
+    def on_change(self, change: RowChange) -> None:
+        if change.op == "INSERT":
+            return
+        if change.id is None:
+            self.clear()
+        else:
+            self.discard(change.id)
+
+    def on_connect(self) -> None:
+        self.clear()
+        self.enabled = self.maxsize > 0
+
+    def on_disconnect(self) -> None:
+        self.clear()
+        self.enabled = False
+
+    @staticmethod
+    def key(token: Any) -> str:
+        """Build key of token.
+
+        Args:
+            token: ``SecretStr`` or any value, that is converted to ``str``.
+
+        Returns:
+            Revealed token.
+        """
+
+        if isinstance(token, SecretStr):
+            return token.get_secret_value()
+        return str(token)
+
+
+def index_lookup(fn):
+    """Look up entity by ``query.token`` in ``self.token_index`` before
+    reading it from the database, and store read entity.
+
+    If ``self.token_index`` is ``None``, method is called as is. Inside
+    :class:`.UnitOfWork` read entity is not stored.
+
+    Examples:
+        ::
+
+            >>> class PartnerRepository:
+            ...     token_index: Optional[TokenIndex]
+            ...
+            ...     @index_lookup
+            ...     @collect_response
+            ...     async def read_by_token(self, query):
+            ...         ...
+
+    Returns:
+        Decorated repository method.
+    """
+
+    @wraps(fn)
+    async def inner(self, query):
+        index: Optional[TokenIndex] = self.token_index
+        if index is None:
+            return await fn(self, query=query)
+
+        entity = index.get(query.token)
+        if entity is not None:
+            return entity
+
+        generation = index.generation
+        entity = await fn(self, query=query)
+        if not in_transaction():
+            index.put(entity, generation=generation)
+        return entity
+
+    return inner
+
+
+def index_store(fn):
+    """Store entity or list of entities returned by repository method in
+    ``self.token_index``.
+
+    Inside :class:`.UnitOfWork` entities are dropped from the index instead,
+    because the transaction may be rolled back. Committed rows are stored on
+    the next read.
+
+    Examples:
+        ::
+
+            >>> class PartnerRepository:
+            ...     token_index: Optional[TokenIndex]
+            ...
+            ...     @index_store
+            ...     @collect_response
+            ...     async def update(self, cmd):
+            ...         ...
+
+    Returns:
+        Decorated repository method.
+    """
+
+    @wraps(fn)
+    async def inner(self, *args, **kwargs):
+        result = await fn(self, *args, **kwargs)
+        index: Optional[TokenIndex] = self.token_index
+        if index is not None:
+            for entity in result if isinstance(result, list) else (result,):
+                if in_transaction():
+                    index.discard(entity.id)
+                else:
+                    index.put(entity)
+        return result
+
+    return inner
+
+
+def index_evict(fn):
+    """Drop entity or list of entities returned by repository method from
+    ``self.token_index``.
+
+    Examples:
+        ::
+
+            >>> class PartnerRepository:
+            ...     token_index: Optional[TokenIndex]
+            ...
+            ...     @index_evict
+            ...     @collect_response
+            ...     async def delete(self, cmd):
+            ...         ...
+
+    Returns:
+        Decorated repository method.
+    """
+
+    @wraps(fn)
+    async def inner(self, *args, **kwargs):
+        result = await fn(self, *args, **kwargs)
+        if self.token_index is not None:
+            for entity in result if isinstance(result, list) else (result,):
+                self.token_index.discard(entity.id)
+        return result
+
+    return inner
@@ -2,7 +2,13 @@
 
 from dependency_injector import containers, providers
 
-from app.pkg.connectors.postgresql.resource import Postgresql
+from app.pkg.connectors.postgresql.notifications import RowChangeListener
+from app.pkg.connectors.postgresql.resource import (
+    Postgresql,
+    PostgresqlAsyncpg,
+    PostgresqlAsyncpgReplicas,
+    PostgresqlReplicas,
+)
 from app.pkg.settings import settings
 
 __all__ = ["PostgresSQL"]
@@ -16,9 +22,56 @@ class PostgresSQL(containers.DeclarativeContainer):
         pydantic_settings=[settings],
     )
 
-    connector = providers.Resource(
-        Postgresql,
+    #: Pool of the primary. Driver is selected by ``POSTGRES.DRIVER``.
+    connector = providers.Selector(
+        configuration.POSTGRES.DRIVER,
+        aiopg=providers.Resource(
+            Postgresql,
+            dsn=configuration.POSTGRES.DSN,
+            minsize=configuration.POSTGRES.MIN_CONNECTION,
+            maxsize=configuration.POSTGRES.MAX_CONNECTION,
+            acquire_timeout=configuration.POSTGRES.ACQUIRE_TIMEOUT,
+            max_connection_age=configuration.POSTGRES.MAX_CONNECTION_AGE,
+        ),
+        asyncpg=providers.Resource(
+            PostgresqlAsyncpg,
+            dsn=configuration.POSTGRES.DSN,
+            minsize=configuration.POSTGRES.MIN_CONNECTION,
+            maxsize=configuration.POSTGRES.MAX_CONNECTION,
+            statement_cache_size=configuration.POSTGRES.PREPARED_STATEMENTS_CACHE_SIZE,
+            acquire_timeout=configuration.POSTGRES.ACQUIRE_TIMEOUT,
+            max_connection_age=configuration.POSTGRES.MAX_CONNECTION_AGE,
+        ),
+    )
+
+    #: Pools of read replicas with the same driver as ``connector``.
+    replicas = providers.Selector(
+        configuration.POSTGRES.DRIVER,
+        aiopg=providers.Resource(
+            PostgresqlReplicas,
+            dsns=configuration.POSTGRES.REPLICAS,
+            health_check_interval=configuration.POSTGRES.REPLICA_HEALTH_CHECK_INTERVAL,
+            maxsize=configuration.POSTGRES.MAX_CONNECTION,
+            acquire_timeout=configuration.POSTGRES.ACQUIRE_TIMEOUT,
+            max_connection_age=configuration.POSTGRES.MAX_CONNECTION_AGE,
+        ),
+        asyncpg=providers.Resource(
+            PostgresqlAsyncpgReplicas,
+            dsns=configuration.POSTGRES.REPLICAS,
+            health_check_interval=configuration.POSTGRES.REPLICA_HEALTH_CHECK_INTERVAL,
+            maxsize=configuration.POSTGRES.MAX_CONNECTION,
+            statement_cache_size=configuration.POSTGRES.PREPARED_STATEMENTS_CACHE_SIZE,
+            acquire_timeout=configuration.POSTGRES.ACQUIRE_TIMEOUT,
+            max_connection_age=configuration.POSTGRES.MAX_CONNECTION_AGE,
+        ),
+    )
+
+    #: Listener of changed rows. It uses ``LISTEN`` of aiopg with any driver.
+    #: It is started by :func:`.on_startup`, not by initialization of the
+    #: container.
+    listener = providers.Singleton(
+        RowChangeListener,
         dsn=configuration.POSTGRES.DSN,
-        minsize=configuration.POSTGRES.MIN_CONNECTION,
-        maxsize=configuration.POSTGRES.MAX_CONNECTION,
+        max_reconnect_interval=configuration.POSTGRES.LISTENER_MAX_RECONNECT_INTERVAL,
+        ping_interval=configuration.POSTGRES.LISTENER_PING_INTERVAL,
     )
@@ -0,0 +1,531 @@
+"""Adapter of asyncpg pool to the interface of aiopg pool.
+
+Repositories, :class:`.PoolMonitor`, :func:`.collect_response` and
+:func:`.handle_exception` are written for aiopg: queries with psycopg2
+placeholders, rows as dicts and :class:`psycopg2.Error` with ``pgcode`` and
+``diag``. Classes of this module give the same interface on top of asyncpg, so
+the backend is selected only by ``POSTGRES.DRIVER``.
+
+Notes:
+    ``asyncpg`` is an optional dependency, so this module is imported only when
+    asyncpg backend is selected. See :class:`.PostgresqlAsyncpg`.
+"""
+
+import asyncio
+import re
+from functools import lru_cache
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Type
+
+import asyncpg
+import psycopg2
+import psycopg2.errors
+from asyncpg.pool import PoolConnectionProxy
+
+__all__ = [
+    "AsyncpgPool",
+    "AsyncpgConnection",
+    "AsyncpgCursor",
+    "convert_query",
+    "convert_error",
+]
+
+#: re.Pattern: Placeholder of psycopg2 query.
+__placeholder__ = re.compile(r"%\((\w+)\)s|%%|%s")
+
+#: re.Pattern: First keyword of query after leading whitespace and comments.
+__keyword__ = re.compile(r"(?:\s|--[^\n]*|/\*.*?\*/)*(\w*)", re.DOTALL)
+
+#: tuple: First keywords of statements, that always return rows.
+__returning__ = ("select", "values", "table", "show", "explain")
+
+#: tuple: First keywords of statements, that return rows only with
+#: ``RETURNING`` clause.
+__modifying__ = ("insert", "update", "delete", "merge", "with")
+
+#: tuple: First keywords of statements of server-side cursors. Their texts
+#: contain names of cursors and rows of ``FETCH`` change their shape with the
+#: cursor, so they are never put in the statement cache.
+__cursor_statements__ = ("declare", "fetch", "move")
+
+#: int: Max count of queries in :data:`__returns_rows__`.
+__returns_rows_size__ = 1024
+
+#: Dict[str, bool]: Queries, that were described by the server, and whether
+#: they return rows.
+__returns_rows__: Dict[str, bool] = {}
+
+#: tuple: Errors of asyncpg, that are converted to psycopg2 errors.
+__errors__ = (asyncpg.PostgresError, asyncpg.InterfaceError, OSError)
+
+
+@lru_cache(maxsize=1024)
+def convert_query(query: str) -> Tuple[str, Tuple[str, ...]]:
+    """Replace psycopg2 placeholders of the query with asyncpg ones.
+
+    Args:
+        query: Query with ``%(name)s`` or ``%s`` placeholders.
+
+    Notes:
+        Unlike :func:`.compile_query`, any query is converted, because asyncpg
+        prepares all queries with parameters.
+
+    Examples:
+        ::
+
+            >>> convert_query("select %(id)s, %(name)s where id = %(id)s")
+            ('select $1, $2 where id = $1', ('id', 'name'))
+            >>> convert_query("select %s, '100%%'")
+            ("select $1, '100%'", ())
+
+    Returns:
+        Query with ``$n`` placeholders and names of parameters in order of their
+        numbers. Names are empty for positional placeholders.
+    """
+
+    names: Dict[str, int] = {}
+    positional = 0
+
+    def replace(match: re.Match) -> str:
+        nonlocal positional
+        name = match.group(1)
+        if name is not None:
+            return f"${names.setdefault(name, len(names) + 1)}"
+        if match.group(0) == "%%":
+            return "%"
+        positional += 1
+        return f"${positional}"
+
+    return __placeholder__.sub(replace, query), tuple(names)
+
+
+def convert_error(error: Exception) -> psycopg2.Error:
+    """Convert asyncpg error to psycopg2 error with the same ``pgcode``.
+
+    Args:
+        error: Error raised by asyncpg or by socket of the connection.
+
+    Notes:
+        Converted error is an instance of the psycopg2 class of its SQLSTATE,
+        e.g. :class:`psycopg2.errors.UniqueViolation`, and has ``diag`` with
+        ``constraint_name`` and ``message_detail``, so
+        :func:`.handle_exception` maps it to the same API exception as error of
+        aiopg. Errors of the socket become :class:`psycopg2.OperationalError`.
+
+    Returns:
+        psycopg2 error.
+    """
+
+    if isinstance(error, asyncpg.PostgresError):
+        converted = __error_type(error.sqlstate, psycopg2.DatabaseError)(str(error))
+        converted.asyncpg_error = error
+        return converted
+    if isinstance(error, asyncpg.InterfaceError):
+        return __error_type(None, psycopg2.InterfaceError)(str(error))
+    return __error_type(None, psycopg2.OperationalError)(str(error))
+
+
+@lru_cache(maxsize=None)
+def __error_type(
+    sqlstate: Optional[str],
+    default: Type[psycopg2.Error],
+) -> Type[psycopg2.Error]:
+    """Create subclass of psycopg2 error of the SQLSTATE.
+
+    Args:
+        sqlstate: Code of the error. ``None`` for errors of the client.
+        default: Base class for unknown codes.
+
+    Returns:
+        Subclass of psycopg2 error, that reads ``pgcode`` and ``diag`` from the
+        asyncpg error.
+    """
+
+    base = default
+    if sqlstate is not None:
+        try:
+            base = psycopg2.errors.lookup(sqlstate)
+        except KeyError:
+            pass
+    return type(base.__name__, (_AsyncpgError, base), {"__module__": __name__})
+
+
+class _Diagnostics:
+    """Diagnostics of asyncpg error in the interface of psycopg2 ``diag``."""
+
+    def __init__(self, error: Optional[asyncpg.PostgresError]):
+        #: Optional[str]: Code of the error.
+        self.sqlstate = getattr(error, "sqlstate", None)
+        #: Optional[str]: Primary message of the error.
+        self.message_primary = getattr(error, "message", None)
+        #: Optional[str]: Detail of the error, e.g. values violated constraint.
+        self.message_detail = getattr(error, "detail", None)
+        #: Optional[str]: Hint of the error.
+        self.message_hint = getattr(error, "hint", None)
+        #: Optional[str]: Name of schema of the error.
+        self.schema_name = getattr(error, "schema_name", None)
+        #: Optional[str]: Name of table of the error.
+        self.table_name = getattr(error, "table_name", None)
+        #: Optional[str]: Name of column of the error.
+        self.column_name = getattr(error, "column_name", None)
+        #: Optional[str]: Name of violated constraint.
+        self.constraint_name = getattr(error, "constraint_name", None)
+
+
+class _AsyncpgError:
+    """Mixin of psycopg2 errors converted from asyncpg errors."""
+
+    #: Optional[asyncpg.PostgresError]: Original error of the server.
+    asyncpg_error: Optional[asyncpg.PostgresError] = None
+
+    @property
+    def pgcode(self) -> Optional[str]:
+        """Code of the error."""
+
+        return getattr(self.asyncpg_error, "sqlstate", None)
+
+    @property
+    def pgerror(self) -> Optional[str]:
+        """Message of the error."""
+
+        return getattr(self.asyncpg_error, "message", None)
+
+    @property
+    def diag(self) -> _Diagnostics:
+        """Diagnostics of the error."""
+
+        return _Diagnostics(self.asyncpg_error)
+
+
+class AsyncpgCursor:
+    """Cursor of asyncpg connection with interface of aiopg cursor.
+
+    Queries with parameters are converted by :func:`.convert_query` and are
+    executed as prepared statements of the built-in statement cache of asyncpg,
+    with binary protocol. Queries without parameters are sent as is, like
+    psycopg2 does.
+
+    Notes:
+        Rows are read on ``execute`` and returned as dicts, like rows of
+        :class:`psycopg2.extras.RealDictCursor`, so :func:`.collect_response`
+        and :class:`.TracedCursor` handle them the same way.
+
+        asyncpg returns either rows or the status of a statement, so the cursor
+        has to know in advance, whether the statement returns rows. Statements
+        with parameters and ``INSERT``, ``UPDATE``, ``DELETE``, ``MERGE`` and
+        ``WITH`` ones are described by the server on their first execution and
+        the result is kept in :data:`__returns_rows__`. Statements, that do not
+        return rows, are run by ``execute`` and ``rowcount`` is read from their
+        status, e.g. ``UPDATE 3``.
+
+        Statements of server-side cursors are executed as unnamed prepared
+        statements, that bypass the statement cache.
+    """
+
+    def __init__(self, connection: PoolConnectionProxy):
+        self.__connection = connection
+        self.__rows: List[Dict[str, Any]] = []
+        self.__position = 0
+        self.__rowcount = -1
+
+    @property
+    def rowcount(self) -> int:
+        """Count of rows returned or affected by the last query."""
+
+        return self.__rowcount
+
+    async def execute(self, operation: str, parameters: Any = None) -> None:
+        """Execute query and read its rows.
+
+        Args:
+            operation: Query with psycopg2 placeholders.
+            parameters: Mapping for named placeholders, sequence for positional
+                ones or ``None``.
+
+        Raises:
+            psycopg2.Error: Error converted by :func:`.convert_error`.
+        """
+
+        self.__rows = []
+        self.__position = 0
+        query, arguments = operation, []
+        if parameters is not None:
+            query, names = convert_query(operation)
+            arguments = self.__arguments(names, parameters)
+        keyword = self.__keyword(query)
+
+        status = None
+        try:
+            if keyword in __cursor_statements__:
+                records, status = await self.__execute_uncached(query, arguments)
+            elif keyword in __returning__:
+                records = await self.__connection.fetch(query, *arguments)
+            elif parameters is None and keyword not in __modifying__:
+                records, status = [], await self.__connection.execute(query)
+            elif query not in __returns_rows__:
+                records, status = await self.__execute_uncached(
+                    query,
+                    arguments,
+                    describe=True,
+                )
+            elif __returns_rows__[query]:
+                records = await self.__connection.fetch(query, *arguments)
+            else:
+                records = []
+                status = await self.__connection.execute(query, *arguments)
+        except __errors__ as error:
+            raise convert_error(error) from error
+        self.__rows = [dict(record) for record in records]
+        self.__rowcount = len(self.__rows)
+        if status is not None:
+            count = status.rsplit(" ", 1)[-1]
+            self.__rowcount = int(count) if count.isdigit() else -1
+
+    async def fetchone(self) -> Optional[Dict[str, Any]]:
+        """Return next row or ``None``."""
+
+        rows = await self.fetchmany(1)
+        return rows[0] if rows else None
+
+    async def fetchmany(self, size: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Return next ``size`` rows, one row by default."""
+
+        start = self.__position
+        self.__position = min(start + (size or 1), len(self.__rows))
+        return self.__rows[start : self.__position]
+
+    async def fetchall(self) -> List[Dict[str, Any]]:
+        """Return all remaining rows."""
+
+        return await self.fetchmany(len(self.__rows) - self.__position)
+
+    def close(self) -> None:
+        """Drop read rows."""
+
+        self.__rows = []
+        self.__position = 0
+
+    async def __execute_uncached(
+        self,
+        query: str,
+        arguments: Sequence[Any],
+        describe: bool = False,
+    ) -> Tuple[List[asyncpg.Record], str]:
+        """Execute query as unnamed prepared statement out of the statement cache.
+
+        Args:
+            query: Query with asyncpg placeholders.
+            arguments: Positional arguments of the query.
+            describe: Remember in :data:`__returns_rows__`, whether the query
+                returns rows.
+
+        Returns:
+            Rows and status of the statement.
+        """
+
+        statement = await self.__connection.prepare(query, name="")
+        records = await statement.fetch(*arguments)
+        if describe:
+            if len(__returns_rows__) >= __returns_rows_size__:
+                __returns_rows__.pop(next(iter(__returns_rows__)))
+            __returns_rows__[query] = bool(statement.get_attributes())
+        return records, statement.get_statusmsg()
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def __keyword(query: str) -> str:
+        """Find first keyword of the query.
+
+        Args:
+            query: Query, that may start with comments.
+
+        Notes:
+            Nested block comments are not supported.
+
+        Returns:
+            Lowercase keyword or empty string.
+        """
+
+        return __keyword__.match(query).group(1).lower()
+
+    @staticmethod
+    def __arguments(names: Tuple[str, ...], parameters: Any) -> Sequence[Any]:
+        """Order parameters by numbers of placeholders.
+
+        Args:
+            names: Names of parameters from :func:`.convert_query`.
+            parameters: Parameters of the query.
+
+        Returns:
+            Positional arguments of the asyncpg query.
+        """
+
+        if isinstance(parameters, Mapping):
+            return [parameters[name] for name in names]
+        return list(parameters)
+
+
+class AsyncpgConnection:
+    """Connection of :class:`.AsyncpgPool` with interface of aiopg connection.
+
+    Adapter lives as long as the asyncpg connection, so it is a stable key for
+    :class:`.PoolMonitor`, while pool gives a new proxy on every acquire.
+    """
+
+    #: Optional[PoolConnectionProxy]: Proxy of the current acquire.
+    proxy: Optional[PoolConnectionProxy]
+
+    def __init__(self):
+        self.proxy = None
+
+    @property
+    def closed(self) -> bool:
+        """Connection is released or closed."""
+
+        return self.proxy is None or self.proxy.is_closed()
+
+    def close(self) -> None:
+        """Close connection, pool opens a new one instead of it."""
+
+        self.proxy.terminate()
+
+    async def cursor(self, cursor_factory: Any = None) -> AsyncpgCursor:
+        """Create cursor.
+
+        Args:
+            cursor_factory: Ignored, rows are always dicts.
+
+        Returns:
+            Cursor of the connection.
+        """
+
+        return AsyncpgCursor(self.proxy)
+
+
+class _Connection(asyncpg.Connection):
+    """Asyncpg connection, that keeps its adapter."""
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        #: AsyncpgConnection: Adapter of the connection.
+        self.adapter = AsyncpgConnection()
+
+
+class AsyncpgPool:
+    """Asyncpg pool with interface of aiopg pool.
+
+    Examples:
+        ::
+
+            >>> pool = await AsyncpgPool.create(dsn, minsize=1, maxsize=16)
+            >>> conn = await pool.acquire()
+            >>> cur = await conn.cursor()
+            >>> await cur.execute("select %(id)s as id", {"id": 1})
+            >>> await cur.fetchone()
+            {'id': 1}
+            >>> await pool.release(conn)
+    """
+
+    def __init__(self, pool: asyncpg.Pool):
+        self.__pool = pool
+        self.__closing: Optional[asyncio.Future] = None
+
+    @classmethod
+    async def create(
+        cls,
+        dsn: str,
+        minsize: int = 1,
+        maxsize: int = 10,
+        statement_cache_size: int = 100,
+        **kwargs: Any,
+    ) -> "AsyncpgPool":
+        """Create pool with names of arguments of :func:`aiopg.create_pool`.
+
+        Args:
+            dsn: D.S.N - Data Source Name.
+            minsize: Min count of connections.
+            maxsize: Max count of connections.
+            statement_cache_size: Max count of prepared statements cached on
+                one connection. ``0`` disables the cache.
+            **kwargs: Other arguments of :func:`asyncpg.create_pool`.
+
+        Raises:
+            psycopg2.OperationalError: Database is unavailable.
+
+        Returns:
+            Created pool.
+        """
+
+        try:
+            pool = await asyncpg.create_pool(
+                dsn=dsn,
+                min_size=minsize,
+                max_size=maxsize,
+                statement_cache_size=statement_cache_size,
+                connection_class=_Connection,
+                **kwargs,
+            )
+        except __errors__ as error:
+            raise convert_error(error) from error
+        return cls(pool)
+
+    @property
+    def size(self) -> int:
+        """Count of open connections."""
+
+        return self.__pool.get_size()
+
+    @property
+    def freesize(self) -> int:
+        """Count of idle connections."""
+
+        return self.__pool.get_idle_size()
+
+    @property
+    def closed(self) -> bool:
+        """Pool is closed or closing."""
+
+        return self.__closing is not None
+
+    async def acquire(self) -> AsyncpgConnection:
+        """Acquire connection.
+
+        Raises:
+            psycopg2.OperationalError: Database is unavailable.
+
+        Returns:
+            Adapter of the acquired connection.
+        """
+
+        try:
+            proxy = await self.__pool.acquire()
+        except __errors__ as error:
+            raise convert_error(error) from error
+        connection: AsyncpgConnection = proxy.adapter
+        connection.proxy = proxy
+        return connection
+
+    def release(self, connection: AsyncpgConnection) -> asyncio.Future:
+        """Return connection to the pool.
+
+        Args:
+            connection: Connection from :meth:`.acquire`.
+
+        Returns:
+            Future of release, like :meth:`aiopg.Pool.release`. It may be not
+            awaited.
+        """
+
+        proxy, connection.proxy = connection.proxy, None
+        return asyncio.ensure_future(self.__pool.release(proxy))
+
+    def close(self) -> None:
+        """Start graceful closing of the pool."""
+
+        if self.__closing is None:
+            self.__closing = asyncio.ensure_future(self.__pool.close())
+
+    async def wait_closed(self) -> None:
+        """Wait until all connections are released and closed."""
+
+        self.close()
+        await self.__closing
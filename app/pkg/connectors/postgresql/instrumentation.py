@@ -0,0 +1,361 @@
+"""Per-query instrumentation of repository methods.
+
+Every call of a repository method decorated by :func:`.collect_response` or
+:func:`.collect_stream` is traced with :class:`.QueryTrace`. The trace is
+stored in context, so pool acquire, execute and fetch of the cursors used by
+the method are timed separately from decoding of the rows to models.
+
+Exported metrics:
+    * ``repository_query_duration_seconds`` - time of every phase of the
+      method: ``acquire``, ``execute``, ``fetch``, ``decode`` and ``total``.
+    * ``repository_query_rows`` - count of rows returned by the method.
+
+Labels of metrics are only names of repository class and its method, so
+their cardinality is bounded by the code.
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Optional
+
+import psycopg2
+from opentelemetry import trace
+from opentelemetry.trace import Span, Status, StatusCode
+from prometheus_client import Histogram
+
+from app.pkg.models.exceptions.repository import DriverError
+
+__all__ = [
+    "QueryInstrument",
+    "QueryTrace",
+    "TracedCursor",
+    "current_query",
+    "payload_size",
+]
+
+#: Tracer of repository methods.
+__tracer__ = trace.get_tracer(__name__)
+
+#: Tuple[Type[Exception], ...]: Errors, that mark span of the call as failed.
+#: Other exceptions, e.g. :class:`.EmptyResult`, are results of the query.
+__failures__ = (psycopg2.Error, DriverError)
+
+#: ContextVar[Optional[QueryTrace]]: Trace of the repository method, which
+#: is executed in the current context.
+__current_query__: ContextVar[Optional["QueryTrace"]] = ContextVar(
+    "current_query",
+    default=None,
+)
+
+
+def current_query() -> Optional["QueryTrace"]:
+    """Get trace of the repository method executed in the current context.
+
+    Returns:
+        Trace or ``None`` outside of repository methods.
+    """
+
+    return __current_query__.get()
+
+
+class QueryTrace:
+    """Timings of one call of repository method.
+
+    Phases are observed in histograms of the method and, if the span of the
+    method is sampled, are written as its child spans with the same start and
+    end time.
+    """
+
+    __slots__ = ("instrument", "span", "start", "rows", "_context")
+
+    #: QueryInstrument: Instrument of the method.
+    instrument: "QueryInstrument"
+
+    #: Span: Span of the call.
+    span: Span
+
+    #: int: Start time of the call in nanoseconds since the epoch.
+    start: int
+
+    #: int: Count of returned rows.
+    rows: int
+
+    def __init__(self, instrument: "QueryInstrument", span: Span, start: int):
+        self.instrument = instrument
+        self.span = span
+        self.start = start
+        self.rows = 0
+        self._context = trace.set_span_in_context(span)
+
+    def record(self, phase: str, start: int, end: int) -> None:
+        """Record phase of the call.
+
+        Args:
+            phase: Name of the phase.
+            start: Start time in nanoseconds since the epoch.
+            end: End time in nanoseconds since the epoch.
+        """
+
+        self.instrument.observe(phase, (end - start) / 1e9)
+        if self.span.is_recording():
+            __tracer__.start_span(
+                phase,
+                context=self._context,
+                start_time=start,
+            ).end(end_time=end)
+
+    @contextmanager
+    def phase(self, phase: str) -> Iterator[None]:
+        """Time block of code as phase of the call.
+
+        Args:
+            phase: Name of the phase.
+        """
+
+        start = time.time_ns()
+        try:
+            yield
+        finally:
+            self.record(phase, start, time.time_ns())
+
+    @contextmanager
+    def activate(self) -> Iterator["QueryTrace"]:
+        """Make the trace current in the block of code, so queries of the
+        block are timed as its phases.
+
+        Returns:
+            The trace.
+        """
+
+        token = __current_query__.set(self)
+        try:
+            yield self
+        finally:
+            __current_query__.reset(token)
+
+    def finish(self, error: Optional[BaseException] = None) -> None:
+        """Observe total time and rows of the call and end its span.
+
+        Args:
+            error: Exception raised by the call, if any. Span is marked as
+                failed only by errors of the driver, so the call, that found
+                no rows, is successful with ``0`` rows.
+        """
+
+        end = time.time_ns()
+        self.instrument.observe("total", (end - self.start) / 1e9)
+        self.instrument.observe_rows(self.rows)
+        if self.span.is_recording():
+            self.span.set_attribute("db.response.rows", self.rows)
+            if isinstance(error, __failures__):
+                self.span.record_exception(error)
+                self.span.set_status(Status(StatusCode.ERROR, type(error).__name__))
+        self.span.end(end_time=end)
+
+
+class QueryInstrument:
+    """Histograms and span name of one repository method.
+
+    Labelled histograms are created once, when the method is decorated.
+
+    Examples:
+        ::
+
+            >>> instrument = QueryInstrument("ContactsRepository", "read_all")
+            >>> with instrument.trace() as query:
+            ...     with query.phase("decode"):
+            ...         ...
+    """
+
+    __DURATION = Histogram(
+        "repository_query_duration_seconds",
+        "Histogram of time of phases of repository methods (in seconds).",
+        ["repository", "method", "phase"],
+        buckets=(
+            0.0005,
+            0.001,
+            0.0025,
+            0.005,
+            0.01,
+            0.025,
+            0.05,
+            0.1,
+            0.25,
+            0.5,
+            1,
+            2.5,
+            5,
+            10,
+        ),
+    )
+    __ROWS = Histogram(
+        "repository_query_rows",
+        "Histogram of count of rows returned by repository methods.",
+        ["repository", "method"],
+        buckets=(0, 1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000, 10000),
+    )
+
+    #: str: Name of repository class.
+    repository: str
+
+    #: str: Name of the method.
+    method: str
+
+    def __init__(self, repository: str, method: str):
+        self.repository = repository
+        self.method = method
+        self.__name = f"{repository}.{method}"
+        self.__phases: Dict[str, Any] = {
+            phase: self.__DURATION.labels(
+                repository=repository,
+                method=method,
+                phase=phase,
+            )
+            for phase in ("acquire", "execute", "fetch", "decode", "total")
+        }
+        self.__rows = self.__ROWS.labels(repository=repository, method=method)
+
+    @classmethod
+    def of(cls, qualname: str) -> "QueryInstrument":
+        """Create instrument from qualified name of the method.
+
+        Args:
+            qualname: Qualified name, e.g. ``ContactsRepository.read_all``.
+
+        Returns:
+            Instrument of the method.
+        """
+
+        repository, _, method = qualname.rpartition(".")
+        return cls(repository=repository.rpartition(".")[2], method=method)
+
+    def observe(self, phase: str, seconds: float) -> None:
+        """Observe time of the phase.
+
+        Args:
+            phase: Name of the phase.
+            seconds: Duration of the phase.
+        """
+
+        self.__phases[phase].observe(seconds)
+
+    def observe_rows(self, rows: int) -> None:
+        """Observe count of returned rows.
+
+        Args:
+            rows: Count of rows.
+        """
+
+        self.__rows.observe(rows)
+
+    def start(self) -> QueryTrace:
+        """Start call of the method.
+
+        Notes:
+            Span of the call is the child of the current span, e.g. of the
+            request. Trace must be activated with :meth:`.QueryTrace.activate`
+            and finished with :meth:`.QueryTrace.finish`.
+
+        Returns:
+            Trace of the call.
+        """
+
+        start = time.time_ns()
+        span = __tracer__.start_span(
+            self.__name,
+            start_time=start,
+            attributes={
+                "db.system": "postgresql",
+                "code.namespace": self.repository,
+                "code.function": self.method,
+            },
+        )
+        return QueryTrace(instrument=self, span=span, start=start)
+
+    @contextmanager
+    def trace(self) -> Iterator[QueryTrace]:
+        """Trace call of the method in the block of code.
+
+        Returns:
+            Active trace of the call.
+        """
+
+        query = self.start()
+        try:
+            with query.activate():
+                yield query
+        except BaseException as error:
+            query.finish(error)
+            raise
+        query.finish()
+
+
+class TracedCursor:
+    """Proxy of aiopg cursor, that times execute and fetch of queries as phases
+    of the current :class:`.QueryTrace`.
+
+    Outside of repository methods queries are not timed. All other attributes
+    are proxied to the wrapped cursor.
+    """
+
+    __slots__ = ("_cursor",)
+
+    def __init__(self, cursor: Any):
+        self._cursor = cursor
+
+    def __getattr__(self, item: str) -> Any:
+        return getattr(self._cursor, item)
+
+    async def execute(self, operation: str, parameters: Any = None, **kwargs):
+        query = __current_query__.get()
+        if query is None:
+            return await self._cursor.execute(operation, parameters, **kwargs)
+        with query.phase("execute"):
+            return await self._cursor.execute(operation, parameters, **kwargs)
+
+    async def fetchone(self) -> Any:
+        return await self.__fetch(self._cursor.fetchone())
+
+    async def fetchmany(self, size: Optional[int] = None) -> Any:
+        return await self.__fetch(self._cursor.fetchmany(size))
+
+    async def fetchall(self) -> Any:
+        return await self.__fetch(self._cursor.fetchall())
+
+    @staticmethod
+    async def __fetch(fetching: Any) -> Any:
+        """Await fetch of the cursor as phase of the current trace.
+
+        Args:
+            fetching: Awaitable fetch of the wrapped cursor.
+
+        Returns:
+            Fetched rows.
+        """
+
+        query = __current_query__.get()
+        if query is None:
+            return await fetching
+        with query.phase("fetch"):
+            return await fetching
+
+
+def payload_size(response: Any) -> int:
+    """Count size of text and binary values of rows.
+
+    Args:
+        response: Single row or list of rows.
+
+    Returns:
+        Total length of ``str``, ``bytes`` and ``memoryview`` values.
+    """
+
+    rows = response if isinstance(response, list) else (response,)
+    return sum(
+        len(value)
+        for row in rows
+        if isinstance(row, dict)
+        for value in row.values()
+        if isinstance(value, (str, bytes, memoryview))
+    )
@@ -0,0 +1,259 @@
+"""Saturation metrics, acquire timeout and max age of pooled connections.
+
+aiopg pool waits for a free connection without limit and has no visibility,
+so :class:`.PoolMonitor` acquires connections on behalf of the repositories,
+exports state of the pool to prometheus and recycles old connections.
+"""
+
+import asyncio
+import time
+import weakref
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+from aiopg import Connection, Pool
+from prometheus_client import Counter, Gauge, Histogram
+
+from app.pkg.connectors.postgresql.prepared import invalidate_statement_cache
+from app.pkg.models.exceptions.repository import PoolAcquireTimeout
+
+__all__ = ["PoolMonitor", "get_pool_monitor", "register_pool_monitor"]
+
+#: WeakKeyDictionary: Monitors of live pools.
+__monitors__: "weakref.WeakKeyDictionary[Pool, PoolMonitor]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+class PoolMonitor:
+    """Acquire connections from the pool with timeout and metrics.
+
+    Exported metrics are labeled with ``pool`` name (``primary`` or
+    ``replica-N``):
+        * ``postgresql_pool_size`` - count of open connections.
+        * ``postgresql_pool_free_connections`` - count of idle connections.
+        * ``postgresql_pool_waiters`` - count of coroutines waiting for connection.
+        * ``postgresql_pool_acquire_seconds`` - time of waiting for connection.
+        * ``postgresql_pool_acquire_timeouts_total`` - count of failed acquires.
+        * ``postgresql_connection_lifetime_seconds`` - age of closed connections.
+
+    Notes:
+        Connection older than ``max_connection_age`` is closed when it is
+        released, and the pool opens a new one on demand. So long-living
+        server processes do not grow in memory, and connections are spread
+        over new replicas behind a balancer.
+
+    Examples:
+        ::
+
+            >>> monitor = PoolMonitor(pool, acquire_timeout=5, max_connection_age=3600)
+            >>> async with monitor.acquire() as conn:
+            ...     cur = await conn.cursor()
+    """
+
+    __SIZE = Gauge(
+        "postgresql_pool_size",
+        "Count of open connections in the pool.",
+        ["pool"],
+        multiprocess_mode="livesum",
+    )
+    __FREE = Gauge(
+        "postgresql_pool_free_connections",
+        "Count of idle connections in the pool.",
+        ["pool"],
+        multiprocess_mode="livesum",
+    )
+    __WAITERS = Gauge(
+        "postgresql_pool_waiters",
+        "Count of coroutines waiting for connection from the pool.",
+        ["pool"],
+        multiprocess_mode="livesum",
+    )
+    __ACQUIRE_TIME = Histogram(
+        "postgresql_pool_acquire_seconds",
+        "Histogram of waiting time for connection from the pool (in seconds).",
+        ["pool"],
+        buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+    )
+    __ACQUIRE_TIMEOUTS = Counter(
+        "postgresql_pool_acquire_timeouts_total",
+        "Total count of acquires failed by timeout.",
+        ["pool"],
+    )
+    __LIFETIME = Histogram(
+        "postgresql_connection_lifetime_seconds",
+        "Histogram of age of closed connections (in seconds).",
+        ["pool"],
+        buckets=(1, 10, 60, 300, 900, 1800, 3600, 7200, 14400, 43200, 86400),
+    )
+
+    #: Pool: Monitored aiopg pool.
+    pool: Pool
+
+    #: str: Name of the pool in labels of metrics.
+    name: str
+
+    #: Optional[float]: Max seconds to wait for connection. ``None`` to wait
+    #: without limit.
+    acquire_timeout: Optional[float]
+
+    #: Optional[float]: Max age of connection in seconds. ``None`` to keep
+    #: connections open until the pool closes them.
+    max_connection_age: Optional[float]
+
+    def __init__(
+        self,
+        pool: Pool,
+        acquire_timeout: Optional[float] = None,
+        max_connection_age: Optional[float] = None,
+        name: str = "primary",
+    ):
+        self.pool = pool
+        self.name = name
+        self.acquire_timeout = acquire_timeout or None
+        self.max_connection_age = max_connection_age or None
+
+        self.__waiters = 0
+        self.__size = self.__SIZE.labels(pool=name)
+        self.__free = self.__FREE.labels(pool=name)
+        self.__waiting = self.__WAITERS.labels(pool=name)
+        self.__acquire_time = self.__ACQUIRE_TIME.labels(pool=name)
+        self.__acquire_timeouts = self.__ACQUIRE_TIMEOUTS.labels(pool=name)
+        self.__lifetime = self.__LIFETIME.labels(pool=name)
+        self.__opened: "weakref.WeakKeyDictionary[Connection, float]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[Connection]:
+        """Acquire connection and release it on exit.
+
+        Raises:
+            PoolAcquireTimeout: Pool has no free connection during
+                :attr:`.acquire_timeout`.
+
+        Returns:
+            Pooled aiopg connection.
+        """
+
+        conn = await self.__acquire()
+        opened = self.__opened.setdefault(conn, time.monotonic())
+        try:
+            yield conn
+        finally:
+            age = time.monotonic() - opened
+            if conn.closed:
+                self.__lifetime.observe(age)
+            elif self.max_connection_age is not None and age > self.max_connection_age:
+                invalidate_statement_cache(conn)
+                conn.close()
+                self.__lifetime.observe(age)
+            await self.pool.release(conn)
+            self.observe()
+
+    def observe(self) -> None:
+        """Export current state of the pool."""
+
+        self.__size.set(self.pool.size)
+        self.__free.set(self.pool.freesize)
+        self.__waiting.set(self.__waiters)
+
+    async def __acquire(self) -> Connection:
+        """Wait for connection from the pool at most :attr:`.acquire_timeout`.
+
+        Returns:
+            Pooled aiopg connection.
+        """
+
+        started = time.monotonic()
+        self.__waiters += 1
+        self.observe()
+
+        acquiring = asyncio.ensure_future(self.pool.acquire())
+        try:
+            done, _ = await asyncio.wait({acquiring}, timeout=self.acquire_timeout)
+        except asyncio.CancelledError:
+            self.__abandon(acquiring)
+            raise
+        finally:
+            self.__waiters -= 1
+            self.__acquire_time.observe(time.monotonic() - started)
+            self.observe()
+
+        if not done:
+            self.__abandon(acquiring)
+            self.__acquire_timeouts.inc()
+            raise PoolAcquireTimeout(
+                details=f"No free connection in {self.acquire_timeout} seconds.",
+            )
+        return acquiring.result()
+
+    def __abandon(self, acquiring: asyncio.Future) -> None:
+        """Cancel acquire, nobody waits for.
+
+        Connection, that was acquired right before cancellation, is returned to
+        the pool.
+
+        Args:
+            acquiring: Task of :meth:`aiopg.Pool.acquire`.
+        """
+
+        def release(future: asyncio.Future) -> None:
+            if future.cancelled():
+                return
+            if future.exception() is None:
+                self.pool.release(future.result())
+
+        acquiring.cancel()
+        acquiring.add_done_callback(release)
+
+
+def register_pool_monitor(
+    pool: Pool,
+    acquire_timeout: Optional[float] = None,
+    max_connection_age: Optional[float] = None,
+    name: str = "primary",
+) -> PoolMonitor:
+    """Create monitor of the pool.
+
+    Args:
+        pool: aiopg pool or :class:`.AsyncpgPool`.
+        acquire_timeout: Max seconds to wait for connection. ``0`` or ``None``
+            to wait without limit.
+        max_connection_age: Max age of connection in seconds. ``0`` or ``None``
+            to not recycle connections.
+        name: Name of the pool in labels of metrics, e.g. ``primary`` or
+            ``replica-1``.
+
+    Returns:
+        Monitor bound to the pool.
+    """
+
+    monitor = __monitors__[pool] = PoolMonitor(
+        pool=pool,
+        acquire_timeout=acquire_timeout,
+        max_connection_age=max_connection_age,
+        name=name,
+    )
+    monitor.observe()
+    return monitor
+
+
+def get_pool_monitor(pool: Pool) -> PoolMonitor:
+    """Get monitor of the pool.
+
+    Notes:
+        Pools, that were not created by :class:`.Postgresql` resource (e.g. in
+        tests), get monitor without timeout and recycling.
+
+    Args:
+        pool: aiopg pool or :class:`.AsyncpgPool`.
+
+    Returns:
+        Monitor bound to the pool.
+    """
+
+    monitor = __monitors__.get(pool)
+    if monitor is None:
+        monitor = register_pool_monitor(pool)
+    return monitor
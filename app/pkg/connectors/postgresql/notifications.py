@@ -0,0 +1,313 @@
+"""Notifications about changed rows over postgresql ``LISTEN/NOTIFY``.
+
+Triggers (see ``migrations``) send ``NOTIFY`` with JSON payload
+``{"table": ..., "op": ..., "id": ..., "ts": ...}`` to :data:`.CHANNEL`, and
+postgresql delivers it after commit, so in-process caches of every worker drop
+stale values. Row triggers ``notify_row_change`` send one notification per
+changed row. Statement triggers ``notify_table_change`` of tables, which are
+cached by tags, send one notification per statement without ``id``, so bulk
+writes do not flood the channel.
+"""
+
+import asyncio
+import inspect
+import json
+import random
+import time
+from abc import ABC, abstractmethod
+from contextlib import suppress
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+import aiopg
+from prometheus_client import Counter, Gauge, Histogram
+
+from app.pkg.logger import get_logger
+
+__all__ = ["CHANNEL", "RowChange", "RowChangeListener", "RowChangeSubscriber"]
+
+logger = get_logger(__name__)
+
+#: str: Channel of notifications about changed rows.
+CHANNEL = "row_changes"
+
+
+@dataclass(frozen=True)
+class RowChange:
+    """Committed change of one row or of the whole table.
+
+    Attributes:
+        table: Name of changed table.
+        op: ``INSERT``, ``UPDATE``, ``DELETE`` or ``TRUNCATE``.
+        id: Primary key of the row. ``None`` if any rows of the table may be
+            changed by the statement.
+        ts: Unix time of the statement, that made the change, if it is sent by
+            trigger. It is not time of commit, which is unknown to trigger.
+    """
+
+    table: str
+    op: str
+    id: Optional[int] = None
+    ts: Optional[float] = None
+
+
+class RowChangeSubscriber(ABC):
+    """Receiver of changes of rows of one table.
+
+    Notes:
+        Methods may be coroutine functions, listener awaits them before
+        the next notification is dispatched.
+    """
+
+    @abstractmethod
+    def on_change(self, change: RowChange) -> Any:
+        """Handle committed change of the row.
+
+        Args:
+            change: Change of the row.
+        """
+
+    @abstractmethod
+    def on_connect(self) -> Any:
+        """Handle start of listening.
+
+        Notifications sent before are lost, so everything cached from
+        the table may be stale.
+        """
+
+    @abstractmethod
+    def on_disconnect(self) -> Any:
+        """Handle loss of listening connection.
+
+        Changes are not delivered until :meth:`.on_connect`.
+        """
+
+
+class RowChangeListener:
+    """Listen to :data:`.CHANNEL` on the dedicated connection and pass changes
+    to subscribers of changed table.
+
+    Exported metrics:
+        * ``postgresql_listener_connected`` - 1 if changes are delivered.
+        * ``postgresql_listener_reconnects_total`` - count of failed connections.
+        * ``postgresql_notifications_total`` - count of received changes.
+        * ``postgresql_notification_lag_seconds`` - time from the statement,
+          that changed rows, to dispatch of the change. It includes the rest of
+          the transaction, because notifications are delivered after commit.
+
+    Notes:
+        Lost connection is reopened with exponential backoff from
+        ``reconnect_interval`` to ``max_reconnect_interval`` seconds with
+        jitter, so workers do not reconnect all at once. Connection without
+        notifications is checked with ``select 1`` every ``ping_interval``
+        seconds, so half-open connection is detected too.
+
+    Examples:
+        ::
+
+            >>> listener = RowChangeListener(dsn=settings.POSTGRES.DSN)
+            >>> await listener.start()
+            >>> await listener.subscribe("contacts", token_index)
+    """
+
+    __CONNECTED = Gauge(
+        "postgresql_listener_connected",
+        "Listening connection of row changes is open: 1 if open, else 0.",
+        multiprocess_mode="livemin",
+    )
+    __RECONNECTS = Counter(
+        "postgresql_listener_reconnects_total",
+        "Total count of failures of listening connection.",
+    )
+    __NOTIFICATIONS = Counter(
+        "postgresql_notifications_total",
+        "Total count of received row changes by table.",
+        ["table"],
+    )
+    __LAG = Histogram(
+        "postgresql_notification_lag_seconds",
+        "Seconds from the statement changing rows to dispatch of the change.",
+        ["table"],
+        buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+    )
+
+    #: str: D.S.N of the primary.
+    dsn: str
+
+    #: float: Seconds before the first attempt to reconnect.
+    reconnect_interval: float
+
+    #: float: Max seconds between attempts to reconnect.
+    max_reconnect_interval: float
+
+    #: float: Seconds without notifications before connection is checked.
+    ping_interval: float
+
+    def __init__(
+        self,
+        dsn: str,
+        reconnect_interval: float = 0.5,
+        max_reconnect_interval: float = 30,
+        ping_interval: float = 30,
+    ):
+        self.dsn = dsn
+        self.reconnect_interval = reconnect_interval
+        self.max_reconnect_interval = max_reconnect_interval
+        self.ping_interval = ping_interval
+
+        self.__subscribers: Dict[str, List[RowChangeSubscriber]] = {}
+        self.__conn: Optional[aiopg.Connection] = None
+        self.__task: Optional[asyncio.Task] = None
+
+    @property
+    def connected(self) -> bool:
+        """Listening connection is open."""
+
+        return self.__conn is not None and not self.__conn.closed
+
+    async def subscribe(self, table: str, subscriber: RowChangeSubscriber) -> None:
+        """Pass changes of rows of the table to subscriber.
+
+        Args:
+            table: Name of table.
+            subscriber: Receiver of changes.
+        """
+
+        self.__subscribers.setdefault(table, []).append(subscriber)
+        if not self.connected:
+            await self.__notify(subscriber.on_disconnect)
+
+    async def start(self) -> None:
+        """Try to connect and start listening in background."""
+
+        if self.__task is not None:
+            return
+
+        with suppress(Exception):
+            await self.__connect()
+        self.__task = asyncio.ensure_future(self.__run())
+
+    async def close(self) -> None:
+        """Stop listening and close the connection."""
+
+        if self.__task is not None:
+            self.__task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self.__task
+            self.__task = None
+        await self.__disconnect()
+
+    async def __run(self) -> None:
+        """Dispatch notifications and reconnect until cancelled."""
+
+        delay = self.reconnect_interval
+        while True:
+            try:
+                if not self.connected:
+                    await self.__connect()
+                delay = self.reconnect_interval
+                await self.__listen()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.warning(
+                    "Listening to %s failed, reconnect in %.1fs: %r",
+                    CHANNEL,
+                    delay,
+                    e,
+                )
+                self.__RECONNECTS.inc()
+                await self.__disconnect()
+                await asyncio.sleep(delay * random.uniform(0.5, 1))  # nosec B311
+                delay = min(delay * 2, self.max_reconnect_interval)
+
+    async def __connect(self) -> None:
+        """Open connection and subscribe to :data:`.CHANNEL`."""
+
+        conn = await aiopg.connect(dsn=self.dsn)
+        try:
+            async with conn.cursor() as cur:
+                await cur.execute(f"listen {CHANNEL}")
+        except BaseException:
+            await conn.close()
+            raise
+
+        self.__conn = conn
+        self.__CONNECTED.set(1)
+        for subscriber in self.__all_subscribers():
+            await self.__notify(subscriber.on_connect)
+
+    async def __disconnect(self) -> None:
+        """Close connection and notify subscribers."""
+
+        conn, self.__conn = self.__conn, None
+        self.__CONNECTED.set(0)
+        if conn is None:
+            return
+
+        for subscriber in self.__all_subscribers():
+            await self.__notify(subscriber.on_disconnect)
+        await conn.close()
+
+    async def __listen(self) -> None:
+        """Dispatch notifications of the open connection until it fails."""
+
+        while True:
+            try:
+                notify = await asyncio.wait_for(
+                    self.__conn.notifies.get(),
+                    timeout=self.ping_interval,
+                )
+            except asyncio.TimeoutError:
+                async with self.__conn.cursor() as cur:
+                    await asyncio.wait_for(
+                        cur.execute("select 1"),
+                        self.ping_interval,
+                    )
+                continue
+
+            await self.__dispatch(notify.payload)
+
+    async def __dispatch(self, payload: str) -> None:
+        """Pass change to subscribers of its table.
+
+        Args:
+            payload: JSON payload of notification.
+        """
+
+        try:
+            change = RowChange(**json.loads(payload))
+        except (TypeError, ValueError) as e:
+            logger.warning("Invalid notification %r: %r", payload, e)
+            return
+
+        self.__NOTIFICATIONS.labels(table=change.table).inc()
+        if change.ts is not None:
+            lag = max(time.time() - change.ts, 0)
+            self.__LAG.labels(table=change.table).observe(lag)
+
+        for subscriber in self.__subscribers.get(change.table, ()):
+            await self.__notify(subscriber.on_change, change)
+
+    @staticmethod
+    async def __notify(method, *args) -> None:
+        """Call method of subscriber, that may be coroutine function.
+
+        Errors of subscriber are logged, so they do not stop listening.
+
+        Args:
+            method: Bound method of subscriber.
+            *args: Arguments of method.
+        """
+
+        try:
+            result = method(*args)
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.error("Subscriber %r failed: %r", method, e)
+
+    def __all_subscribers(self) -> List[RowChangeSubscriber]:
+        """Get subscribers of all tables."""
+
+        return [s for subscribers in self.__subscribers.values() for s in subscribers]
@@ -0,0 +1,288 @@
+"""Per-connection cache of prepared statements.
+
+Every distinct query is prepared with ``PREPARE`` once per pooled connection and
+executed with ``EXECUTE`` afterward, so postgresql does not parse and plan it on
+every request.
+"""
+
+import itertools
+import re
+import weakref
+from collections import OrderedDict
+from contextlib import suppress
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+
+import psycopg2
+from aiopg import Connection, Cursor
+from psycopg2 import errorcodes, errors
+from psycopg2.extensions import TRANSACTION_STATUS_IDLE  # type: ignore
+
+__all__ = [
+    "PreparedStatementCache",
+    "PreparedCursor",
+    "compile_query",
+    "get_statement_cache",
+    "invalidate_statement_cache",
+]
+
+#: re.Pattern: Named placeholder of psycopg2 query.
+__placeholder__ = re.compile(r"%\((\w+)\)s|%%|%s")
+
+#: tuple: First keywords of queries, that can be prepared.
+__preparable__ = ("select", "insert", "update", "delete", "with", "values")
+
+#: Iterator[int]: Numbers of names of prepared statements. Shared by all caches,
+#: so cache created after :func:`.invalidate_statement_cache` never reuses name
+#: of a statement, that is still prepared on the connection.
+__statement_numbers__ = itertools.count(1)
+
+#: WeakKeyDictionary: Statement caches of live connections.
+__caches__: "weakref.WeakKeyDictionary[Connection, PreparedStatementCache]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+@lru_cache(maxsize=1024)
+def compile_query(query: str) -> Optional[Tuple[str, Tuple[str, ...]]]:
+    """Convert psycopg2 query with named placeholders to ``PREPARE`` syntax.
+
+    Args:
+        query: Query with ``%(name)s`` placeholders.
+
+    Examples:
+        ::
+
+            >>> compile_query("select * from users where id = %(id)s")
+            ('select * from users where id = $1', ('id',))
+
+    Returns:
+        Query with ``$n`` placeholders and names of parameters in order of
+        their numbers, or ``None`` if query can not be prepared.
+    """
+
+    if not query.lstrip().lower().startswith(__preparable__):
+        return None
+
+    names: Dict[str, int] = {}
+    positional = False
+
+    def replace(match: re.Match) -> str:
+        nonlocal positional
+        name = match.group(1)
+        if name is None:
+            positional = positional or match.group(0) == "%s"
+            return "%"
+        return f"${names.setdefault(name, len(names) + 1)}"
+
+    compiled = __placeholder__.sub(replace, query)
+    if positional:
+        return None
+    return compiled, tuple(names)
+
+
+class PreparedStatementCache:
+    """LRU cache of statements prepared on one connection.
+
+    Evicted statements are deallocated on the server with ``DEALLOCATE``.
+    """
+
+    #: int: Max count of prepared statements on the connection.
+    maxsize: int
+
+    #: OrderedDict[str, str]: Query to name of prepared statement.
+    statements: "OrderedDict[str, str]"
+
+    #: set: Queries, that postgresql refused to prepare.
+    unpreparable: set
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.statements = OrderedDict()
+        self.unpreparable = set()
+
+    def get(self, query: str) -> Optional[str]:
+        """Get name of prepared statement and mark it as recently used.
+
+        Args:
+            query: Compiled query.
+
+        Returns:
+            Name of prepared statement or ``None``.
+        """
+
+        name = self.statements.get(query)
+        if name is not None:
+            self.statements.move_to_end(query)
+        return name
+
+    def add(self, query: str) -> Tuple[str, Optional[str]]:
+        """Register new statement.
+
+        Args:
+            query: Compiled query.
+
+        Returns:
+            Name for the new statement and name of the evicted statement, that
+            must be deallocated, if any.
+        """
+
+        name = f"__stmt_{next(__statement_numbers__)}"
+        self.statements[query] = name
+        evicted = None
+        if len(self.statements) > self.maxsize:
+            _, evicted = self.statements.popitem(last=False)
+        return name, evicted
+
+    def discard(self, query: str) -> None:
+        """Forget statement, e.g. when it is not valid on the server anymore.
+
+        Args:
+            query: Compiled query.
+        """
+
+        self.statements.pop(query, None)
+
+
+def get_statement_cache(
+    connection: Connection,
+    maxsize: int,
+) -> PreparedStatementCache:
+    """Get statement cache of the connection.
+
+    Notes:
+        Cache is stored with weak reference to the connection, so when pool
+        recycles connection, cache is dropped with it.
+
+    Args:
+        connection: Pooled aiopg connection.
+        maxsize: Max count of prepared statements on the connection.
+
+    Returns:
+        Statement cache bound to the connection.
+    """
+
+    cache = __caches__.get(connection)
+    if cache is None:
+        cache = __caches__[connection] = PreparedStatementCache(maxsize=maxsize)
+    return cache
+
+
+def invalidate_statement_cache(connection: Connection) -> None:
+    """Drop statement cache of the connection.
+
+    Must be called when connection is recycled or session state is reset.
+    Statements are not deallocated, but new cache of the connection never
+    reuses their names, so live connection stays usable.
+
+    Args:
+        connection: Pooled aiopg connection.
+    """
+
+    __caches__.pop(connection, None)
+
+
+class PreparedCursor:
+    """Proxy of aiopg cursor, that executes queries as prepared statements.
+
+    Queries, that can not be prepared (e.g. ``begin``, ``declare`` or queries
+    with positional placeholders), are executed as is. New statements are
+    prepared only when connection is not inside a transaction, so failed
+    ``PREPARE`` never aborts transaction of the caller.
+
+    All other attributes are proxied to the wrapped cursor.
+    """
+
+    __slots__ = ("_cursor", "_cache")
+
+    def __init__(self, cursor: Cursor, cache: PreparedStatementCache):
+        self._cursor = cursor
+        self._cache = cache
+
+    def __getattr__(self, item: str) -> Any:
+        return getattr(self._cursor, item)
+
+    async def execute(self, operation: str, parameters: Any = None, **kwargs):
+        """Execute query as prepared statement.
+
+        Args:
+            operation: Query with ``%(name)s`` placeholders.
+            parameters: Mapping with parameters of the query.
+            **kwargs: Keyword arguments of :meth:`aiopg.Cursor.execute`.
+
+        Returns:
+            None
+        """
+
+        if parameters is None:
+            compiled = None if "%" in operation else compile_query(operation)
+        elif isinstance(parameters, dict):
+            compiled = compile_query(operation)
+        else:
+            compiled = None
+
+        if compiled is None:
+            return await self._cursor.execute(operation, parameters, **kwargs)
+
+        query, names = compiled
+        name = self._cache.get(query)
+        if name is None:
+            name = await self.__prepare(query)
+            if name is None:
+                return await self._cursor.execute(operation, parameters, **kwargs)
+
+        execute = f"execute {name}"
+        values = None
+        if names:
+            execute += f"({', '.join(['%s'] * len(names))})"
+            values = tuple(parameters[n] for n in names)
+
+        try:
+            return await self._cursor.execute(execute, values, **kwargs)
+        except (errors.InvalidSqlStatementName, psycopg2.NotSupportedError):
+            # Statement was deallocated on the server or its cached plan is stale
+            # after schema change. Forget it and run the query as is.
+            self._cache.discard(query)
+            if self.__in_transaction():
+                raise
+            return await self._cursor.execute(operation, parameters, **kwargs)
+
+    async def __prepare(self, query: str) -> Optional[str]:
+        """Prepare statement on the connection.
+
+        Args:
+            query: Compiled query.
+
+        Returns:
+            Name of prepared statement or ``None``, if query must be executed
+            without preparing.
+        """
+
+        if query in self._cache.unpreparable or self.__in_transaction():
+            return None
+
+        name, evicted = self._cache.add(query)
+        if evicted is not None:
+            with suppress(errors.InvalidSqlStatementName):
+                await self._cursor.execute(f"deallocate {evicted}")
+        try:
+            await self._cursor.execute(f"prepare {name} as {query}")
+        except psycopg2.ProgrammingError as error:
+            self._cache.discard(query)
+            if error.pgcode == errorcodes.DUPLICATE_PSTATEMENT:
+                raise
+            self._cache.unpreparable.add(query)
+            return None
+        return name
+
+    def __in_transaction(self) -> bool:
+        """Check that connection of the cursor is inside a transaction.
+
+        Returns:
+            ``True`` if connection is not idle.
+        """
+
+        return (
+            self._cursor.connection.raw.get_transaction_status()
+            != TRANSACTION_STATUS_IDLE
+        )
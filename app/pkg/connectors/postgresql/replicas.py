@@ -0,0 +1,168 @@
+"""Read replicas of postgresql with health checks."""
+
+import asyncio
+import itertools
+from contextlib import suppress
+from typing import List, Optional
+
+from aiopg import Pool
+from prometheus_client import Gauge
+from psycopg2.extensions import parse_dsn  # type: ignore
+
+from app.pkg.connectors.postgresql.monitor import get_pool_monitor
+
+__all__ = ["Replica", "ReplicaSet"]
+
+
+class Replica:
+    """Pool of one read replica."""
+
+    #: str: Name of replica without credentials, e.g. ``host:port/database``.
+    name: str
+
+    #: Pool: aiopg pool of the replica.
+    pool: Pool
+
+    #: bool: Result of the last health check.
+    healthy: bool
+
+    def __init__(self, dsn: str, pool: Pool):
+        params = parse_dsn(dsn)
+        self.name = (
+            f"{params.get('host', '')}:{params.get('port', 5432)}"
+            f"/{params.get('dbname', '')}"
+        )
+        self.pool = pool
+        self.healthy = False
+
+    @property
+    def busy(self) -> int:
+        """Count of connections in use."""
+
+        return self.pool.size - self.pool.freesize
+
+
+class ReplicaSet:
+    """Choose healthy replica for read-only queries.
+
+    Replicas are checked with ``select 1`` every ``health_check_interval``
+    seconds. Replica, that does not answer in time, is excluded from routing
+    until the next successful check, so reads fail over to the primary.
+
+    Notes:
+        Replica is chosen by the least count of busy connections, ties are
+        resolved with round-robin.
+
+    Examples:
+        ::
+
+            >>> replica = replicas.choose()
+            >>> pool = primary if replica is None else replica.pool
+    """
+
+    __HEALTHY = Gauge(
+        "postgresql_replica_healthy",
+        "Health of read replica: 1 if replica is used for reads, else 0.",
+        ["replica"],
+        multiprocess_mode="livemin",
+    )
+
+    #: List[Replica]: All configured replicas.
+    replicas: List[Replica]
+
+    #: float: Seconds between health checks.
+    health_check_interval: float
+
+    def __init__(self, replicas: List[Replica], health_check_interval: float):
+        self.replicas = replicas
+        self.health_check_interval = health_check_interval
+
+        self.__turn = itertools.count()
+        self.__task: Optional[asyncio.Task] = None
+
+    def choose(self) -> Optional[Replica]:
+        """Choose the least busy healthy replica.
+
+        Returns:
+            Replica or ``None``, if there is no healthy replica.
+        """
+
+        healthy = [replica for replica in self.replicas if replica.healthy]
+        if not healthy:
+            return None
+
+        start = next(self.__turn) % len(healthy)
+        ordered = healthy[start:] + healthy[:start]
+        return min(ordered, key=lambda replica: replica.busy)
+
+    def mark_down(self, replica: Replica) -> None:
+        """Exclude replica from routing until the next successful check.
+
+        Args:
+            replica: Replica, that failed to give a connection.
+        """
+
+        self.__set_health(replica, healthy=False)
+
+    async def check(self) -> None:
+        """Check health of all replicas concurrently."""
+
+        await asyncio.gather(*(self.__check(replica) for replica in self.replicas))
+
+    def start(self) -> None:
+        """Start periodic health checks."""
+
+        if self.replicas and self.__task is None:
+            self.__task = asyncio.ensure_future(self.__run())
+
+    async def close(self) -> None:
+        """Stop health checks and close pools of replicas."""
+
+        if self.__task is not None:
+            self.__task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self.__task
+            self.__task = None
+
+        for replica in self.replicas:
+            replica.pool.close()
+            await replica.pool.wait_closed()
+
+    async def __run(self) -> None:
+        """Check replicas until cancelled."""
+
+        while True:
+            await asyncio.sleep(self.health_check_interval)
+            await self.check()
+
+    async def __check(self, replica: Replica) -> None:
+        """Run ``select 1`` on the replica.
+
+        Args:
+            replica: Checked replica.
+        """
+
+        async def ping() -> None:
+            async with get_pool_monitor(replica.pool).acquire() as conn:
+                cur = await conn.cursor()
+                await cur.execute("select 1")
+
+        try:
+            await asyncio.wait_for(ping(), timeout=self.health_check_interval)
+        except asyncio.CancelledError:
+            raise
+        except Exception:  # pylint: disable=broad-exception-caught
+            self.__set_health(replica, healthy=False)
+        else:
+            self.__set_health(replica, healthy=True)
+
+    def __set_health(self, replica: Replica, healthy: bool) -> None:
+        """Update health of replica.
+
+        Args:
+            replica: Replica.
+            healthy: New health of replica.
+        """
+
+        replica.healthy = healthy
+        self.__HEALTHY.labels(replica=replica.name).set(int(healthy))
@@ -1,20 +1,68 @@
 """Async resource for PostgresSQL connector."""
 
+from typing import TYPE_CHECKING, List, Optional, Union
+
 import aiopg
 
+from app.pkg.connectors.postgresql.monitor import register_pool_monitor
+from app.pkg.connectors.postgresql.replicas import Replica, ReplicaSet
 from app.pkg.connectors.resources import BaseAsyncResource
 
-__all__ = ["Postgresql"]
+if TYPE_CHECKING:
+    from app.pkg.connectors.postgresql.asyncpg_adapter import AsyncpgPool
+
+__all__ = [
+    "Postgresql",
+    "PostgresqlAsyncpg",
+    "PostgresqlAsyncpgReplicas",
+    "PostgresqlReplicas",
+]
 
 
 class Postgresql(BaseAsyncResource):
     """PostgresSQL connector using aiopg."""
 
-    async def init(self, dsn: str, *args, **kwargs) -> aiopg.Pool:
+    async def init(
+        self,
+        dsn: str,
+        *args,
+        acquire_timeout: Optional[float] = None,
+        max_connection_age: Optional[float] = None,
+        **kwargs,
+    ) -> aiopg.Pool:
         """Getting connection pool in asynchronous.
 
         Args:
             dsn: D.S.N - Data Source Name.
+            acquire_timeout: Max seconds to wait for free connection of the pool.
+            max_connection_age: Max age of pooled connection in seconds.
+
+        Notes:
+            Pool is registered in :class:`.PoolMonitor`, that applies
+            ``acquire_timeout`` and ``max_connection_age`` and exports metrics
+            of the pool.
+
+        Returns:
+            Created connection pool.
+        """
+
+        pool = await self.create_pool(dsn, *args, **kwargs)
+        register_pool_monitor(
+            pool=pool,
+            acquire_timeout=acquire_timeout,
+            max_connection_age=max_connection_age,
+            name="primary",
+        )
+        return pool
+
+    @staticmethod
+    async def create_pool(dsn: str, *args, **kwargs) -> aiopg.Pool:
+        """Create connection pool of the driver.
+
+        Args:
+            dsn: D.S.N - Data Source Name.
+            *args: Positional arguments of :func:`aiopg.create_pool`.
+            **kwargs: Keyword arguments of :func:`aiopg.create_pool`.
 
         Returns:
             Created connection pool.
@@ -22,7 +70,7 @@ class Postgresql(BaseAsyncResource):
 
         return await aiopg.create_pool(dsn=dsn, *args, **kwargs)
 
-    async def shutdown(self, resource: aiopg.Pool):
+    async def shutdown(self, resource: Union[aiopg.Pool, "AsyncpgPool"]):
         """Close connection.
 
         Args:
@@ -37,3 +85,104 @@ class Postgresql(BaseAsyncResource):
 
         resource.close()
         await resource.wait_closed()
+
+
+class PostgresqlReplicas(BaseAsyncResource):
+    """Pools of postgresql read replicas using aiopg."""
+
+    async def init(
+        self,
+        dsns: List[str],
+        health_check_interval: float,
+        *args,
+        acquire_timeout: Optional[float] = None,
+        max_connection_age: Optional[float] = None,
+        **kwargs,
+    ) -> ReplicaSet:
+        """Create pool for every replica and start health checks.
+
+        Args:
+            dsns: D.S.N of every replica. May be empty.
+            health_check_interval: Seconds between health checks of replicas.
+            acquire_timeout: Max seconds to wait for free connection of the pool.
+            max_connection_age: Max age of pooled connection in seconds.
+
+        Notes:
+            Pools of replicas are created with ``minsize=0``, so unavailable
+            replica does not break startup, it is just excluded from routing
+            by health check.
+
+        Returns:
+            Set of replicas.
+        """
+
+        kwargs["minsize"] = 0
+        replicas = []
+        for number, dsn in enumerate(dsns, start=1):
+            pool = await self.create_pool(dsn, *args, **kwargs)
+            register_pool_monitor(
+                pool=pool,
+                acquire_timeout=acquire_timeout,
+                max_connection_age=max_connection_age,
+                name=f"replica-{number}",
+            )
+            replicas.append(Replica(dsn=dsn, pool=pool))
+
+        replica_set = ReplicaSet(
+            replicas=replicas,
+            health_check_interval=health_check_interval,
+        )
+        await replica_set.check()
+        replica_set.start()
+        return replica_set
+
+    create_pool = staticmethod(Postgresql.create_pool)
+
+    async def shutdown(self, resource: ReplicaSet):
+        """Stop health checks and close pools of replicas.
+
+        Args:
+            resource: Resource returned by :meth:`.PostgresqlReplicas.init()`
+                method.
+        """
+
+        await resource.close()
+
+
+async def _create_asyncpg_pool(dsn: str, *args, **kwargs) -> "AsyncpgPool":
+    """Create asyncpg pool with interface of aiopg pool.
+
+    Args:
+        dsn: D.S.N - Data Source Name.
+        *args: Positional arguments of :meth:`.AsyncpgPool.create`.
+        **kwargs: Keyword arguments of :meth:`.AsyncpgPool.create`.
+
+    Notes:
+        ``asyncpg`` is an optional dependency, so it is imported only when
+        asyncpg backend is selected.
+
+    Returns:
+        Created connection pool.
+    """
+
+    # pylint: disable=import-outside-toplevel
+    from app.pkg.connectors.postgresql.asyncpg_adapter import AsyncpgPool
+
+    return await AsyncpgPool.create(dsn, *args, **kwargs)
+
+
+class PostgresqlAsyncpg(Postgresql):
+    """PostgresSQL connector using asyncpg.
+
+    Pool has interface of aiopg pool, see :class:`.AsyncpgPool`, so
+    repositories work with it unchanged. Prepared statements are cached by
+    asyncpg itself, size of the cache is ``statement_cache_size`` argument.
+    """
+
+    create_pool = staticmethod(_create_asyncpg_pool)
+
+
+class PostgresqlAsyncpgReplicas(PostgresqlReplicas):
+    """Pools of postgresql read replicas using asyncpg."""
+
+    create_pool = staticmethod(_create_asyncpg_pool)
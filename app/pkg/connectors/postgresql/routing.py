@@ -0,0 +1,69 @@
+"""Routing of reads of the current context between the primary and replicas.
+
+Reads go to replicas unless the context has written to the primary, so it
+reads its own writes, or reads are forced to the primary in a block, e.g.
+while the result is stored in a shared cache.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+__all__ = [
+    "pin_to_primary",
+    "pinned_to_primary",
+    "read_from_primary",
+    "reads_from_replicas",
+]
+
+#: ContextVar[bool]: Context has written to the primary, so its reads must not
+#: go to replicas.
+__pinned_to_primary__: ContextVar[bool] = ContextVar(
+    "pinned_to_primary",
+    default=False,
+)
+
+#: ContextVar[bool]: Reads of the current block must go to the primary.
+__primary_reads__: ContextVar[bool] = ContextVar("primary_reads", default=False)
+
+
+def pin_to_primary() -> None:
+    """Send all following reads of the current context to the primary."""
+
+    __pinned_to_primary__.set(True)
+
+
+def pinned_to_primary() -> bool:
+    """Check that the current context has written to the primary.
+
+    Returns:
+        ``True`` if reads of the context must see its own writes.
+    """
+
+    return __pinned_to_primary__.get()
+
+
+def reads_from_replicas() -> bool:
+    """Check that reads of the current context may go to replicas.
+
+    Returns:
+        ``False`` if the context is pinned to the primary or inside
+        :func:`.read_from_primary`.
+    """
+
+    return not (__pinned_to_primary__.get() or __primary_reads__.get())
+
+
+@contextmanager
+def read_from_primary() -> Iterator[None]:
+    """Send reads of the block to the primary.
+
+    Values, that are shared between contexts, must not be read from a lagging
+    replica, otherwise the stale value outlives the lag.
+    """
+
+    token = __primary_reads__.set(True)
+    try:
+        yield
+    finally:
+        __primary_reads__.reset(token)
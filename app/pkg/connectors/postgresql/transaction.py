@@ -0,0 +1,106 @@
+"""Connection of the unit of work bound to the current context.
+
+:class:`.UnitOfWork` binds the cursor of its transaction to the context, so
+all queries of the context reuse it. Caches, that are shared between contexts,
+check :func:`.in_transaction` and do not serve or store values read inside
+not committed transaction. Changes, that must be published only when the
+transaction is committed, are deferred with :func:`.on_commit`.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Iterator, List, Optional
+
+__all__ = [
+    "bind_transaction",
+    "current_transaction",
+    "in_transaction",
+    "on_commit",
+    "run_on_commit",
+]
+
+#: ContextVar[Optional[Any]]: Cursor of the transaction of the current context.
+__transaction__: ContextVar[Optional[Any]] = ContextVar(
+    "transaction",
+    default=None,
+)
+
+#: ContextVar[Optional[List[Callable[[], Awaitable[Any]]]]]: Callbacks, that
+#: are run after commit of the transaction of the current context.
+__on_commit__: ContextVar[Optional[List[Callable[[], Awaitable[Any]]]]] = ContextVar(
+    "on_commit",
+    default=None,
+)
+
+
+def current_transaction() -> Optional[Any]:
+    """Get cursor of the transaction bound to the current context.
+
+    Returns:
+        Cursor or ``None`` outside of unit of work.
+    """
+
+    return __transaction__.get()
+
+
+def in_transaction() -> bool:
+    """Check that the current context is inside unit of work.
+
+    Returns:
+        ``True`` if the context has bound transaction.
+    """
+
+    return __transaction__.get() is not None
+
+
+def on_commit(callback: Callable[[], Awaitable[Any]]) -> None:
+    """Run callback after commit of the transaction of the current context.
+
+    Args:
+        callback: Coroutine function without arguments.
+
+    Notes:
+        Callbacks are dropped, if the transaction is rolled back. Outside of
+        unit of work there is nothing to wait for, so use it only when
+        :func:`.in_transaction` is ``True``.
+
+    Raises:
+        RuntimeError: The context has no bound transaction.
+    """
+
+    callbacks = __on_commit__.get()
+    if callbacks is None:
+        raise RuntimeError("on_commit is called outside of transaction")
+    callbacks.append(callback)
+
+
+async def run_on_commit() -> None:
+    """Run callbacks registered by :func:`.on_commit` in order of
+    registration.
+
+    Called by :class:`.UnitOfWork` after commit.
+    """
+
+    callbacks = __on_commit__.get() or []
+    while callbacks:
+        await callbacks.pop(0)()
+
+
+@contextmanager
+def bind_transaction(cursor: Any) -> Iterator[Any]:
+    """Bind cursor of the transaction to the current context in the block.
+
+    Args:
+        cursor: Cursor with open transaction.
+
+    Returns:
+        The cursor.
+    """
+
+    token = __transaction__.set(cursor)
+    callbacks = __on_commit__.set([])
+    try:
+        yield cursor
+    finally:
+        __on_commit__.reset(callbacks)
+        __transaction__.reset(token)
@@ -0,0 +1,5 @@
+"""Coalescing of reads by key."""
+
+# ruff: noqa
+
+from app.pkg.dataloader.loader import DataLoader
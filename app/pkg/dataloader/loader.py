@@ -0,0 +1,210 @@
+"""DataLoader, that coalesces reads by key into batch queries."""
+
+import asyncio
+from operator import attrgetter
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    TypeVar,
+)
+
+__all__ = ["DataLoader"]
+
+_Key = TypeVar("_Key", bound=Hashable)
+_Item = TypeVar("_Item")
+
+
+class DataLoader(Generic[_Key, _Item]):
+    """Collect all loads issued in the same event loop iteration into one batch.
+
+    Every :meth:`.load` registers the key and returns a future. The first
+    registered key schedules dispatch with :meth:`asyncio.loop.call_soon`,
+    so all coroutines, that are ready in the current iteration, add their keys
+    before ``batch_load`` is called once with the unique keys.
+
+    Notes:
+        Loaded items are not memoized: a key is shared only while its batch is
+        in flight, so later loads always see fresh rows. So one DataLoader may
+        be shared by the whole process (e.g. ``providers.Singleton``) and
+        coalesce loads of concurrent requests.
+
+        Batch is loaded in the context of the load, that opened it. So loads
+        are coalesced only with loads of the same ``scope`` (e.g. reads of
+        replicas and reads of the primary are batched apart). Loads, that must
+        not run in a foreign context (e.g. inside transaction), are not
+        coalesced, when ``scope`` returns ``None``.
+
+    Examples:
+        ::
+
+            >>> from app.pkg import models
+            >>> loader = DataLoader(
+            ...     batch_load=lambda ids: repository.batch_read_all(
+            ...         query=models.ReadAllCountryByIdQuery(ids=ids),
+            ...     ),
+            ... )
+            >>> # One query with ``id = ANY('{1, 2}')``.
+            >>> await asyncio.gather(loader.load(1), loader.load(2), loader.load(1))
+            [Country(id=1, ...), Country(id=2, ...), Country(id=1, ...)]
+    """
+
+    #: Callable[[List[_Key]], Awaitable[Sequence[_Item]]]: Load items by unique
+    #: keys. Missing keys may be skipped.
+    batch_load: Callable[[List[_Key]], Awaitable[Sequence[_Item]]]
+
+    #: Callable[[_Item], _Key]: Get key of loaded item.
+    key: Callable[[_Item], _Key]
+
+    #: int: Max count of keys passed to ``batch_load`` at once.
+    max_batch_size: int
+
+    #: Callable[[], Optional[Hashable]]: Scope of loads of the current
+    #: context. ``None`` disables coalescing.
+    scope: Callable[[], Optional[Hashable]]
+
+    def __init__(
+        self,
+        batch_load: Callable[[List[_Key]], Awaitable[Sequence[_Item]]],
+        key: Callable[[_Item], _Key] = attrgetter("id"),
+        max_batch_size: int = 1000,
+        scope: Callable[[], Optional[Hashable]] = lambda: (),
+    ):
+        self.batch_load = batch_load
+        self.key = key
+        self.max_batch_size = max_batch_size
+        self.scope = scope
+
+        self.__futures: Dict[Hashable, Dict[_Key, asyncio.Future]] = {}
+        self.__queues: Dict[Hashable, List[_Key]] = {}
+        self.__tasks: Set[asyncio.Task] = set()
+
+    async def load(self, key: _Key) -> Optional[_Item]:
+        """Load item by key.
+
+        Args:
+            key: Key of item.
+
+        Returns:
+            Loaded item or ``None`` if ``batch_load`` did not return it.
+
+        Raises:
+            Exception: Any exception raised by ``batch_load``.
+        """
+
+        scope = self.scope()
+        if scope is None:
+            return (await self.__load_now([key]))[0]
+        return await asyncio.shield(self.__future(scope, key))
+
+    async def load_many(self, keys: Iterable[_Key]) -> List[Optional[_Item]]:
+        """Load items by keys in one batch.
+
+        Args:
+            keys: Keys of items. May contain duplicates.
+
+        Returns:
+            Loaded items or ``None`` in order of ``keys``.
+        """
+
+        scope = self.scope()
+        if scope is None:
+            return await self.__load_now(list(keys))
+
+        futures = [self.__future(scope, key) for key in keys]
+        return list(await asyncio.gather(*(asyncio.shield(f) for f in futures)))
+
+    async def __load_now(self, keys: List[_Key]) -> List[Optional[_Item]]:
+        """Load keys in the current context without coalescing.
+
+        Args:
+            keys: Keys of items. May contain duplicates.
+
+        Returns:
+            Loaded items or ``None`` in order of ``keys``.
+        """
+
+        unique = list(dict.fromkeys(keys))
+        found: Dict[_Key, _Item] = {}
+        for start in range(0, len(unique), self.max_batch_size):
+            items = await self.batch_load(unique[start : start + self.max_batch_size])
+            found.update((self.key(item), item) for item in items)
+        return [found.get(key) for key in keys]
+
+    def __future(self, scope: Hashable, key: _Key) -> asyncio.Future:
+        """Get future of the key, register the key if it is not loading yet.
+
+        Args:
+            scope: Scope of the load.
+            key: Key of item.
+
+        Returns:
+            Future resolved with the item when its batch is loaded.
+        """
+
+        futures = self.__futures.setdefault(scope, {})
+        future = futures.get(key)
+        if future is not None:
+            return future
+
+        loop = asyncio.get_running_loop()
+        future = futures[key] = loop.create_future()
+        queue = self.__queues.setdefault(scope, [])
+        queue.append(key)
+        if len(queue) == 1:
+            loop.call_soon(self.__dispatch, scope)
+        return future
+
+    def __dispatch(self, scope: Hashable) -> None:
+        """Start loading of all registered keys of the scope.
+
+        Args:
+            scope: Scope of the loads.
+        """
+
+        keys = self.__queues.pop(scope)
+        for start in range(0, len(keys), self.max_batch_size):
+            task = asyncio.ensure_future(
+                self.__load(scope, keys[start : start + self.max_batch_size]),
+            )
+            self.__tasks.add(task)
+            task.add_done_callback(self.__tasks.discard)
+
+    async def __load(self, scope: Hashable, keys: List[_Key]) -> None:
+        """Load one batch and resolve futures of its keys.
+
+        Args:
+            scope: Scope of the loads.
+            keys: Unique keys of the batch.
+        """
+
+        scoped = self.__futures[scope]
+        futures = [scoped[key] for key in keys]
+        try:
+            items = await self.batch_load(keys)
+        except asyncio.CancelledError:
+            for future in futures:
+                future.cancel()
+            raise
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            for future in futures:
+                if not future.done():
+                    future.set_exception(error)
+            return
+        finally:
+            for key in keys:
+                scoped.pop(key, None)
+            if not scoped:
+                self.__futures.pop(scope, None)
+
+        found = {self.key(item): item for item in items}
+        for key, future in zip(keys, futures):
+            if not future.done():
+                future.set_result(found.get(key))
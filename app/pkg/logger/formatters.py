@@ -0,0 +1,183 @@
+"""Structured formatting and filtering of log records.
+
+Filters of this module are attached to :class:`.DroppingQueueHandler`, so they
+run in the thread, that logs the record: trace context is read from the
+current span, and suppressed records are never queued. Formatting runs in the
+writing thread of :class:`.BatchWriter`.
+"""
+
+import logging
+import random
+import threading
+import time
+from typing import Dict, List, Mapping, Optional, Tuple
+
+import orjson
+from opentelemetry import trace
+from prometheus_client import Counter
+
+__all__ = ["JSONFormatter", "SamplingFilter", "TraceContextFilter"]
+
+
+class TraceContextFilter(logging.Filter):
+    """Add ids of the current OpenTelemetry trace and span to records.
+
+    Ids are stored in ``trace_id`` and ``span_id`` attributes of the record
+    in the same hex format as in ``X-Trace-ID`` header of responses. Records
+    logged outside of a span have no ids.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        context = trace.get_current_span().get_span_context()
+        if context.is_valid:
+            record.trace_id = trace.format_trace_id(context.trace_id)
+            record.span_id = trace.format_span_id(context.span_id)
+        return True
+
+
+class JSONFormatter(logging.Formatter):
+    """Format record as one line JSON object.
+
+    Object contains ``timestamp`` (unix time), ``level``, ``logger``,
+    ``message`` and, if present, ``trace_id``, ``span_id``, ``exception`` and
+    ``stack``. Caller of the record is not written, so loggers do not need to
+    inspect frames.
+
+    Examples:
+        ::
+
+            >>> handler.setFormatter(JSONFormatter())
+            >>> logger.info("Hello, World!")
+            {"timestamp":1609459200.0,"level":"INFO","logger":"app","message":"Hello, World!"}
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "timestamp": record.created,
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        trace_id = getattr(record, "trace_id", None)
+        if trace_id is not None:
+            payload["trace_id"] = trace_id
+            payload["span_id"] = record.span_id
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            payload["exception"] = record.exc_text
+        if record.stack_info:
+            payload["stack"] = self.formatStack(record.stack_info)
+        return orjson.dumps(payload, default=str).decode()
+
+
+class SamplingFilter(logging.Filter):
+    """Sample and rate limit records of high-volume loggers.
+
+    Limits are configured by name of the logger and apply to its children,
+    i.e. limit of ``app.internal`` applies to ``app.internal.routes`` too.
+    The nearest configured ancestor wins.
+
+    Notes:
+        Record passes the sampling with probability of the sample rate of the
+        logger, then takes one token from the bucket of the logger. Bucket
+        holds tokens for one second, but at least one token, and is refilled
+        with rate limit of the logger per second.
+
+        Suppressed records are counted in
+        ``logging_suppressed_records_total``.
+
+    Examples:
+        ::
+
+            >>> handler.addFilter(
+            ...     SamplingFilter(
+            ...         sample_rates={"app.internal.pkg.middlewares": 0.1},
+            ...         rate_limits={"app.internal.pkg.middlewares": 100},
+            ...     ),
+            ... )
+    """
+
+    __SUPPRESSED = Counter(
+        "logging_suppressed_records_total",
+        "Total count of log records suppressed by sampling or rate limit.",
+        ["logger", "reason"],
+    )
+
+    #: Mapping[str, float]: Share of passed records by name of the logger.
+    sample_rates: Mapping[str, float]
+
+    #: Mapping[str, float]: Max count of passed records per second by name of
+    #: the logger.
+    rate_limits: Mapping[str, float]
+
+    def __init__(
+        self,
+        sample_rates: Optional[Mapping[str, float]] = None,
+        rate_limits: Optional[Mapping[str, float]] = None,
+    ):
+        super().__init__()
+        self.sample_rates = dict(sample_rates or {})
+        self.rate_limits = dict(rate_limits or {})
+
+        self.__lock = threading.Lock()
+        self.__buckets: Dict[str, List[float]] = {}
+        self.__resolved: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        resolved = self.__resolved.get(record.name)
+        if resolved is None:
+            resolved = self.__resolved[record.name] = (
+                self.__nearest(record.name, self.sample_rates),
+                self.__nearest(record.name, self.rate_limits),
+            )
+        sampled, limited = resolved
+
+        if sampled is not None and random.random() >= self.sample_rates[sampled]:
+            self.__SUPPRESSED.labels(logger=sampled, reason="sampled").inc()
+            return False
+        if limited is not None and not self.__take(limited):
+            self.__SUPPRESSED.labels(logger=limited, reason="rate_limited").inc()
+            return False
+        return True
+
+    def __take(self, name: str) -> bool:
+        """Take one token from the bucket of the logger.
+
+        Args:
+            name: Configured name of the logger.
+
+        Returns:
+            ``True`` if the bucket had a token.
+        """
+
+        rate = self.rate_limits[name]
+        capacity = max(rate, 1.0)
+        now = time.monotonic()
+        with self.__lock:
+            bucket = self.__buckets.setdefault(name, [capacity, now])
+            tokens = min(capacity, bucket[0] + (now - bucket[1]) * rate)
+            bucket[1] = now
+            if tokens < 1:
+                bucket[0] = tokens
+                return False
+            bucket[0] = tokens - 1
+            return True
+
+    @staticmethod
+    def __nearest(name: str, limits: Mapping[str, float]) -> Optional[str]:
+        """Find the nearest configured ancestor of the logger.
+
+        Args:
+            name: Name of the logger.
+            limits: Configured limits by name of the logger.
+
+        Returns:
+            Configured name or ``None``, if the logger is not limited.
+        """
+
+        while name:
+            if name in limits:
+                return name
+            name = name.rpartition(".")[0]
+        return None
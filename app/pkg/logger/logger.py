@@ -1,9 +1,13 @@
 """Methods for working with logger."""
 
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
 from pathlib import Path
+from typing import Optional
 
+from app.pkg.logger.formatters import JSONFormatter, SamplingFilter, TraceContextFilter
+from app.pkg.logger.pipeline import BatchFileHandler, BatchStreamHandler, BatchWriter
+from app.pkg.models.core.logger import LoggerFormat
 from app.pkg.settings import settings
 
 _log_format = (
@@ -11,8 +15,20 @@ _log_format = (
     "funcName)s(%(lineno)d) - %(message)s "
 )
 
+#: Optional[BatchWriter]: Writer shared by all loggers.
+__writer__: Optional[BatchWriter] = None
 
-def get_file_handler(file_name: str) -> RotatingFileHandler:
+
+def get_formatter() -> logging.Formatter:
+    """Get formatter of records configured in
+    :attr:`.Settings.API.LOGGER.FORMAT`."""
+
+    if settings.API.LOGGER.FORMAT == LoggerFormat.JSON:
+        return JSONFormatter()
+    return logging.Formatter(_log_format)
+
+
+def get_file_handler(file_name: str) -> BatchFileHandler:
     """Get file handler for logger.
 
     Args:
@@ -37,23 +53,70 @@ def get_file_handler(file_name: str) -> RotatingFileHandler:
     """
 
     Path(file_name).absolute().parent.mkdir(exist_ok=True, parents=True)
-    file_handler = RotatingFileHandler(
+    file_handler = BatchFileHandler(
         filename=file_name,
         maxBytes=5242880,
         backupCount=10,
     )
-    file_handler.setFormatter(logging.Formatter(_log_format))
+    file_handler.setFormatter(get_formatter())
     return file_handler
 
 
-def get_stream_handler():
+def get_stream_handler() -> BatchStreamHandler:
     """Get stream handler for logger."""
 
-    stream_handler = logging.StreamHandler()
-    stream_handler.setFormatter(logging.Formatter(_log_format))
+    stream_handler = BatchStreamHandler()
+    stream_handler.setFormatter(get_formatter())
     return stream_handler
 
 
+def get_writer() -> BatchWriter:
+    """Get writer shared by all loggers, create it on the first call.
+
+    Notes:
+        Handlers are created once, so every log file is opened once. Queued
+        records are written on exit of the interpreter.
+
+        Records are sampled and rate limited by
+        :attr:`.Settings.API.LOGGER.SAMPLE_RATES` and
+        :attr:`.Settings.API.LOGGER.RATE_LIMITS` before they are queued.
+
+        In ``json`` format, records get ids of the current trace and span, and
+        loggers do not look up the caller of the record, because it is not
+        written.
+
+    Returns:
+        Background writer of records to file and stream.
+    """
+
+    global __writer__  # pylint: disable=global-statement
+    if __writer__ is None:
+        file_path = str(
+            Path(
+                settings.API.LOGGER.FOLDER_PATH,
+                f"{settings.API.INSTANCE_APP_NAME}.log",
+            ).absolute(),
+        )
+        __writer__ = BatchWriter(
+            handlers=[get_file_handler(file_name=file_path), get_stream_handler()],
+            maxsize=settings.API.LOGGER.QUEUE_SIZE,
+            batch_size=settings.API.LOGGER.BATCH_SIZE,
+        )
+        if settings.API.LOGGER.SAMPLE_RATES or settings.API.LOGGER.RATE_LIMITS:
+            __writer__.handler.addFilter(
+                SamplingFilter(
+                    sample_rates=settings.API.LOGGER.SAMPLE_RATES,
+                    rate_limits=settings.API.LOGGER.RATE_LIMITS,
+                ),
+            )
+        if settings.API.LOGGER.FORMAT == LoggerFormat.JSON:
+            __writer__.handler.addFilter(TraceContextFilter())
+            # See "Optimization" section of the documentation of ``logging``.
+            logging._srcfile = None  # pylint: disable=protected-access
+        atexit.register(__writer__.stop)
+    return __writer__
+
+
 def get_logger(name):
     """Get logger.
 
@@ -61,6 +124,13 @@ def get_logger(name):
         name:
             Name of the logger.
 
+    Notes:
+        Records are put into the bounded queue and written by the background
+        thread (see :class:`.BatchWriter`), so logging never blocks the event
+        loop. If the queue is full, records are dropped and counted.
+
+        Calling the function again for the same name does not add handlers.
+
     Returns:
         LoggerLevel instance.
 
@@ -73,13 +143,8 @@ def get_logger(name):
             2021-01-01 00:00:00,000 - [INFO] - app.pkg.logger - (logger.py).get_logger(43) - Hello, World!  # pylint: disable=line-too-long
     """
     logger = logging.getLogger(name)
-    file_path = str(
-        Path(
-            settings.API.LOGGER.FOLDER_PATH,
-            f"{settings.API.INSTANCE_APP_NAME}.log",
-        ).absolute(),
-    )
-    logger.addHandler(get_file_handler(file_name=file_path))
-    logger.addHandler(get_stream_handler())
+    handler = get_writer().handler
+    if handler not in logger.handlers:
+        logger.addHandler(handler)
     logger.setLevel(settings.API.LOGGER.LEVEL.upper())
     return logger
@@ -0,0 +1,226 @@
+"""Non-blocking logging pipeline.
+
+Loggers put records into the bounded queue with :class:`.DroppingQueueHandler`
+and return at once. The background thread of :class:`.BatchWriter` takes all
+queued records and writes them to the handlers with one write and one flush
+per batch, so disk and stdout are never touched from the event loop.
+"""
+
+import copy
+import logging
+import os
+import queue
+import threading
+from logging.handlers import QueueHandler, RotatingFileHandler
+from typing import List, Optional, Sequence
+
+from prometheus_client import Counter
+
+__all__ = [
+    "BatchFileHandler",
+    "BatchStreamHandler",
+    "BatchWriter",
+    "DroppingQueueHandler",
+]
+
+
+class _BatchHandler(logging.Handler):
+    """Handler, that writes batch of records at once."""
+
+    def format_batch(self, records: Sequence[logging.LogRecord]) -> str:
+        """Format records accepted by level and filters of the handler.
+
+        Args:
+            records: Batch of records.
+
+        Returns:
+            Formatted records, every one ends with terminator.
+        """
+
+        terminator = getattr(self, "terminator", "\n")
+        return "".join(
+            self.format(record) + terminator
+            for record in records
+            if record.levelno >= self.level and self.filter(record)
+        )
+
+    def emit_batch(self, records: Sequence[logging.LogRecord]) -> None:
+        """Write batch of records.
+
+        Args:
+            records: Batch of records.
+        """
+
+        raise NotImplementedError
+
+
+class BatchStreamHandler(logging.StreamHandler, _BatchHandler):
+    """Stream handler, that flushes the stream once per batch."""
+
+    def emit_batch(self, records: Sequence[logging.LogRecord]) -> None:
+        try:
+            text = self.format_batch(records)
+            if text:
+                with self.lock:
+                    self.stream.write(text)
+                    self.flush()
+        except Exception:  # pylint: disable=broad-exception-caught
+            self.handleError(records[0])
+
+
+class BatchFileHandler(RotatingFileHandler, _BatchHandler):
+    """Rotating file handler, that checks size and flushes once per batch."""
+
+    def emit_batch(self, records: Sequence[logging.LogRecord]) -> None:
+        try:
+            text = self.format_batch(records)
+            if not text:
+                return
+            with self.lock:
+                if self.stream is None:
+                    self.stream = self._open()
+                if (
+                    self.maxBytes > 0
+                    and self.stream.tell() > 0
+                    and self.stream.tell() + len(text) >= self.maxBytes
+                ):
+                    self.doRollover()
+                self.stream.write(text)
+                self.flush()
+        except Exception:  # pylint: disable=broad-exception-caught
+            self.handleError(records[0])
+
+
+class DroppingQueueHandler(QueueHandler):
+    """Queue handler, that drops records when the queue is full.
+
+    Dropped records are counted in ``logging_dropped_records_total``, so
+    logging never blocks the caller.
+
+    Notes:
+        Message and traceback of the record are rendered before it is queued,
+        but the traceback is kept apart from the message, so formatters of
+        the writing handlers decide how to write it.
+    """
+
+    __DROPPED = Counter(
+        "logging_dropped_records_total",
+        "Total count of log records dropped because the queue is full.",
+        ["level"],
+    )
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.message = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = logging.Formatter().formatException(
+                    record.exc_info,
+                )
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.__DROPPED.labels(level=record.levelname).inc()
+
+
+class BatchWriter:
+    """Background thread, that writes queued records to handlers in batches.
+
+    Notes:
+        Thread is started again in the child process after ``fork``, with a
+        new queue, because locks of the parent queue may be held by the thread,
+        that does not exist in the child.
+
+    Examples:
+        ::
+
+            >>> writer = BatchWriter(handlers=[BatchStreamHandler()], maxsize=10000)
+            >>> logging.getLogger("app").addHandler(writer.handler)
+    """
+
+    #: DroppingQueueHandler: Handler, that puts records into the queue.
+    handler: DroppingQueueHandler
+
+    #: Sequence[_BatchHandler]: Handlers, that write records.
+    handlers: Sequence[_BatchHandler]
+
+    #: int: Max count of queued records.
+    maxsize: int
+
+    #: int: Max count of records in one batch.
+    batch_size: int
+
+    def __init__(
+        self,
+        handlers: Sequence[_BatchHandler],
+        maxsize: int,
+        batch_size: int = 512,
+    ):
+        self.handlers = handlers
+        self.maxsize = maxsize
+        self.batch_size = batch_size
+        self.handler = DroppingQueueHandler(queue.Queue(maxsize=maxsize))
+
+        self.__thread: Optional[threading.Thread] = None
+        self.start()
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=self.__after_fork)
+
+    def start(self) -> None:
+        """Start writing thread."""
+
+        if self.__thread is not None and self.__thread.is_alive():
+            return
+
+        self.__thread = threading.Thread(
+            target=self.__run,
+            args=(self.handler.queue,),
+            name="log-writer",
+            daemon=True,
+        )
+        self.__thread.start()
+
+    def stop(self) -> None:
+        """Write queued records and stop writing thread."""
+
+        if self.__thread is None:
+            return
+
+        self.handler.queue.put(None)
+        self.__thread.join()
+        self.__thread = None
+
+    def __after_fork(self) -> None:
+        """Restart writing thread in the child process."""
+
+        self.handler.queue = queue.Queue(maxsize=self.maxsize)
+        self.__thread = None
+        self.start()
+
+    def __run(self, records: queue.Queue) -> None:
+        """Write batches until ``None`` is queued.
+
+        Args:
+            records: Queue of records.
+        """
+
+        while True:
+            batch: List[logging.LogRecord] = [records.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(records.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = batch[-1] is None
+            batch = [record for record in batch if record is not None]
+            if batch:
+                for handler in self.handlers:
+                    handler.emit_batch(batch)
+            if stop:
+                return
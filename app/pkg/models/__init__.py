@@ -1,29 +1,41 @@
 """Business models."""
 # ruff: noqa
 
+from app.pkg.models.app.batch import BatchError, BatchFields, BatchItem
 from app.pkg.models.app.city import (
     City,
+    CityUpsert,
     CreateCityCommand,
     DeleteCityCommand,
+    PatchCityCommand,
+    ReadAllCityByIdQuery,
     ReadCityByCountryQuery,
     ReadCityQuery,
     UpdateCityCommand,
 )
 from app.pkg.models.app.contacts import (
     Contacts,
+    ContactsEmailUpdate,
     ContactsFields,
+    ContactsUpsert,
     CreateContactsCommand,
     DeleteContactsCommand,
+    PatchContactsCommand,
+    ReadAllContactsByIdQuery,
     ReadContactsByIdQuery,
     ReadContactsByTelegramUserIdQuery,
     ReadContactsQuery,
     UpdateContactsCommand,
+    UpdateContactsEmailCommand,
     UpdateEmailCommand,
 )
 from app.pkg.models.app.country import (
     Country,
+    CountryUpsert,
     CreateCountryCommand,
     DeleteCountryCommand,
+    PatchCountryCommand,
+    ReadAllCountryByIdQuery,
     ReadCountryQuery,
     UpdateCountryCommand,
 )
@@ -31,14 +43,20 @@ from app.pkg.models.app.direction import (
     CreateDirectionCommand,
     DeleteDirectionCommand,
     Direction,
+    DirectionUpsert,
+    PatchDirectionCommand,
     ReadAllDirectionByIdQuery,
     ReadDirectionQuery,
     UpdateDirectionCommand,
 )
+from app.pkg.models.app.pagination import Page, PaginationFields, PaginationQuery
 from app.pkg.models.app.partner import (
     CreatePartnerCommand,
     DeletePartnerCommand,
     Partner,
+    PartnerUpsert,
+    PatchPartnerCommand,
+    ReadAllPartnerByIdQuery,
     ReadPartnerByTokenQuery,
     ReadPartnerQuery,
     UpdatePartnerCommand,
@@ -46,15 +64,21 @@ from app.pkg.models.app.partner import (
 from app.pkg.models.app.skill import (
     CreateSkillCommand,
     DeleteSkillCommand,
+    PatchSkillCommand,
     ReadAllSkillByIdQuery,
     ReadSkillQuery,
     Skill,
+    SkillUpsert,
     UpdateSkillCommand,
 )
 from app.pkg.models.app.skill_levels import (
     CreateSkillLevelCommand,
     DeleteSkillLevelCommand,
+    PatchSkillLevelCommand,
+    ReadAllSkillLevelByIdQuery,
     ReadSkillLevelQuery,
     SkillLevel,
+    SkillLevelUpsert,
     UpdateSkillLevelCommand,
 )
+from app.pkg.models.app.upsert import UpsertFields
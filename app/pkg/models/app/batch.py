@@ -0,0 +1,69 @@
+"""Models for results of batch commands."""
+
+from typing import Generic, Optional, TypeVar
+
+from pydantic.fields import Field
+from pydantic.generics import GenericModel
+from pydantic.types import NonNegativeInt
+
+from app.pkg.models.base import BaseAPIException, BaseModel
+
+__all__ = ["BatchError", "BatchItem", "BatchFields"]
+
+_Item = TypeVar("_Item", bound=BaseModel)
+
+
+class BatchFields:
+    #: int: Max count of commands in one batch request.
+    max_items = 10000
+
+    index: NonNegativeInt = Field(
+        description="Index of the command in the batch.",
+        example=0,
+    )
+    message: str = Field(
+        description="Message of the error.",
+        example="City code already exists.",
+    )
+    status_code: int = Field(
+        description="HTTP status code the command would fail with.",
+        example=409,
+    )
+
+
+class BatchError(BaseModel):
+    """Error of one command of the batch."""
+
+    message: str = BatchFields.message
+    status_code: int = BatchFields.status_code
+
+    @classmethod
+    def from_exception(cls, error: BaseAPIException) -> "BatchError":
+        """Build error from exception raised by the command.
+
+        Args:
+            error: API exception.
+
+        Returns:
+            BatchError: Error with message and status code of the exception.
+        """
+        return cls(message=str(error.message), status_code=error.status_code)
+
+
+class BatchItem(BaseModel, GenericModel, Generic[_Item]):
+    """Result of one command of the batch.
+
+    Exactly one of ``item`` and ``error`` is set.
+
+    Examples:
+        >>> from app.pkg import models
+        >>> models.BatchItem[models.Country](
+        ...     index=0,
+        ...     item=models.Country(id=1, name="Russia", code="RUS"),
+        ... )
+        BatchItem[Country](index=0, item=Country(...), error=None)
+    """
+
+    index: NonNegativeInt = BatchFields.index
+    item: Optional[_Item] = None
+    error: Optional[BatchError] = None
@@ -1,16 +1,22 @@
 """Models of city object."""
 
+import typing
+
 from pydantic.fields import Field
 from pydantic.types import PositiveInt
 
-from app.pkg.models.base import BaseModel
+from app.pkg.models.app.upsert import UpsertFields
+from app.pkg.models.base import BaseModel, BasePatchModel, optional
 
 __all__ = [
     "City",
+    "CityUpsert",
     "CreateCityCommand",
     "ReadCityQuery",
     "ReadCityByCountryQuery",
+    "ReadAllCityByIdQuery",
     "UpdateCityCommand",
+    "PatchCityCommand",
     "DeleteCityCommand",
 ]
 
@@ -21,6 +27,10 @@ class BaseCity(BaseModel):
 
 class CityFields:
     id: PositiveInt = Field(description="Internal skill id.", example=1)
+    ids: typing.List[PositiveInt] = Field(
+        description="List of city ids.",
+        example=[1, 2, 3],
+    )
     name: PositiveInt = Field(description="City name.", example="Moscow")
     code: str = Field(description="City code.", example="MSK", regex=r"^[A-Z]{3}$")
     country_id: PositiveInt = Field(description="Country id.", example=1)
@@ -36,6 +46,10 @@ class City(_City):
     id: PositiveInt = CityFields.id
 
 
+class CityUpsert(City):
+    created: bool = UpsertFields.created
+
+
 # Commands.
 class CreateCityCommand(_City):
     ...
@@ -45,6 +59,13 @@ class UpdateCityCommand(_City):
     id: PositiveInt = CityFields.id
 
 
+class PatchCityCommand(BaseCity, BasePatchModel):
+    id: PositiveInt = CityFields.id
+    name: str = optional(CityFields.name)
+    code: str = optional(CityFields.code)
+    country_id: PositiveInt = optional(CityFields.country_id)
+
+
 class DeleteCityCommand(BaseCity):
     id: PositiveInt = CityFields.id
 
@@ -56,3 +77,7 @@ class ReadCityQuery(BaseCity):
 
 class ReadCityByCountryQuery(BaseCity):
     country_id: PositiveInt = CityFields.country_id
+
+
+class ReadAllCityByIdQuery(BaseCity):
+    ids: typing.List[PositiveInt] = CityFields.ids
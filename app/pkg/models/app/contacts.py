@@ -7,17 +7,23 @@ from pydantic import EmailStr
 from pydantic.fields import Field
 from pydantic.types import PositiveInt, SecretStr
 
-from app.pkg.models.base import BaseModel
+from app.pkg.models.app.upsert import UpsertFields
+from app.pkg.models.base import BaseModel, BasePatchModel, optional
 
 __all__ = [
     "Contacts",
+    "ContactsUpsert",
     "ContactsFields",
+    "ContactsEmailUpdate",
     "CreateContactsCommand",
     "ReadContactsQuery",
     "ReadContactsByIdQuery",
+    "ReadAllContactsByIdQuery",
     "ReadContactsByTelegramUserIdQuery",
     "UpdateContactsCommand",
+    "PatchContactsCommand",
     "UpdateEmailCommand",
+    "UpdateContactsEmailCommand",
     "DeleteContactsCommand",
 ]
 
@@ -30,6 +36,10 @@ class ContactsFields:
     """Model fields of contacts."""
 
     id: PositiveInt = Field(description="Internal skill id.", example=1)
+    ids: typing.List[PositiveInt] = Field(
+        description="List of contacts ids.",
+        example=[1, 2, 3],
+    )
     email: typing.Optional[EmailStr] = Field(
         description="StrictUser email.",
         example="test@example.ru",
@@ -55,6 +65,10 @@ class ContactsFields:
         example=1,
         default=None,
     )
+    changed: bool = Field(
+        description="Email of contacts was changed.",
+        example=True,
+    )
 
 
 class _Contacts(BaseContacts):
@@ -69,6 +83,14 @@ class Contacts(_Contacts):
     id: PositiveInt = ContactsFields.id
 
 
+class ContactsUpsert(Contacts):
+    created: bool = UpsertFields.created
+
+
+class ContactsEmailUpdate(Contacts):
+    changed: bool = ContactsFields.changed
+
+
 # Commands.
 class CreateContactsCommand(_Contacts):
     ...
@@ -78,10 +100,26 @@ class UpdateContactsCommand(_Contacts):
     id: PositiveInt = ContactsFields.id
 
 
+class PatchContactsCommand(BaseContacts, BasePatchModel):
+    id: PositiveInt = ContactsFields.id
+    email: typing.Optional[EmailStr] = optional(ContactsFields.email)
+    telegram_username: typing.Optional[str] = optional(
+        ContactsFields.telegram_username,
+    )
+    token: SecretStr = optional(ContactsFields.token)
+    telegram_user_id: PositiveInt = optional(ContactsFields.telegram_user_id)
+    partner_id: typing.Optional[PositiveInt] = optional(ContactsFields.partner_id)
+
+
 class UpdateEmailCommand(BaseContacts):
     email: typing.Optional[EmailStr] = ContactsFields.email
 
 
+class UpdateContactsEmailCommand(BaseContacts):
+    token: SecretStr = ContactsFields.token
+    email: typing.Optional[EmailStr] = ContactsFields.email
+
+
 class DeleteContactsCommand(BaseContacts):
     id: PositiveInt = ContactsFields.id
 
@@ -97,3 +135,7 @@ class ReadContactsByTelegramUserIdQuery(BaseContacts):
 
 class ReadContactsByIdQuery(BaseContacts):
     id: PositiveInt = ContactsFields.id
+
+
+class ReadAllContactsByIdQuery(BaseContacts):
+    ids: typing.List[PositiveInt] = ContactsFields.ids
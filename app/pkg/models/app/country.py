@@ -1,16 +1,22 @@
 """Models for country object."""
 
 
+import typing
+
 from pydantic.fields import Field
 from pydantic.types import PositiveInt
 
-from app.pkg.models.base import BaseModel
+from app.pkg.models.app.upsert import UpsertFields
+from app.pkg.models.base import BaseModel, BasePatchModel, optional
 
 __all__ = [
     "Country",
+    "CountryUpsert",
     "CreateCountryCommand",
     "ReadCountryQuery",
+    "ReadAllCountryByIdQuery",
     "UpdateCountryCommand",
+    "PatchCountryCommand",
     "DeleteCountryCommand",
 ]
 
@@ -21,6 +27,10 @@ class BaseCountry(BaseModel):
 
 class CountryFields:
     id: PositiveInt = Field(description="Internal skill id.", example=1)
+    ids: typing.List[PositiveInt] = Field(
+        description="List of country ids.",
+        example=[1, 2, 3],
+    )
     name: str = Field(description="Country name.", example="Russia")
     code: str = Field(description="Country code.", example="RUS", regex=r"^[A-Z]{3}$")
 
@@ -34,6 +44,10 @@ class Country(_Country):
     id: PositiveInt = CountryFields.id
 
 
+class CountryUpsert(Country):
+    created: bool = UpsertFields.created
+
+
 # Commands.
 class CreateCountryCommand(_Country):
     ...
@@ -43,6 +57,12 @@ class UpdateCountryCommand(_Country):
     id: PositiveInt = CountryFields.id
 
 
+class PatchCountryCommand(BaseCountry, BasePatchModel):
+    id: PositiveInt = CountryFields.id
+    name: str = optional(CountryFields.name)
+    code: str = optional(CountryFields.code)
+
+
 class DeleteCountryCommand(BaseCountry):
     id: PositiveInt = CountryFields.id
 
@@ -50,3 +70,7 @@ class DeleteCountryCommand(BaseCountry):
 # Queries.
 class ReadCountryQuery(BaseCountry):
     id: PositiveInt = CountryFields.id
+
+
+class ReadAllCountryByIdQuery(BaseCountry):
+    ids: typing.List[PositiveInt] = CountryFields.ids
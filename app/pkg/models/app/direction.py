@@ -5,14 +5,17 @@ import typing
 from pydantic.fields import Field
 from pydantic.types import PositiveInt
 
-from app.pkg.models.base import BaseModel
+from app.pkg.models.app.upsert import UpsertFields
+from app.pkg.models.base import BaseModel, BasePatchModel, optional
 
 __all__ = [
     "Direction",
+    "DirectionUpsert",
     "CreateDirectionCommand",
     "ReadDirectionQuery",
     "ReadAllDirectionByIdQuery",
     "UpdateDirectionCommand",
+    "PatchDirectionCommand",
     "DeleteDirectionCommand",
 ]
 
@@ -38,6 +41,10 @@ class Direction(_Direction):
     id: PositiveInt = DirectionFields.id
 
 
+class DirectionUpsert(Direction):
+    created: bool = UpsertFields.created
+
+
 # Commands.
 class CreateDirectionCommand(_Direction):
     ...
@@ -47,6 +54,11 @@ class UpdateDirectionCommand(_Direction):
     id: PositiveInt = DirectionFields.id
 
 
+class PatchDirectionCommand(BaseDirection, BasePatchModel):
+    id: PositiveInt = DirectionFields.id
+    name: str = optional(DirectionFields.name)
+
+
 class DeleteDirectionCommand(BaseDirection):
     id: PositiveInt = DirectionFields.id
 
@@ -0,0 +1,81 @@
+"""Models for keyset pagination of ``read_all`` methods."""
+
+from typing import Generic, List, Optional, Sequence, TypeVar
+
+from pydantic.fields import Field
+from pydantic.generics import GenericModel
+from pydantic.types import NonNegativeInt, PositiveInt
+
+from app.pkg.models.base import BaseModel
+
+__all__ = ["PaginationQuery", "Page", "PaginationFields"]
+
+_Item = TypeVar("_Item", bound=BaseModel)
+
+
+class PaginationFields:
+    limit: int = Field(
+        default=100,
+        gt=0,
+        le=1000,
+        description="Maximum number of rows in one page.",
+        example=100,
+    )
+    after_id: NonNegativeInt = Field(
+        default=0,
+        description="Return only rows with ``id`` greater than this cursor.",
+        example=0,
+    )
+    next_after_id: Optional[PositiveInt] = Field(
+        default=None,
+        description="Cursor for the next page. ``null`` on the last page.",
+        example=100,
+    )
+
+
+# Queries.
+class PaginationQuery(BaseModel):
+    """Keyset pagination query.
+
+    Rows are always ordered by ``id``, so the cursor of the next page is the
+    ``id`` of the last row of the current one.
+    """
+
+    limit: int = PaginationFields.limit
+    after_id: NonNegativeInt = PaginationFields.after_id
+
+
+class Page(BaseModel, GenericModel, Generic[_Item]):
+    """One page of rows read with :class:`.PaginationQuery`.
+
+    Examples:
+        >>> from app.pkg import models
+        >>> page = models.Page[models.Country].from_items(
+        ...     items=[models.Country(id=1, name="Russia", code="RUS")],
+        ...     query=models.PaginationQuery(limit=1),
+        ... )
+        >>> page.next_after_id
+        1
+    """
+
+    items: List[_Item]
+    next_after_id: Optional[PositiveInt] = PaginationFields.next_after_id
+
+    @classmethod
+    def from_items(cls, items: Sequence[_Item], query: PaginationQuery):
+        """Build page from rows returned by repository.
+
+        Items already validated by repository layer, so they are not validated
+        again.
+
+        Args:
+            items: Rows of the current page ordered by ``id``.
+            query: Query the rows were read with.
+
+        Returns:
+            Page: Page with cursor for the next page. If the page is not full,
+                it is the last one and ``next_after_id`` is ``None``.
+        """
+        items = list(items)
+        next_after_id = items[-1].id if len(items) >= query.limit else None
+        return cls.construct(items=items, next_after_id=next_after_id)
@@ -4,18 +4,23 @@ Aka: Yandex, GeekBrains, etc.
 """
 import secrets
 import string
+import typing
 
 from pydantic.fields import Field
 from pydantic.types import PositiveInt
 
-from app.pkg.models.base import BaseModel
+from app.pkg.models.app.upsert import UpsertFields
+from app.pkg.models.base import BaseModel, BasePatchModel, optional
 
 __all__ = [
     "Partner",
+    "PartnerUpsert",
     "CreatePartnerCommand",
     "ReadPartnerQuery",
     "ReadPartnerByTokenQuery",
+    "ReadAllPartnerByIdQuery",
     "UpdatePartnerCommand",
+    "PatchPartnerCommand",
     "DeletePartnerCommand",
 ]
 
@@ -28,6 +33,10 @@ class PartnersFields:
     """Model fields of partners."""
 
     id: PositiveInt = Field(description="Internal partner id.", example=1)
+    ids: typing.List[PositiveInt] = Field(
+        description="List of partner ids.",
+        example=[1, 2, 3],
+    )
     name: str = Field(description="Partner name.", example="Yandex")
     token: str = Field(
         description="Partner short token.",
@@ -47,6 +56,10 @@ class Partner(_Partner):
     id: PositiveInt = PartnersFields.id
 
 
+class PartnerUpsert(Partner):
+    created: bool = UpsertFields.created
+
+
 # Commands.
 class CreatePartnerCommand(_Partner):
     ...
@@ -56,6 +69,12 @@ class UpdatePartnerCommand(_Partner):
     id: PositiveInt = PartnersFields.id
 
 
+class PatchPartnerCommand(BasePartner, BasePatchModel):
+    id: PositiveInt = PartnersFields.id
+    name: str = optional(PartnersFields.name)
+    token: str = optional(PartnersFields.token)
+
+
 class DeletePartnerCommand(BasePartner):
     id: PositiveInt = PartnersFields.id
 
@@ -67,3 +86,7 @@ class ReadPartnerQuery(BasePartner):
 
 class ReadPartnerByTokenQuery(BasePartner):
     token: str = PartnersFields.token
+
+
+class ReadAllPartnerByIdQuery(BasePartner):
+    ids: typing.List[PositiveInt] = PartnersFields.ids
@@ -5,14 +5,17 @@ import typing
 from pydantic.fields import Field
 from pydantic.types import PositiveInt
 
-from app.pkg.models.base import BaseModel
+from app.pkg.models.app.upsert import UpsertFields
+from app.pkg.models.base import BaseModel, BasePatchModel, optional
 
 __all__ = [
     "Skill",
+    "SkillUpsert",
     "CreateSkillCommand",
     "ReadSkillQuery",
     "ReadAllSkillByIdQuery",
     "UpdateSkillCommand",
+    "PatchSkillCommand",
     "DeleteSkillCommand",
 ]
 
@@ -38,6 +41,10 @@ class Skill(_Skill):
     id: PositiveInt = SkillFields.id
 
 
+class SkillUpsert(Skill):
+    created: bool = UpsertFields.created
+
+
 # Commands.
 class CreateSkillCommand(_Skill):
     ...
@@ -47,6 +54,11 @@ class UpdateSkillCommand(_Skill):
     id: PositiveInt = SkillFields.id
 
 
+class PatchSkillCommand(BaseSkill, BasePatchModel):
+    id: PositiveInt = SkillFields.id
+    name: str = optional(SkillFields.name)
+
+
 class DeleteSkillCommand(BaseSkill):
     id: PositiveInt = SkillFields.id
 
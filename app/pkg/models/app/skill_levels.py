@@ -1,15 +1,21 @@
 """Models for skill level object."""
 
+import typing
+
 from pydantic.fields import Field
 from pydantic.types import PositiveInt
 
-from app.pkg.models.base import BaseModel
+from app.pkg.models.app.upsert import UpsertFields
+from app.pkg.models.base import BaseModel, BasePatchModel, optional
 
 __all__ = [
     "SkillLevel",
+    "SkillLevelUpsert",
     "CreateSkillLevelCommand",
     "ReadSkillLevelQuery",
+    "ReadAllSkillLevelByIdQuery",
     "UpdateSkillLevelCommand",
+    "PatchSkillLevelCommand",
     "DeleteSkillLevelCommand",
 ]
 
@@ -20,6 +26,10 @@ class BaseSkillLevel(BaseModel):
 
 class SkillLevelFields:
     id: PositiveInt = Field(description="Internal skill level id.", example=1)
+    ids: typing.List[PositiveInt] = Field(
+        description="List of skill level ids.",
+        example=[1, 2, 3],
+    )
     level: PositiveInt = Field(description="Skill level.", example=1)
     description: str = Field(description="Skill level description.", example="Junior")
 
@@ -33,6 +43,10 @@ class SkillLevel(_SkillLevel):
     id: PositiveInt = SkillLevelFields.id
 
 
+class SkillLevelUpsert(SkillLevel):
+    created: bool = UpsertFields.created
+
+
 # Commands.
 class CreateSkillLevelCommand(_SkillLevel):
     ...
@@ -42,6 +56,12 @@ class UpdateSkillLevelCommand(_SkillLevel):
     id: PositiveInt = SkillLevelFields.id
 
 
+class PatchSkillLevelCommand(BaseSkillLevel, BasePatchModel):
+    id: PositiveInt = SkillLevelFields.id
+    level: PositiveInt = optional(SkillLevelFields.level)
+    description: str = optional(SkillLevelFields.description)
+
+
 class DeleteSkillLevelCommand(BaseSkillLevel):
     id: PositiveInt = SkillLevelFields.id
 
@@ -49,3 +69,7 @@ class DeleteSkillLevelCommand(BaseSkillLevel):
 # Queries.
 class ReadSkillLevelQuery(BaseSkillLevel):
     id: PositiveInt = SkillLevelFields.id
+
+
+class ReadAllSkillLevelByIdQuery(BaseSkillLevel):
+    ids: typing.List[PositiveInt] = SkillLevelFields.ids
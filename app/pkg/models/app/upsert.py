@@ -0,0 +1,12 @@
+"""Fields of results of upsert commands."""
+
+from pydantic.fields import Field
+
+__all__ = ["UpsertFields"]
+
+
+class UpsertFields:
+    created: bool = Field(
+        description="Row was inserted, ``false`` if existing row was updated.",
+        example=True,
+    )
@@ -0,0 +1,214 @@
+"""Precomputed migrations between model classes for trusted
+:meth:`.BaseModel.migrate`."""
+
+from __future__ import annotations
+
+import typing
+from functools import lru_cache
+from typing import Any, Callable, Dict, FrozenSet, Optional, Tuple
+
+import pydantic
+from jsf import JSF
+from pydantic.error_wrappers import ErrorWrapper
+
+from app.pkg.models.base.serializer import get_serializer
+
+__all__ = ["Migration", "get_jsf", "get_migration"]
+
+
+@lru_cache(maxsize=None)
+def get_jsf(model: typing.Type[pydantic.BaseModel]) -> JSF:
+    """Get random data generator of the model schema.
+
+    Notes:
+        Building of :class:`jsf.JSF` parses the whole json schema, so generator
+        is built once per model class.
+
+    Args:
+        model: Model class.
+
+    Returns:
+        Generator of dicts, that match schema of ``model``.
+    """
+
+    return JSF(model.schema())
+
+
+class Migration:
+    """Field mapping from source model class to target model class.
+
+    Fields with the same type in both models are copied as is. Fields, which
+    type differs or which default is built by ``default_factory`` (so it may
+    be not validated), and ``extra_fields`` are validated by the target field.
+    So migration is trusted only as much as source model is valid.
+
+    Warnings:
+        Validators of the target model are not called for copied fields, root
+        validators are not called at all. Copied values are shared between
+        source and target, so they must not be mutated.
+    """
+
+    __slots__ = ("target", "copied", "validated", "absent", "required")
+
+    #: Type[BaseModel]: Target model class.
+    target: typing.Type[pydantic.BaseModel]
+
+    #: Tuple[Tuple[str, str], ...]: Pairs of target and source names of fields,
+    #: that are copied as is.
+    copied: Tuple[Tuple[str, str], ...]
+
+    #: Tuple[Tuple[str, str, Callable], ...]: Target and source names of fields,
+    #: that are validated by the target field, and cast of source value like
+    #: in ``to_dict(show_secrets=True)``.
+    validated: Tuple[Tuple[str, str, Callable[[Any], Any]], ...]
+
+    #: FrozenSet[str]: Fields of target, that are missing in source.
+    absent: FrozenSet[str]
+
+    #: FrozenSet[str]: Required fields of target, that are missing in source.
+    required: FrozenSet[str]
+
+    def __init__(
+        self,
+        source: typing.Type[pydantic.BaseModel],
+        target: typing.Type[pydantic.BaseModel],
+        match_keys: Tuple[Tuple[str, str], ...],
+    ):
+        casts = get_serializer(source, show_secrets=True).casts
+        renamed = dict(match_keys)
+        hidden = set(renamed.values()) - set(renamed)
+
+        copied, validated, absent = [], [], set()
+        for name, field in target.__fields__.items():
+            source_name = renamed.get(name, name)
+            source_field = source.__fields__.get(source_name)
+            if source_field is None or source_name in hidden:
+                absent.add(name)
+            elif (
+                self.__same_type(source_field, field)
+                and (field.allow_none or not source_field.allow_none)
+                # Values of ``default_factory`` are not validated by pydantic.
+                and source_field.default_factory is None
+            ):
+                copied.append((name, source_name))
+            else:
+                validated.append((name, source_name, casts[source_name]))
+
+        self.target = target
+        self.copied = tuple(copied)
+        self.validated = tuple(validated)
+        self.absent = frozenset(absent)
+        self.required = frozenset(n for n in absent if target.__fields__[n].required)
+
+    @staticmethod
+    def __same_type(
+        source: pydantic.fields.ModelField,
+        target: pydantic.fields.ModelField,
+    ) -> bool:
+        """Check, that valid value of source field is valid for target field.
+
+        Notes:
+            Constraints of ``Field`` (e.g. ``regex``) build new type for every
+            field, so fields declared with the same ``FieldInfo`` and
+            annotation are compared by them.
+
+        Args:
+            source: Field of source model.
+            target: Field of target model.
+
+        Returns:
+            True, if value can be copied without validation.
+        """
+
+        if source.outer_type_ == target.outer_type_:
+            return True
+        return (
+            source.field_info is target.field_info
+            and source.annotation == target.annotation
+        )
+
+    def __call__(
+        self,
+        instance: pydantic.BaseModel,
+        extra_fields: Optional[Dict[str, Any]] = None,
+        random_fill: bool = False,
+    ) -> Optional[pydantic.BaseModel]:
+        """Build target model from the instance of source model.
+
+        Args:
+            instance: Instance of source model.
+            extra_fields: Values of target fields. Unknown fields are ignored.
+            random_fill: Fill fields, that are missing in source, with random
+                values.
+
+        Raises:
+            ValidationError: Value of field with different type or extra field
+                is not valid for the target field.
+
+        Returns:
+            Instance of target model or ``None``, if fields are missing and
+            the instance must be migrated with validation.
+        """
+
+        extra_fields = extra_fields or {}
+        if not random_fill and not self.required.issubset(extra_fields):
+            return None
+
+        source = instance.__dict__
+        try:
+            values = {name: source[source_name] for name, source_name in self.copied}
+            unchecked = {
+                name: cast(source[source_name])
+                for name, source_name, cast in self.validated
+            }
+        except KeyError:
+            # Field was deleted from the instance.
+            return None
+
+        fields = self.target.__fields__
+        if random_fill and self.absent:
+            fake = get_jsf(self.target).generate()
+            unchecked.update((name, fake.get(name)) for name in self.absent)
+        for name, value in extra_fields.items():
+            if name in fields:
+                values.pop(name, None)
+                unchecked[name] = value
+
+        errors = []
+        for name, value in unchecked.items():
+            value, error = fields[name].validate(
+                value,
+                values,
+                loc=name,
+                cls=self.target,
+            )
+            if error:
+                errors.append(error)
+            values[name] = value
+        if errors:
+            raise pydantic.ValidationError(
+                typing.cast(typing.List[ErrorWrapper], errors),
+                self.target,
+            )
+
+        return self.target.construct(**values)
+
+
+@lru_cache(maxsize=1024)
+def get_migration(
+    source: typing.Type[pydantic.BaseModel],
+    target: typing.Type[pydantic.BaseModel],
+    match_keys: Tuple[Tuple[str, str], ...] = (),
+) -> Migration:
+    """Get migration between model classes, build it on the first call.
+
+    Args:
+        source: Source model class.
+        target: Target model class.
+        match_keys: Sorted pairs of target and source names of renamed fields.
+
+    Returns:
+        Migration from ``source`` to ``target``.
+    """
+
+    return Migration(source=source, target=target, match_keys=match_keys)
@@ -5,19 +5,17 @@ from __future__ import annotations
 import time
 import typing
 from datetime import date, datetime
-from typing import Any, Dict, List, Tuple, TypeVar
-from uuid import UUID
+from typing import Any, TypeVar
 
 import pydantic
-from jsf import JSF
-from pydantic import UUID4
 
 from app.pkg.models import types
+from app.pkg.models.base.migration import get_jsf, get_migration
+from app.pkg.models.base.serializer import cast_value, get_serializer
 
 __all__ = ["BaseModel", "Model"]
 
 Model = TypeVar("Model", bound="BaseModel")
-_T = TypeVar("_T")
 
 
 class BaseModel(pydantic.BaseModel):
@@ -99,6 +97,11 @@ class BaseModel(pydantic.BaseModel):
                 >>> print(dict_model["some_value_two"])
                 'value'
 
+        Notes:
+            Without ``values`` and ``kwargs`` model is serialized with
+            serializer compiled once for its class (see
+            :class:`.Serializer`), so values are not dispatched on their type.
+
         Raises:
             TypeError: If ``values`` are not a Dict object.
 
@@ -106,61 +109,13 @@ class BaseModel(pydantic.BaseModel):
             Dict object with reveal password filed.
         """
 
-        values = self.dict(**kwargs).items() if not values else values.items()
-        r = {}
-        for k, v in values:
-            v = self.__cast_values(v=v, show_secrets=show_secrets)
-            r[k] = v
-        return r
-
-    def __cast_values(self, v: _T, show_secrets: bool, **kwargs) -> _T:
-        """Cast value for dict object.
-
-        Args:
-            v:
-                Any value.
-            show_secrets:
-                If True, then the secret will be revealed.
-
-        Warnings:
-            This method is not memory optimized.
-        """
-
-        if isinstance(v, (List, Tuple)):
-            return [
-                self.__cast_values(v=ve, show_secrets=show_secrets, **kwargs)
-                for ve in v
-            ]
-
-        elif isinstance(v, (pydantic.SecretBytes, pydantic.SecretStr)):
-            return self.__cast_secret(v=v, show_secrets=show_secrets)
-
-        elif isinstance(v, Dict) and v:
-            return self.to_dict(show_secrets=show_secrets, values=v, **kwargs)
-
-        elif isinstance(v, (UUID, UUID4)):
-            return str(v)
+        if not values and not kwargs:
+            return get_serializer(type(self), show_secrets)(self)
 
-        elif isinstance(v, datetime):
-            return v.timestamp()
-
-        return v
-
-    @staticmethod
-    def __cast_secret(v, show_secrets: bool) -> str:
-        """Cast secret value to str.
-
-        Args:
-            v: pydantic.Secret* object.
-            show_secrets: bool value. If True, then the secret will be revealed.
-
-        Returns: str value of ``v``.
-        """
-
-        if isinstance(v, pydantic.SecretBytes):
-            return v.get_secret_value().decode() if show_secrets else str(v)
-        elif isinstance(v, pydantic.SecretStr):
-            return v.get_secret_value() if show_secrets else str(v)
+        values = self.dict(**kwargs) if not values else values
+        return {
+            k: cast_value(v=v, show_secrets=show_secrets) for k, v in values.items()
+        }
 
     def delete_attribute(self, attr: str) -> BaseModel:
         """Delete some attribute field from a model.
@@ -182,6 +137,7 @@ class BaseModel(pydantic.BaseModel):
         random_fill: bool = False,
         match_keys: dict[str, str] | None = None,
         extra_fields: dict[str, typing.Any] | None = None,
+        trusted: bool = False,
     ) -> Model:
         """Migrate one model to another ignoring missmatch.
 
@@ -205,6 +161,11 @@ class BaseModel(pydantic.BaseModel):
                 Key: name of field in a target model.
 
                 Value: value of field in a target model.
+            trusted:
+                If True, then values of fields with the same type are copied
+                without validation, using field mapping precomputed once per
+                pair of models (see :class:`.Migration`). Use it for models,
+                that were built by our own code.
 
         Examples:
             When migrating from model A to model B, the fields that are not
@@ -264,11 +225,25 @@ class BaseModel(pydantic.BaseModel):
                 >>> a = A(a=1, b=2, c=3)
                 >>> a.migrate(model=B, extra_fields={"c": 3})  # B(a=1, b=2, c=3)
 
+            If the model was validated already, migration can skip validation
+            of the copied fields with the ``trusted`` argument::
+
+                >>> a.migrate(model=B, extra_fields={"c": 3}, trusted=True)
+
 
         Returns:
             pydantic model parsed from ``model``.
         """
 
+        if trusted:
+            migrated = get_migration(
+                type(self),
+                model,
+                tuple(sorted(match_keys.items())) if match_keys else (),
+            )(self, extra_fields=extra_fields, random_fill=random_fill)
+            if migrated is not None:
+                return migrated
+
         self_dict_model = self.to_dict(show_secrets=True)
 
         if not match_keys:
@@ -285,8 +260,7 @@ class BaseModel(pydantic.BaseModel):
         if not random_fill:
             return pydantic.parse_obj_as(model, self_dict_model)
 
-        # TODO: Make this look better.
-        faker = JSF(model.schema()).generate()
+        faker = get_jsf(model).generate()
         faker.update(self_dict_model)
         return pydantic.parse_obj_as(model, faker)
 
@@ -0,0 +1,68 @@
+"""Base model of sparse update commands."""
+
+from __future__ import annotations
+
+import copy
+import typing
+from typing import Any
+
+import pydantic
+from pydantic.fields import FieldInfo
+
+from app.pkg.models.base.model import BaseModel
+
+__all__ = ["BasePatchModel", "optional"]
+
+
+def optional(field: FieldInfo) -> FieldInfo:
+    """Copy field of model, so it may be omitted in sparse command.
+
+    Args:
+        field: Field of the full model, e.g. ``CityFields.name``.
+
+    Returns:
+        Same field with ``None`` default and without default factory.
+    """
+
+    field = copy.copy(field)
+    field.default = None
+    field.default_factory = None
+    return field
+
+
+class BasePatchModel(BaseModel):
+    """Base model of sparse update commands.
+
+    Only fields, that are set in the command, are updated. Fields declared
+    with :func:`.optional` may be omitted, but not set to ``null``, unless
+    their annotation is ``Optional``.
+
+    Examples:
+        ::
+
+            >>> class PatchCityCommand(BasePatchModel):
+            ...     id: PositiveInt = CityFields.id
+            ...     name: str = optional(CityFields.name)
+            >>> PatchCityCommand(id=1, name="Moscow").to_patch()
+            {'id': 1, 'name': 'Moscow'}
+    """
+
+    @pydantic.root_validator(pre=True)
+    def __check_not_null(cls, values: typing.Dict[str, Any]):
+        for field in cls.__fields__.values():
+            nullable = type(None) in typing.get_args(field.annotation)
+            if not nullable and values.get(field.alias, ...) is None:
+                raise ValueError(f"{field.alias} must not be null")
+        return values
+
+    def to_patch(self, show_secrets: bool = False) -> typing.Dict[str, Any]:
+        """Make dict of fields, that are set in the command.
+
+        Args:
+            show_secrets: Reveal values of secret fields.
+
+        Returns:
+            Values of set fields in order of declaration.
+        """
+
+        return self.to_dict(show_secrets=show_secrets, exclude_unset=True)
@@ -0,0 +1,363 @@
+"""Compiled serializers of :meth:`.BaseModel.to_dict`.
+
+Serializer is generated once per model class from types of its fields, so
+``to_dict`` does not dispatch on the type of every value at runtime: fields of
+scalar types are copied as is and only fields of known complex types are
+converted.
+"""
+
+from __future__ import annotations
+
+import typing
+import weakref
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Callable, Dict, FrozenSet, List, Tuple, Union
+from uuid import UUID
+
+import pydantic
+
+__all__ = ["Serializer", "cast_value", "get_serializer"]
+
+#: tuple: Types, that ``to_dict`` returns as is.
+__scalars__ = (str, bytes, bool, int, float, Decimal, date, Enum)
+
+#: frozenset: Classes of validated values of scalar fields.
+__plains__ = frozenset((str, bytes, bool, int, float, Decimal, date, type(None)))
+
+#: WeakKeyDictionary: Serializers of model classes by ``show_secrets``.
+__serializers__: "weakref.WeakKeyDictionary[type, Dict[bool, Serializer]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+_Cast = Union[Callable[[Any], Any], FrozenSet[type]]
+
+
+def cast_value(v: Any, show_secrets: bool) -> Any:
+    """Cast value of :meth:`pydantic.BaseModel.dict` for ``to_dict``.
+
+    Used for values, which type is not known before runtime.
+
+    Args:
+        v: Any value.
+        show_secrets: If True, then the secret will be revealed.
+
+    Returns:
+        Casted value.
+    """
+
+    if isinstance(v, (List, Tuple)):
+        return [cast_value(v=ve, show_secrets=show_secrets) for ve in v]
+
+    elif isinstance(v, (pydantic.SecretBytes, pydantic.SecretStr)):
+        return __cast_secret(v=v, show_secrets=show_secrets)
+
+    elif isinstance(v, Dict) and v:
+        return {k: cast_value(v=ve, show_secrets=show_secrets) for k, ve in v.items()}
+
+    elif isinstance(v, UUID):
+        return str(v)
+
+    elif isinstance(v, datetime):
+        return v.timestamp()
+
+    return v
+
+
+def __cast_secret(v, show_secrets: bool) -> str:
+    """Cast secret value to str.
+
+    Args:
+        v: pydantic.Secret* object.
+        show_secrets: bool value. If True, then the secret will be revealed.
+
+    Returns: str value of ``v``.
+    """
+
+    if isinstance(v, pydantic.SecretBytes):
+        return v.get_secret_value().decode() if show_secrets else str(v)
+    return v.get_secret_value() if show_secrets else str(v)
+
+
+class Serializer:
+    """Serializer of one model class.
+
+    Every field gets a cast built from its type: scalars are copied as is,
+    secrets, uuids, datetimes, nested models, lists and dicts are converted
+    directly. Every cast checks that the value has the expected type and
+    passes unexpected values (e.g. unvalidated defaults from
+    ``default_factory`` or values of :meth:`pydantic.BaseModel.construct`) to
+    the dynamic cast, so the result is always the same as of
+    :func:`.cast_value`.
+
+    Notes:
+        :meth:`.__call__` uses generated function, that builds the dict with
+        one literal. If the instance has extra or deleted attributes (see
+        :meth:`.BaseModel.delete_attribute`), it falls back to a loop over
+        ``__dict__`` with the same casts.
+    """
+
+    __slots__ = ("casts", "size", "dynamic", "literal")
+
+    #: Dict[str, Callable[[Any], Any]]: Cast of every field.
+    casts: Dict[str, Callable[[Any], Any]]
+
+    #: int: Count of fields.
+    size: int
+
+    #: Callable[[Any], Any]: Cast for values of unknown type.
+    dynamic: Callable[[Any], Any]
+
+    #: Callable[[dict], dict]: Generated function, that serializes ``__dict__``
+    #: with all fields.
+    literal: Callable[[dict], dict]
+
+    def __init__(self, model: typing.Type[pydantic.BaseModel], show_secrets: bool):
+        self.dynamic = self.__build_dynamic(show_secrets)
+
+        plains: Dict[str, FrozenSet[type]] = {}
+        self.casts = {}
+        for name, field in model.__fields__.items():
+            cast = self.__build_cast(field, show_secrets, self.dynamic)
+            if isinstance(cast, frozenset):
+                plains[name] = cast
+                cast = self.__plain(cast, self.dynamic)
+            self.casts[name] = cast
+
+        self.size = len(self.casts)
+        self.literal = self.__compile(self.casts, plains, self.dynamic)
+
+    def __call__(self, instance: pydantic.BaseModel) -> dict:
+        values = instance.__dict__
+        if len(values) == self.size:
+            try:
+                return self.literal(values)
+            except KeyError:
+                pass
+
+        dynamic = self.dynamic
+        return {k: self.casts.get(k, dynamic)(v) for k, v in values.items()}
+
+    @staticmethod
+    def __compile(
+        casts: Dict[str, Callable[[Any], Any]],
+        plains: Dict[str, FrozenSet[type]],
+        dynamic: Callable[[Any], Any],
+    ) -> Callable[[dict], dict]:
+        """Generate function, that builds dict of all fields with one literal.
+
+        Fields of scalar types are checked inline, without call of cast.
+
+        Args:
+            casts: Cast of every field.
+            plains: Expected classes of fields of scalar types.
+            dynamic: Cast for values of unknown type.
+
+        Returns:
+            Function of ``__dict__`` of instance.
+        """
+
+        namespace: Dict[str, Any] = {"dynamic": dynamic}
+        items = []
+        for i, (name, cast) in enumerate(casts.items()):
+            if name in plains:
+                namespace[f"plain_{i}"] = plains[name]
+                items.append(
+                    f"{name!r}: v_{i} if (v_{i} := values[{name!r}]).__class__ "
+                    f"in plain_{i} else dynamic(v_{i})",
+                )
+            else:
+                namespace[f"cast_{i}"] = cast
+                items.append(f"{name!r}: cast_{i}(values[{name!r}])")
+
+        source = f"def serialize(values):\n    return {{{', '.join(items)}}}\n"
+        exec(source, namespace)  # pylint: disable=exec-used  # nosec B102
+        return namespace["serialize"]
+
+    @staticmethod
+    def __build_dynamic(show_secrets: bool) -> Callable[[Any], Any]:
+        """Build cast of value with unknown type.
+
+        Args:
+            show_secrets: If True, then secrets will be revealed.
+
+        Returns:
+            Cast, that converts nested models like
+            :meth:`pydantic.BaseModel.dict` and then casts the result with
+            :func:`.cast_value`.
+        """
+
+        def dynamic(v: Any) -> Any:
+            v = pydantic.BaseModel._get_value(  # pylint: disable=protected-access
+                v,
+                to_dict=True,
+                by_alias=False,
+                include=None,
+                exclude=None,
+                exclude_unset=False,
+                exclude_defaults=False,
+                exclude_none=False,
+            )
+            return cast_value(v=v, show_secrets=show_secrets)
+
+        return dynamic
+
+    @staticmethod
+    def __plain(
+        plain: FrozenSet[type],
+        dynamic: Callable[[Any], Any],
+    ) -> Callable[[Any], Any]:
+        """Build cast of scalar value.
+
+        Args:
+            plain: Expected classes of value.
+            dynamic: Cast for values of unknown type.
+
+        Returns:
+            Cast, that returns value of expected class as is.
+        """
+
+        return lambda v: v if v.__class__ in plain else dynamic(v)
+
+    @staticmethod
+    def __build_cast(
+        field: pydantic.fields.ModelField,
+        show_secrets: bool,
+        dynamic: Callable[[Any], Any],
+    ) -> _Cast:
+        """Build cast of the field from its type.
+
+        Args:
+            field: Field of model.
+            show_secrets: If True, then secrets will be revealed.
+            dynamic: Cast for types, that are not supported.
+
+        Returns:
+            Cast of the field or classes of scalar value.
+        """
+
+        if field.shape in (
+            pydantic.fields.SHAPE_SINGLETON,
+            pydantic.fields.SHAPE_LIST,
+            pydantic.fields.SHAPE_TUPLE_ELLIPSIS,
+            pydantic.fields.SHAPE_DICT,
+        ):
+            return Serializer.__cast_of(field.outer_type_, show_secrets, dynamic)
+        return dynamic
+
+    @staticmethod
+    def __cast_of(  # pylint: disable=too-many-return-statements
+        tp: Any,
+        show_secrets: bool,
+        dynamic: Callable[[Any], Any],
+    ) -> _Cast:
+        """Build cast of the type.
+
+        Args:
+            tp: Type of value.
+            show_secrets: If True, then secrets will be revealed.
+            dynamic: Cast for types, that are not supported.
+
+        Returns:
+            Cast of value or classes of scalar value.
+        """
+
+        origin = typing.get_origin(tp)
+        args = typing.get_args(tp)
+
+        if origin is typing.Union:
+            if len(args) == 2 and type(None) in args:
+                tp = args[0] if args[1] is type(None) else args[1]
+                return Serializer.__cast_of(tp, show_secrets, dynamic)
+            return dynamic
+
+        if origin in (list, tuple):
+            if (
+                not args
+                or origin is tuple
+                and not (len(args) == 2 and args[1] is Ellipsis)
+            ):
+                return dynamic
+            item = Serializer.__cast_of(args[0], show_secrets, dynamic)
+            if isinstance(item, frozenset):
+                item = Serializer.__plain(item, dynamic)
+            return lambda v: (
+                [item(ve) for ve in v] if isinstance(v, (list, tuple)) else dynamic(v)
+            )
+
+        if origin is dict:
+            if not args:
+                return dynamic
+            value = Serializer.__cast_of(args[1], show_secrets, dynamic)
+            if isinstance(value, frozenset):
+                value = Serializer.__plain(value, dynamic)
+            return lambda v: (
+                {k: value(ve) for k, ve in v.items()}
+                if isinstance(v, dict)
+                else dynamic(v)
+            )
+
+        if origin is not None or not isinstance(tp, type):
+            return dynamic
+
+        if issubclass(tp, pydantic.BaseModel):
+            return lambda v: (
+                get_serializer(v.__class__, show_secrets)(v)
+                if isinstance(v, pydantic.BaseModel)
+                else dynamic(v)
+            )
+
+        if issubclass(tp, pydantic.SecretBytes):
+            if show_secrets:
+                return lambda v: (
+                    v.get_secret_value().decode()
+                    if isinstance(v, pydantic.SecretBytes)
+                    else dynamic(v)
+                )
+            return (
+                lambda v: str(v) if isinstance(v, pydantic.SecretBytes) else dynamic(v)
+            )
+
+        if issubclass(tp, pydantic.SecretStr):
+            if show_secrets:
+                return lambda v: (
+                    v.get_secret_value()
+                    if isinstance(v, pydantic.SecretStr)
+                    else dynamic(v)
+                )
+            return lambda v: str(v) if isinstance(v, pydantic.SecretStr) else dynamic(v)
+
+        if issubclass(tp, UUID):
+            return lambda v: str(v) if isinstance(v, UUID) else dynamic(v)
+
+        if issubclass(tp, datetime):
+            return lambda v: v.timestamp() if isinstance(v, datetime) else dynamic(v)
+
+        if issubclass(tp, __scalars__):
+            return __plains__ | {tp}
+
+        return dynamic
+
+
+def get_serializer(
+    model: typing.Type[pydantic.BaseModel],
+    show_secrets: bool,
+) -> Serializer:
+    """Get serializer of the model class, build it on the first call.
+
+    Args:
+        model: Model class.
+        show_secrets: If True, then secrets will be revealed.
+
+    Returns:
+        Serializer of instances of ``model``.
+    """
+
+    serializers = __serializers__.get(model)
+    if serializers is None:
+        serializers = __serializers__[model] = {}
+    serializer = serializers.get(show_secrets)
+    if serializer is None:
+        serializer = serializers[show_secrets] = Serializer(model, show_secrets)
+    return serializer
@@ -0,0 +1,21 @@
+"""Models of cache settings."""
+
+from app.pkg.models.base import BaseEnum
+
+__all__ = ["CacheBackend", "SingleFlightScope"]
+
+
+class CacheBackend(str, BaseEnum):
+    MEMORY = "memory"
+    REDIS = "redis"
+
+
+class SingleFlightScope(str, BaseEnum):
+    """Scope, in which identical in-flight reads are shared."""
+
+    #: Share reads between all requests of the worker process.
+    PROCESS = "process"
+    #: Share reads only inside one service instance, i.e. one request.
+    REQUEST = "request"
+    #: Do not share reads.
+    DISABLED = "disabled"
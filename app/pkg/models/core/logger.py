@@ -2,7 +2,7 @@
 
 from app.pkg.models.base import BaseEnum
 
-__all__ = ["LoggerLevel"]
+__all__ = ["LoggerLevel", "LoggerFormat"]
 
 
 class LoggerLevel(str, BaseEnum):
@@ -12,3 +12,12 @@ class LoggerLevel(str, BaseEnum):
     DEBUG = "DEBUG"
     CRITICAL = "CRITICAL"
     NOTSET = "NOTSET"
+
+
+class LoggerFormat(str, BaseEnum):
+    """Format of written records."""
+
+    #: Human-readable line with the caller of the record.
+    TEXT = "text"
+    #: One JSON object per line with trace and span ids of the record.
+    JSON = "json"
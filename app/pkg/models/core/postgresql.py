@@ -0,0 +1,15 @@
+"""PostgresqlDriver model."""
+
+from app.pkg.models.base import BaseEnum
+
+__all__ = ["PostgresqlDriver"]
+
+
+class PostgresqlDriver(str, BaseEnum):
+    """Driver of connection pools to postgresql."""
+
+    #: psycopg2 connections wrapped by aiopg.
+    AIOPG = "aiopg"
+    #: asyncpg connections with binary protocol and built-in statement cache.
+    #  Requires ``asyncpg`` extra.
+    ASYNCPG = "asyncpg"
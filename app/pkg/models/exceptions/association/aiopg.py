@@ -19,6 +19,7 @@ __all__ = ["__aiopg__", "__constrains__"]
 
 __aiopg__ = {
     errorcodes.UNIQUE_VIOLATION: repository.UniqueViolation,
+    errorcodes.CARDINALITY_VIOLATION: repository.RepeatedKey,
 }
 
 # TODO: Make this dict more flexible.
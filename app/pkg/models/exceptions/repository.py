@@ -7,8 +7,10 @@ from app.pkg.models.base import BaseAPIException
 
 __all__ = [
     "UniqueViolation",
+    "RepeatedKey",
     "EmptyResult",
     "DriverError",
+    "PoolAcquireTimeout",
 ]
 
 
@@ -17,6 +19,13 @@ class UniqueViolation(BaseAPIException):
     status_code = status.HTTP_409_CONFLICT
 
 
+class RepeatedKey(BaseAPIException):
+    """Exception for several upserts of the same row in one query."""
+
+    message = "Batch contains several commands with the same key."
+    status_code = status.HTTP_409_CONFLICT
+
+
 class EmptyResult(BaseAPIException):
     message = "Empty result."
     status_code = status.HTTP_404_NOT_FOUND
@@ -40,3 +49,10 @@ class DriverError(BaseAPIException):
             self.details = details
 
         super().__init__()
+
+
+class PoolAcquireTimeout(DriverError):
+    """Exception for exhausted pool of connections."""
+
+    message = "Database is overloaded, try again later."
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
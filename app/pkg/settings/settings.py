@@ -1,16 +1,25 @@
 """Module for load settings form `.env` or if server running with parameter
 `dev` from `.env.dev`"""
+import json
 import pathlib
 import typing
 import urllib.parse
 from functools import lru_cache
 
 from dotenv import find_dotenv
-from pydantic import PostgresDsn, root_validator, validator
+from pydantic import Field, PostgresDsn, confloat, root_validator, validator
 from pydantic.env_settings import BaseSettings
-from pydantic.types import PositiveInt, SecretStr
-
-from app.pkg.models.core.logger import LoggerLevel
+from pydantic.types import (
+    NonNegativeFloat,
+    NonNegativeInt,
+    PositiveFloat,
+    PositiveInt,
+    SecretStr,
+)
+
+from app.pkg.models.core.cache import CacheBackend, SingleFlightScope
+from app.pkg.models.core.logger import LoggerFormat, LoggerLevel
+from app.pkg.models.core.postgresql import PostgresqlDriver
 
 __all__ = ["Settings", "get_settings"]
 
@@ -74,11 +83,50 @@ class Postgresql(_Settings):
     #: str: Postgresql database name.
     DATABASE_NAME: str = "postgres"
 
+    #: PostgresqlDriver: Driver of pools to the primary and replicas. Listener of
+    #  changed rows always uses aiopg.
+    DRIVER: PostgresqlDriver = PostgresqlDriver.AIOPG
+
     #: PositiveInt: Min count of connections in one pool to postgresql.
     MIN_CONNECTION: PositiveInt = 1
     #: PositiveInt: Max count of connections in one pool  to postgresql.
     MAX_CONNECTION: PositiveInt = 16
 
+    #: NonNegativeInt: Max count of prepared statements cached on one connection.
+    #  Set ``0`` to execute queries without preparing.
+    PREPARED_STATEMENTS_CACHE_SIZE: NonNegativeInt = 256
+
+    #: NonNegativeFloat: Max seconds to wait for free connection of the pool,
+    #  then :class:`.PoolAcquireTimeout` is raised. Set ``0`` to wait without limit.
+    ACQUIRE_TIMEOUT: NonNegativeFloat = 10
+    #: NonNegativeInt: Max age of connection in seconds. Older connections are
+    #  closed on release. Set ``0`` to not recycle connections.
+    MAX_CONNECTION_AGE: NonNegativeInt = 3600
+
+    #: List[str]: DSN of every read replica. Read-only queries are routed to
+    #  replicas, all other queries to the primary. Empty to use only primary.
+    REPLICAS: typing.List[str] = Field(default_factory=list)
+    #: PositiveFloat: Seconds between health checks of replicas.
+    REPLICA_HEALTH_CHECK_INTERVAL: PositiveFloat = 5
+
+    @validator("REPLICAS", pre=True)
+    def __parse_json(  # pylint: disable=unused-private-member, no-self-argument
+        cls,
+        v: typing.Any,
+    ):
+        """Parse JSON array from nested env variable."""
+
+        if isinstance(v, str):
+            return json.loads(v)
+        return v
+
+    #: PositiveFloat: Max seconds between attempts to reopen connection, that
+    #  listens to changes of rows. Attempts start from 0.5 seconds and double.
+    LISTENER_MAX_RECONNECT_INTERVAL: PositiveFloat = 30
+    #: PositiveFloat: Seconds without notifications before listening connection
+    #  is checked with ``select 1``.
+    LISTENER_PING_INTERVAL: PositiveFloat = 30
+
     #: str: Concatenation all settings for postgresql in one string. (DSN)
     #  Builds in `root_validator` method.
     DSN: typing.Optional[str] = None
@@ -123,6 +171,31 @@ class Logging(_Settings):
     LEVEL: LoggerLevel = LoggerLevel.DEBUG
     #: pathlib.Path: Path of saving logs on local storage.
     FOLDER_PATH: pathlib.Path = pathlib.Path("./src/logs")
+    #: PositiveInt: Max count of records waiting to be written. Records logged
+    #  while the queue is full are dropped.
+    QUEUE_SIZE: PositiveInt = 10000
+    #: PositiveInt: Max count of records written with one flush.
+    BATCH_SIZE: PositiveInt = 512
+    #: LoggerFormat: Format of records. ``json`` writes one object per line
+    #  with ids of the trace and span and does not inspect callers.
+    FORMAT: LoggerFormat = LoggerFormat.TEXT
+    #: Dict[str, float]: Share of written records by name of the logger,
+    #  e.g. ``{"app.internal.pkg.middlewares": 0.1}``.
+    SAMPLE_RATES: typing.Dict[str, confloat(gt=0, le=1)] = {}
+    #: Dict[str, PositiveFloat]: Max count of written records per second by
+    #  name of the logger.
+    RATE_LIMITS: typing.Dict[str, PositiveFloat] = {}
+
+    @validator("SAMPLE_RATES", "RATE_LIMITS", pre=True)
+    def __parse_json(  # pylint: disable=unused-private-member, no-self-argument
+        cls,
+        v: typing.Any,
+    ):
+        """Parse JSON object from nested env variable."""
+
+        if isinstance(v, str):
+            return json.loads(v)
+        return v
 
     @validator("FOLDER_PATH")
     def __create_dir_if_not_exist(  # pylint: disable=unused-private-member, no-self-argument
@@ -165,6 +238,33 @@ class Centrifugo(_Settings):
     PORT: PositiveInt = 8001
 
 
+class Cache(_Settings):
+    """Cache settings."""
+
+    #: CacheBackend: Storage of cached values. In-process LRU or Redis.
+    BACKEND: CacheBackend = CacheBackend.MEMORY
+    #: PositiveInt: Default time to live of cached values in seconds.
+    TTL: PositiveInt = 300
+    #: PositiveInt: Max count of values in in-process LRU cache.
+    MAX_SIZE: PositiveInt = 4096
+    #: str: Prefix of all cache keys.
+    NAMESPACE: str = "cache"
+    #: SingleFlightScope: Scope of sharing identical in-flight reads.
+    SINGLE_FLIGHT: SingleFlightScope = SingleFlightScope.PROCESS
+    #: NonNegativeInt: Max count of contacts and of partners in in-process
+    #  token index. Set ``0`` to read them by token from the database.
+    TOKEN_INDEX_MAX_SIZE: NonNegativeInt = 10000
+
+    #: str: Redis host.
+    REDIS_HOST: str = "localhost"
+    #: PositiveInt: positive int (x > 0) port of redis.
+    REDIS_PORT: PositiveInt = 6379
+    #: NonNegativeInt: Number of redis database.
+    REDIS_DB: NonNegativeInt = 0
+    #: Optional[SecretStr]: Redis password.
+    REDIS_PASSWORD: typing.Optional[SecretStr] = None
+
+
 class Settings(_Settings):
     """Server settings.
 
@@ -178,6 +278,9 @@ class Settings(_Settings):
     #: Postgresql: Postgresql settings.
     POSTGRES: Postgresql
 
+    #: Cache: Cache settings.
+    CACHE: Cache = Field(default_factory=Cache)
+
 
 # TODO: Возможно даже lru_cache не стоит использовать. Стоит использовать meta sigleton.
 #   Для класса настроек. А инициализацию перенести в `def __init__`
@@ -0,0 +1,57 @@
+"""
+row change notifications
+"""
+
+from yoyo import step
+
+__depends__ = {'20231112_06_vK6vZ-contacts', '20231113_01_boUZA-partners'}
+
+steps = [
+    step(
+        """
+            create or replace function notify_row_change() returns trigger as $$
+            declare
+                row_id int;
+            begin
+                if TG_OP = 'DELETE' then
+                    row_id := OLD.id;
+                else
+                    row_id := NEW.id;
+                end if;
+                perform pg_notify(
+                    'row_changes',
+                    json_build_object(
+                        'table', TG_TABLE_NAME,
+                        'op', TG_OP,
+                        'id', row_id
+                    )::text
+                );
+                return null;
+            end;
+            $$ language plpgsql;
+        """,
+        """
+            drop function if exists notify_row_change();
+        """,
+    ),
+    step(
+        """
+            create trigger contacts_notify_row_change
+                after insert or update or delete on contacts
+                for each row execute procedure notify_row_change();
+        """,
+        """
+            drop trigger if exists contacts_notify_row_change on contacts;
+        """,
+    ),
+    step(
+        """
+            create trigger partners_notify_row_change
+                after insert or update or delete on partners
+                for each row execute procedure notify_row_change();
+        """,
+        """
+            drop trigger if exists partners_notify_row_change on partners;
+        """,
+    ),
+]
@@ -0,0 +1,79 @@
+"""
+cache invalidation notifications
+"""
+
+from yoyo import step
+
+__depends__ = {
+    '20231112_01_tPfA5-skill-levels',
+    '20231112_02_CYMKS-skills',
+    '20231112_04_IxuQN-directions',
+    '20231112_05_knHgl-cities',
+    '20231112_10_wPUeW-countries',
+    '20231114_01_rWq3T-row-change-notifications',
+}
+
+__tables__ = ("countries", "cities", "skills", "skill_levels", "directions")
+
+steps = [
+    step(
+        """
+            create or replace function notify_row_change() returns trigger as $$
+            declare
+                row_id int;
+            begin
+                if TG_OP = 'DELETE' then
+                    row_id := OLD.id;
+                else
+                    row_id := NEW.id;
+                end if;
+                perform pg_notify(
+                    'row_changes',
+                    json_build_object(
+                        'table', TG_TABLE_NAME,
+                        'op', TG_OP,
+                        'id', row_id,
+                        'ts', extract(epoch from clock_timestamp())
+                    )::text
+                );
+                return null;
+            end;
+            $$ language plpgsql;
+        """,
+        """
+            create or replace function notify_row_change() returns trigger as $$
+            declare
+                row_id int;
+            begin
+                if TG_OP = 'DELETE' then
+                    row_id := OLD.id;
+                else
+                    row_id := NEW.id;
+                end if;
+                perform pg_notify(
+                    'row_changes',
+                    json_build_object(
+                        'table', TG_TABLE_NAME,
+                        'op', TG_OP,
+                        'id', row_id
+                    )::text
+                );
+                return null;
+            end;
+            $$ language plpgsql;
+        """,
+    ),
+    *(
+        step(
+            f"""
+                create trigger {table}_notify_row_change
+                    after insert or update or delete on {table}
+                    for each row execute procedure notify_row_change();
+            """,
+            f"""
+                drop trigger if exists {table}_notify_row_change on {table};
+            """,
+        )
+        for table in __tables__
+    ),
+]
@@ -0,0 +1,49 @@
+"""
+statement change notifications
+"""
+
+from yoyo import step
+
+__depends__ = {'20231115_01_hJ8sN-cache-invalidation-notifications'}
+
+__tables__ = ("countries", "cities", "skills", "skill_levels", "directions")
+
+steps = [
+    step(
+        """
+            create or replace function notify_table_change() returns trigger as $$
+            begin
+                perform pg_notify(
+                    'row_changes',
+                    json_build_object(
+                        'table', TG_TABLE_NAME,
+                        'op', TG_OP,
+                        'ts', extract(epoch from statement_timestamp())
+                    )::text
+                );
+                return null;
+            end;
+            $$ language plpgsql;
+        """,
+        """
+            drop function if exists notify_table_change();
+        """,
+    ),
+    *(
+        step(
+            f"""
+                drop trigger if exists {table}_notify_row_change on {table};
+                create trigger {table}_notify_table_change
+                    after insert or update or delete or truncate on {table}
+                    for each statement execute procedure notify_table_change();
+            """,
+            f"""
+                drop trigger if exists {table}_notify_table_change on {table};
+                create trigger {table}_notify_row_change
+                    after insert or update or delete on {table}
+                    for each row execute procedure notify_row_change();
+            """,
+        )
+        for table in __tables__
+    ),
+]
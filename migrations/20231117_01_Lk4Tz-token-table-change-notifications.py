@@ -0,0 +1,33 @@
+"""
+token table change notifications
+"""
+
+from yoyo import step
+
+__depends__ = {'20231116_01_Qm7dV-statement-change-notifications'}
+
+__tables__ = ("contacts", "partners")
+
+steps = [
+    *(
+        step(
+            f"""
+                drop trigger if exists {table}_notify_row_change on {table};
+                create trigger {table}_notify_row_change
+                    after update or delete on {table}
+                    for each row execute procedure notify_row_change();
+                create trigger {table}_notify_table_change
+                    after truncate on {table}
+                    for each statement execute procedure notify_table_change();
+            """,
+            f"""
+                drop trigger if exists {table}_notify_table_change on {table};
+                drop trigger if exists {table}_notify_row_change on {table};
+                create trigger {table}_notify_row_change
+                    after insert or update or delete on {table}
+                    for each row execute procedure notify_row_change();
+            """,
+        )
+        for table in __tables__
+    ),
+]
@@ -0,0 +1,130 @@
+"""Side-by-side benchmark of postgresql drivers on the repository test suite.
+
+Repository tests (marked ``postgresql``) are run in a subprocess once per
+driver of :class:`.PostgresqlDriver` in every round. Drivers take turns, so
+both of them meet the same state of the host and of the database.
+
+Examples:
+    ::
+
+        $ python -m scripts.benchmark_drivers --rounds 5
+        driver     rounds   best, s   median, s   vs aiopg
+        aiopg           5     ...         ...         1.00
+        asyncpg         5     ...         ...         ...
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import time
+from argparse import ArgumentParser
+from typing import Dict, List
+
+from app.pkg.models.core.postgresql import PostgresqlDriver
+
+#: str: Path of the repository test suite.
+__suite__ = "tests/app/internal/repository"
+
+
+def run_suite(driver: PostgresqlDriver, path: str) -> float:
+    """Run the repository test suite with the driver.
+
+    Args:
+        driver: Driver of connection pools.
+        path: Path of tests.
+
+    Raises:
+        SystemExit: Tests failed, so timing is meaningless.
+
+    Returns:
+        Wall time of the run in seconds.
+    """
+
+    env = {**os.environ, "POSTGRES__DRIVER": driver.value}
+    command = [
+        sys.executable,
+        "-m",
+        "pytest",
+        "-q",
+        "-p",
+        "no:cacheprovider",
+        "-m",
+        "postgresql",
+        path,
+    ]
+
+    started = time.perf_counter()
+    result = subprocess.run(  # nosec B603
+        command,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    elapsed = time.perf_counter() - started
+
+    if result.returncode != 0:
+        print(result.stdout, result.stderr, sep="\n", file=sys.stderr)
+        raise SystemExit(f"Tests failed with {driver} driver.")
+    return elapsed
+
+
+def report(timings: Dict[PostgresqlDriver, List[float]]) -> None:
+    """Print best and median time of every driver.
+
+    Args:
+        timings: Wall times of runs of every driver.
+
+    Notes:
+        Column ``vs aiopg`` is the ratio of medians, less than ``1`` is faster
+        than aiopg.
+    """
+
+    baseline = statistics.median(timings[PostgresqlDriver.AIOPG])
+    print(
+        f"{'driver':<10}{'rounds':>7}{'best, s':>10}{'median, s':>12}{'vs aiopg':>11}",
+    )
+    for driver, runs in timings.items():
+        median = statistics.median(runs)
+        print(
+            f"{driver.value:<10}{len(runs):>7}{min(runs):>10.2f}"
+            f"{median:>12.2f}{median / baseline:>11.2f}",
+        )
+
+
+def parse_cli_args():
+    """Parse cli arguments."""
+
+    parser = ArgumentParser(description="Benchmark postgresql drivers")
+    parser.add_argument(
+        "--rounds",
+        type=int,
+        default=3,
+        help="Count of runs of the suite with every driver",
+    )
+    parser.add_argument(
+        "--path",
+        default=__suite__,
+        help="Path of benchmarked tests",
+    )
+    return parser.parse_args()
+
+
+def cli():
+    """Run the suite with every driver in turns and print timings."""
+
+    args = parse_cli_args()
+
+    timings: Dict[PostgresqlDriver, List[float]] = {
+        driver: [] for driver in PostgresqlDriver
+    }
+    for _ in range(args.rounds):
+        for driver in PostgresqlDriver:
+            timings[driver].append(run_suite(driver, args.path))
+
+    report(timings)
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,39 @@
+"""Testing aggregation of metrics of several workers."""
+
+import subprocess
+import sys
+
+import pytest
+
+from app.internal.pkg.middlewares.metrics import mark_process_dead, metrics
+
+__worker = """
+import os
+from prometheus_client import Counter, Gauge
+
+Counter("worker_requests", "Requests.").inc()
+Gauge("worker_in_progress", "In progress.", multiprocess_mode="livesum").inc()
+print(os.getpid())
+"""
+
+
+def __run_worker(path: str) -> int:
+    output = subprocess.run(
+        [sys.executable, "-c", __worker],
+        env={"PROMETHEUS_MULTIPROC_DIR": path},
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return int(output)
+
+
+async def test_metrics_of_all_workers(tmp_path, monkeypatch: pytest.MonkeyPatch):
+    first, _ = __run_worker(str(tmp_path)), __run_worker(str(tmp_path))
+    monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+
+    mark_process_dead(first)
+    body = metrics(request=None).body.decode()
+
+    assert "worker_requests_total 2.0" in body
+    assert "worker_in_progress 1.0" in body
@@ -0,0 +1,115 @@
+"""Testing metrics of :class:`.PrometheusMiddleware`."""
+
+import asyncio
+import time
+
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+from prometheus_client import REGISTRY
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.internal.pkg.middlewares.prometheus import PrometheusMiddleware
+
+
+async def __ok(item_id: int):
+    return {"id": item_id}
+
+
+async def __fail():
+    raise RuntimeError("broken")
+
+
+def __build_app(app_name: str, middleware=PrometheusMiddleware, **kwargs) -> FastAPI:
+    app = FastAPI()
+    for i in range(20):
+        app.add_api_route(f"/static{i}/", __ok)
+        app.add_api_route(f"/dynamic{i}/{{item_id:int}}/", __ok)
+    app.add_api_route("/items/{item_id:int}/", __ok)
+    app.add_api_route("/fail/", __fail)
+    app.add_middleware(middleware, app_name=app_name, **kwargs)
+    return app
+
+
+def __sample(name: str, **labels) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+async def test_metrics_by_path_template():
+    async with AsyncClient(app=__build_app("template"), base_url="http://t") as client:
+        for item_id in range(3):
+            assert (await client.get(f"/items/{item_id}/")).status_code == 200
+        assert (await client.get("/unknown/")).status_code == 404
+
+    labels = {"method": "GET", "path": "/items/{item_id:int}/", "app_name": "template"}
+    assert __sample("fastapi_requests_total", **labels) == 3
+    assert __sample("fastapi_responses_total", status_code="200", **labels) == 3
+    assert __sample("fastapi_requests_duration_seconds_count", **labels) == 3
+    assert __sample("fastapi_requests_in_progress", **labels) == 0
+    assert (
+        __sample(
+            "fastapi_requests_total",
+            method="GET",
+            path="/unknown/",
+            app_name="template",
+        )
+        == 0
+    )
+
+
+async def test_unhandled_exception():
+    async with AsyncClient(app=__build_app("failing"), base_url="http://t") as client:
+        response = await client.get("/fail/")
+
+    labels = {"method": "GET", "path": "/fail/", "app_name": "failing"}
+    assert response.status_code == 500
+    assert __sample("fastapi_responses_total", status_code="500", **labels) == 1
+    assert (
+        __sample("fastapi_exceptions_total", exception_type="RuntimeError", **labels)
+        == 1
+    )
+
+
+@pytest.mark.slow
+async def test_overhead_below_base_http_middleware():
+    class _Passthrough(BaseHTTPMiddleware):
+        def __init__(self, app, app_name: str):
+            super().__init__(app)
+            del app_name  # unused
+
+        async def dispatch(self, request, call_next):
+            return await call_next(request)
+
+    async def __elapsed(app: FastAPI, number: int) -> float:
+        scope = {
+            "type": "http",
+            "http_version": "1.1",
+            "method": "GET",
+            "path": "/items/1/",
+            "raw_path": b"/items/1/",
+            "root_path": "",
+            "scheme": "http",
+            "query_string": b"",
+            "headers": [],
+            "server": ("testserver", 80),
+            "client": ("testclient", 50000),
+            "app": app,
+        }
+
+        async def receive():
+            await asyncio.sleep(60)
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            del message  # unused
+
+        start = time.perf_counter()
+        for _ in range(number):
+            await app(dict(scope), receive, send)
+        return time.perf_counter() - start
+
+    prometheus = __build_app("overhead")
+    passthrough = __build_app("passthrough", middleware=_Passthrough)
+    await __elapsed(prometheus, 10)
+
+    assert await __elapsed(prometheus, 300) < await __elapsed(passthrough, 300)
@@ -0,0 +1,92 @@
+"""Testing fast JSON responses of :class:`.FastJSONRoute`."""
+
+from datetime import datetime
+from typing import List, Optional
+
+import pytest
+from fastapi import APIRouter, FastAPI
+from httpx import AsyncClient
+from pydantic import SecretStr
+
+from app.internal.pkg.responses.fast_json import FastJSONRoute
+from app.pkg import models
+from app.pkg.models.base import BaseModel
+
+
+class Nested(BaseModel):
+    secret: SecretStr
+    hidden: int
+
+
+class Response(BaseModel):
+    id: int
+    token: SecretStr
+    data: bytes
+    created_at: datetime
+    nested: Optional[Nested] = None
+    items: List[Nested]
+
+
+__response = Response(
+    id=1,
+    token="token",
+    data=b"data",
+    created_at=datetime(2023, 1, 1, 12, 30),
+    nested=Nested(secret="secret", hidden=1),
+    items=[Nested(secret="first", hidden=2), Nested(secret="second", hidden=3)],
+)
+
+
+def __build_app(route_class) -> FastAPI:
+    router = APIRouter(**({"route_class": route_class} if route_class else {}))
+
+    @router.get(
+        "/model/",
+        response_model=Response,
+        response_model_exclude={"id": True, "items": {"__all__": {"hidden"}}},
+    )
+    async def read_model():
+        return __response
+
+    @router.get(
+        "/list/", response_model=List[Nested], response_model_exclude={"hidden"}
+    )
+    async def read_list():
+        return __response.items
+
+    @router.get("/dict/", response_model=Nested)
+    async def read_dict():
+        return {"secret": "secret", "hidden": "4", "extra": True}
+
+    @router.get("/page/", response_model=models.Page[models.Country])
+    async def read_page():
+        return models.Page[models.Country](
+            items=[models.Country(id=1, name="Russia", code="RUS")],
+        )
+
+    app = FastAPI()
+    app.include_router(router)
+    return app
+
+
+@pytest.mark.parametrize("url", ["/model/", "/list/", "/dict/", "/page/"])
+async def test_same_as_default_route(url: str):
+    async with AsyncClient(app=__build_app(FastJSONRoute), base_url="http://t") as fast:
+        fast_response = await fast.get(url)
+    async with AsyncClient(app=__build_app(None), base_url="http://t") as default:
+        default_response = await default.get(url)
+
+    assert fast_response.status_code == default_response.status_code == 200
+    assert fast_response.headers["content-type"] == "application/json"
+    assert fast_response.content == default_response.content
+
+
+async def test_route_without_response_model_is_not_wrapped():
+    router = APIRouter(route_class=FastJSONRoute)
+
+    @router.get("/")
+    async def read():
+        return {}
+
+    route = router.routes[0]
+    assert route.dependant.call is route.endpoint
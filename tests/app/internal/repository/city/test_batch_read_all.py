@@ -0,0 +1,36 @@
+"""Module for testing batch_read_all method of CityRepository."""
+
+
+import pytest
+
+from app.internal.repository.postgresql import CityRepository
+from app.pkg import models
+from app.pkg.models.exceptions.repository import EmptyResult
+
+
+@pytest.mark.postgresql
+async def test_batch_read_all(
+    city_repository: CityRepository,
+    city_inserter,
+    country_inserter,
+    check_array_equality,
+):
+    country, _ = await country_inserter()
+
+    expected = []
+    for _ in range(10):
+        result, _ = await city_inserter(country_id=country.id)
+        expected.append(result)
+
+    query = models.ReadAllCityByIdQuery(ids=[item.id for item in expected])
+
+    result = await city_repository.batch_read_all(query=query)
+
+    assert check_array_equality(expected, result)
+
+
+@pytest.mark.postgresql
+async def test_empty(city_repository: CityRepository):
+    query = models.ReadAllCityByIdQuery(ids=[])
+    with pytest.raises(EmptyResult):
+        await city_repository.batch_read_all(query=query)
@@ -0,0 +1,55 @@
+"""Module for testing create_many method of city repository."""
+
+
+import pytest
+
+from app.internal.repository.postgresql import CityRepository
+from app.pkg import models
+from app.pkg.models.exceptions.city import CityNameAlreadyExists
+from app.pkg.models.exceptions.repository import EmptyResult
+
+
+@pytest.mark.postgresql
+async def test_create_many(
+    city_repository: CityRepository,
+    city_generator,
+    country_inserter,
+):
+    country, _ = await country_inserter()
+
+    items = [city_generator(country_id=country.id) for _ in range(3)]
+
+    result = await city_repository.create_many(
+        cmds=[item.migrate(model=models.CreateCityCommand) for item in items],
+    )
+
+    assert result == [
+        item.migrate(model=models.City, extra_fields={"id": created.id})
+        for item, created in zip(items, result)
+    ]
+
+
+@pytest.mark.postgresql
+async def test_create_many_is_atomic(
+    city_repository: CityRepository,
+    clean_postgres,
+    city_generator,
+    country_inserter,
+):
+    _ = clean_postgres
+
+    country, _ = await country_inserter()
+
+    first = city_generator(country_id=country.id)
+    second = city_generator(country_id=country.id, name=first.name)
+
+    with pytest.raises(CityNameAlreadyExists):
+        await city_repository.create_many(
+            cmds=[
+                first.migrate(model=models.CreateCityCommand),
+                second.migrate(model=models.CreateCityCommand),
+            ],
+        )
+
+    with pytest.raises(EmptyResult):
+        await city_repository.read_all(query=models.PaginationQuery())
@@ -0,0 +1,43 @@
+"""Module for testing city repository patch method."""
+
+
+import pytest
+
+from app.pkg import models
+from app.pkg.models.exceptions.repository import EmptyResult
+
+
+@pytest.mark.postgresql
+async def test_patch(city_repository, city_inserter, country_inserter):
+    country, _ = await country_inserter()
+    city, _ = await city_inserter(country_id=country.id)
+
+    result = await city_repository.patch(
+        cmd=models.PatchCityCommand(id=city.id, name="Moscow"),
+    )
+
+    assert result == city.migrate(
+        models.City,
+        extra_fields={"id": city.id, "name": "Moscow"},
+    )
+
+
+@pytest.mark.postgresql
+async def test_patch_without_fields(city_repository, city_inserter, country_inserter):
+    country, _ = await country_inserter()
+    city, _ = await city_inserter(country_id=country.id)
+
+    result = await city_repository.patch(cmd=models.PatchCityCommand(id=city.id))
+
+    assert result == city.migrate(models.City, extra_fields={"id": city.id})
+
+
+@pytest.mark.postgresql
+async def test_city_not_found(city_repository, city_inserter, country_inserter):
+    country, _ = await country_inserter()
+    city, _ = await city_inserter(country_id=country.id)
+
+    with pytest.raises(EmptyResult):
+        await city_repository.patch(
+            cmd=models.PatchCityCommand(id=city.id + 1, name="Moscow"),
+        )
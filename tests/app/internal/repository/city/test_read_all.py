@@ -19,7 +19,7 @@ async def test_read_all(
     result, _ = await country_inserter(country_code="RUS")
     city, city_cmd = await city_inserter(country_id=result.id)
 
-    cities = await city_repository.read_all()
+    cities = await city_repository.read_all(query=models.PaginationQuery())
 
     assert isinstance(cities, list)
     assert len(cities) == 1
@@ -38,4 +38,29 @@ async def test_read_all_empty(city_repository, clean_postgres):
     _ = clean_postgres
 
     with pytest.raises(EmptyResult):
-        await city_repository.read_all()
+        await city_repository.read_all(query=models.PaginationQuery())
+
+
+@pytest.mark.postgresql
+@pytest.mark.slow
+async def test_read_all_keyset_pagination(
+    city_repository,
+    city_inserter,
+    country_inserter,
+    clean_postgres,
+):
+    _ = clean_postgres
+
+    country, _ = await country_inserter()
+    expected = []
+    for _ in range(3):
+        result, _ = await city_inserter(country_id=country.id)
+        expected.append(result)
+
+    first_page = await city_repository.read_all(query=models.PaginationQuery(limit=2))
+    second_page = await city_repository.read_all(
+        query=models.PaginationQuery(limit=2, after_id=first_page[-1].id),
+    )
+
+    assert first_page == expected[:2]
+    assert second_page == expected[2:]
@@ -0,0 +1,36 @@
+"""Module for testing stream_all method of CityRepository."""
+
+
+import pytest
+
+from app.internal.repository.postgresql import CityRepository
+
+
+@pytest.mark.postgresql
+@pytest.mark.slow
+async def test_stream_all(
+    city_repository: CityRepository,
+    city_inserter,
+    country_inserter,
+    clean_postgres,
+):
+    _ = clean_postgres
+
+    country, _ = await country_inserter()
+    expected = []
+    for _ in range(3):
+        result, _ = await city_inserter(country_id=country.id)
+        expected.append(result)
+
+    batches = [batch async for batch in city_repository.stream_all(batch_size=2)]
+
+    assert [len(batch) for batch in batches] == [2, 1]
+    assert [item for batch in batches for item in batch] == expected
+
+
+@pytest.mark.postgresql
+@pytest.mark.slow
+async def test_stream_all_empty(city_repository: CityRepository, clean_postgres):
+    _ = clean_postgres
+
+    assert [batch async for batch in city_repository.stream_all()] == []
@@ -0,0 +1,64 @@
+"""Module for testing upsert methods of city repository."""
+
+
+from uuid import uuid4
+
+import pytest
+
+from app.internal.repository.postgresql import CityRepository
+from app.pkg import models
+from app.pkg.models.exceptions.repository import RepeatedKey
+
+
+@pytest.mark.postgresql
+async def test_upsert_updates_existing(
+    city_repository: CityRepository,
+    city_inserter,
+    country_inserter,
+):
+    country, _ = await country_inserter()
+    existing, cmd = await city_inserter(country_id=country.id)
+
+    cmd = cmd.migrate(
+        model=models.CreateCityCommand,
+        extra_fields={"name": uuid4().hex},
+    )
+
+    result = await city_repository.upsert(cmd=cmd)
+
+    assert result == cmd.migrate(
+        model=models.CityUpsert,
+        extra_fields={"id": existing.id, "created": False},
+    )
+
+
+@pytest.mark.postgresql
+async def test_upsert_many_reports_created(
+    city_repository: CityRepository,
+    city_inserter,
+    country_inserter,
+    city_generator,
+):
+    country, _ = await country_inserter()
+    existing, cmd = await city_inserter(country_id=country.id)
+    new = city_generator(country_id=country.id)
+
+    result = await city_repository.upsert_many(
+        cmds=[cmd, new.migrate(model=models.CreateCityCommand)],
+    )
+
+    assert [item.created for item in result] == [False, True]
+    assert result[0].id == existing.id
+
+
+@pytest.mark.postgresql
+async def test_upsert_many_repeated_key(
+    city_repository: CityRepository,
+    city_inserter,
+    country_inserter,
+):
+    country, _ = await country_inserter()
+    _, cmd = await city_inserter(country_id=country.id)
+
+    with pytest.raises(RepeatedKey):
+        await city_repository.upsert_many(cmds=[cmd, cmd])
@@ -0,0 +1,36 @@
+"""Module for testing batch_read_all method of ContactsRepository."""
+
+
+import pytest
+
+from app.internal.repository.postgresql import ContactsRepository
+from app.pkg import models
+from app.pkg.models.exceptions.repository import EmptyResult
+
+
+@pytest.mark.postgresql
+async def test_batch_read_all(
+    contact_repository: ContactsRepository,
+    contact_inserter,
+    partner_inserter,
+    check_array_equality,
+):
+    partner, _ = await partner_inserter()
+
+    expected = []
+    for _ in range(10):
+        result, _ = await contact_inserter(partner_id=partner.id)
+        expected.append(result)
+
+    query = models.ReadAllContactsByIdQuery(ids=[item.id for item in expected])
+
+    result = await contact_repository.batch_read_all(query=query)
+
+    assert check_array_equality(expected, result)
+
+
+@pytest.mark.postgresql
+async def test_empty(contact_repository: ContactsRepository):
+    query = models.ReadAllContactsByIdQuery(ids=[])
+    with pytest.raises(EmptyResult):
+        await contact_repository.batch_read_all(query=query)
@@ -0,0 +1,58 @@
+"""Module for testing create_many method of contacts repository."""
+
+
+from uuid import uuid4
+
+import pytest
+
+from app.internal.repository.postgresql import ContactsRepository
+from app.pkg import models
+from app.pkg.models.exceptions.contacts import TokenAlreadyExists
+from app.pkg.models.exceptions.repository import EmptyResult
+
+
+@pytest.mark.postgresql
+async def test_create_many(
+    contact_repository: ContactsRepository,
+    contact_generator,
+    partner_inserter,
+):
+    partner, _ = await partner_inserter()
+
+    items = [contact_generator(partner_id=partner.id) for _ in range(3)]
+
+    result = await contact_repository.create_many(
+        cmds=[item.migrate(model=models.CreateContactsCommand) for item in items],
+    )
+
+    assert result == [
+        item.migrate(model=models.Contacts, extra_fields={"id": created.id})
+        for item, created in zip(items, result)
+    ]
+
+
+@pytest.mark.postgresql
+async def test_create_many_is_atomic(
+    contact_repository: ContactsRepository,
+    clean_postgres,
+    contact_generator,
+    partner_inserter,
+):
+    _ = clean_postgres
+
+    partner, _ = await partner_inserter()
+
+    token = uuid4().hex
+    first = contact_generator(partner_id=partner.id, token=token)
+    second = contact_generator(partner_id=partner.id, token=token)
+
+    with pytest.raises(TokenAlreadyExists):
+        await contact_repository.create_many(
+            cmds=[
+                first.migrate(model=models.CreateContactsCommand),
+                second.migrate(model=models.CreateContactsCommand),
+            ],
+        )
+
+    with pytest.raises(EmptyResult):
+        await contact_repository.read_all(query=models.PaginationQuery())
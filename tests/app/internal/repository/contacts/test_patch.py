@@ -0,0 +1,88 @@
+"""Module for testing patch method of contacts repository."""
+
+
+import uuid
+
+import pytest
+
+from app.internal.repository.postgresql import ContactsRepository
+from app.pkg import models
+from app.pkg.models.exceptions.contacts import EmailAlreadyExists
+from app.pkg.models.exceptions.repository import EmptyResult
+
+
+@pytest.mark.postgresql
+async def test_patch_keeps_token(
+    contact_repository: ContactsRepository,
+    contact_inserter,
+    partner_inserter,
+):
+    partner, _ = await partner_inserter()
+    contact, _ = await contact_inserter(partner_id=partner.id, token=uuid.uuid4().hex)
+    telegram_username = f"@{uuid.uuid4().hex}"
+
+    result = await contact_repository.patch(
+        cmd=models.PatchContactsCommand(
+            id=contact.id,
+            telegram_username=telegram_username,
+        ),
+    )
+
+    assert result == contact.migrate(
+        model=models.Contacts,
+        extra_fields={"telegram_username": telegram_username},
+    )
+
+
+@pytest.mark.postgresql
+async def test_patch_clears_email(
+    contact_repository: ContactsRepository,
+    contact_inserter,
+    partner_inserter,
+):
+    partner, _ = await partner_inserter()
+    contact, _ = await contact_inserter(
+        partner_id=partner.id,
+        token=uuid.uuid4().hex,
+        email=f"{uuid.uuid4().hex}@{uuid.uuid4().hex}.com",
+    )
+
+    result = await contact_repository.patch(
+        cmd=models.PatchContactsCommand(id=contact.id, email=None),
+    )
+
+    assert result.email is None
+
+
+@pytest.mark.postgresql
+async def test_email_already_exists(
+    contact_repository: ContactsRepository,
+    contact_inserter,
+    partner_inserter,
+):
+    partner, _ = await partner_inserter()
+    contact, _ = await contact_inserter(partner_id=partner.id)
+    _, other = await contact_inserter(
+        partner_id=partner.id,
+        email=f"{uuid.uuid4().hex}@{uuid.uuid4().hex}.com",
+    )
+
+    with pytest.raises(EmailAlreadyExists):
+        await contact_repository.patch(
+            cmd=models.PatchContactsCommand(id=contact.id, email=other.email),
+        )
+
+
+@pytest.mark.postgresql
+async def test_patch_not_found(
+    contact_repository: ContactsRepository,
+    contact_inserter,
+    partner_inserter,
+):
+    partner, _ = await partner_inserter()
+    contact, _ = await contact_inserter(partner_id=partner.id)
+
+    with pytest.raises(EmptyResult):
+        await contact_repository.patch(
+            cmd=models.PatchContactsCommand(id=contact.id + 1, partner_id=partner.id),
+        )
@@ -1,9 +1,13 @@
 """Module for testing read method of contacts repository."""
 
+import asyncio
+import contextvars
+
 import pytest
 
 from app.internal.repository.postgresql import ContactsRepository
 from app.pkg import models
+from app.pkg.connectors.postgresql.routing import pinned_to_primary
 from app.pkg.models.exceptions.repository import EmptyResult
 
 
@@ -38,3 +42,27 @@ async def test_read_not_found(
                 token=contact.token.get_secret_value() + "1",
             ),
         )
+
+
+@pytest.mark.postgresql
+async def test_read_does_not_pin_to_primary(
+    contact_repository: ContactsRepository,
+    contact_inserter,
+    partner_inserter,
+):
+    partner, _ = await partner_inserter()
+    contact, _ = await contact_inserter(partner_id=partner.id)
+
+    async def read():
+        await contact_repository.read(
+            query=models.ReadContactsQuery(token=contact.token),
+        )
+        await contact_repository.read_by_telegram_user_id(
+            query=models.ReadContactsByTelegramUserIdQuery(
+                telegram_user_id=contact.telegram_user_id,
+            ),
+        )
+        return pinned_to_primary()
+
+    # Task runs in a fresh context, that has not written yet.
+    assert not await contextvars.Context().run(asyncio.ensure_future, read())
@@ -18,7 +18,7 @@ async def test_read_all(
     partner, _ = await partner_inserter()
     contact, _ = await contact_inserter(partner_id=partner.id)
 
-    result = await contact_repository.read_all()
+    result = await contact_repository.read_all(query=models.PaginationQuery())
 
     assert result == [
         contact.migrate(model=models.Contacts),
@@ -34,4 +34,31 @@ async def test_read_all_not_found(
     _ = clean_postgres
 
     with pytest.raises(EmptyResult):
-        await contact_repository.read_all()
+        await contact_repository.read_all(query=models.PaginationQuery())
+
+
+@pytest.mark.postgresql
+@pytest.mark.slow
+async def test_read_all_keyset_pagination(
+    contact_repository,
+    contact_inserter,
+    partner_inserter,
+    clean_postgres,
+):
+    _ = clean_postgres
+
+    partner, _ = await partner_inserter()
+    expected = []
+    for _ in range(3):
+        result, _ = await contact_inserter(partner_id=partner.id)
+        expected.append(result)
+
+    first_page = await contact_repository.read_all(
+        query=models.PaginationQuery(limit=2)
+    )
+    second_page = await contact_repository.read_all(
+        query=models.PaginationQuery(limit=2, after_id=first_page[-1].id),
+    )
+
+    assert first_page == expected[:2]
+    assert second_page == expected[2:]
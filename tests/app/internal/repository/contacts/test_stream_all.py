@@ -0,0 +1,36 @@
+"""Module for testing stream_all method of ContactsRepository."""
+
+
+import pytest
+
+from app.internal.repository.postgresql import ContactsRepository
+
+
+@pytest.mark.postgresql
+@pytest.mark.slow
+async def test_stream_all(
+    contact_repository: ContactsRepository,
+    contact_inserter,
+    partner_inserter,
+    clean_postgres,
+):
+    _ = clean_postgres
+
+    partner, _ = await partner_inserter()
+    expected = []
+    for _ in range(3):
+        result, _ = await contact_inserter(partner_id=partner.id)
+        expected.append(result)
+
+    batches = [batch async for batch in contact_repository.stream_all(batch_size=2)]
+
+    assert [len(batch) for batch in batches] == [2, 1]
+    assert [item for batch in batches for item in batch] == expected
+
+
+@pytest.mark.postgresql
+@pytest.mark.slow
+async def test_stream_all_empty(contact_repository: ContactsRepository, clean_postgres):
+    _ = clean_postgres
+
+    assert [batch async for batch in contact_repository.stream_all()] == []
@@ -0,0 +1,87 @@
+"""Module for testing update_email method of contacts repository."""
+
+
+import uuid
+
+import pytest
+
+from app.internal.repository.postgresql import ContactsRepository
+from app.pkg import models
+from app.pkg.models.exceptions.contacts import EmailAlreadyExists
+from app.pkg.models.exceptions.repository import EmptyResult
+
+
+@pytest.mark.postgresql
+async def test_update_email(
+    contact_repository: ContactsRepository,
+    contact_inserter,
+    partner_inserter,
+):
+    partner, _ = await partner_inserter()
+    contact, _ = await contact_inserter(partner_id=partner.id)
+    email = f"{uuid.uuid4().hex}@{uuid.uuid4().hex}.com"
+
+    result = await contact_repository.update_email(
+        cmd=models.UpdateContactsEmailCommand(token=contact.token, email=email),
+    )
+
+    assert result.changed is True
+    assert result.migrate(models.Contacts) == contact.migrate(
+        model=models.Contacts,
+        extra_fields={"email": email},
+    )
+
+
+@pytest.mark.postgresql
+async def test_update_email_not_changed(
+    contact_repository: ContactsRepository,
+    contact_inserter,
+    partner_inserter,
+):
+    partner, _ = await partner_inserter()
+    contact, _ = await contact_inserter(partner_id=partner.id)
+
+    result = await contact_repository.update_email(
+        cmd=models.UpdateContactsEmailCommand(
+            token=contact.token,
+            email=contact.email,
+        ),
+    )
+
+    assert result.changed is False
+    assert result.migrate(models.Contacts) == contact
+
+
+@pytest.mark.postgresql
+async def test_update_email_not_found(
+    contact_repository: ContactsRepository,
+):
+    with pytest.raises(EmptyResult):
+        await contact_repository.update_email(
+            cmd=models.UpdateContactsEmailCommand(
+                token=str(uuid.uuid4()),
+                email=f"{uuid.uuid4().hex}@{uuid.uuid4().hex}.com",
+            ),
+        )
+
+
+@pytest.mark.postgresql
+async def test_email_already_exists(
+    contact_repository: ContactsRepository,
+    contact_inserter,
+    partner_inserter,
+):
+    partner, _ = await partner_inserter()
+    contact, _ = await contact_inserter(partner_id=partner.id)
+    _, cmd = await contact_inserter(
+        partner_id=partner.id,
+        email=f"{uuid.uuid4().hex}@{uuid.uuid4().hex}.com",
+    )
+
+    with pytest.raises(EmailAlreadyExists):
+        await contact_repository.update_email(
+            cmd=models.UpdateContactsEmailCommand(
+                token=contact.token,
+                email=cmd.email,
+            ),
+        )
@@ -0,0 +1,68 @@
+"""Module for testing upsert methods of contacts repository."""
+
+
+from uuid import uuid4
+
+import pytest
+
+from app.internal.repository.postgresql import ContactsRepository
+from app.pkg import models
+from app.pkg.models.exceptions.repository import RepeatedKey
+
+
+@pytest.mark.postgresql
+async def test_upsert_updates_existing(
+    contact_repository: ContactsRepository,
+    contact_inserter,
+    partner_inserter,
+):
+    partner, _ = await partner_inserter()
+    existing, cmd = await contact_inserter(partner_id=partner.id)
+
+    cmd = cmd.migrate(
+        model=models.CreateContactsCommand,
+        extra_fields={
+            "email": f"{uuid4().hex}@{uuid4().hex}.com",
+            "token": str(uuid4()),
+        },
+    )
+
+    result = await contact_repository.upsert(cmd=cmd)
+
+    # Token of the existing row is kept.
+    assert result == cmd.migrate(
+        model=models.ContactsUpsert,
+        extra_fields={"id": existing.id, "token": existing.token, "created": False},
+    )
+
+
+@pytest.mark.postgresql
+async def test_upsert_many_reports_created(
+    contact_repository: ContactsRepository,
+    contact_inserter,
+    partner_inserter,
+    contact_generator,
+):
+    partner, _ = await partner_inserter()
+    existing, cmd = await contact_inserter(partner_id=partner.id)
+    new = contact_generator(partner_id=partner.id)
+
+    result = await contact_repository.upsert_many(
+        cmds=[cmd, new.migrate(model=models.CreateContactsCommand)],
+    )
+
+    assert [item.created for item in result] == [False, True]
+    assert result[0].id == existing.id
+
+
+@pytest.mark.postgresql
+async def test_upsert_many_repeated_key(
+    contact_repository: ContactsRepository,
+    contact_inserter,
+    partner_inserter,
+):
+    partner, _ = await partner_inserter()
+    _, cmd = await contact_inserter(partner_id=partner.id)
+
+    with pytest.raises(RepeatedKey):
+        await contact_repository.upsert_many(cmds=[cmd, cmd])
@@ -0,0 +1,33 @@
+"""Module for testing batch_read_all method of CountryRepository."""
+
+
+import pytest
+
+from app.internal.repository.postgresql import CountryRepository
+from app.pkg import models
+from app.pkg.models.exceptions.repository import EmptyResult
+
+
+@pytest.mark.postgresql
+async def test_batch_read_all(
+    country_repository: CountryRepository,
+    country_inserter,
+    check_array_equality,
+):
+    expected = []
+    for _ in range(3):
+        result, _ = await country_inserter()
+        expected.append(result)
+
+    query = models.ReadAllCountryByIdQuery(ids=[item.id for item in expected])
+
+    result = await country_repository.batch_read_all(query=query)
+
+    assert check_array_equality(expected, result)
+
+
+@pytest.mark.postgresql
+async def test_empty(country_repository: CountryRepository):
+    query = models.ReadAllCountryByIdQuery(ids=[])
+    with pytest.raises(EmptyResult):
+        await country_repository.batch_read_all(query=query)
@@ -0,0 +1,49 @@
+"""Module for testing create_many method of country repository."""
+
+
+import pytest
+
+from app.internal.repository.postgresql import CountryRepository
+from app.pkg import models
+from app.pkg.models.exceptions.country import CountryNameAlreadyExists
+from app.pkg.models.exceptions.repository import EmptyResult
+
+
+@pytest.mark.postgresql
+async def test_create_many(
+    country_repository: CountryRepository,
+    country_generator,
+):
+    items = [country_generator() for _ in range(3)]
+
+    result = await country_repository.create_many(
+        cmds=[item.migrate(model=models.CreateCountryCommand) for item in items],
+    )
+
+    assert result == [
+        item.migrate(model=models.Country, extra_fields={"id": created.id})
+        for item, created in zip(items, result)
+    ]
+
+
+@pytest.mark.postgresql
+async def test_create_many_is_atomic(
+    country_repository: CountryRepository,
+    clean_postgres,
+    country_generator,
+):
+    _ = clean_postgres
+
+    first = country_generator()
+    second = country_generator(name=first.name)
+
+    with pytest.raises(CountryNameAlreadyExists):
+        await country_repository.create_many(
+            cmds=[
+                first.migrate(model=models.CreateCountryCommand),
+                second.migrate(model=models.CreateCountryCommand),
+            ],
+        )
+
+    with pytest.raises(EmptyResult):
+        await country_repository.read_all(query=models.PaginationQuery())
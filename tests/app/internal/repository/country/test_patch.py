@@ -0,0 +1,31 @@
+"""Module for testing country repository patch method."""
+
+
+import pytest
+
+from app.pkg import models
+from app.pkg.models.exceptions.repository import EmptyResult
+
+
+@pytest.mark.postgresql
+async def test_patch(country_repository, country_inserter):
+    country, _ = await country_inserter()
+
+    result = await country_repository.patch(
+        cmd=models.PatchCountryCommand(id=country.id, name="Russia"),
+    )
+
+    assert result == country.migrate(
+        models.Country,
+        extra_fields={"id": country.id, "name": "Russia"},
+    )
+
+
+@pytest.mark.postgresql
+async def test_country_not_found(country_repository, country_inserter):
+    country, _ = await country_inserter()
+
+    with pytest.raises(EmptyResult):
+        await country_repository.patch(
+            cmd=models.PatchCountryCommand(id=country.id + 1, code="RUS"),
+        )
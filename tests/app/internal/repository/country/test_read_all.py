@@ -2,6 +2,7 @@
 
 import pytest
 
+from app.pkg import models
 from app.pkg.models.exceptions.repository import EmptyResult
 
 
@@ -12,7 +13,7 @@ async def test_read_all(country_repository, country_inserter, clean_postgres):
 
     result, _ = await country_inserter()
 
-    assert await country_repository.read_all() == [result]
+    assert await country_repository.read_all(query=models.PaginationQuery()) == [result]
 
 
 @pytest.mark.postgresql
@@ -21,4 +22,29 @@ async def test_country_not_found(country_repository, clean_postgres):
     _ = clean_postgres
 
     with pytest.raises(EmptyResult):
-        await country_repository.read_all()
+        await country_repository.read_all(query=models.PaginationQuery())
+
+
+@pytest.mark.postgresql
+@pytest.mark.slow
+async def test_read_all_keyset_pagination(
+    country_repository,
+    country_inserter,
+    clean_postgres,
+):
+    _ = clean_postgres
+
+    expected = []
+    for _ in range(3):
+        result, _ = await country_inserter()
+        expected.append(result)
+
+    first_page = await country_repository.read_all(
+        query=models.PaginationQuery(limit=2)
+    )
+    second_page = await country_repository.read_all(
+        query=models.PaginationQuery(limit=2, after_id=first_page[-1].id),
+    )
+
+    assert first_page == expected[:2]
+    assert second_page == expected[2:]
@@ -0,0 +1,78 @@
+"""Module for testing upsert methods of country repository."""
+
+
+from uuid import uuid4
+
+import pytest
+
+from app.internal.repository.postgresql import CountryRepository
+from app.pkg import models
+from app.pkg.models.exceptions.repository import RepeatedKey
+
+
+@pytest.mark.postgresql
+async def test_upsert_updates_existing(
+    country_repository: CountryRepository,
+    country_inserter,
+):
+    existing, cmd = await country_inserter()
+
+    cmd = cmd.migrate(
+        model=models.CreateCountryCommand,
+        extra_fields={"name": uuid4().hex},
+    )
+
+    result = await country_repository.upsert(cmd=cmd)
+
+    assert result == cmd.migrate(
+        model=models.CountryUpsert,
+        extra_fields={"id": existing.id, "created": False},
+    )
+
+
+@pytest.mark.postgresql
+async def test_upsert_many_reports_created(
+    country_repository: CountryRepository,
+    country_inserter,
+    country_generator,
+):
+    existing, cmd = await country_inserter()
+    new = country_generator()
+
+    result = await country_repository.upsert_many(
+        cmds=[cmd, new.migrate(model=models.CreateCountryCommand)],
+    )
+
+    assert [item.created for item in result] == [False, True]
+    assert result[0].id == existing.id
+
+
+@pytest.mark.postgresql
+async def test_upsert_many_repeated_key(
+    country_repository: CountryRepository,
+    country_inserter,
+):
+    _, cmd = await country_inserter()
+
+    with pytest.raises(RepeatedKey):
+        await country_repository.upsert_many(cmds=[cmd, cmd])
+
+
+@pytest.mark.postgresql
+async def test_upsert_many_keeps_order_of_commands(
+    country_repository: CountryRepository,
+    country_inserter,
+    country_generator,
+):
+    existing, cmd = await country_inserter()
+    first, last = country_generator(), country_generator()
+    cmds = [
+        first.migrate(model=models.CreateCountryCommand),
+        cmd,
+        last.migrate(model=models.CreateCountryCommand),
+    ]
+
+    result = await country_repository.upsert_many(cmds=cmds)
+
+    assert [item.code for item in result] == [item.code for item in cmds]
+    assert [item.created for item in result] == [True, False, True]
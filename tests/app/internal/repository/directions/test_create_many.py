@@ -0,0 +1,49 @@
+"""Module for testing create_many method of directions repository."""
+
+
+import pytest
+
+from app.internal.repository.postgresql import DirectionRepository
+from app.pkg import models
+from app.pkg.models.exceptions.direction import DirectionNameAlreadyExists
+from app.pkg.models.exceptions.repository import EmptyResult
+
+
+@pytest.mark.postgresql
+async def test_create_many(
+    direction_repository: DirectionRepository,
+    direction_generator,
+):
+    items = [direction_generator() for _ in range(3)]
+
+    result = await direction_repository.create_many(
+        cmds=[item.migrate(model=models.CreateDirectionCommand) for item in items],
+    )
+
+    assert result == [
+        item.migrate(model=models.Direction, extra_fields={"id": created.id})
+        for item, created in zip(items, result)
+    ]
+
+
+@pytest.mark.postgresql
+async def test_create_many_is_atomic(
+    direction_repository: DirectionRepository,
+    clean_postgres,
+    direction_generator,
+):
+    _ = clean_postgres
+
+    first = direction_generator()
+    second = direction_generator(name=first.name)
+
+    with pytest.raises(DirectionNameAlreadyExists):
+        await direction_repository.create_many(
+            cmds=[
+                first.migrate(model=models.CreateDirectionCommand),
+                second.migrate(model=models.CreateDirectionCommand),
+            ],
+        )
+
+    with pytest.raises(EmptyResult):
+        await direction_repository.read_all(query=models.PaginationQuery())
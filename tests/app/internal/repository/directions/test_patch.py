@@ -0,0 +1,56 @@
+"""Module for testing direction repository patch method."""
+
+
+import pytest
+
+from app.internal.repository.postgresql import DirectionRepository
+from app.pkg import models
+from app.pkg.models.exceptions.direction import DirectionNameAlreadyExists
+from app.pkg.models.exceptions.repository import EmptyResult
+
+
+@pytest.mark.postgresql
+async def test_patch(
+    direction_inserter,
+    direction_repository: DirectionRepository,
+):
+    direction, _ = await direction_inserter()
+
+    result = await direction_repository.patch(
+        cmd=models.PatchDirectionCommand(
+            id=direction.id,
+            name=f"{direction.name}_new_name",
+        ),
+    )
+
+    assert result == direction.migrate(
+        model=models.Direction,
+        extra_fields={"name": f"{direction.name}_new_name"},
+    )
+
+
+@pytest.mark.postgresql
+async def test_not_unique_name(
+    direction_inserter,
+    direction_repository: DirectionRepository,
+):
+    direction, _ = await direction_inserter()
+    other, _ = await direction_inserter()
+
+    with pytest.raises(DirectionNameAlreadyExists):
+        await direction_repository.patch(
+            cmd=models.PatchDirectionCommand(id=direction.id, name=other.name),
+        )
+
+
+@pytest.mark.postgresql
+async def test_not_found(
+    direction_inserter,
+    direction_repository: DirectionRepository,
+):
+    direction, _ = await direction_inserter()
+
+    with pytest.raises(EmptyResult):
+        await direction_repository.patch(
+            cmd=models.PatchDirectionCommand(id=direction.id + 1, name="Backend"),
+        )
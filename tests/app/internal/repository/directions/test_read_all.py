@@ -3,6 +3,7 @@
 
 import pytest
 
+from app.pkg import models
 from app.pkg.models.exceptions.repository import EmptyResult
 
 
@@ -13,7 +14,9 @@ async def test_read_all(direction_repository, direction_inserter, clean_postgres
 
     result, _ = await direction_inserter()
 
-    assert await direction_repository.read_all() == [result]
+    assert await direction_repository.read_all(query=models.PaginationQuery()) == [
+        result
+    ]
 
 
 @pytest.mark.postgresql
@@ -22,4 +25,29 @@ async def test_direction_not_found(direction_repository, clean_postgres):
     _ = clean_postgres
 
     with pytest.raises(EmptyResult):
-        await direction_repository.read_all()
+        await direction_repository.read_all(query=models.PaginationQuery())
+
+
+@pytest.mark.postgresql
+@pytest.mark.slow
+async def test_read_all_keyset_pagination(
+    direction_repository,
+    direction_inserter,
+    clean_postgres,
+):
+    _ = clean_postgres
+
+    expected = []
+    for _ in range(3):
+        result, _ = await direction_inserter()
+        expected.append(result)
+
+    first_page = await direction_repository.read_all(
+        query=models.PaginationQuery(limit=2)
+    )
+    second_page = await direction_repository.read_all(
+        query=models.PaginationQuery(limit=2, after_id=first_page[-1].id),
+    )
+
+    assert first_page == expected[:2]
+    assert second_page == expected[2:]
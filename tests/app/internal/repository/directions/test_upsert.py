@@ -0,0 +1,51 @@
+"""Module for testing upsert methods of direction repository."""
+
+
+import pytest
+
+from app.internal.repository.postgresql import DirectionRepository
+from app.pkg import models
+from app.pkg.models.exceptions.repository import RepeatedKey
+
+
+@pytest.mark.postgresql
+async def test_upsert_updates_existing(
+    direction_repository: DirectionRepository,
+    direction_inserter,
+):
+    existing, cmd = await direction_inserter()
+
+    result = await direction_repository.upsert(cmd=cmd)
+
+    assert result == cmd.migrate(
+        model=models.DirectionUpsert,
+        extra_fields={"id": existing.id, "created": False},
+    )
+
+
+@pytest.mark.postgresql
+async def test_upsert_many_reports_created(
+    direction_repository: DirectionRepository,
+    direction_inserter,
+    direction_generator,
+):
+    existing, cmd = await direction_inserter()
+    new = direction_generator()
+
+    result = await direction_repository.upsert_many(
+        cmds=[cmd, new.migrate(model=models.CreateDirectionCommand)],
+    )
+
+    assert [item.created for item in result] == [False, True]
+    assert result[0].id == existing.id
+
+
+@pytest.mark.postgresql
+async def test_upsert_many_repeated_key(
+    direction_repository: DirectionRepository,
+    direction_inserter,
+):
+    _, cmd = await direction_inserter()
+
+    with pytest.raises(RepeatedKey):
+        await direction_repository.upsert_many(cmds=[cmd, cmd])
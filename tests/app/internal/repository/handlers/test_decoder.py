@@ -0,0 +1,46 @@
+"""Testing decoders built by :func:`.build_decoder`."""
+
+from typing import List
+
+import pytest
+
+from app.internal.repository.postgresql.handlers.decoder import build_decoder
+from app.pkg import models
+
+
+@pytest.mark.parametrize("trusted", [True, False])
+async def test_decode_list(trusted: bool):
+    rows = [{"id": 1, "name": "Russia", "code": "RUS"}]
+
+    result = build_decoder(List[models.Country], trusted=trusted)(rows)
+
+    assert result == [models.Country(id=1, name="Russia", code="RUS")]
+    assert isinstance(result[0], models.Country)
+
+
+@pytest.mark.parametrize("trusted", [True, False])
+async def test_decode_single(trusted: bool):
+    row = {"id": 1, "name": "Russia", "code": "RUS"}
+
+    result = build_decoder(models.Country, trusted=trusted)(row)
+
+    assert result == models.Country(id=1, name="Russia", code="RUS")
+
+
+async def test_trusted_falls_back_to_validation_for_secrets():
+    row = {
+        "id": 1,
+        "token": "c8b4b6c9-0d4a-4f46-a3b6-2f5c0e9e8f00",
+        "email": None,
+        "telegram_username": None,
+        "telegram_user_id": 1,
+        "partner_id": None,
+    }
+
+    result = build_decoder(models.Contacts, trusted=True)(row)
+
+    assert result.token.get_secret_value() == row["token"]
+
+
+async def test_decoder_is_cached():
+    assert build_decoder(List[models.Country]) is build_decoder(List[models.Country])
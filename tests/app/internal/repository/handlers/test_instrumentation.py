@@ -0,0 +1,137 @@
+"""Testing per-query instrumentation of :func:`.collect_response`."""
+
+import time
+from typing import AsyncIterator, List
+
+import psycopg2
+import pytest
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.trace import StatusCode
+from prometheus_client import REGISTRY
+
+from app.internal.repository.postgresql.handlers.collect_response import (
+    collect_response,
+    collect_stream,
+)
+from app.pkg import models
+from app.pkg.connectors.postgresql.instrumentation import (
+    QueryInstrument,
+    QueryTrace,
+    TracedCursor,
+)
+from app.pkg.models.exceptions.repository import EmptyResult, PoolAcquireTimeout
+
+
+class _Cursor:
+    def __init__(self, rows: List[dict]):
+        self.rows = rows
+
+    async def execute(self, operation: str, parameters: dict = None):
+        del operation, parameters  # unused
+
+    async def fetchall(self) -> List[dict]:
+        return self.rows
+
+
+class InstrumentedRepository:
+    def __init__(self, rows: List[dict]):
+        self.cur = TracedCursor(_Cursor(rows))
+
+    @collect_response(trusted=True)
+    async def read_all(self) -> List[models.Country]:
+        await self.cur.execute("select * from country")
+        return await self.cur.fetchall()
+
+    @collect_stream(trusted=True)
+    async def stream_all(self) -> AsyncIterator[List[models.Country]]:
+        for _ in range(2):
+            await self.cur.execute("fetch forward 2 from stream_cursor")
+            yield await self.cur.fetchall()
+
+
+__rows = [{"id": i, "name": "Russia", "code": "RUS"} for i in range(1, 3)]
+
+
+def __count(method: str, phase: str) -> float:
+    return (
+        REGISTRY.get_sample_value(
+            "repository_query_duration_seconds_count",
+            {"repository": "InstrumentedRepository", "method": method, "phase": phase},
+        )
+        or 0
+    )
+
+
+def __rows_sum(method: str) -> float:
+    return (
+        REGISTRY.get_sample_value(
+            "repository_query_rows_sum",
+            {"repository": "InstrumentedRepository", "method": method},
+        )
+        or 0
+    )
+
+
+async def test_phases_of_method():
+    before = {p: __count("read_all", p) for p in ("execute", "fetch", "decode")}
+    rows = __rows_sum("read_all")
+
+    result = await InstrumentedRepository(__rows).read_all()
+
+    assert len(result) == 2
+    for phase, count in before.items():
+        assert __count("read_all", phase) == count + 1
+    assert __rows_sum("read_all") == rows + 2
+
+
+async def test_empty_result_is_observed():
+    total = __count("read_all", "total")
+
+    with pytest.raises(EmptyResult):
+        await InstrumentedRepository([]).read_all()
+
+    assert __count("read_all", "total") == total + 1
+    assert __count("read_all", "acquire") == 0
+
+
+async def test_phases_of_stream():
+    execute = __count("stream_all", "execute")
+    rows = __rows_sum("stream_all")
+
+    batches = [b async for b in InstrumentedRepository(__rows).stream_all()]
+
+    assert len(batches) == 2
+    assert __count("stream_all", "execute") == execute + 2
+    assert __rows_sum("stream_all") == rows + 4
+
+
+async def test_queries_outside_of_method_are_not_observed():
+    repository = InstrumentedRepository(__rows)
+    execute = __count("read_all", "execute")
+
+    await repository.cur.execute("select 1")
+
+    assert __count("read_all", "execute") == execute
+
+
+@pytest.mark.parametrize(
+    "error, status_code",
+    [
+        (None, StatusCode.UNSET),
+        (EmptyResult(), StatusCode.UNSET),
+        (psycopg2.OperationalError(), StatusCode.ERROR),
+        (PoolAcquireTimeout(), StatusCode.ERROR),
+    ],
+)
+async def test_span_fails_only_by_driver_error(error, status_code):
+    span = TracerProvider().get_tracer(__name__).start_span("read_all")
+    query = QueryTrace(
+        instrument=QueryInstrument.of("InstrumentedRepository.read_all"),
+        span=span,
+        start=time.time_ns(),
+    )
+
+    query.finish(error)
+
+    assert span.status.status_code == status_code
+    assert span.attributes["db.response.rows"] == 0
@@ -0,0 +1,43 @@
+"""Testing queries built by :func:`.patch_query`."""
+
+import pydantic
+import pytest
+
+from app.internal.repository.postgresql.handlers.patch import patch_query
+from app.pkg import models
+
+
+async def test_only_set_fields_are_updated():
+    values = models.PatchCityCommand(id=1, code="MSK").to_patch()
+
+    q = patch_query("cities", values, returning="id, name, code, country_id")
+
+    assert values == {"id": 1, "code": "MSK"}
+    assert q == (
+        "update cities set code = %(code)s "
+        "where id = %(id)s returning id, name, code, country_id"
+    )
+
+
+async def test_query_is_cached_per_field_set():
+    first = patch_query("countries", {"id": 1, "name": "Russia"}, returning="id")
+    second = patch_query("countries", {"id": 2, "name": "Belarus"}, returning="id")
+
+    assert first is second
+
+
+async def test_empty_patch_only_reads():
+    q = patch_query("partners", {"id": 1}, returning="id, name, token")
+
+    assert q == "select id, name, token from partners where id = %(id)s"
+
+
+async def test_unset_token_is_not_generated():
+    cmd = models.PatchPartnerCommand(id=1, name="Yandex")
+
+    assert cmd.to_patch() == {"id": 1, "name": "Yandex"}
+
+
+async def test_null_is_rejected():
+    with pytest.raises(pydantic.ValidationError):
+        models.PatchCountryCommand(id=1, name=None)
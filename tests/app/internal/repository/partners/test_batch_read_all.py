@@ -0,0 +1,33 @@
+"""Module for testing batch_read_all method of PartnerRepository."""
+
+
+import pytest
+
+from app.internal.repository.postgresql import PartnerRepository
+from app.pkg import models
+from app.pkg.models.exceptions.repository import EmptyResult
+
+
+@pytest.mark.postgresql
+async def test_batch_read_all(
+    partner_repository: PartnerRepository,
+    partner_inserter,
+    check_array_equality,
+):
+    expected = []
+    for _ in range(10):
+        result, _ = await partner_inserter()
+        expected.append(result)
+
+    query = models.ReadAllPartnerByIdQuery(ids=[item.id for item in expected])
+
+    result = await partner_repository.batch_read_all(query=query)
+
+    assert check_array_equality(expected, result)
+
+
+@pytest.mark.postgresql
+async def test_empty(partner_repository: PartnerRepository):
+    query = models.ReadAllPartnerByIdQuery(ids=[])
+    with pytest.raises(EmptyResult):
+        await partner_repository.batch_read_all(query=query)
@@ -0,0 +1,49 @@
+"""Module for testing create_many method of partner repository."""
+
+
+import pytest
+
+from app.internal.repository.postgresql import PartnerRepository
+from app.pkg import models
+from app.pkg.models.exceptions.partners import PartnerNameAlreadyExists
+from app.pkg.models.exceptions.repository import EmptyResult
+
+
+@pytest.mark.postgresql
+async def test_create_many(
+    partner_repository: PartnerRepository,
+    partner_generator,
+):
+    items = [partner_generator() for _ in range(3)]
+
+    result = await partner_repository.create_many(
+        cmds=[item.migrate(model=models.CreatePartnerCommand) for item in items],
+    )
+
+    assert result == [
+        item.migrate(model=models.Partner, extra_fields={"id": created.id})
+        for item, created in zip(items, result)
+    ]
+
+
+@pytest.mark.postgresql
+async def test_create_many_is_atomic(
+    partner_repository: PartnerRepository,
+    clean_postgres,
+    partner_generator,
+):
+    _ = clean_postgres
+
+    first = partner_generator()
+    second = partner_generator(name=first.name)
+
+    with pytest.raises(PartnerNameAlreadyExists):
+        await partner_repository.create_many(
+            cmds=[
+                first.migrate(model=models.CreatePartnerCommand),
+                second.migrate(model=models.CreatePartnerCommand),
+            ],
+        )
+
+    with pytest.raises(EmptyResult):
+        await partner_repository.read_all(query=models.PaginationQuery())
@@ -0,0 +1,42 @@
+"""Module for testing patch method of partner repository."""
+
+
+from uuid import uuid4
+
+import pytest
+
+from app.internal.repository.postgresql import PartnerRepository
+from app.pkg import models
+from app.pkg.models.exceptions.partners import PartnerNameAlreadyExists
+
+
+@pytest.mark.postgresql
+async def test_patch_keeps_token(
+    partner_inserter,
+    partner_repository: PartnerRepository,
+):
+    partner, _ = await partner_inserter()
+    name = uuid4().hex
+
+    result = await partner_repository.patch(
+        cmd=models.PatchPartnerCommand(id=partner.id, name=name),
+    )
+
+    assert result == partner.migrate(
+        model=models.Partner,
+        extra_fields={"id": partner.id, "name": name},
+    )
+
+
+@pytest.mark.postgresql
+async def test_partner_name_already_exists(
+    partner_inserter,
+    partner_repository: PartnerRepository,
+):
+    partner, _ = await partner_inserter()
+    other, _ = await partner_inserter()
+
+    with pytest.raises(PartnerNameAlreadyExists):
+        await partner_repository.patch(
+            cmd=models.PatchPartnerCommand(id=partner.id, name=other.name),
+        )
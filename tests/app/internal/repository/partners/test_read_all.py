@@ -4,6 +4,7 @@
 import pytest
 
 from app.internal.repository.postgresql import PartnerRepository
+from app.pkg import models
 from app.pkg.models.exceptions.repository import EmptyResult
 
 
@@ -17,7 +18,7 @@ async def test_read_all(
     _ = clean_postgres
 
     partner, _ = await partner_inserter()
-    result = await partner_repository.read_all()
+    result = await partner_repository.read_all(query=models.PaginationQuery())
     assert result == [partner]
 
 
@@ -30,4 +31,29 @@ async def test_read_all_not_found(
     _ = clean_postgres
 
     with pytest.raises(EmptyResult):
-        await partner_repository.read_all()
+        await partner_repository.read_all(query=models.PaginationQuery())
+
+
+@pytest.mark.postgresql
+@pytest.mark.slow
+async def test_read_all_keyset_pagination(
+    partner_repository,
+    partner_inserter,
+    clean_postgres,
+):
+    _ = clean_postgres
+
+    expected = []
+    for _ in range(3):
+        result, _ = await partner_inserter()
+        expected.append(result)
+
+    first_page = await partner_repository.read_all(
+        query=models.PaginationQuery(limit=2)
+    )
+    second_page = await partner_repository.read_all(
+        query=models.PaginationQuery(limit=2, after_id=first_page[-1].id),
+    )
+
+    assert first_page == expected[:2]
+    assert second_page == expected[2:]
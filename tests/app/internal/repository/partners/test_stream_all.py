@@ -0,0 +1,34 @@
+"""Module for testing stream_all method of PartnerRepository."""
+
+
+import pytest
+
+from app.internal.repository.postgresql import PartnerRepository
+
+
+@pytest.mark.postgresql
+@pytest.mark.slow
+async def test_stream_all(
+    partner_repository: PartnerRepository,
+    partner_inserter,
+    clean_postgres,
+):
+    _ = clean_postgres
+
+    expected = []
+    for _ in range(3):
+        result, _ = await partner_inserter()
+        expected.append(result)
+
+    batches = [batch async for batch in partner_repository.stream_all(batch_size=2)]
+
+    assert [len(batch) for batch in batches] == [2, 1]
+    assert [item for batch in batches for item in batch] == expected
+
+
+@pytest.mark.postgresql
+@pytest.mark.slow
+async def test_stream_all_empty(partner_repository: PartnerRepository, clean_postgres):
+    _ = clean_postgres
+
+    assert [batch async for batch in partner_repository.stream_all()] == []
@@ -0,0 +1,59 @@
+"""Module for testing upsert methods of partner repository."""
+
+
+from uuid import uuid4
+
+import pytest
+
+from app.internal.repository.postgresql import PartnerRepository
+from app.pkg import models
+from app.pkg.models.exceptions.repository import RepeatedKey
+
+
+@pytest.mark.postgresql
+async def test_upsert_updates_existing(
+    partner_repository: PartnerRepository,
+    partner_inserter,
+):
+    existing, cmd = await partner_inserter()
+
+    cmd = cmd.migrate(
+        model=models.CreatePartnerCommand,
+        extra_fields={"token": uuid4().hex},
+    )
+
+    result = await partner_repository.upsert(cmd=cmd)
+
+    # Token of the existing row is kept.
+    assert result == cmd.migrate(
+        model=models.PartnerUpsert,
+        extra_fields={"id": existing.id, "token": existing.token, "created": False},
+    )
+
+
+@pytest.mark.postgresql
+async def test_upsert_many_reports_created(
+    partner_repository: PartnerRepository,
+    partner_inserter,
+    partner_generator,
+):
+    existing, cmd = await partner_inserter()
+    new = partner_generator()
+
+    result = await partner_repository.upsert_many(
+        cmds=[cmd, new.migrate(model=models.CreatePartnerCommand)],
+    )
+
+    assert [item.created for item in result] == [False, True]
+    assert result[0].id == existing.id
+
+
+@pytest.mark.postgresql
+async def test_upsert_many_repeated_key(
+    partner_repository: PartnerRepository,
+    partner_inserter,
+):
+    _, cmd = await partner_inserter()
+
+    with pytest.raises(RepeatedKey):
+        await partner_repository.upsert_many(cmds=[cmd, cmd])
@@ -0,0 +1,49 @@
+"""Module for testing create_many method of skill repository."""
+
+
+import pytest
+
+from app.internal.repository.postgresql import SkillRepository
+from app.pkg import models
+from app.pkg.models.exceptions.skill import SkillNameAlreadyExists
+from app.pkg.models.exceptions.repository import EmptyResult
+
+
+@pytest.mark.postgresql
+async def test_create_many(
+    skill_repository: SkillRepository,
+    skill_generator,
+):
+    items = [skill_generator() for _ in range(3)]
+
+    result = await skill_repository.create_many(
+        cmds=[item.migrate(model=models.CreateSkillCommand) for item in items],
+    )
+
+    assert result == [
+        item.migrate(model=models.Skill, extra_fields={"id": created.id})
+        for item, created in zip(items, result)
+    ]
+
+
+@pytest.mark.postgresql
+async def test_create_many_is_atomic(
+    skill_repository: SkillRepository,
+    clean_postgres,
+    skill_generator,
+):
+    _ = clean_postgres
+
+    first = skill_generator()
+    second = skill_generator(name=first.name)
+
+    with pytest.raises(SkillNameAlreadyExists):
+        await skill_repository.create_many(
+            cmds=[
+                first.migrate(model=models.CreateSkillCommand),
+                second.migrate(model=models.CreateSkillCommand),
+            ],
+        )
+
+    with pytest.raises(EmptyResult):
+        await skill_repository.read_all(query=models.PaginationQuery())
@@ -0,0 +1,44 @@
+"""Module for testing skill repository patch method."""
+
+
+import pytest
+
+from app.internal.repository.postgresql import SkillRepository
+from app.pkg import models
+from app.pkg.models.exceptions.repository import EmptyResult
+from app.pkg.models.exceptions.skill import SkillNameAlreadyExists
+
+
+@pytest.mark.postgresql
+async def test_patch(skill_inserter, skill_repository: SkillRepository):
+    skill, _ = await skill_inserter()
+
+    result = await skill_repository.patch(
+        cmd=models.PatchSkillCommand(id=skill.id, name=f"{skill.name}_new_name"),
+    )
+
+    assert result == skill.migrate(
+        model=models.Skill,
+        extra_fields={"name": f"{skill.name}_new_name"},
+    )
+
+
+@pytest.mark.postgresql
+async def test_not_unique_name(skill_inserter, skill_repository: SkillRepository):
+    skill, _ = await skill_inserter()
+    other, _ = await skill_inserter()
+
+    with pytest.raises(SkillNameAlreadyExists):
+        await skill_repository.patch(
+            cmd=models.PatchSkillCommand(id=skill.id, name=other.name),
+        )
+
+
+@pytest.mark.postgresql
+async def test_not_found(skill_inserter, skill_repository: SkillRepository):
+    skill, _ = await skill_inserter()
+
+    with pytest.raises(EmptyResult):
+        await skill_repository.patch(
+            cmd=models.PatchSkillCommand(id=skill.id + 1, name="Python"),
+        )
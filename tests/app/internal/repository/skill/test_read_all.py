@@ -4,6 +4,7 @@
 import pytest
 
 from app.internal.repository.postgresql import SkillRepository
+from app.pkg import models
 from app.pkg.models.exceptions.repository import EmptyResult
 
 
@@ -23,7 +24,7 @@ async def test_read_all(
         expected.append(result)
         cmds.append(cmd)
 
-    result = await skill_repository.read_all()
+    result = await skill_repository.read_all(query=models.PaginationQuery())
 
     assert result == expected
 
@@ -34,4 +35,27 @@ async def test_empty(skill_repository: SkillRepository, clean_postgres):
     _ = clean_postgres
 
     with pytest.raises(EmptyResult):
-        await skill_repository.read_all()
+        await skill_repository.read_all(query=models.PaginationQuery())
+
+
+@pytest.mark.postgresql
+@pytest.mark.slow
+async def test_read_all_keyset_pagination(
+    skill_repository,
+    skill_inserter,
+    clean_postgres,
+):
+    _ = clean_postgres
+
+    expected = []
+    for _ in range(3):
+        result, _ = await skill_inserter()
+        expected.append(result)
+
+    first_page = await skill_repository.read_all(query=models.PaginationQuery(limit=2))
+    second_page = await skill_repository.read_all(
+        query=models.PaginationQuery(limit=2, after_id=first_page[-1].id),
+    )
+
+    assert first_page == expected[:2]
+    assert second_page == expected[2:]
@@ -0,0 +1,34 @@
+"""Module for testing stream_all method of SkillRepository."""
+
+
+import pytest
+
+from app.internal.repository.postgresql import SkillRepository
+
+
+@pytest.mark.postgresql
+@pytest.mark.slow
+async def test_stream_all(
+    skill_repository: SkillRepository,
+    skill_inserter,
+    clean_postgres,
+):
+    _ = clean_postgres
+
+    expected = []
+    for _ in range(3):
+        result, _ = await skill_inserter()
+        expected.append(result)
+
+    batches = [batch async for batch in skill_repository.stream_all(batch_size=2)]
+
+    assert [len(batch) for batch in batches] == [2, 1]
+    assert [item for batch in batches for item in batch] == expected
+
+
+@pytest.mark.postgresql
+@pytest.mark.slow
+async def test_stream_all_empty(skill_repository: SkillRepository, clean_postgres):
+    _ = clean_postgres
+
+    assert [batch async for batch in skill_repository.stream_all()] == []
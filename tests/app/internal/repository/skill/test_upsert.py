@@ -0,0 +1,51 @@
+"""Module for testing upsert methods of skill repository."""
+
+
+import pytest
+
+from app.internal.repository.postgresql import SkillRepository
+from app.pkg import models
+from app.pkg.models.exceptions.repository import RepeatedKey
+
+
+@pytest.mark.postgresql
+async def test_upsert_updates_existing(
+    skill_repository: SkillRepository,
+    skill_inserter,
+):
+    existing, cmd = await skill_inserter()
+
+    result = await skill_repository.upsert(cmd=cmd)
+
+    assert result == cmd.migrate(
+        model=models.SkillUpsert,
+        extra_fields={"id": existing.id, "created": False},
+    )
+
+
+@pytest.mark.postgresql
+async def test_upsert_many_reports_created(
+    skill_repository: SkillRepository,
+    skill_inserter,
+    skill_generator,
+):
+    existing, cmd = await skill_inserter()
+    new = skill_generator()
+
+    result = await skill_repository.upsert_many(
+        cmds=[cmd, new.migrate(model=models.CreateSkillCommand)],
+    )
+
+    assert [item.created for item in result] == [False, True]
+    assert result[0].id == existing.id
+
+
+@pytest.mark.postgresql
+async def test_upsert_many_repeated_key(
+    skill_repository: SkillRepository,
+    skill_inserter,
+):
+    _, cmd = await skill_inserter()
+
+    with pytest.raises(RepeatedKey):
+        await skill_repository.upsert_many(cmds=[cmd, cmd])
@@ -0,0 +1,33 @@
+"""Module for testing batch_read_all method of SkillLevelRepository."""
+
+
+import pytest
+
+from app.internal.repository.postgresql import SkillLevelRepository
+from app.pkg import models
+from app.pkg.models.exceptions.repository import EmptyResult
+
+
+@pytest.mark.postgresql
+async def test_batch_read_all(
+    skill_level_repository: SkillLevelRepository,
+    skill_level_inserter,
+    check_array_equality,
+):
+    expected = []
+    for _ in range(10):
+        result, _ = await skill_level_inserter()
+        expected.append(result)
+
+    query = models.ReadAllSkillLevelByIdQuery(ids=[item.id for item in expected])
+
+    result = await skill_level_repository.batch_read_all(query=query)
+
+    assert check_array_equality(expected, result)
+
+
+@pytest.mark.postgresql
+async def test_empty(skill_level_repository: SkillLevelRepository):
+    query = models.ReadAllSkillLevelByIdQuery(ids=[])
+    with pytest.raises(EmptyResult):
+        await skill_level_repository.batch_read_all(query=query)
@@ -0,0 +1,49 @@
+"""Module for testing create_many method of skill level repository."""
+
+
+import pytest
+
+from app.internal.repository.postgresql import SkillLevelRepository
+from app.pkg import models
+from app.pkg.models.exceptions.skill_levels import SkillLevelAlreadyExists
+from app.pkg.models.exceptions.repository import EmptyResult
+
+
+@pytest.mark.postgresql
+async def test_create_many(
+    skill_level_repository: SkillLevelRepository,
+    skill_level_generator,
+):
+    items = [skill_level_generator() for _ in range(3)]
+
+    result = await skill_level_repository.create_many(
+        cmds=[item.migrate(model=models.CreateSkillLevelCommand) for item in items],
+    )
+
+    assert result == [
+        item.migrate(model=models.SkillLevel, extra_fields={"id": created.id})
+        for item, created in zip(items, result)
+    ]
+
+
+@pytest.mark.postgresql
+async def test_create_many_is_atomic(
+    skill_level_repository: SkillLevelRepository,
+    clean_postgres,
+    skill_level_generator,
+):
+    _ = clean_postgres
+
+    first = skill_level_generator()
+    second = skill_level_generator(level=first.level)
+
+    with pytest.raises(SkillLevelAlreadyExists):
+        await skill_level_repository.create_many(
+            cmds=[
+                first.migrate(model=models.CreateSkillLevelCommand),
+                second.migrate(model=models.CreateSkillLevelCommand),
+            ],
+        )
+
+    with pytest.raises(EmptyResult):
+        await skill_level_repository.read_all(query=models.PaginationQuery())
@@ -0,0 +1,53 @@
+"""Module for testing skill level repository patch method."""
+
+
+import pytest
+
+from app.internal.repository.postgresql import SkillLevelRepository
+from app.pkg import models
+from app.pkg.models.exceptions.repository import EmptyResult
+from app.pkg.models.exceptions.skill_levels import SkillLevelAlreadyExists
+
+
+@pytest.mark.postgresql
+async def test_patch_keeps_level(
+    skill_level_inserter,
+    skill_level_repository: SkillLevelRepository,
+):
+    skill_level, _ = await skill_level_inserter()
+
+    result = await skill_level_repository.patch(
+        cmd=models.PatchSkillLevelCommand(id=skill_level.id, description="Senior"),
+    )
+
+    assert result == skill_level.migrate(
+        model=models.SkillLevel,
+        extra_fields={"description": "Senior"},
+    )
+
+
+@pytest.mark.postgresql
+async def test_level_not_unique(
+    skill_level_inserter,
+    skill_level_repository: SkillLevelRepository,
+):
+    skill_level, _ = await skill_level_inserter()
+    other, _ = await skill_level_inserter()
+
+    with pytest.raises(SkillLevelAlreadyExists):
+        await skill_level_repository.patch(
+            cmd=models.PatchSkillLevelCommand(id=skill_level.id, level=other.level),
+        )
+
+
+@pytest.mark.postgresql
+async def test_not_found(
+    skill_level_inserter,
+    skill_level_repository: SkillLevelRepository,
+):
+    skill_level, _ = await skill_level_inserter()
+
+    with pytest.raises(EmptyResult):
+        await skill_level_repository.patch(
+            cmd=models.PatchSkillLevelCommand(id=skill_level.id + 1, level=1),
+        )
@@ -4,6 +4,7 @@
 import pytest
 
 from app.internal.repository.postgresql import SkillLevelRepository
+from app.pkg import models
 from app.pkg.models.exceptions.repository import EmptyResult
 
 
@@ -18,7 +19,7 @@ async def test_read_all(
 
     skill_level, _ = await skill_level_inserter()
 
-    result = await skill_level_repository.read_all()
+    result = await skill_level_repository.read_all(query=models.PaginationQuery())
     assert result == [skill_level]
 
 
@@ -28,7 +29,7 @@ async def test_not_found(skill_level_repository: SkillLevelRepository, clean_pos
     _ = clean_postgres
 
     with pytest.raises(EmptyResult):
-        await skill_level_repository.read_all()
+        await skill_level_repository.read_all(query=models.PaginationQuery())
 
 
 @pytest.mark.postgresql
@@ -43,5 +44,30 @@ async def test_multiple_read_all(
     skill_level, _ = await skill_level_inserter()
     skill_level2, _ = await skill_level_inserter()
 
-    result = await skill_level_repository.read_all()
+    result = await skill_level_repository.read_all(query=models.PaginationQuery())
     assert result == [skill_level, skill_level2]
+
+
+@pytest.mark.postgresql
+@pytest.mark.slow
+async def test_read_all_keyset_pagination(
+    skill_level_repository,
+    skill_level_inserter,
+    clean_postgres,
+):
+    _ = clean_postgres
+
+    expected = []
+    for _ in range(3):
+        result, _ = await skill_level_inserter()
+        expected.append(result)
+
+    first_page = await skill_level_repository.read_all(
+        query=models.PaginationQuery(limit=2)
+    )
+    second_page = await skill_level_repository.read_all(
+        query=models.PaginationQuery(limit=2, after_id=first_page[-1].id),
+    )
+
+    assert first_page == expected[:2]
+    assert second_page == expected[2:]
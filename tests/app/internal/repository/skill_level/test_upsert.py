@@ -0,0 +1,58 @@
+"""Module for testing upsert methods of skill level repository."""
+
+
+from uuid import uuid4
+
+import pytest
+
+from app.internal.repository.postgresql import SkillLevelRepository
+from app.pkg import models
+from app.pkg.models.exceptions.repository import RepeatedKey
+
+
+@pytest.mark.postgresql
+async def test_upsert_updates_existing(
+    skill_level_repository: SkillLevelRepository,
+    skill_level_inserter,
+):
+    existing, cmd = await skill_level_inserter()
+
+    cmd = cmd.migrate(
+        model=models.CreateSkillLevelCommand,
+        extra_fields={"description": uuid4().hex},
+    )
+
+    result = await skill_level_repository.upsert(cmd=cmd)
+
+    assert result == cmd.migrate(
+        model=models.SkillLevelUpsert,
+        extra_fields={"id": existing.id, "created": False},
+    )
+
+
+@pytest.mark.postgresql
+async def test_upsert_many_reports_created(
+    skill_level_repository: SkillLevelRepository,
+    skill_level_inserter,
+    skill_level_generator,
+):
+    existing, cmd = await skill_level_inserter()
+    new = skill_level_generator()
+
+    result = await skill_level_repository.upsert_many(
+        cmds=[cmd, new.migrate(model=models.CreateSkillLevelCommand)],
+    )
+
+    assert [item.created for item in result] == [False, True]
+    assert result[0].id == existing.id
+
+
+@pytest.mark.postgresql
+async def test_upsert_many_repeated_key(
+    skill_level_repository: SkillLevelRepository,
+    skill_level_inserter,
+):
+    _, cmd = await skill_level_inserter()
+
+    with pytest.raises(RepeatedKey):
+        await skill_level_repository.upsert_many(cmds=[cmd, cmd])
@@ -0,0 +1,133 @@
+"""Module for testing unit of work of postgresql repositories."""
+
+import pytest
+
+from app.internal.repository.postgresql import CountryRepository
+from app.internal.repository.postgresql.connection import (
+    get_connection,
+    savepoint,
+    server_side_cursor,
+)
+from app.internal.repository.postgresql.unit_of_work import UnitOfWork
+from app.internal.services import CountryService
+from app.pkg import models
+from app.pkg.models.exceptions.country import CountryCodeAlreadyExists
+from app.pkg.models.exceptions.repository import DriverError, EmptyResult
+
+
+@pytest.mark.postgresql
+async def test_commit(country_repository: CountryRepository, country_inserter):
+    async with UnitOfWork():
+        country, _ = await country_inserter()
+
+    assert (
+        await country_repository.read(
+            query=models.ReadCountryQuery(id=country.id),
+        )
+        == country
+    )
+
+
+@pytest.mark.postgresql
+async def test_rollback(country_repository: CountryRepository, country_inserter):
+    with pytest.raises(RuntimeError):
+        async with UnitOfWork():
+            country, _ = await country_inserter()
+            raise RuntimeError
+
+    with pytest.raises(EmptyResult):
+        await country_repository.read(query=models.ReadCountryQuery(id=country.id))
+
+
+@pytest.mark.postgresql
+async def test_one_connection():
+    unit_of_work = UnitOfWork()
+    async with unit_of_work:
+        async with get_connection() as first, get_connection(read_only=True) as second:
+            assert first is second is unit_of_work.cursor
+
+        async with unit_of_work:
+            async with get_connection() as nested:
+                assert nested is first
+
+    assert unit_of_work.cursor is None
+
+
+@pytest.mark.postgresql
+async def test_failed_savepoint_keeps_transaction(
+    country_repository: CountryRepository,
+    country_generator,
+    country_inserter,
+):
+    async with UnitOfWork():
+        country, _ = await country_inserter()
+        with pytest.raises(CountryCodeAlreadyExists):
+            async with savepoint():
+                await country_repository.create(
+                    cmd=country_generator(code=country.code).migrate(
+                        model=models.CreateCountryCommand,
+                    ),
+                )
+        other, _ = await country_inserter()
+
+    for item in (country, other):
+        assert (
+            await country_repository.read(query=models.ReadCountryQuery(id=item.id))
+            == item
+        )
+
+
+@pytest.mark.postgresql
+async def test_failed_call_aborts_transaction(
+    country_repository: CountryRepository,
+    country_generator,
+    country_inserter,
+):
+    with pytest.raises(DriverError):
+        async with UnitOfWork():
+            country, _ = await country_inserter()
+            with pytest.raises(CountryCodeAlreadyExists):
+                await country_repository.create(
+                    cmd=country_generator(code=country.code).migrate(
+                        model=models.CreateCountryCommand,
+                    ),
+                )
+            await country_inserter()
+
+    with pytest.raises(EmptyResult):
+        await country_repository.read(query=models.ReadCountryQuery(id=country.id))
+
+
+@pytest.mark.postgresql
+async def test_create_in_batches(
+    country_repository: CountryRepository,
+    country_generator,
+    clean_postgres,
+):
+    _ = clean_postgres
+
+    first = country_generator()
+    cmds = [
+        item.migrate(model=models.CreateCountryCommand)
+        for item in (first, country_generator(), country_generator(code=first.code))
+    ]
+
+    async with UnitOfWork():
+        result = await CountryService(
+            country_repository=country_repository,
+        ).create_many_countries(cmds=cmds)
+
+    assert [item.error is None for item in result] == [True, True, False]
+    assert await country_repository.read_all(
+        query=models.PaginationQuery(),
+    ) == [item.item for item in result[:2]]
+
+
+@pytest.mark.postgresql
+async def test_streams_of_one_transaction(country_repository: CountryRepository):
+    async with UnitOfWork():
+        async with get_connection() as cur:
+            async with server_side_cursor(cur, "select 1 as id") as first:
+                async with server_side_cursor(cur, "select 2 as id") as second:
+                    assert [rows async for rows in first] == [[{"id": 1}]]
+                    assert [rows async for rows in second] == [[{"id": 2}]]
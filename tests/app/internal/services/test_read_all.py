@@ -0,0 +1,41 @@
+"""Module for testing pages of ``read_all`` methods of services."""
+
+import pytest
+
+from app.pkg import models
+
+
+@pytest.mark.postgresql
+async def test_page_after_full_last_page_is_empty(
+    country_service,
+    country_inserter,
+    clean_postgres,
+):
+    _ = clean_postgres
+
+    expected = []
+    for _ in range(2):
+        result, _ = await country_inserter()
+        expected.append(result)
+
+    last_page = await country_service.read_all_countries(
+        query=models.PaginationQuery(limit=2),
+    )
+    after_last_page = await country_service.read_all_countries(
+        query=models.PaginationQuery(limit=2, after_id=last_page.next_after_id),
+    )
+
+    assert last_page.items == expected
+    assert last_page.next_after_id == expected[-1].id
+    assert after_last_page.items == []
+    assert after_last_page.next_after_id is None
+
+
+@pytest.mark.postgresql
+async def test_empty_table_is_empty_page(city_service, clean_postgres):
+    _ = clean_postgres
+
+    page = await city_service.read_all_cities(query=models.PaginationQuery())
+
+    assert page.items == []
+    assert page.next_after_id is None
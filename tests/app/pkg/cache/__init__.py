@@ -0,0 +1 @@
+"""Testing read-through cache."""
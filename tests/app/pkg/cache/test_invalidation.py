@@ -0,0 +1,46 @@
+"""Testing invalidation of in-process cache by changes of rows."""
+
+import pytest
+
+from app.pkg.cache import CacheInvalidator, MemoryBackend, ReadThroughCache, cached
+from app.pkg.connectors.postgresql.notifications import RowChange
+
+
+class _Service:
+    def __init__(self, cache):
+        self.cache = cache
+        self.reads = 0
+
+    @cached("countries")
+    async def read(self, item_id: int) -> int:
+        self.reads += 1
+        return item_id
+
+
+@pytest.fixture()
+def service() -> _Service:
+    return _Service(cache=ReadThroughCache(backend=MemoryBackend(maxsize=8), ttl=60))
+
+
+async def test_invalidate_on_change(service: _Service):
+    invalidator = CacheInvalidator(cache=service.cache, tags=("countries",))
+
+    await service.read(1)
+    await invalidator.on_change(RowChange(table="countries", op="UPDATE", id=1))
+    await service.read(1)
+
+    assert service.reads == 2
+
+
+async def test_bypass_while_disconnected(service: _Service):
+    invalidator = CacheInvalidator(cache=service.cache, tags=("countries",))
+
+    invalidator.on_disconnect()
+    await service.read(1)
+    await service.read(1)
+    assert service.reads == 2
+
+    await invalidator.on_connect()
+    await service.read(1)
+    await service.read(1)
+    assert service.reads == 3
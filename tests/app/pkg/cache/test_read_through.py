@@ -0,0 +1,105 @@
+"""Testing read-through cache with in-process backend."""
+
+import pytest
+
+from app.pkg.cache import MemoryBackend, ReadThroughCache, cached, invalidates
+from app.pkg.connectors.postgresql.routing import reads_from_replicas
+from app.pkg.connectors.postgresql.transaction import bind_transaction, run_on_commit
+
+
+class _Service:
+    def __init__(self, cache):
+        self.cache = cache
+        self.reads = 0
+
+    @cached("items")
+    async def read(self, item_id: int) -> int:
+        self.reads += 1
+        return item_id
+
+    @invalidates("items")
+    async def update(self) -> None:
+        return None
+
+
+@pytest.fixture()
+def cache() -> ReadThroughCache:
+    return ReadThroughCache(backend=MemoryBackend(maxsize=2), ttl=60)
+
+
+async def test_cached_hit(cache: ReadThroughCache):
+    service = _Service(cache=cache)
+
+    assert await service.read(1) == 1
+    assert await service.read(1) == 1
+    assert await service.read(2) == 2
+    assert service.reads == 2
+
+
+async def test_invalidates(cache: ReadThroughCache):
+    service = _Service(cache=cache)
+
+    await service.read(1)
+    await service.update()
+    await service.read(1)
+    assert service.reads == 2
+
+
+async def test_invalidates_after_commit(cache: ReadThroughCache):
+    service = _Service(cache=cache)
+    await service.read(1)
+
+    with bind_transaction(object()):
+        await service.update()
+    await service.read(1)
+    assert service.reads == 1
+
+    with bind_transaction(object()):
+        await service.update()
+        await run_on_commit()
+    await service.read(1)
+    assert service.reads == 2
+
+
+async def test_cache_disabled():
+    service = _Service(cache=None)
+
+    await service.read(1)
+    await service.read(1)
+    assert service.reads == 2
+
+
+async def test_memory_backend_ttl(monkeypatch):
+    backend = MemoryBackend(maxsize=2)
+    await backend.set("key", "value", ttl=10)
+    assert await backend.get("key") == "value"
+
+    monkeypatch.setattr("time.monotonic", lambda: float("inf"))
+    assert await backend.get("key") is None
+
+
+async def test_memory_backend_evicts_least_recently_used():
+    backend = MemoryBackend(maxsize=2)
+    await backend.set("first", 1, ttl=60)
+    await backend.set("second", 2, ttl=60)
+    await backend.get("first")
+    await backend.set("third", 3, ttl=60)
+
+    assert await backend.get("first") == 1
+    assert await backend.get("second") is None
+    assert await backend.get("third") == 3
+
+
+async def test_miss_is_loaded_from_primary(cache: ReadThroughCache):
+    routes = []
+
+    async def loader():
+        routes.append(reads_from_replicas())
+        return 1
+
+    await cache.get_or_load(name="item", key="1", loader=loader)
+    cache.suspend("items")
+    await cache.get_or_load(name="item", key="1", loader=loader, tags=("items",))
+
+    assert routes == [False, True]
+    assert reads_from_replicas()
@@ -0,0 +1,103 @@
+"""Testing single-flight of identical in-flight calls."""
+
+import asyncio
+
+import pytest
+
+from app.pkg import models
+from app.pkg.cache import SingleFlight, single_flight
+from app.pkg.connectors.postgresql.routing import pin_to_primary, read_from_primary
+from app.pkg.connectors.postgresql.transaction import bind_transaction
+
+
+class _Service:
+    def __init__(self, flights):
+        self.single_flight = flights
+        self.reads = 0
+
+    @single_flight
+    async def read(self, query: models.ReadPartnerByTokenQuery) -> str:
+        self.reads += 1
+        await asyncio.sleep(0.01)
+        return query.token
+
+
+async def test_identical_calls_share_flight():
+    service = _Service(flights=SingleFlight())
+    query = models.ReadPartnerByTokenQuery(token="token")
+
+    result = await asyncio.gather(*(service.read(query) for _ in range(10)))
+
+    assert result == ["token"] * 10
+    assert service.reads == 1
+
+
+async def test_different_calls_do_not_share_flight():
+    service = _Service(flights=SingleFlight())
+
+    await asyncio.gather(
+        service.read(models.ReadPartnerByTokenQuery(token="first")),
+        service.read(models.ReadPartnerByTokenQuery(token="second")),
+    )
+
+    assert service.reads == 2
+
+
+async def test_finished_flight_is_not_shared():
+    service = _Service(flights=SingleFlight())
+    query = models.ReadPartnerByTokenQuery(token="token")
+
+    await service.read(query)
+    await service.read(query)
+
+    assert service.reads == 2
+
+
+async def test_cancelled_leader_does_not_cancel_followers():
+    service = _Service(flights=SingleFlight())
+    query = models.ReadPartnerByTokenQuery(token="token")
+
+    leader = asyncio.ensure_future(service.read(query))
+    follower = asyncio.ensure_future(service.read(query))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await follower == "token"
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+
+
+async def test_calls_inside_transaction_do_not_share_flight():
+    service = _Service(flights=SingleFlight())
+    query = models.ReadPartnerByTokenQuery(token="token")
+
+    with bind_transaction(object()):
+        await asyncio.gather(service.read(query), service.read(query))
+
+    assert service.reads == 2
+
+
+async def test_calls_pinned_to_primary_do_not_share_flight():
+    service = _Service(flights=SingleFlight())
+    query = models.ReadPartnerByTokenQuery(token="token")
+
+    async def read_own_write():
+        pin_to_primary()
+        return await service.read(query)
+
+    await asyncio.gather(service.read(query), read_own_write())
+
+    assert service.reads == 2
+
+
+async def test_calls_from_primary_do_not_join_replica_reads():
+    service = _Service(flights=SingleFlight())
+    query = models.ReadPartnerByTokenQuery(token="token")
+
+    async def read_primary():
+        with read_from_primary():
+            return await service.read(query)
+
+    await asyncio.gather(service.read(query), read_primary(), read_primary())
+
+    assert service.reads == 2
@@ -0,0 +1,123 @@
+"""Testing in-process token index."""
+
+import asyncio
+
+import pytest
+
+from app.pkg import models
+from app.pkg.cache import TokenIndex, index_evict, index_lookup, index_store
+from app.pkg.connectors.postgresql.notifications import RowChange
+
+
+class _Repository:
+    def __init__(self, token_index):
+        self.token_index = token_index
+        self.reads = 0
+        self.partners = {}
+
+    @index_lookup
+    async def read_by_token(self, query: models.ReadPartnerByTokenQuery):
+        self.reads += 1
+        await asyncio.sleep(0)
+        return self.partners[query.token]
+
+    @index_store
+    async def update(self, cmd: models.UpdatePartnerCommand):
+        self.partners[cmd.token] = models.Partner(**cmd.to_dict())
+        return self.partners[cmd.token]
+
+    @index_evict
+    async def delete(self, cmd: models.DeletePartnerCommand):
+        return self.partners.pop(
+            next(t for t, p in self.partners.items() if p.id == cmd.id),
+        )
+
+
+@pytest.fixture()
+def repository() -> _Repository:
+    repository = _Repository(token_index=TokenIndex(name="partners", maxsize=2))
+    for i in range(1, 4):
+        repository.partners[f"token{i}"] = models.Partner(
+            id=i,
+            name=f"partner{i}",
+            token=f"token{i}",
+        )
+    return repository
+
+
+async def __read(repository: _Repository, token: str) -> models.Partner:
+    return await repository.read_by_token(
+        query=models.ReadPartnerByTokenQuery(token=token),
+    )
+
+
+async def test_lookup_hit(repository: _Repository):
+    first = await __read(repository, "token1")
+
+    assert await __read(repository, "token1") is first
+    assert repository.reads == 1
+
+
+async def test_lru_eviction(repository: _Repository):
+    await __read(repository, "token1")
+    await __read(repository, "token2")
+    await __read(repository, "token1")
+    await __read(repository, "token3")
+
+    assert repository.token_index.get("token2") is None
+    assert repository.token_index.get("token1") is not None
+
+
+async def test_update_replaces_old_token(repository: _Repository):
+    await __read(repository, "token1")
+
+    updated = await repository.update(
+        cmd=models.UpdatePartnerCommand(id=1, name="partner1", token="new"),
+    )
+
+    assert repository.token_index.get("token1") is None
+    assert repository.token_index.get("new") is updated
+
+
+async def test_delete_and_notification_drop(repository: _Repository):
+    await __read(repository, "token1")
+    await __read(repository, "token2")
+
+    await repository.delete(cmd=models.DeletePartnerCommand(id=1))
+    repository.token_index.on_change(RowChange(table="partners", op="UPDATE", id=2))
+
+    assert repository.token_index.get("token1") is None
+    assert repository.token_index.get("token2") is None
+
+
+async def test_concurrent_change_is_not_overwritten(repository: _Repository):
+    read = asyncio.ensure_future(__read(repository, "token1"))
+    await asyncio.sleep(0)
+    repository.token_index.on_change(RowChange(table="partners", op="UPDATE", id=1))
+    await read
+
+    assert repository.token_index.get("token1") is None
+
+
+async def test_disabled_while_disconnected(repository: _Repository):
+    repository.token_index.on_disconnect()
+
+    await __read(repository, "token1")
+    await __read(repository, "token1")
+    assert repository.reads == 2
+
+    repository.token_index.on_connect()
+    await __read(repository, "token1")
+    await __read(repository, "token1")
+    assert repository.reads == 3
+
+
+async def test_warm(repository: _Repository):
+    async def batches():
+        yield list(repository.partners.values())
+
+    await repository.token_index.warm(batches())
+
+    assert repository.token_index.get("token1") is not None
+    assert repository.token_index.get("token2") is not None
+    assert repository.token_index.get("token3") is None
@@ -0,0 +1,225 @@
+"""Testing adapter of asyncpg pool to the interface of aiopg pool."""
+
+import psycopg2
+import psycopg2.errors
+import pytest
+
+from app.internal.repository.postgresql.handlers.handle_exception import (
+    handle_exception,
+)
+from app.pkg.models.exceptions.country import CountryCodeAlreadyExists
+from app.pkg.models.exceptions.repository import DriverError, UniqueViolation
+
+asyncpg = pytest.importorskip("asyncpg")
+
+# pylint: disable=wrong-import-position
+from app.pkg.connectors.postgresql.asyncpg_adapter import (  # noqa: E402
+    AsyncpgCursor,
+    convert_error,
+    convert_query,
+)
+
+
+class FakeStatement:
+    """Prepared statement, that returns records and status of its connection."""
+
+    def __init__(self, connection, query):
+        self.connection = connection
+        self.query = query
+
+    async def fetch(self, *args):
+        return await self.connection.fetch(self.query, *args)
+
+    def get_statusmsg(self):
+        return self.connection.status
+
+    def get_attributes(self):
+        return tuple(self.connection.records[:1])
+
+
+class FakeConnection:
+    """Connection, that returns given records and status."""
+
+    def __init__(self, records=None, error=None, status="BEGIN"):
+        self.records = records or []
+        self.error = error
+        self.status = status
+        self.queries = []
+
+    async def fetch(self, query, *args):
+        self.queries.append(("fetch", query, args))
+        if self.error is not None:
+            raise self.error
+        return self.records
+
+    async def execute(self, query, *args):
+        self.queries.append(("execute", query, args))
+        if self.error is not None:
+            raise self.error
+        return self.status
+
+    async def prepare(self, query, name=None):
+        self.queries.append(("prepare", query, name))
+        return FakeStatement(self, query)
+
+
+def unique_violation(constraint_name: str) -> Exception:
+    return asyncpg.UniqueViolationError.new(
+        {
+            "C": "23505",
+            "M": "duplicate key value violates unique constraint",
+            "D": "Key (code)=(RU) already exists.",
+            "n": constraint_name,
+        },
+    )
+
+
+@pytest.mark.parametrize(
+    "query, expected",
+    [
+        (
+            "select id from users where id = %(id)s or parent_id = %(id)s",
+            ("select id from users where id = $1 or parent_id = $1", ("id",)),
+        ),
+        (
+            "update users set name = %(name)s where id = %(id)s",
+            ("update users set name = $1 where id = $2", ("name", "id")),
+        ),
+        (
+            "select id from users where id = %s and name like 'a%%'",
+            ("select id from users where id = $1 and name like 'a%'", ()),
+        ),
+    ],
+)
+async def test_convert_query(query, expected):
+    assert convert_query(query) == expected
+
+
+async def test_convert_error_keeps_code_and_diagnostics():
+    error = convert_error(unique_violation("countries_code_key"))
+
+    assert isinstance(error, psycopg2.errors.UniqueViolation)
+    assert error.pgcode == "23505"
+    assert error.diag.constraint_name == "countries_code_key"
+    assert error.diag.message_detail == "Key (code)=(RU) already exists."
+
+
+async def test_convert_error_of_socket():
+    error = convert_error(ConnectionResetError())
+
+    assert isinstance(error, psycopg2.OperationalError)
+    assert error.pgcode is None
+
+
+@pytest.mark.parametrize(
+    "constraint_name, expected",
+    [
+        ("countries_code_key", CountryCodeAlreadyExists),
+        ("unknown_key", UniqueViolation),
+    ],
+)
+async def test_handle_exception_of_converted_error(constraint_name, expected):
+    cur = AsyncpgCursor(FakeConnection(error=unique_violation(constraint_name)))
+
+    @handle_exception
+    async def create():
+        await cur.execute("insert into countries(code) values (%(code)s)", {"code": 1})
+
+    with pytest.raises(expected):
+        await create()
+
+
+async def test_handle_exception_of_unknown_code():
+    error = asyncpg.PostgresError.new({"C": "XX999", "M": "unknown", "D": "detail"})
+    cur = AsyncpgCursor(FakeConnection(error=error))
+
+    @handle_exception
+    async def read():
+        await cur.execute("select %(id)s", {"id": 1})
+
+    with pytest.raises(DriverError):
+        await read()
+
+
+async def test_cursor_orders_named_parameters():
+    conn = FakeConnection(records=[{"id": 1}, {"id": 2}, {"id": 3}])
+    cur = AsyncpgCursor(conn)
+
+    await cur.execute(
+        "select id from cities where country_id = %(country_id)s and id > %(id)s",
+        {"id": 1, "country_id": 7},
+    )
+
+    assert conn.queries == [
+        ("fetch", "select id from cities where country_id = $1 and id > $2", (7, 1)),
+    ]
+    assert await cur.fetchone() == {"id": 1}
+    assert await cur.fetchall() == [{"id": 2}, {"id": 3}]
+    assert await cur.fetchone() is None
+
+
+async def test_cursor_sends_query_without_parameters_as_is():
+    conn = FakeConnection()
+    cur = AsyncpgCursor(conn)
+
+    await cur.execute("begin")
+    await cur.execute("select 1 where 'a' like '%'")
+
+    assert conn.queries == [
+        ("execute", "begin", ()),
+        ("fetch", "select 1 where 'a' like '%'", ()),
+    ]
+
+
+async def test_cursor_reads_rows_of_query_with_leading_comment():
+    conn = FakeConnection(records=[{"id": 1}])
+    cur = AsyncpgCursor(conn)
+
+    await cur.execute("-- read cities\n/* by id */ select id from cities")
+
+    assert conn.queries[0][0] == "fetch"
+    assert await cur.fetchall() == [{"id": 1}]
+
+
+async def test_cursor_describes_modifying_query_once():
+    conn = FakeConnection(status="UPDATE 3")
+    cur = AsyncpgCursor(conn)
+    query = "update skills set name = %(name)s where id > %(id)s"
+
+    await cur.execute(query, {"name": "Python", "id": 1})
+    assert cur.rowcount == 3
+    await cur.execute(query, {"name": "Python", "id": 2})
+    assert cur.rowcount == 3
+
+    converted = "update skills set name = $1 where id > $2"
+    assert conn.queries == [
+        ("prepare", converted, ""),
+        ("fetch", converted, ("Python", 1)),
+        ("execute", converted, ("Python", 2)),
+    ]
+
+
+async def test_cursor_reads_rows_of_described_returning_query():
+    conn = FakeConnection(records=[{"id": 1}, {"id": 2}], status="DELETE 2")
+    cur = AsyncpgCursor(conn)
+    query = "delete from skills where id > %(id)s returning id"
+
+    await cur.execute(query, {"id": 0})
+    await cur.execute(query, {"id": 0})
+
+    assert [kind for kind, *_ in conn.queries] == ["prepare", "fetch", "fetch"]
+    assert cur.rowcount == 2
+    assert await cur.fetchall() == [{"id": 1}, {"id": 2}]
+
+
+async def test_cursor_fetches_from_server_side_cursor_out_of_cache():
+    conn = FakeConnection(records=[{"id": 1}], status="FETCH 1")
+    cur = AsyncpgCursor(conn)
+
+    await cur.execute("fetch forward 10 from stream_cursor_1")
+    await cur.execute("fetch forward 10 from stream_cursor_1")
+
+    assert [kind for kind, *_ in conn.queries] == ["prepare", "fetch"] * 2
+    assert {name for kind, _, name in conn.queries if kind == "prepare"} == {""}
+    assert cur.rowcount == 1
+    assert await cur.fetchall() == [{"id": 1}]
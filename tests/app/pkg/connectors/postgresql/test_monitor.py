@@ -0,0 +1,64 @@
+"""Testing monitor of postgresql pool."""
+
+import asyncio
+
+import aiopg
+import pytest
+from prometheus_client import REGISTRY
+
+from app.pkg.connectors.postgresql.monitor import PoolMonitor
+from app.pkg.models.exceptions.repository import PoolAcquireTimeout
+
+
+@pytest.fixture()
+async def pool(settings):
+    pool = await aiopg.create_pool(dsn=settings.POSTGRES.DSN, minsize=1, maxsize=1)
+    yield pool
+    pool.close()
+    await pool.wait_closed()
+
+
+@pytest.mark.postgresql
+async def test_acquire_timeout(pool):
+    monitor = PoolMonitor(pool=pool, acquire_timeout=0.1)
+
+    async with monitor.acquire():
+        with pytest.raises(PoolAcquireTimeout):
+            async with monitor.acquire():
+                pass
+
+    async with monitor.acquire() as conn:
+        assert not conn.closed
+    assert pool.freesize == 1
+
+
+@pytest.mark.postgresql
+async def test_recycle_old_connection(pool):
+    monitor = PoolMonitor(pool=pool, max_connection_age=0.1)
+
+    async with monitor.acquire() as conn:
+        await asyncio.sleep(0.2)
+    assert conn.closed
+
+    async with monitor.acquire() as new_conn:
+        assert new_conn is not conn
+        assert not new_conn.closed
+
+
+@pytest.mark.postgresql
+async def test_metrics_are_labeled_with_pool(pool):
+    monitor = PoolMonitor(pool=pool, name="replica-7")
+
+    async with monitor.acquire():
+        labels = {"pool": "replica-7"}
+        assert REGISTRY.get_sample_value("postgresql_pool_size", labels) == 1
+        assert (
+            REGISTRY.get_sample_value("postgresql_pool_free_connections", labels) == 0
+        )
+        assert (
+            REGISTRY.get_sample_value(
+                "postgresql_pool_acquire_seconds_count",
+                labels,
+            )
+            == 1
+        )
@@ -0,0 +1,122 @@
+"""Testing listener of changed rows."""
+
+import asyncio
+import json
+from typing import List, Optional
+
+import aiopg
+import pytest
+
+from app.pkg.connectors.postgresql.notifications import (
+    CHANNEL,
+    RowChange,
+    RowChangeListener,
+    RowChangeSubscriber,
+)
+
+
+class _Subscriber(RowChangeSubscriber):
+    def __init__(self):
+        self.changes: List[RowChange] = []
+        self.connected: Optional[bool] = None
+        self.received = asyncio.Event()
+
+    def on_change(self, change: RowChange) -> None:
+        self.changes.append(change)
+        self.received.set()
+
+    def on_connect(self) -> None:
+        self.connected = True
+
+    def on_disconnect(self) -> None:
+        self.connected = False
+
+
+@pytest.fixture()
+async def listener(settings):
+    listener = RowChangeListener(dsn=settings.POSTGRES.DSN)
+    await listener.start()
+    yield listener
+    await listener.close()
+
+
+@pytest.mark.postgresql
+async def test_receive_change(settings, listener: RowChangeListener):
+    subscriber = _Subscriber()
+    await listener.subscribe("partners", subscriber)
+    change = {"table": "partners", "op": "UPDATE", "id": 1}
+
+    async with aiopg.connect(dsn=settings.POSTGRES.DSN) as conn:
+        cur = await conn.cursor()
+        await cur.execute("select pg_notify(%s, %s)", (CHANNEL, json.dumps(change)))
+
+    await asyncio.wait_for(subscriber.received.wait(), timeout=5)
+    assert subscriber.changes == [RowChange(**change)]
+
+
+@pytest.mark.postgresql
+async def test_subscriber_is_disconnected_on_close(listener: RowChangeListener):
+    subscriber = _Subscriber()
+    await listener.subscribe("contacts", subscriber)
+
+    await listener.close()
+
+    assert subscriber.connected is False
+
+
+@pytest.mark.postgresql
+async def test_one_change_per_statement_of_cached_table(
+    settings,
+    listener: RowChangeListener,
+):
+    subscriber = _Subscriber()
+    await listener.subscribe("countries", subscriber)
+
+    async with aiopg.connect(dsn=settings.POSTGRES.DSN) as conn:
+        async with conn.cursor() as cur:
+            await cur.execute(
+                "insert into countries(name, code) values ('A', 'AAA'), ('B', 'BBB')",
+            )
+            await cur.execute("delete from countries where code in ('AAA', 'BBB')")
+
+    await asyncio.wait_for(subscriber.received.wait(), timeout=5)
+    while len(subscriber.changes) < 2:
+        subscriber.received.clear()
+        await asyncio.wait_for(subscriber.received.wait(), timeout=5)
+    await asyncio.sleep(0.1)
+
+    assert [(c.op, c.id) for c in subscriber.changes] == [
+        ("INSERT", None),
+        ("DELETE", None),
+    ]
+    assert all(change.ts is not None for change in subscriber.changes)
+
+
+@pytest.mark.postgresql
+async def test_changes_of_token_table(settings, listener: RowChangeListener):
+    subscriber = _Subscriber()
+    await listener.subscribe("partners", subscriber)
+
+    async with aiopg.connect(dsn=settings.POSTGRES.DSN) as conn:
+        async with conn.cursor() as cur:
+            await cur.execute(
+                "insert into partners(name, token) values ('notified', 'notified') "
+                "returning id",
+            )
+            (partner_id,) = await cur.fetchone()
+            await cur.execute(
+                "update partners set name = 'renamed' where id = %s",
+                (partner_id,),
+            )
+            await cur.execute("truncate partners cascade")
+
+    await asyncio.wait_for(subscriber.received.wait(), timeout=5)
+    while len(subscriber.changes) < 2:
+        subscriber.received.clear()
+        await asyncio.wait_for(subscriber.received.wait(), timeout=5)
+    await asyncio.sleep(0.1)
+
+    assert [(c.op, c.id) for c in subscriber.changes] == [
+        ("UPDATE", partner_id),
+        ("TRUNCATE", None),
+    ]
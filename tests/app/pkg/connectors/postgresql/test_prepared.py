@@ -0,0 +1,84 @@
+"""Testing prepared statements cache of postgresql connector."""
+
+import pytest
+from psycopg2.extras import RealDictCursor  # type: ignore
+
+from app.internal.repository.postgresql import connection
+from app.pkg.connectors.postgresql.monitor import get_pool_monitor
+from app.pkg.connectors.postgresql.prepared import (
+    PreparedCursor,
+    PreparedStatementCache,
+    compile_query,
+    get_statement_cache,
+    invalidate_statement_cache,
+)
+
+
+@pytest.mark.parametrize(
+    "query, expected",
+    [
+        (
+            "select id from users where id = %(id)s or parent_id = %(id)s",
+            ("select id from users where id = $1 or parent_id = $1", ("id",)),
+        ),
+        (
+            "update users set name = %(name)s where id = %(id)s",
+            ("update users set name = $1 where id = $2", ("name", "id")),
+        ),
+        (
+            "select id from users where name like 'a%%'",
+            ("select id from users where name like 'a%'", ()),
+        ),
+    ],
+)
+async def test_compile_query(query, expected):
+    assert compile_query(query) == expected
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "begin",
+        "declare stream_cursor no scroll cursor for select 1",
+        "select id from users where id = %s",
+    ],
+)
+async def test_compile_query_not_preparable(query):
+    assert compile_query(query) is None
+
+
+async def test_cache_evicts_least_recently_used():
+    cache = PreparedStatementCache(maxsize=2)
+
+    first, _ = cache.add("select 1")
+    second, _ = cache.add("select 2")
+    assert cache.get("select 1") == first
+
+    _, evicted = cache.add("select 3")
+
+    assert evicted == second
+    assert cache.get("select 2") is None
+    assert cache.get("select 1") == first
+
+
+async def test_new_cache_does_not_reuse_names():
+    first, _ = PreparedStatementCache(maxsize=2).add("select 1")
+    second, _ = PreparedStatementCache(maxsize=2).add("select 1")
+
+    assert first != second
+
+
+@pytest.mark.postgresql
+async def test_invalidated_connection_prepares_again():
+    q = "select %(id)s::int as id"
+
+    async with connection.get_connection(return_pool=True) as pool:
+        async with get_pool_monitor(pool).acquire() as conn:
+            for _ in range(2):
+                cur = PreparedCursor(
+                    cursor=await conn.cursor(cursor_factory=RealDictCursor),
+                    cache=get_statement_cache(conn, maxsize=2),
+                )
+                await cur.execute(q, {"id": 1})
+                assert await cur.fetchone() == {"id": 1}
+                invalidate_statement_cache(conn)
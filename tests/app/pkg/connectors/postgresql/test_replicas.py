@@ -0,0 +1,39 @@
+"""Testing health checks of postgresql read replicas."""
+
+import aiopg
+import pytest
+
+from app.pkg.connectors.postgresql.replicas import Replica, ReplicaSet
+
+
+@pytest.fixture()
+async def replica_set(settings):
+    down_dsn = settings.POSTGRES.DSN.replace(f":{settings.POSTGRES.PORT}/", ":1/")
+    replicas = [
+        Replica(dsn=dsn, pool=await aiopg.create_pool(dsn=dsn, minsize=0, maxsize=1))
+        for dsn in (settings.POSTGRES.DSN, down_dsn)
+    ]
+    replica_set = ReplicaSet(replicas=replicas, health_check_interval=1)
+    yield replica_set
+    await replica_set.close()
+
+
+@pytest.mark.postgresql
+async def test_choose_healthy_replica(replica_set: ReplicaSet):
+    up, down = replica_set.replicas
+
+    await replica_set.check()
+
+    assert up.healthy
+    assert not down.healthy
+    assert replica_set.choose() is up
+
+
+@pytest.mark.postgresql
+async def test_fail_over_to_primary(replica_set: ReplicaSet):
+    up, _ = replica_set.replicas
+    await replica_set.check()
+
+    replica_set.mark_down(up)
+
+    assert replica_set.choose() is None
@@ -0,0 +1 @@
+"""Testing coalescing of reads by key."""
@@ -0,0 +1,91 @@
+"""Testing DataLoader."""
+
+import asyncio
+from contextvars import ContextVar
+from typing import List
+
+import pytest
+
+from app.pkg import models
+from app.pkg.dataloader import DataLoader
+
+
+class _BatchLoad:
+    def __init__(self):
+        self.calls: List[List[int]] = []
+
+    async def __call__(self, ids: List[int]) -> List[models.Country]:
+        self.calls.append(ids)
+        return [
+            models.Country(id=i, name=f"Country {i}", code="RUS") for i in ids if i < 10
+        ]
+
+
+async def test_load_coalesces_keys():
+    batch_load = _BatchLoad()
+    loader = DataLoader(batch_load=batch_load)
+
+    result = await asyncio.gather(loader.load(1), loader.load(2), loader.load(1))
+
+    assert [country.id for country in result] == [1, 2, 1]
+    assert batch_load.calls == [[1, 2]]
+
+
+async def test_load_missing_key():
+    loader = DataLoader(batch_load=_BatchLoad())
+
+    assert await loader.load(10) is None
+
+
+async def test_load_many_splits_batches():
+    batch_load = _BatchLoad()
+    loader = DataLoader(batch_load=batch_load, max_batch_size=2)
+
+    result = await loader.load_many([1, 2, 3, 3])
+
+    assert [country.id for country in result] == [1, 2, 3, 3]
+    assert batch_load.calls == [[1, 2], [3]]
+
+
+async def test_load_raises_error_of_batch():
+    async def batch_load(ids: List[int]) -> List[models.Country]:
+        raise ValueError(ids)
+
+    loader = DataLoader(batch_load=batch_load)
+
+    with pytest.raises(ValueError):
+        await asyncio.gather(loader.load(1), loader.load(2))
+
+
+async def test_load_without_coalescing():
+    batch_load = _BatchLoad()
+    loader = DataLoader(batch_load=batch_load, scope=lambda: None)
+
+    result = await asyncio.gather(loader.load(1), loader.load(2))
+
+    assert [country.id for country in result] == [1, 2]
+    assert await loader.load_many([3, 10, 3]) == [
+        models.Country(id=3, name="Country 3", code="RUS"),
+        None,
+        models.Country(id=3, name="Country 3", code="RUS"),
+    ]
+    assert batch_load.calls == [[1], [2], [3, 10]]
+
+
+async def test_load_coalesces_keys_of_one_scope():
+    batch_load = _BatchLoad()
+    scope: ContextVar[str] = ContextVar("scope", default="replicas")
+    loader = DataLoader(batch_load=batch_load, scope=scope.get)
+
+    async def load_in_scope(key: int, name: str):
+        scope.set(name)
+        return await loader.load(key)
+
+    result = await asyncio.gather(
+        load_in_scope(1, "replicas"),
+        load_in_scope(2, "primary"),
+        load_in_scope(1, "primary"),
+    )
+
+    assert [country.id for country in result] == [1, 2, 1]
+    assert sorted(batch_load.calls) == [[1], [2, 1]]
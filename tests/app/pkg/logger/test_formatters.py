@@ -0,0 +1,64 @@
+"""Testing structured formatting and sampling of log records."""
+
+import logging
+import queue
+import sys
+
+import orjson
+from opentelemetry import trace
+from opentelemetry.sdk.trace import TracerProvider
+
+from app.pkg.logger.formatters import JSONFormatter, SamplingFilter, TraceContextFilter
+from app.pkg.logger.pipeline import DroppingQueueHandler
+
+
+def __record(name: str = "test", msg: str = "message") -> logging.LogRecord:
+    return logging.LogRecord(name, logging.INFO, __file__, 1, msg, None, None)
+
+
+async def test_json_formatter_writes_trace_ids():
+    handler = DroppingQueueHandler(queue.Queue())
+    handler.addFilter(TraceContextFilter())
+    tracer = TracerProvider().get_tracer(__name__)
+
+    with tracer.start_as_current_span("request") as span:
+        handler.handle(__record(msg="Hello, %s!"))
+        context = span.get_span_context()
+
+    record = handler.queue.get_nowait()
+    payload = orjson.loads(JSONFormatter().format(record))
+
+    assert payload["message"] == "Hello, %s!"
+    assert payload["trace_id"] == trace.format_trace_id(context.trace_id)
+    assert payload["span_id"] == trace.format_span_id(context.span_id)
+
+
+async def test_json_formatter_writes_exception_apart():
+    handler = DroppingQueueHandler(queue.Queue())
+    try:
+        raise ValueError("broken")
+    except ValueError:
+        record = __record()
+        record.exc_info = sys.exc_info()
+    handler.handle(record)
+
+    payload = orjson.loads(JSONFormatter().format(handler.queue.get_nowait()))
+
+    assert payload["message"] == "message"
+    assert "trace_id" not in payload
+    assert "ValueError: broken" in payload["exception"]
+
+
+async def test_sampling_filter_applies_to_children():
+    sampling = SamplingFilter(sample_rates={"app.internal": 0.000001})
+
+    assert not sampling.filter(__record("app.internal.routes"))
+    assert sampling.filter(__record("app.pkg"))
+
+
+async def test_rate_limit_filter_passes_burst():
+    sampling = SamplingFilter(rate_limits={"app": 3})
+
+    passed = [sampling.filter(__record("app.routes")) for _ in range(10)]
+
+    assert passed.count(True) == 3
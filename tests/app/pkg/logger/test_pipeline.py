@@ -0,0 +1,55 @@
+"""Testing non-blocking logging pipeline."""
+
+import io
+import logging
+import queue
+
+from prometheus_client import REGISTRY
+
+from app.pkg.logger import get_logger
+from app.pkg.logger.pipeline import (
+    BatchStreamHandler,
+    BatchWriter,
+    DroppingQueueHandler,
+)
+
+
+def __record(msg: str, level: int = logging.INFO) -> logging.LogRecord:
+    return logging.LogRecord("test", level, __file__, 1, msg, None, None)
+
+
+async def test_get_logger_is_idempotent():
+    logger = get_logger("tests.pipeline")
+    handlers = list(logger.handlers)
+
+    assert get_logger("tests.pipeline").handlers == handlers
+    assert len(handlers) == 1
+
+
+async def test_full_queue_drops_records():
+    handler = DroppingQueueHandler(queue.Queue(maxsize=1))
+    labels = {"level": "WARNING"}
+    dropped = REGISTRY.get_sample_value("logging_dropped_records_total", labels) or 0
+
+    handler.handle(__record("first", logging.WARNING))
+    handler.handle(__record("second", logging.WARNING))
+
+    assert handler.queue.qsize() == 1
+    assert (
+        REGISTRY.get_sample_value("logging_dropped_records_total", labels)
+        == dropped + 1
+    )
+
+
+async def test_writer_writes_batches():
+    stream = io.StringIO()
+    stream_handler = BatchStreamHandler(stream)
+    stream_handler.setLevel(logging.INFO)
+    writer = BatchWriter(handlers=[stream_handler], maxsize=100, batch_size=10)
+
+    for i in range(25):
+        writer.handler.handle(__record(f"record {i}"))
+    writer.handler.handle(__record("debug", logging.DEBUG))
+    writer.stop()
+
+    assert stream.getvalue() == "".join(f"record {i}\n" for i in range(25))
@@ -1,5 +1,6 @@
 """Tests for :meth:`.BaseModel.migrate()`."""
 import decimal
+import typing
 
 import pydantic
 import pytest
@@ -113,3 +114,65 @@ async def test_with_extra_field():
     assert another_model.some_value_two == "1"
     assert another_model.some_value_three == "1"
     assert another_model.some_value_four == decimal.Decimal("1.0")
+
+
+async def test_trusted_equals_validated():
+    class TestModel(BaseModel):
+        some_value: int
+        some_value_two: pydantic.SecretStr
+        some_value_three: typing.Optional[str] = None
+
+    class AnotherTestModel(BaseModel):
+        some_value: int
+        some_value_two: pydantic.SecretStr
+        some_value_three: str
+        some_value_four: float = 1.0
+
+    model = TestModel(some_value=1, some_value_two="key", some_value_three="1")
+
+    assert model.migrate(AnotherTestModel, trusted=True) == model.migrate(
+        AnotherTestModel,
+    )
+
+
+async def test_trusted_validates_extra_fields():
+    class TestModel(BaseModel):
+        some_value: int
+
+    class AnotherTestModel(BaseModel):
+        some_value: int
+        some_value_two: decimal.Decimal
+
+    model = TestModel(some_value=1)
+    another_model = model.migrate(
+        AnotherTestModel,
+        extra_fields={"some_value_two": "1.0"},
+        trusted=True,
+    )
+
+    assert another_model.some_value_two == decimal.Decimal("1.0")
+    with pytest.raises(pydantic.ValidationError):
+        model.migrate(
+            AnotherTestModel,
+            extra_fields={"some_value_two": "not a number"},
+            trusted=True,
+        )
+
+
+async def test_trusted_with_some_missing_fields():
+    class TestModel(BaseModel):
+        some_value: int
+
+    class AnotherTestModel(BaseModel):
+        some_value: int
+        some_value_two: str
+
+    model = TestModel(some_value=1)
+
+    with pytest.raises(pydantic.ValidationError):
+        model.migrate(AnotherTestModel, trusted=True)
+
+    another_model = model.migrate(AnotherTestModel, random_fill=True, trusted=True)
+
+    assert another_model.some_value == 1
+    assert isinstance(another_model.some_value_two, str)
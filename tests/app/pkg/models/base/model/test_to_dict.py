@@ -216,5 +216,25 @@ async def test_model_reduction_with_deciphering(create_model):
     assert dict_model["reduction"] == "reduction"
 
 
-# TODO: Добавить бенчмарки для to_dict.
-#   Есть ощущение, что тут происходит много лишних операций.
+async def test_compiled_serializer_casts_unvalidated_defaults():
+    class TestModel(BaseModel):
+        some_value: pydantic.SecretStr = pydantic.Field(default_factory=uuid.uuid4)
+        some_value_two: typing.Optional[datetime.datetime] = None
+
+    model = TestModel()
+    dict_model = model.to_dict(show_secrets=True)
+
+    assert dict_model == model.to_dict(show_secrets=True, values=model.dict())
+    assert isinstance(dict_model["some_value"], str)
+    assert dict_model["some_value_two"] is None
+
+
+async def test_compiled_serializer_with_deleted_attribute():
+    class TestModel(BaseModel):
+        some_value: int
+        some_value_two: pydantic.SecretStr
+
+    model = TestModel(some_value=1, some_value_two="key")
+    model.delete_attribute("some_value")
+
+    assert model.to_dict(show_secrets=True) == {"some_value_two": "key"}
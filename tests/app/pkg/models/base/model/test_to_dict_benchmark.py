@@ -0,0 +1,65 @@
+"""Micro-benchmarks of :meth:`.BaseModel.to_dict()`.
+
+Compiled serializer is compared with the dynamic cast of
+:meth:`pydantic.BaseModel.dict`, that ``to_dict`` uses when ``values`` are
+passed.
+"""
+
+import timeit
+
+import pytest
+
+from app.pkg import models
+from app.pkg.models.base import BaseModel
+
+
+def __speedup(model: BaseModel, number: int) -> float:
+    dynamic = timeit.timeit(
+        lambda: model.to_dict(show_secrets=True, values=model.dict()),
+        number=number,
+    )
+    compiled = timeit.timeit(lambda: model.to_dict(show_secrets=True), number=number)
+    return dynamic / compiled
+
+
+#: MarkDecorator: Serialized models and count of runs to time.
+__cases__ = pytest.mark.parametrize(
+    "model, number",
+    [
+        (
+            models.CreateContactsCommand(
+                email="test@example.ru",
+                telegram_username="@tester1337",
+                telegram_user_id=1,
+                partner_id=1,
+            ),
+            10000,
+        ),
+        (models.ReadAllContactsByIdQuery(ids=list(range(1, 10001))), 20),
+        (
+            models.Page[models.Country](
+                items=[
+                    models.Country(id=i, name="Country", code="CTR")
+                    for i in range(1, 1001)
+                ],
+            ),
+            20,
+        ),
+    ],
+)
+
+
+@__cases__
+async def test_to_dict_equals_dynamic_cast(model: BaseModel, number: int):
+    _ = number
+
+    assert model.to_dict(show_secrets=True) == model.to_dict(
+        show_secrets=True,
+        values=model.dict(),
+    )
+
+
+@pytest.mark.slow
+@__cases__
+async def test_to_dict_speedup(model: BaseModel, number: int):
+    assert __speedup(model, number=number) > 1
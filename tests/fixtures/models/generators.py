@@ -4,14 +4,14 @@ from typing import Any, Callable, Type
 
 import pydantic
 import pytest
-from jsf import JSF
 
 from app.pkg import models
 from app.pkg.models.base import Model
+from app.pkg.models.base.migration import get_jsf
 
 
 def __generator(model: Type[Model], **kwargs) -> Callable[..., Model]:
-    mock = JSF(model.schema())
+    mock = get_jsf(model)
 
     def generate() -> Any:
         mock_generate = mock.generate()
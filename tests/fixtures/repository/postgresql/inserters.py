@@ -32,7 +32,7 @@ async def __inserter(
         tuple[Model, Model]: Tuple with result of insert and command.
     """
 
-    cmd = generator(**kwargs).migrate(model=cmd_model)
+    cmd = generator(**kwargs).migrate(model=cmd_model, trusted=True)
 
     return await repository.create(cmd=cmd), cmd
 